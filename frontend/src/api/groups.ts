@@ -7,8 +7,11 @@ import type {
   EventGroupListResponse,
   EventGroupUpdate,
   PreviewGroupResponse,
+  PreviewJobResponse,
 } from "./types"
 
+const PREVIEW_POLL_MS = 1000
+
 export async function listGroups(
   includeDisabled = false,
   includeStats = true
@@ -68,10 +71,32 @@ export async function promoteGroup(
   return api.post(`/groups/${groupId}/promote`)
 }
 
+/**
+ * Preview stream matching. By default the server answers from the last
+ * run's stream snapshot; with refresh (or when no snapshot exists yet) it
+ * refreshes the M3U account and refetches streams in a background job,
+ * which is polled until it finishes.
+ */
 export async function previewGroup(
-  groupId: number
+  groupId: number,
+  refresh = false
 ): Promise<PreviewGroupResponse> {
-  return api.get(`/groups/${groupId}/preview`)
+  const response = await api.get<PreviewGroupResponse | PreviewJobResponse>(
+    `/groups/${groupId}/preview${refresh ? "?refresh=true" : ""}`
+  )
+  if (!("job_id" in response)) return response
+
+  let job = response
+  while (job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, PREVIEW_POLL_MS))
+    job = await api.get<PreviewJobResponse>(
+      `/groups/${groupId}/preview/jobs/${job.job_id}`
+    )
+  }
+  if (job.status === "failed" || !job.result) {
+    throw new Error(job.error || "Preview failed")
+  }
+  return job.result
 }
 
 export interface RawStream {
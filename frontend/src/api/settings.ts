@@ -205,11 +205,35 @@ export interface ConnectionTestResponse {
   error: string | null
 }
 
+export interface SchedulerTaskRun {
+  started_at: string
+  duration_seconds: number
+  status: "ok" | "skipped" | "error"
+  error: string | null
+}
+
+export interface SchedulerTaskStatus {
+  name: string
+  schedule: string | number | null
+  priority: number
+  running: boolean
+  next_run: string | null
+  last_run: string | null
+  last_duration_seconds: number | null
+  last_status: "ok" | "skipped" | "error" | null
+  last_error: string | null
+  run_count: number
+  error_count: number
+  coalesced_runs: number
+  history: SchedulerTaskRun[]
+}
+
 export interface SchedulerStatus {
   running: boolean
   cron_expression: string | null
   last_run: string | null
   next_run: string | null
+  tasks?: SchedulerTaskStatus[]
 }
 
 // Note: cron_description is handled on frontend via cronstrue library
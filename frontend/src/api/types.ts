@@ -324,10 +324,23 @@ export interface PreviewGroupResponse {
   filtered_exclude_regex: number
   cache_hits: number
   cache_misses: number
+  /** Set when answered from the last run's stream snapshot */
+  snapshot_at?: string | null
+  /** Streams re-matched because they are new or renamed since the snapshot */
+  rematched_count?: number | null
   streams: PreviewStream[]
   errors: string[]
 }
 
+/** Background full preview started with ?refresh=true */
+export interface PreviewJobResponse {
+  job_id: string
+  group_id: number
+  status: "running" | "completed" | "failed"
+  result: PreviewGroupResponse | null
+  error: string | null
+}
+
 // Team Aliases
 export interface TeamAlias {
   id: number
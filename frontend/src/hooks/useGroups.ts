@@ -80,7 +80,8 @@ export function useToggleGroup() {
 
 export function usePreviewGroup() {
   return useMutation({
-    mutationFn: (groupId: number) => previewGroup(groupId),
+    mutationFn: ({ groupId, refresh = false }: { groupId: number; refresh?: boolean }) =>
+      previewGroup(groupId, refresh),
   })
 }
 
@@ -16,6 +16,7 @@ import {
   ArrowDown,
   ArrowUpDown,
   RotateCcw,
+  RefreshCw,
   Library,
   Crown,
   Layers,
@@ -565,9 +566,9 @@ export function EventGroups() {
     }
   }
 
-  const handlePreview = async (group: EventGroup) => {
+  const handlePreview = async (groupId: number, refresh = false) => {
     try {
-      const result = await previewMutation.mutateAsync(group.id)
+      const result = await previewMutation.mutateAsync({ groupId, refresh })
       setPreviewData(result)
       setShowPreviewModal(true)
     } catch (err) {
@@ -1582,12 +1583,12 @@ export function EventGroups() {
                           variant="ghost"
                           size="icon"
                           className="h-8 w-8"
-                          onClick={() => handlePreview(group)}
+                          onClick={() => handlePreview(group.id)}
                           disabled={previewMutation.isPending}
                           title="Preview stream matches"
                         >
                           {previewMutation.isPending &&
-                          previewMutation.variables === group.id ? (
+                          previewMutation.variables?.groupId === group.id ? (
                             <Loader2 className="h-4 w-4 animate-spin" />
                           ) : (
                             <Search className="h-4 w-4" />
@@ -2287,9 +2288,32 @@ export function EventGroups() {
             </DialogTitle>
             <DialogDescription>
               Preview of stream matching results. Processing is done via EPG generation.
+              {previewData?.snapshot_at && (
+                <>
+                  {" "}Streams as of{" "}
+                  {new Date(previewData.snapshot_at.replace(" ", "T") + "Z").toLocaleString()}.
+                </>
+              )}
             </DialogDescription>
           </DialogHeader>
 
+          {previewData && (
+            <div className="flex justify-end">
+              <Button
+                variant="outline"
+                size="sm"
+                onClick={() => handlePreview(previewData.group_id, true)}
+                disabled={previewMutation.isPending}
+                title="Refresh the M3U account and refetch streams"
+              >
+                <RefreshCw
+                  className={`h-4 w-4 mr-1 ${previewMutation.isPending ? "animate-spin" : ""}`}
+                />
+                Refresh streams
+              </Button>
+            </div>
+          )}
+
           {previewData && (
             <div className="flex-1 overflow-hidden flex flex-col gap-4">
               {/* Summary stats */}
@@ -22,6 +22,7 @@ from teamarr.api.routes import (
     health,
     keywords,
     linear_epg,
+    metrics,
     migration,
     presets,
     settings,
@@ -129,6 +130,18 @@ def _run_ufc_segment_migration(db_factory, migration_name: str = "ufc_segment_fi
         logger.warning("[MIGRATION] %s failed: %s", migration_name, e)
 
 
+def _refresh_cache_in_background(cache_service, league_mapping_service) -> None:
+    """Refresh stale parts of an existing team/league cache after startup."""
+    try:
+        if cache_service.refresh_if_needed(max_age_days=1):
+            league_mapping_service.reload()
+            logger.info("[STARTUP] Team/league cache refreshed in background")
+        else:
+            logger.info("[STARTUP] Team/league cache is fresh")
+    except Exception as e:
+        logger.warning("[STARTUP] Background cache refresh failed: %s", e)
+
+
 def _run_startup_tasks():
     """Run startup tasks in background thread."""
     from teamarr.database import get_db
@@ -167,11 +180,20 @@ def _run_startup_tasks():
         if skip_cache:
             logger.info("[STARTUP] Cache refresh skipped (SKIP_CACHE_REFRESH set)")
         else:
-            startup_state.set_phase(StartupPhase.REFRESHING_CACHE)
             cache_service = create_cache_service(get_db)
-            logger.info("[STARTUP] Refreshing team/league cache on startup...")
-            cache_service.refresh()
-            logger.info("[STARTUP] Team/league cache refreshed")
+            if cache_service.get_stats().is_empty:
+                startup_state.set_phase(StartupPhase.REFRESHING_CACHE)
+                logger.info("[STARTUP] Team/league cache empty, refreshing...")
+                cache_service.refresh()
+                logger.info("[STARTUP] Team/league cache refreshed")
+            else:
+                # Serve the existing cache now; only stale leagues are refetched
+                threading.Thread(
+                    target=_refresh_cache_in_background,
+                    args=(cache_service, league_mapping_service),
+                    name="CacheRefresh",
+                    daemon=True,
+                ).start()
 
         # Reload league mapping service to pick up new league names from cache
         league_mapping_service.reload()
@@ -361,6 +383,7 @@ def create_app() -> FastAPI:
     app.include_router(dispatcharr.router, prefix="/api/v1", tags=["Dispatcharr"])
     app.include_router(migration.router, prefix="/api/v1", tags=["Migration"])
     app.include_router(backup.router, prefix="/api/v1", tags=["Backup"])
+    app.include_router(metrics.router, prefix="/api/v1", tags=["Metrics"])
     app.include_router(detection_keywords.router, tags=["Detection Keywords"])
 
     # Serve React UI static files
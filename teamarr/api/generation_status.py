@@ -2,11 +2,17 @@
 
 Provides global state for tracking EPG generation progress,
 used by both SSE streaming and polling endpoints.
+
+Progress updates are published lock-free and coalesced per phase; the
+polling endpoint and every SSE subscriber read the same folded snapshot,
+and SSE streams are emitted at a capped rate.
 """
 
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import count
 from threading import Lock
 from typing import Any
 
@@ -23,6 +29,8 @@ class GenerationStatus:
     current: int = 0
     total: int = 0
     item_name: str = ""
+    # Per-phase progress for phases that run concurrently (e.g. teams + groups)
+    phases: dict[str, dict[str, Any]] = field(default_factory=dict)
     started_at: datetime | None = None
     completed_at: datetime | None = None
     error: str | None = None
@@ -39,6 +47,7 @@ class GenerationStatus:
             "current": self.current,
             "total": self.total,
             "item_name": self.item_name,
+            "phases": {name: dict(p) for name, p in self.phases.items()},
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "error": self.error,
@@ -55,6 +64,7 @@ class GenerationStatus:
         self.current = 0
         self.total = 0
         self.item_name = ""
+        self.phases = {}
         self.started_at = None
         self.completed_at = None
         self.error = None
@@ -65,13 +75,69 @@ class GenerationStatus:
 _status = GenerationStatus()
 _status_lock = Lock()
 
+# Maximum rate at which subscribers (SSE streams) are sent new snapshots
+PROGRESS_MAX_RATE_HZ = 10
+# Send an SSE heartbeat after this many seconds without a snapshot
+HEARTBEAT_INTERVAL = 0.5
+
+# Progress bus: publishers (generation threads) record the latest update per
+# phase without taking a lock; readers fold pending updates into _status.
+# Each entry is phase -> (sequence number, fields). Plain dict assignment and
+# next() on itertools.count are atomic under the GIL.
+_pending: dict[str, tuple[int, dict[str, Any]]] = {}
+_sequence = count(1)
+_folded_seq = 0
+_version = 0  # Bumped whenever the folded snapshot changes
+
+
+def _fold_pending() -> None:
+    """Apply pending progress updates to _status in publish order.
+
+    Caller must hold _status_lock. Updates published outside a run (e.g.
+    stragglers after completion) are ignored.
+    """
+    global _folded_seq, _version
+    if not _status.in_progress:
+        return
+    updates = sorted(
+        (entry for entry in list(_pending.items()) if entry[1][0] > _folded_seq),
+        key=lambda entry: entry[1][0],
+    )
+    for phase, (seq, fields) in updates:
+        _folded_seq = max(_folded_seq, seq)
+        for name, value in fields.items():
+            if name == "percent":
+                # Never allow progress to go backwards
+                if value > _status.percent:
+                    _status.percent = value
+            else:
+                setattr(_status, name, value)
+        if phase:
+            # Track each phase separately so overlapping phases stay visible
+            entry = _status.phases.setdefault(phase, {"current": 0, "total": 0, "message": ""})
+            if fields.get("total"):
+                entry["current"] = fields.get("current") or 0
+                entry["total"] = fields["total"]
+            if "message" in fields:
+                entry["message"] = fields["message"]
+    if updates:
+        _version += 1
+
 
 def get_status() -> dict:
     """Get current generation status as dict."""
     with _status_lock:
+        _fold_pending()
         return _status.to_dict()
 
 
+def _snapshot() -> tuple[int, bool, dict]:
+    """Fold pending updates and return (version, in_progress, status dict)."""
+    with _status_lock:
+        _fold_pending()
+        return _version, _status.in_progress, _status.to_dict()
+
+
 def is_in_progress() -> bool:
     """Check if generation is in progress."""
     with _status_lock:
@@ -83,9 +149,13 @@ def start_generation() -> bool:
 
     Returns False if already in progress.
     """
+    global _folded_seq, _version
     with _status_lock:
         if _status.in_progress:
             return False
+        _pending.clear()
+        _folded_seq = next(_sequence)
+        _version += 1
         _status.reset()
         _status.in_progress = True
         _status.status = "starting"
@@ -104,33 +174,80 @@ def update_status(
     total: int | None = None,
     item_name: str | None = None,
 ) -> None:
-    """Update generation status.
+    """Publish a progress update.
+
+    Lock-free and O(1): only the latest update per phase is kept until a
+    reader (status poll or SSE stream) folds it into the shared snapshot, so
+    per-stream callbacks don't pay for locking or serialization.
 
     Progress percentage is monotonically increasing - once set to a value,
     it cannot go backwards. This prevents display glitches from race conditions.
     """
-    with _status_lock:
-        if status is not None:
-            _status.status = status
-        if message is not None:
-            _status.message = message
-        if percent is not None:
-            # Never allow progress to go backwards
-            if percent > _status.percent:
-                _status.percent = percent
-        if phase is not None:
-            _status.phase = phase
-        if current is not None:
-            _status.current = current
-        if total is not None:
-            _status.total = total
-        if item_name is not None:
-            _status.item_name = item_name
+    fields = {
+        name: value
+        for name, value in (
+            ("status", status),
+            ("message", message),
+            ("percent", percent),
+            ("phase", phase),
+            ("current", current),
+            ("total", total),
+            ("item_name", item_name),
+        )
+        if value is not None
+    }
+    key = phase or ""
+    previous = _pending.get(key)
+    if previous is not None:
+        # Coalesce partial updates for the same phase (later values win)
+        fields = {**previous[1], **fields}
+    _pending[key] = (next(_sequence), fields)
+
+
+def iter_status_updates(
+    max_rate_hz: float = PROGRESS_MAX_RATE_HZ,
+) -> Iterator[dict | None]:
+    """Yield status snapshots while generation is in progress.
+
+    Emits at most max_rate_hz snapshots per second, and only when something
+    changed; intermediate updates are coalesced. Yields None as a heartbeat
+    when nothing changed for HEARTBEAT_INTERVAL seconds. Any number of
+    subscribers can iterate concurrently - they all read the same snapshot.
+    Stops once generation is no longer in progress.
+    """
+    interval = 1.0 / max_rate_hz
+    last_version = -1
+    last_emit = time.monotonic()
+    while True:
+        version, in_progress, snapshot = _snapshot()
+        if not in_progress:
+            return
+        now = time.monotonic()
+        if version != last_version:
+            last_version = version
+            last_emit = now
+            yield snapshot
+        elif now - last_emit >= HEARTBEAT_INTERVAL:
+            last_emit = now
+            yield None
+        time.sleep(interval)
+
+
+def _close_pending() -> None:
+    """Fold outstanding updates, then ignore any published after this point.
+
+    Caller must hold _status_lock.
+    """
+    global _folded_seq, _version
+    _fold_pending()
+    _folded_seq = next(_sequence)
+    _version += 1
 
 
 def complete_generation(result: dict) -> None:
     """Mark generation as complete."""
     with _status_lock:
+        _close_pending()
         _status.in_progress = False
         _status.status = "complete"
         _status.message = "EPG generation complete"
@@ -142,6 +259,7 @@ def complete_generation(result: dict) -> None:
 def fail_generation(error: str) -> None:
     """Mark generation as failed."""
     with _status_lock:
+        _close_pending()
         _status.in_progress = False
         _status.status = "error"
         _status.message = f"Error: {error}"
@@ -2,6 +2,8 @@
 
 Provides endpoints for cache management:
 - GET /cache/status - Get cache statistics
+- GET /cache/providers - Provider response cache hit rates and sizes
+- DELETE /cache/providers/{provider} - Clear one provider's response cache
 - POST /cache/refresh - Trigger cache refresh (SSE streaming)
 - GET /cache/refresh/status - Get refresh progress
 - GET /cache/leagues - List cached leagues
@@ -14,7 +16,7 @@ import logging
 import queue
 import threading
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from teamarr.api.cache_refresh_status import (
@@ -27,6 +29,11 @@ from teamarr.api.cache_refresh_status import (
 )
 from teamarr.database import get_db
 from teamarr.services import create_cache_service
+from teamarr.utilities.cache import (
+    PROVIDER_CACHE_MAX_BYTES,
+    get_provider_response_cache,
+    provider_response_cache_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +59,35 @@ def get_cache_status() -> dict:
         "is_empty": stats.is_empty,
         "refresh_in_progress": stats.refresh_in_progress,
         "last_error": stats.last_error,
+        "provider_caches": provider_response_cache_stats(),
     }
 
 
+@router.get("/providers")
+def get_provider_cache_stats() -> dict:
+    """Get persistent provider response cache statistics.
+
+    Returns:
+        Per provider (tsdb, hockeytech, cricbuzz): hits (memory and
+        SQLite), misses, hit rate, stored entries and bytes (compressed
+        and raw), and the size cap
+    """
+    return {"providers": provider_response_cache_stats()}
+
+
+@router.delete("/providers/{provider}")
+def clear_provider_cache(provider: str) -> dict:
+    """Clear one provider's persistent response cache.
+
+    The next requests go to the provider again (for TSDB that spends
+    rate budget).
+    """
+    if provider not in PROVIDER_CACHE_MAX_BYTES:
+        raise HTTPException(status_code=404, detail=f"Unknown provider: {provider}")
+    get_provider_response_cache(provider).clear()
+    return {"success": True, "provider": provider}
+
+
 @router.get("/refresh/status")
 def get_refresh_progress() -> dict:
     """Get current cache refresh progress.
@@ -12,6 +12,7 @@ from fastapi import APIRouter, HTTPException
 
 from teamarr.database import get_db
 from teamarr.dispatcharr.factory import get_dispatcharr_connection
+from teamarr.dispatcharr.managers.metadata import CHANNEL_GROUPS, CHANNEL_PROFILES
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,8 @@ def list_m3u_accounts() -> list[dict]:
     if not conn:
         raise HTTPException(status_code=503, detail="Dispatcharr not configured or unavailable")
 
+    # Live call: status and updated_at change with every refresh, so the
+    # cached metadata list would show them stale
     accounts = conn.m3u.list_accounts(include_custom=False)
     return [
         {
@@ -57,7 +60,7 @@ def list_m3u_groups(account_id: int) -> list[dict]:
         raise HTTPException(status_code=503, detail="Dispatcharr not configured or unavailable")
 
     # Get all groups first
-    all_groups = conn.m3u.list_groups()
+    all_groups = conn.metadata.list_groups()
 
     # Get streams filtered by account to find groups with streams from this account
     # Note: This is an approximation - Dispatcharr may not directly support
@@ -141,7 +144,7 @@ def list_channel_groups(exclude_m3u: bool = True) -> list[dict]:
     if not conn:
         raise HTTPException(status_code=503, detail="Dispatcharr not configured or unavailable")
 
-    groups = conn.m3u.list_groups(exclude_m3u=exclude_m3u)
+    groups = conn.metadata.list_groups(exclude_m3u=exclude_m3u)
     return [
         {
             "id": g.id,
@@ -170,6 +173,7 @@ def create_channel_group(name: str) -> dict:
         logger.warning("[FAILED] Create channel group name=%s error=%s", name, result.error)
         raise HTTPException(status_code=400, detail=result.error)
 
+    conn.metadata.invalidate(CHANNEL_GROUPS)
     logger.info("[CREATED] Channel group in Dispatcharr name=%s", name)
     return result.data
 
@@ -185,7 +189,7 @@ def list_channel_profiles() -> list[dict]:
     if not conn:
         raise HTTPException(status_code=503, detail="Dispatcharr not configured or unavailable")
 
-    profiles = conn.channels.list_profiles()
+    profiles = conn.metadata.list_profiles()
     return [
         {
             "id": p.id,
@@ -214,6 +218,7 @@ def create_channel_profile(name: str) -> dict:
         logger.warning("[FAILED] Create channel profile name=%s error=%s", name, result.error)
         raise HTTPException(status_code=400, detail=result.error)
 
+    conn.metadata.invalidate(CHANNEL_PROFILES)
     logger.info("[CREATED] Channel profile in Dispatcharr name=%s", name)
     return result.data
 
@@ -231,7 +236,7 @@ def list_stream_profiles() -> list[dict]:
     if not conn:
         raise HTTPException(status_code=503, detail="Dispatcharr not configured or unavailable")
 
-    profiles = conn.channels.list_stream_profiles()
+    profiles = conn.metadata.list_stream_profiles()
     return [
         {
             "id": p.id,
@@ -2,19 +2,21 @@
 
 import json
 import logging
-import queue
 import threading
 from datetime import date, datetime
+from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response, StreamingResponse
 
+from teamarr.api.conditional import etag_matches, not_modified
 from teamarr.api.dependencies import get_sports_service
 from teamarr.api.generation_status import (
     complete_generation,
     fail_generation,
     get_status,
     is_in_progress,
+    iter_status_updates,
     start_generation,
     update_status,
 )
@@ -50,9 +52,28 @@ router = APIRouter()
 # =============================================================================
 
 
+def _get_dispatcharr_client():
+    """Dispatcharr connection for generation, or None if not configured.
+
+    Must use get_dispatcharr_connection() to get DispatcharrConnection
+    with .m3u, .channels, .epg managers (not just the client).
+    """
+    from teamarr.database.settings import get_dispatcharr_settings
+    from teamarr.dispatcharr import get_dispatcharr_connection
+
+    with get_db() as conn:
+        dispatcharr_settings = get_dispatcharr_settings(conn)
+
+    if dispatcharr_settings.enabled and dispatcharr_settings.url:
+        return get_dispatcharr_connection(get_db)
+    return None
+
+
 @router.post("/epg/generate", response_model=EPGGenerateResponse)
 def generate_epg(
-    request: EPGGenerateRequest,
+    request: EPGGenerateRequest | None = None,
+    group_id: int | None = Query(None, description="Regenerate only this event group"),
+    team_id: int | None = Query(None, description="Regenerate only this team"),
     service: SportsDataService = Depends(get_sports_service),
 ):
     """Generate full EPG using the unified generation workflow.
@@ -64,21 +85,17 @@ def generate_epg(
     - Dispatcharr integration
     - Channel lifecycle (deletions, reconciliation, cleanup)
 
+    With group_id or team_id, only that unit is reprocessed and spliced
+    into the existing guide (see run_scoped_generation).
+
     For real-time progress, use GET /epg/generate/stream instead.
     """
     from teamarr.consumers.generation import run_full_generation
-    from teamarr.database.settings import get_dispatcharr_settings
-    from teamarr.dispatcharr import get_dispatcharr_connection
 
-    # Get Dispatcharr connection if configured (not just client)
-    # Must use get_dispatcharr_connection() to get DispatcharrConnection
-    # with .m3u, .channels, .epg managers
-    with get_db() as conn:
-        dispatcharr_settings = get_dispatcharr_settings(conn)
+    if group_id is not None or team_id is not None:
+        return _generate_scoped(group_id, team_id)
 
-    dispatcharr_client = None
-    if dispatcharr_settings.enabled and dispatcharr_settings.url:
-        dispatcharr_client = get_dispatcharr_connection(get_db)
+    dispatcharr_client = _get_dispatcharr_client()
 
     # Check if generation is already running (sync with status endpoint)
     if not start_generation():
@@ -180,6 +197,45 @@ def generate_epg(
     )
 
 
+def _generate_scoped(group_id: int | None, team_id: int | None) -> EPGGenerateResponse:
+    """Regenerate one group or team and splice it into the guide."""
+    from teamarr.consumers.generation import run_scoped_generation
+
+    if group_id is not None and team_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specify group_id or team_id, not both",
+        )
+
+    logger.info(
+        "[STARTED] Scoped EPG generation via API (%s)",
+        f"group {group_id}" if group_id is not None else f"team {team_id}",
+    )
+    result = run_scoped_generation(
+        db_factory=get_db,
+        group_id=group_id,
+        team_id=team_id,
+        dispatcharr_client=_get_dispatcharr_client(),
+    )
+
+    if not result.success:
+        error = result.error or "Generation failed"
+        if error.endswith("not found"):
+            code = status.HTTP_404_NOT_FOUND
+        elif error.endswith("in progress"):
+            code = status.HTTP_409_CONFLICT
+        else:
+            code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        raise HTTPException(status_code=code, detail=error)
+
+    return EPGGenerateResponse(
+        programmes_count=result.programmes_total,
+        teams_processed=result.teams_processed,
+        events_processed=result.groups_programmes,
+        duration_seconds=result.duration_seconds,
+    )
+
+
 @router.get("/epg/generate/status")
 def get_generation_status():
     """Get current EPG generation status for polling-based progress.
@@ -231,9 +287,6 @@ def generate_epg_stream():
             media_type="text/event-stream",
         )
 
-    # Queue for progress updates (used by SSE stream if client reads it)
-    progress_queue: queue.Queue = queue.Queue()
-
     def run_generation():
         """Run EPG generation in background thread."""
         try:
@@ -245,7 +298,7 @@ def generate_epg_stream():
             if dispatcharr_settings.enabled and dispatcharr_settings.url:
                 dispatcharr_client = get_dispatcharr_connection(get_db)
 
-            # Progress callback that updates status and queues for SSE
+            # Progress callback publishes to the status bus (read by SSE and polling)
             def progress_callback(
                 phase: str,
                 percent: int,
@@ -263,7 +316,6 @@ def generate_epg_stream():
                     total=total,
                     item_name=item_name,
                 )
-                progress_queue.put(get_status())
 
             # Run unified generation
             result = run_full_generation(
@@ -302,14 +354,8 @@ def generate_epg_stream():
             else:
                 fail_generation(result.error or "Unknown error")
 
-            progress_queue.put(get_status())
-
         except Exception as e:
             fail_generation(str(e))
-            progress_queue.put(get_status())
-
-        finally:
-            progress_queue.put({"_done": True})
 
     # Start generation thread IMMEDIATELY (before returning response)
     # This ensures generation runs even if client doesn't read SSE stream
@@ -321,19 +367,13 @@ def generate_epg_stream():
         # Send initial status immediately
         yield f"data: {json.dumps(get_status())}\n\n"
 
-        # Stream progress updates
-        while True:
-            try:
-                data = progress_queue.get(timeout=0.5)
-
-                if data.get("_done"):
-                    break
-
-                yield f"data: {json.dumps(data)}\n\n"
-
-            except queue.Empty:
+        # Stream coalesced progress snapshots (rate-limited) until generation ends
+        for data in iter_status_updates():
+            if data is None:
                 # Send heartbeat to keep connection alive
                 yield ": heartbeat\n\n"
+            else:
+                yield f"data: {json.dumps(data)}\n\n"
 
         # Wait for thread to complete
         generation_thread.join(timeout=5)
@@ -353,22 +393,22 @@ def generate_epg_stream():
 
 
 @router.get("/epg/xmltv")
-def get_xmltv():
+def get_xmltv(request: Request):
     """Serve the most recently generated EPG file.
 
     Returns the combined XMLTV file from the last EPG generation.
-    Use /epg/generate to create/update the EPG.
+    Use /epg/generate to create/update the EPG. Supports If-None-Match:
+    unchanged guides return 304 without a body.
 
     Dispatcharr EPG source URL: http://teamarr:9195/api/v1/epg/xmltv
     """
-    from pathlib import Path
-
     from fastapi.responses import FileResponse
 
     from teamarr.database.settings import get_epg_settings
 
     with get_db() as conn:
         epg_settings = get_epg_settings(conn)
+        artifact = _current_full_artifact(conn, epg_settings.epg_output_path)
 
     output_path = epg_settings.epg_output_path or "./data/teamarr.xml"
     file_path = Path(output_path)
@@ -379,10 +419,17 @@ def get_xmltv():
             detail="EPG file not found. Run EPG generation first.",
         )
 
+    headers = {}
+    if artifact:
+        if etag_matches(request, artifact.etag):
+            return not_modified(artifact.etag)
+        headers = {"ETag": artifact.etag, "Cache-Control": "no-cache"}
+
     return FileResponse(
         path=file_path,
         media_type="application/xml",
         filename="teamarr.xml",
+        headers=headers,
     )
 
 
@@ -546,8 +593,6 @@ def _get_combined_xmltv() -> str:
     Uses the same file that's served to users via /epg/xmltv endpoint,
     guaranteeing consistency between preview and actual output.
     """
-    from pathlib import Path
-
     from teamarr.database.settings import get_epg_settings
 
     with get_db() as conn:
@@ -560,148 +605,39 @@ def _get_combined_xmltv() -> str:
     return output_path.read_text(encoding="utf-8")
 
 
+def _current_full_artifact(conn, output_path: str | None):
+    """Artifact for the served EPG file, if generation wrote the file on disk now.
+
+    Returns None when the output path changed or the file was modified
+    since the last full generation, so callers fall back to the file itself.
+    """
+    from teamarr.database.xmltv_artifacts import SCOPE_FULL, get_xmltv_artifact
+
+    if not output_path:
+        return None
+    artifact = get_xmltv_artifact(conn, SCOPE_FULL)
+    if not artifact or Path(artifact.path) != Path(output_path).absolute():
+        return None
+    return artifact if artifact.is_current() else None
+
+
 def _analyze_xmltv(xmltv_content: str) -> dict:
     """Analyze XMLTV content for issues."""
-    import re
     import xml.etree.ElementTree as ET
-    from collections import defaultdict
-
-    result = {
-        "channels": {"total": 0, "team_based": 0, "event_based": 0},
-        "programmes": {
-            "total": 0,
-            "events": 0,
-            "pregame": 0,
-            "postgame": 0,
-            "idle": 0,
-        },
-        "date_range": {"start": None, "end": None},
-        "unreplaced_variables": [],
-        "coverage_gaps": [],
-    }
+
+    from teamarr.utilities.xmltv import analyze_xmltv_tree, empty_xmltv_analysis
 
     if not xmltv_content:
-        return result
+        return empty_xmltv_analysis()
 
     try:
         # Parse with comments
         parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
         root = ET.fromstring(xmltv_content, parser=parser)
     except ET.ParseError:
-        return result
-
-    # Count channels
-    channels = root.findall("channel")
-    result["channels"]["total"] = len(channels)
-    for ch in channels:
-        ch_id = ch.get("id", "")
-        if ch_id.startswith("teamarr-event-"):
-            result["channels"]["event_based"] += 1
-        else:
-            result["channels"]["team_based"] += 1
-
-    # Analyze programmes
-    programmes = root.findall("programme")
-    result["programmes"]["total"] = len(programmes)
-
-    # Track programmes per channel for gap detection
-    channel_programmes: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
-    unreplaced_vars: set[str] = set()
-    var_pattern = re.compile(r"\{[a-z_]+\}")
-
-    min_start = None
-    max_stop = None
-
-    for prog in programmes:
-        channel_id = prog.get("channel", "")
-        start = prog.get("start", "")
-        stop = prog.get("stop", "")
-
-        # Track date range
-        if start:
-            start_date = start[:8]
-            if min_start is None or start_date < min_start:
-                min_start = start_date
-        if stop:
-            stop_date = stop[:8]
-            if max_stop is None or stop_date > max_stop:
-                max_stop = stop_date
-
-        # Get text content for variable checking
-        title = prog.findtext("title", "") or ""
-        subtitle = prog.findtext("sub-title", "") or ""
-        desc = prog.findtext("desc", "") or ""
-
-        # Check for programme type from filler comment (V1 compatibility)
-        # Comments look like: <!-- teamarr:filler-pregame -->
-        filler_type = None
-        for child in prog:
-            if callable(child.tag):  # This is a Comment
-                comment_text = child.text or ""
-                if comment_text.startswith("teamarr:filler-"):
-                    filler_type = comment_text.replace("teamarr:filler-", "")
-                    break
-
-        if filler_type == "pregame":
-            result["programmes"]["pregame"] += 1
-        elif filler_type == "postgame":
-            result["programmes"]["postgame"] += 1
-        elif filler_type == "idle":
-            result["programmes"]["idle"] += 1
-        else:
-            result["programmes"]["events"] += 1
-
-        for text in [title, subtitle, desc]:
-            if text:
-                matches = var_pattern.findall(text)
-                unreplaced_vars.update(matches)
-
-        # Store for gap detection
-        if channel_id and start and stop:
-            channel_programmes[channel_id].append((start, stop, title or "Unknown"))
-
-    result["unreplaced_variables"] = sorted(unreplaced_vars)
-    result["date_range"]["start"] = min_start
-    result["date_range"]["end"] = max_stop
-
-    # Detect coverage gaps (> 5 minute gap between programmes)
-    from datetime import datetime
-
-    for channel_id, progs in channel_programmes.items():
-        # Sort by start time
-        progs.sort(key=lambda x: x[0])
-
-        for i in range(len(progs) - 1):
-            _, stop1, title1 = progs[i]
-            start2, _, title2 = progs[i + 1]
-
-            # Parse times (format: YYYYMMDDHHmmss +ZZZZ)
-            try:
-                stop1_time = stop1[:14]
-                start2_time = start2[:14]
-
-                fmt = "%Y%m%d%H%M%S"
-                dt_stop = datetime.strptime(stop1_time, fmt)
-                dt_start = datetime.strptime(start2_time, fmt)
-
-                gap_seconds = (dt_start - dt_stop).total_seconds()
-                gap_minutes = int(gap_seconds / 60)
-
-                if gap_minutes > 5:  # More than 5 minute gap
-                    result["coverage_gaps"].append(
-                        {
-                            "channel": channel_id,
-                            "after_program": title1[:50],
-                            "before_program": title2[:50],
-                            "after_stop": stop1,
-                            "before_start": start2,
-                            "gap_minutes": gap_minutes,
-                        }
-                    )
-            except (ValueError, TypeError):
-                continue
+        return empty_xmltv_analysis()
 
-    return result
+    return analyze_xmltv_tree(root)
 
 
 @router.get("/epg/analysis")
@@ -715,8 +651,15 @@ def get_epg_analysis():
     - Unreplaced template variables
     - Coverage gaps between programmes
     """
-    xmltv = _get_combined_xmltv()
-    result = _analyze_xmltv(xmltv)
+    from teamarr.database.settings import get_epg_settings
+
+    # Precomputed by the last full generation; parse only if the file changed since
+    with get_db() as conn:
+        artifact = _current_full_artifact(conn, get_epg_settings(conn).epg_output_path)
+    if artifact and artifact.analysis:
+        result = artifact.analysis
+    else:
+        result = _analyze_xmltv(_get_combined_xmltv())
 
     # Override programme counts with stats from latest full_epg processing run
     # (XML comments may not survive serialization, so use DB stats instead)
@@ -985,58 +928,41 @@ def search_events(
 
     Returns events matching the search criteria. Use this to find the
     correct event when manually correcting a failed or incorrect match.
+
+    Searches every event already in the service cache (all leagues), ranked
+    by how well the team name matches. Only an explicitly requested league
+    is fetched from its provider, and only if its scoreboard isn't cached.
     """
     from teamarr.database.leagues import get_all_leagues
 
     target = _parse_date(target_date) if target_date else date.today()
-    results: list[EventSearchResult] = []
 
     # Get league info for display names
     with get_db() as conn:
         all_leagues = {lg["league_code"]: lg for lg in get_all_leagues(conn)}
 
-    # If league specified, search only that league
     if league:
-        leagues_to_search = [league]
-    else:
-        # Search top leagues (limit to prevent too many API calls)
-        leagues_to_search = ["nfl", "nba", "nhl", "mlb", "eng.1", "mls"]
-
-    for lg in leagues_to_search:
+        # Cache hit unless this league/day was never fetched
         try:
-            events = service.get_events(lg, target)
+            service.get_events(league, target)
         except Exception as e:
-            logger.debug("[EPG] Event search failed for league=%s: %s", lg, e)
-            continue
-
-        for event in events:
-            # Filter by team name if specified
-            if team:
-                team_lower = team.lower()
-                home_name = event.home_team.name.lower() if event.home_team else ""
-                away_name = event.away_team.name.lower() if event.away_team else ""
-                if team_lower not in home_name and team_lower not in away_name:
-                    continue
-
-            lg_info = all_leagues.get(lg, {})
-            results.append(
-                EventSearchResult(
-                    event_id=event.id,
-                    event_name=event.name,
-                    league=lg,
-                    league_name=lg_info.get("display_name"),
-                    start_time=event.start_time.isoformat(),
-                    home_team=event.home_team.name if event.home_team else None,
-                    away_team=event.away_team.name if event.away_team else None,
-                    status=event.status.state if event.status else None,
-                )
-            )
-
-            if len(results) >= limit:
-                break
-
-        if len(results) >= limit:
-            break
+            logger.debug("[EPG] Event search failed for league=%s: %s", league, e)
+
+    results = [
+        EventSearchResult(
+            event_id=event.event_id,
+            event_name=event.event_name,
+            league=event.league,
+            league_name=all_leagues.get(event.league, {}).get("display_name"),
+            start_time=event.start_time,
+            home_team=event.home_team,
+            away_team=event.away_team,
+            status=event.status,
+        )
+        for event in service.search_cached_events(
+            team=team, target_date=target, league=league, limit=limit
+        )
+    ]
 
     return {
         "count": len(results),
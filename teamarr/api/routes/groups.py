@@ -7,12 +7,15 @@ Provides REST API for:
 """
 
 import logging
+import threading
+import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from pydantic import BaseModel, Field, field_validator
 
+from teamarr.api.conditional import etag_matches, not_modified
 from teamarr.database import get_db
 
 logger = logging.getLogger(__name__)
@@ -580,7 +583,7 @@ def list_groups(
         try:
             dispatcharr = get_dispatcharr_connection(get_db)
             if dispatcharr:
-                accounts = dispatcharr.m3u.list_accounts()
+                accounts = dispatcharr.metadata.list_accounts()
                 m3u_account_names = {a.id: a.name for a in accounts}
         except Exception:
             pass  # Fall back to stored names if Dispatcharr unavailable
@@ -1173,7 +1176,7 @@ def get_group_by_id(group_id: int):
         try:
             dispatcharr = get_dispatcharr_connection(get_db)
             if dispatcharr:
-                accounts = dispatcharr.m3u.list_accounts()
+                accounts = dispatcharr.metadata.list_accounts()
                 for a in accounts:
                     if a.id == group.m3u_account_id:
                         m3u_account_name = a.name
@@ -1671,7 +1674,7 @@ def list_m3u_groups():
         )
 
     try:
-        groups = conn.m3u.list_groups()
+        groups = conn.metadata.list_groups()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1707,7 +1710,7 @@ def list_dispatcharr_channel_groups() -> dict:
         )
 
     try:
-        groups = conn.m3u.list_groups()
+        groups = conn.metadata.list_groups()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1756,39 +1759,29 @@ class PreviewGroupResponse(BaseModel):
     filtered_exclude_regex: int = 0
     cache_hits: int = 0
     cache_misses: int = 0
+    snapshot_at: str | None = None  # Set when answered from the last stream snapshot
+    rematched_count: int | None = None  # Streams re-matched (new/renamed since snapshot)
     streams: list[PreviewStreamModel]
     errors: list[str]
 
 
-@router.get("/{group_id}/preview", response_model=PreviewGroupResponse)
-def preview_group(group_id: int):
-    """Preview stream matching for a group without creating channels.
+class PreviewJobResponse(BaseModel):
+    """Background full preview (?refresh=true)."""
 
-    Fetches streams from Dispatcharr, filters them, matches them to events,
-    but does NOT create channels or generate EPG.
-    """
-    from datetime import date
+    job_id: str
+    group_id: int
+    status: str  # running, completed, failed
+    result: PreviewGroupResponse | None = None
+    error: str | None = None
 
-    from teamarr.database.groups import get_group
-    from teamarr.dispatcharr import get_factory
-    from teamarr.services import create_group_service
 
-    with get_db() as conn:
-        group = get_group(conn, group_id)
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+# Full-refresh preview jobs, newest last (bounded: finished jobs are pruned)
+_preview_jobs: dict[str, dict] = {}
+_preview_jobs_lock = threading.Lock()
+_MAX_PREVIEW_JOBS = 20
 
-    # Get Dispatcharr connection (has m3u manager)
-    factory = get_factory(get_db)
-    conn = factory.get_connection() if factory else None
-
-    # Preview the group
-    group_service = create_group_service(get_db, conn)
-    result = group_service.preview_group(group_id, date.today())
 
+def _preview_response(result) -> PreviewGroupResponse:
     return PreviewGroupResponse(
         group_id=result.group_id,
         group_name=result.group_name,
@@ -1802,6 +1795,8 @@ def preview_group(group_id: int):
         filtered_exclude_regex=result.filtered_exclude_regex,
         cache_hits=result.cache_hits,
         cache_misses=result.cache_misses,
+        snapshot_at=result.snapshot_at,
+        rematched_count=result.rematched_count,
         streams=[
             PreviewStreamModel(
                 stream_id=s.stream_id,
@@ -1822,6 +1817,104 @@ def preview_group(group_id: int):
     )
 
 
+def _preview_job_response(job_id: str, job: dict) -> PreviewJobResponse:
+    return PreviewJobResponse(
+        job_id=job_id,
+        group_id=job["group_id"],
+        status=job["status"],
+        result=job.get("result"),
+        error=job.get("error"),
+    )
+
+
+def _start_preview_job(group_service, group_id: int, target_date) -> PreviewJobResponse:
+    """Run the full preview (M3U refresh, stream fetch, matching) in the background."""
+    job_id = uuid.uuid4().hex
+    job: dict[str, Any] = {"group_id": group_id, "status": "running"}
+    with _preview_jobs_lock:
+        # Drop the oldest finished jobs; running ones are kept until they finish
+        finished = [k for k, v in _preview_jobs.items() if v["status"] != "running"]
+        for key in finished[: max(0, len(_preview_jobs) - _MAX_PREVIEW_JOBS + 1)]:
+            del _preview_jobs[key]
+        _preview_jobs[job_id] = job
+
+    def run():
+        try:
+            result = group_service.preview_group(group_id, target_date)
+            job["result"] = _preview_response(result)
+            job["status"] = "completed"
+        except Exception as e:
+            logger.exception("[PREVIEW] Full preview failed for group %d", group_id)
+            job["error"] = str(e)
+            job["status"] = "failed"
+
+    threading.Thread(target=run, name=f"group-preview-{group_id}", daemon=True).start()
+    return _preview_job_response(job_id, job)
+
+
+@router.get(
+    "/{group_id}/preview",
+    response_model=PreviewGroupResponse | PreviewJobResponse,
+)
+def preview_group(
+    group_id: int,
+    refresh: bool = Query(
+        False, description="Refresh M3U and refetch streams in the background; returns a job"
+    ),
+):
+    """Preview stream matching for a group without creating channels.
+
+    By default, answers from the streams captured by the last run (or full
+    preview): the group's current filters are re-applied and only streams
+    whose fingerprint or matching settings changed are re-matched
+    (read-only). With refresh=true, or when no run has captured streams
+    yet, the full path (M3U refresh, stream fetch, matching) runs in the
+    background, updates the snapshot and a job is returned - poll
+    GET /{group_id}/preview/jobs/{job_id}.
+
+    Never creates channels or generates EPG.
+    """
+    from datetime import date
+
+    from teamarr.database.groups import get_group, get_group_stream_snapshot
+    from teamarr.dispatcharr import get_factory
+    from teamarr.services import create_group_service
+
+    with get_db() as conn:
+        group = get_group(conn, group_id)
+        if not group:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Group {group_id} not found",
+            )
+        has_snapshot = get_group_stream_snapshot(conn, group_id) is not None
+
+    # Get Dispatcharr connection (has m3u manager)
+    factory = get_factory(get_db)
+    conn = factory.get_connection() if factory else None
+
+    group_service = create_group_service(get_db, conn)
+    if refresh or not has_snapshot:
+        return _start_preview_job(group_service, group_id, date.today())
+
+    return _preview_response(
+        group_service.preview_group(group_id, date.today(), from_snapshot=True)
+    )
+
+
+@router.get("/{group_id}/preview/jobs/{job_id}", response_model=PreviewJobResponse)
+def get_preview_job(group_id: int, job_id: str):
+    """Poll a full-refresh preview started with ?refresh=true."""
+    with _preview_jobs_lock:
+        job = _preview_jobs.get(job_id)
+    if not job or job["group_id"] != group_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Preview job {job_id} not found",
+        )
+    return _preview_job_response(job_id, job)
+
+
 class RawStreamModel(BaseModel):
     """Stream info for regex testing with builtin filter status."""
 
@@ -1926,16 +2019,17 @@ def get_raw_streams(group_id: int):
 
 
 @router.get("/{group_id}/xmltv")
-def get_group_xmltv(group_id: int) -> Response:
+def get_group_xmltv(group_id: int, request: Request) -> Response:
     """Get the stored XMLTV for an event group.
 
     This endpoint serves the XMLTV content that was generated when
     the group was last processed. Dispatcharr can be configured to
-    fetch from this URL.
+    fetch from this URL. Supports If-None-Match (304 when unchanged).
 
     Returns 404 if the group hasn't been processed yet.
     """
     from teamarr.database.groups import get_group, get_group_xmltv_with_metadata
+    from teamarr.database.xmltv_artifacts import xmltv_etag
 
     with get_db() as conn:
         group = get_group(conn, group_id)
@@ -1953,28 +2047,56 @@ def get_group_xmltv(group_id: int) -> Response:
             )
 
     xmltv_content, updated_at = result
+    etag = xmltv_etag(xmltv_content)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     return Response(
         content=xmltv_content,
         media_type="application/xml",
         headers={
             "Content-Disposition": f"inline; filename=teamarr-group-{group_id}.xml",
             "X-Generated-At": updated_at,
+            "ETag": etag,
+            "Cache-Control": "no-cache",
         },
     )
 
 
 @router.get("/xmltv/combined")
-def get_combined_xmltv() -> Response:
+def get_combined_xmltv(request: Request) -> Response:
     """Get combined XMLTV from all enabled event groups.
 
     Merges XMLTV content from all groups that have been processed.
     This is useful for having a single EPG source in Dispatcharr.
+
+    Serves the events guide written by the last full generation while no
+    group's XMLTV has changed since; otherwise merges on the fly.
+    Supports If-None-Match (304 when unchanged).
     """
-    from teamarr.database.groups import get_all_group_xmltv
+    from fastapi.responses import FileResponse
+
+    from teamarr.database.groups import get_all_group_xmltv, get_group_xmltv_source_key
     from teamarr.database.settings import get_display_settings
+    from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, get_xmltv_artifact, xmltv_etag
     from teamarr.utilities.xmltv import merge_xmltv_content
 
+    headers = {"Content-Disposition": "inline; filename=teamarr-events.xml"}
+
     with get_db() as conn:
+        artifact = get_xmltv_artifact(conn, SCOPE_EVENTS)
+        if (
+            artifact
+            and artifact.source_key == get_group_xmltv_source_key(conn)
+            and artifact.is_current()
+        ):
+            if etag_matches(request, artifact.etag):
+                return not_modified(artifact.etag)
+            return FileResponse(
+                path=artifact.path,
+                media_type="application/xml",
+                headers={**headers, "ETag": artifact.etag, "Cache-Control": "no-cache"},
+            )
+
         xmltv_contents = get_all_group_xmltv(conn)
 
         if not xmltv_contents:
@@ -1990,11 +2112,14 @@ def get_combined_xmltv() -> Response:
         generator_name=display_settings.xmltv_generator_name,
         generator_url=display_settings.xmltv_generator_url,
     )
+    etag = xmltv_etag(combined)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     return Response(
         content=combined,
         media_type="application/xml",
-        headers={"Content-Disposition": "inline; filename=teamarr-events.xml"},
+        headers={**headers, "ETag": etag, "Cache-Control": "no-cache"},
     )
 
 
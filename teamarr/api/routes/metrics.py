@@ -0,0 +1,20 @@
+"""Metrics endpoint.
+
+Exposes process-lifetime timing histograms and counters (see
+teamarr.utilities.metrics) in the Prometheus text exposition format.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from teamarr.utilities import metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Get latency histograms and counters in Prometheus text format."""
+    return PlainTextResponse(metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -183,6 +183,7 @@ def get_scheduler_status():
         cron_expression=status.cron_expression,
         last_run=status.last_run.isoformat() if status.last_run else None,
         next_run=status.next_run.isoformat() if status.next_run else None,
+        tasks=status.tasks,
     )
 
 
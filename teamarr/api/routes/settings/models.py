@@ -168,6 +168,7 @@ class SchedulerStatusResponse(BaseModel):
     cron_expression: str | None = None
     last_run: str | None = None
     next_run: str | None = None
+    tasks: list[dict] = []
 
 
 # =============================================================================
@@ -8,10 +8,11 @@ import os
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from teamarr.core import SportsProvider
 from teamarr.database import get_db
+from teamarr.database.team_cache import update_team_search_index
 
 from .queries import TeamLeagueCache
 
@@ -28,6 +29,17 @@ EXPECTED_LEAGUES = {
 }
 
 
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a cache timestamp ("...Z" UTC ISO or SQLite CURRENT_TIMESTAMP) as naive UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
 class CacheRefresher:
     """Refreshes team and league cache from providers."""
 
@@ -40,44 +52,69 @@ class CacheRefresher:
 
     def __init__(self, db_factory: Callable = get_db) -> None:
         self._db = db_factory
+        # league_code -> metadata, loaded in one query per refresh
+        self._league_metadata: dict[str, dict] | None = None
+        # (league_slug, provider) -> last_refreshed, loaded per refresh
+        self._league_refreshed: dict[tuple[str, str], datetime | None] = {}
 
-    def _get_league_metadata(self, league_slug: str) -> dict | None:
-        """Get league metadata from the leagues table.
+    def _load_league_metadata(self) -> dict[str, dict]:
+        """Load metadata for all leagues from the leagues table in one query.
 
         The leagues table is the single source of truth for league display data.
-
-        Returns:
-            Dict with display_name, logo_url, sport, league_id or None
         """
         with self._db() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT display_name, logo_url, sport, league_id
-                FROM leagues WHERE league_code = ?
-                """,
-                (league_slug,),
+            cursor = conn.execute(
+                """SELECT league_code, display_name, logo_url, sport, league_id,
+                          provider, provider_league_id
+                   FROM leagues"""
             )
-            row = cursor.fetchone()
-            if row:
-                return {
+            return {
+                row["league_code"]: {
                     "display_name": row["display_name"],
                     "logo_url": row["logo_url"],
                     "sport": row["sport"],
                     "league_id": row["league_id"],
+                    "provider": row["provider"],
+                    "provider_league_id": row["provider_league_id"],
                 }
-        return None
+                for row in cursor.fetchall()
+            }
+
+    def _get_league_metadata(self, league_slug: str) -> dict | None:
+        """Get league metadata from the leagues table.
+
+        Returns:
+            Dict with display_name, logo_url, sport, league_id, provider,
+            provider_league_id or None
+        """
+        if self._league_metadata is None:
+            self._league_metadata = self._load_league_metadata()
+        return self._league_metadata.get(league_slug)
+
+    @staticmethod
+    def _sport_league(db_metadata: dict | None, provider_name: str) -> tuple[str, str] | None:
+        """(sport, league) API path from a leagues row's "sport/league" provider_league_id."""
+        if not db_metadata or db_metadata.get("provider") != provider_name:
+            return None
+        parts = (db_metadata.get("provider_league_id") or "").split("/", 1)
+        return (parts[0], parts[1]) if len(parts) == 2 else None
 
     def refresh(
         self,
         progress_callback: Callable[[str, int], None] | None = None,
+        max_league_age_days: float | None = None,
     ) -> dict:
-        """Refresh entire cache from all registered providers.
+        """Refresh cache from all registered providers.
 
         Uses ProviderRegistry to discover all providers and fetch their data.
+        Results are applied as a diff (see _save_cache), so the cache stays
+        fully readable while a refresh runs.
 
         Args:
             progress_callback: Optional callback(message, percent)
+            max_league_age_days: Incremental refresh - only rediscover leagues
+                last refreshed longer ago than this (known ESPN soccer leagues
+                are reused instead of re-enumerated). None = full refresh.
 
         Returns:
             Dict with refresh statistics
@@ -85,6 +122,8 @@ class CacheRefresher:
         from teamarr.providers import ProviderRegistry
 
         start_time = time.time()
+        full = max_league_age_days is None
+        stale_before = None if full else datetime.utcnow() - timedelta(days=max_league_age_days)
 
         def report(msg: str, pct: int) -> None:
             if progress_callback:
@@ -92,7 +131,9 @@ class CacheRefresher:
 
         try:
             self._set_refresh_in_progress(True)
-            logger.info("[STARTED] Cache refresh")
+            logger.info("[STARTED] Cache refresh (%s)", "full" if full else "stale leagues")
+            self._league_metadata = self._load_league_metadata()
+            self._league_refreshed = self._load_league_refresh_times()
             report("Starting cache refresh...", 5)
 
             # Collect all teams and leagues
@@ -141,21 +182,27 @@ class CacheRefresher:
                     return callback
 
                 leagues, teams = self._discover_from_provider(
-                    provider, make_progress_callback(start_pct, end_pct)
+                    provider, make_progress_callback(start_pct, end_pct), stale_before
                 )
                 all_leagues.extend(leagues)
                 all_teams.extend(teams)
 
             # Merge TSDB seed data with API results before saving
             # This fills in teams that the free tier API doesn't return
+            discovered = {(lg["league_slug"], lg["provider"]) for lg in all_leagues}
             all_teams, all_leagues = self._merge_with_seed(all_teams, all_leagues)
+            if not full:
+                # Seed covers every TSDB league; keep only the ones refreshed now
+                all_leagues = [
+                    lg for lg in all_leagues if (lg["league_slug"], lg["provider"]) in discovered
+                ]
 
             # Auto-discover Cricbuzz series IDs (yearly updates)
             self._update_cricbuzz_series_ids(progress_callback)
 
             # Save to database (95-100%)
             report(f"Saving {len(all_teams)} teams, {len(all_leagues)} leagues...", 95)
-            self._save_cache(all_teams, all_leagues)
+            saved = self._save_cache(all_teams, all_leagues, full=full)
 
             # Update existing soccer teams with newly discovered leagues
             soccer_updated = self._refresh_soccer_team_leagues()
@@ -164,13 +211,18 @@ class CacheRefresher:
 
             # Update metadata
             duration = time.time() - start_time
-            self._update_meta(len(all_leagues), len(all_teams), duration, None)
+            self._update_meta(
+                saved["leagues_total"], saved["teams_total"], duration, None, full=full
+            )
             self._set_refresh_in_progress(False)
 
             logger.info(
-                "[COMPLETED] Cache refresh: %d leagues, %d teams, %.1fs",
+                "[COMPLETED] Cache refresh: %d leagues, %d teams (+%d ~%d -%d teams), %.1fs",
                 len(all_leagues),
                 len(all_teams),
+                saved["inserted"],
+                saved["updated"],
+                saved["deleted"],
                 duration,
             )
             report(f"Cache refresh complete in {duration:.1f}s", 100)
@@ -195,11 +247,14 @@ class CacheRefresher:
                 "error": str(e),
             }
 
-    def refresh_if_needed(self, max_age_days: int = 7) -> bool:
+    def refresh_if_needed(self, max_age_days: float = 7) -> bool:
         """Refresh cache if stale.
 
+        Empty cache or no full refresh within a week: full refresh.
+        Otherwise only leagues older than max_age_days are rediscovered.
+
         Args:
-            max_age_days: Maximum cache age before refresh
+            max_age_days: Maximum league age before it is refreshed
 
         Returns:
             True if refresh was performed
@@ -212,12 +267,37 @@ class CacheRefresher:
             result = self.refresh()
             return result["success"]
 
+        if self._has_stale_leagues(max_age_days):
+            logger.info("[CACHE_REFRESH] Refreshing leagues older than %s days...", max_age_days)
+            result = self.refresh(max_league_age_days=max_age_days)
+            return result["success"]
+
         return False
 
+    def _load_league_refresh_times(self) -> dict[tuple[str, str], datetime | None]:
+        """Load last_refreshed per (league_slug, provider) from league_cache."""
+        with self._db() as conn:
+            rows = conn.execute(
+                "SELECT league_slug, provider, last_refreshed FROM league_cache"
+            ).fetchall()
+        return {
+            (row["league_slug"], row["provider"]): _parse_timestamp(row["last_refreshed"])
+            for row in rows
+        }
+
+    def _has_stale_leagues(self, max_age_days: float) -> bool:
+        """True if any cached league is older than max_age_days."""
+        stale_before = datetime.utcnow() - timedelta(days=max_age_days)
+        return any(
+            refreshed is None or refreshed < stale_before
+            for refreshed in self._load_league_refresh_times().values()
+        )
+
     def _discover_from_provider(
         self,
         provider: SportsProvider,
         progress_callback: Callable[[str, int], None] | None = None,
+        stale_before: datetime | None = None,
     ) -> tuple[list[dict], list[dict]]:
         """Discover all leagues and teams from a provider.
 
@@ -227,19 +307,33 @@ class CacheRefresher:
         Args:
             provider: The sports provider to discover from
             progress_callback: Optional callback(message, percent)
+            stale_before: If set, only leagues last refreshed before this
+                (or never) are fetched, and ESPN soccer leagues already in
+                league_cache are reused instead of re-enumerated
 
         Returns:
-            (leagues, teams) tuple
+            (leagues, teams) tuple. Leagues whose fetch failed are flagged
+            with "failed": True.
         """
         provider_name = provider.name
         leagues: list[dict] = []
         teams: list[dict] = []
 
         # Get leagues this provider supports
-        supported_leagues = provider.get_supported_leagues()
+        supported_leagues = list(provider.get_supported_leagues())
 
-        # For ESPN, also discover dynamic soccer leagues
-        if provider_name == "espn":
+        if stale_before is not None:
+            refreshed_at = self._league_refreshed
+            for slug, cached_provider in refreshed_at:
+                if cached_provider == provider_name and slug not in supported_leagues:
+                    supported_leagues.append(slug)
+            supported_leagues = [
+                slug
+                for slug in supported_leagues
+                if (refreshed_at.get((slug, provider_name)) or datetime.min) < stale_before
+            ]
+        elif provider_name == "espn":
+            # For ESPN, also discover dynamic soccer leagues
             if progress_callback:
                 progress_callback("Discovering ESPN soccer leagues...", 0)
             soccer_slugs = self._fetch_espn_soccer_league_slugs(progress_callback)
@@ -249,7 +343,10 @@ class CacheRefresher:
                     supported_leagues.append(slug)
 
         if not supported_leagues:
-            logger.info("[CACHE_REFRESH] No leagues found for provider %s", provider_name)
+            if stale_before is None:
+                logger.info("[CACHE_REFRESH] No leagues found for provider %s", provider_name)
+            else:
+                logger.debug("[CACHE_REFRESH] No stale leagues for provider %s", provider_name)
             return [], []
 
         # Build league list with sport info
@@ -272,13 +369,14 @@ class CacheRefresher:
                 league_name = db_metadata["display_name"] if db_metadata else None
                 logo_url = db_metadata["logo_url"] if db_metadata else None
 
-                # Fall back to ESPN API if not in leagues table
-                if (not logo_url or not league_name) and provider_name == "espn":
+                # Fall back to the provider API if not in leagues table
+                # (ESPN: uses the registry instance's pooled client, and the
+                # sport/league path from the metadata loaded above)
+                if (not logo_url or not league_name) and hasattr(provider, "get_league_info"):
                     try:
-                        from teamarr.providers.espn.client import ESPNClient
-
-                        client = ESPNClient()
-                        league_info_api = client.get_league_info(league_slug)
+                        league_info_api = provider.get_league_info(
+                            league_slug, self._sport_league(db_metadata, provider_name)
+                        )
                         if league_info_api:
                             if not logo_url:
                                 logo_url = league_info_api.get("logo_url")
@@ -329,6 +427,7 @@ class CacheRefresher:
                     "league_name": db_metadata["display_name"] if db_metadata else None,
                     "logo_url": db_metadata["logo_url"] if db_metadata else None,
                     "team_count": 0,
+                    "failed": True,
                 }, []
 
         # Fetch in parallel
@@ -404,50 +503,55 @@ class CacheRefresher:
 
         url = "https://sports.core.api.espn.com/v2/sports/soccer/leagues?limit=500"
 
+        # One pooled client for the index and every league ref, so the ~250
+        # parallel lookups reuse keepalive connections instead of each doing
+        # its own DNS lookup and TLS handshake
+        limits = httpx.Limits(
+            max_connections=self.MAX_WORKERS, max_keepalive_connections=self.MAX_WORKERS
+        )
         try:
-            with httpx.Client(timeout=30) as client:
+            with httpx.Client(timeout=30, limits=limits) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
 
-            # Extract league refs and fetch slugs
-            league_refs = data.get("items", [])
-            slugs = []
-            total = len(league_refs)
-            completed = 0
+                # Extract league refs and fetch slugs
+                league_refs = data.get("items", [])
+                slugs = []
+                total = len(league_refs)
+                completed = 0
 
-            def fetch_slug(ref_url: str) -> str | None:
-                try:
-                    with httpx.Client(timeout=10) as client:
-                        resp = client.get(ref_url)
+                def fetch_slug(ref_url: str) -> str | None:
+                    try:
+                        resp = client.get(ref_url, timeout=10)
                         if resp.status_code == 200:
                             return resp.json().get("slug")
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                    logger.debug(
-                        "[CACHE_REFRESH] Failed to fetch league slug from %s: %s", ref_url, e
-                    )
-                return None
-
-            # Fetch slugs in parallel
-            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                futures = {
-                    executor.submit(fetch_slug, ref["$ref"]): ref
-                    for ref in league_refs
-                    if "$ref" in ref
-                }
-
-                for future in as_completed(futures):
-                    completed += 1
-                    # Report progress during discovery (maps to 0-10% of provider range)
-                    if progress_callback and completed % 5 == 0:
-                        discovery_pct = int((completed / total) * 10)  # 0-10%
-                        progress_callback(
-                            f"Discovering soccer leagues: {completed}/{total}", discovery_pct
+                    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                        logger.debug(
+                            "[CACHE_REFRESH] Failed to fetch league slug from %s: %s", ref_url, e
                         )
-
-                    slug = future.result()
-                    if slug and self._should_include_soccer_league(slug):
-                        slugs.append(slug)
+                    return None
+
+                # Fetch slugs in parallel
+                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                    futures = {
+                        executor.submit(fetch_slug, ref["$ref"]): ref
+                        for ref in league_refs
+                        if "$ref" in ref
+                    }
+
+                    for future in as_completed(futures):
+                        completed += 1
+                        # Report progress during discovery (maps to 0-10% of provider range)
+                        if progress_callback and completed % 5 == 0:
+                            discovery_pct = int((completed / total) * 10)  # 0-10%
+                            progress_callback(
+                                f"Discovering soccer leagues: {completed}/{total}", discovery_pct
+                            )
+
+                        slug = future.result()
+                        if slug and self._should_include_soccer_league(slug):
+                            slugs.append(slug)
 
             logger.info("[CACHE_REFRESH] Found %d ESPN soccer leagues", len(slugs))
             return slugs
@@ -468,86 +572,160 @@ class CacheRefresher:
                 return False
         return True
 
-    def _save_cache(self, teams: list[dict], leagues: list[dict]) -> None:
-        """Save teams and leagues to database using batch inserts."""
-        now = datetime.utcnow().isoformat() + "Z"
+    def _save_cache(
+        self, teams: list[dict], leagues: list[dict], full: bool = True
+    ) -> dict[str, int]:
+        """Apply discovered teams and leagues to the cache as a diff.
 
-        with self._db() as conn:
-            cursor = conn.cursor()
+        Only the leagues in ``leagues`` that didn't fail are touched: changed
+        or new rows are upserted, rows that vanished from those leagues are
+        deleted, and unchanged rows are left alone. Leagues whose fetch failed
+        keep their existing rows. On a full refresh, cached leagues that were
+        not discovered at all are removed as well, together with their teams.
 
-            # Clear old data
-            cursor.execute("DELETE FROM team_cache")
-            cursor.execute("DELETE FROM league_cache")
-
-            # Batch insert leagues using executemany (much faster than one-by-one)
-            league_data = [
-                (
-                    league["league_slug"],
-                    league["provider"],
-                    league.get("league_name"),
-                    league["sport"],
-                    league.get("logo_url"),
-                    league.get("team_count", 0),
-                    now,
-                )
-                for league in leagues
-            ]
-            cursor.executemany(
-                """
-                INSERT OR REPLACE INTO league_cache
-                (league_slug, provider, league_name, sport, logo_url,
-                 team_count, last_refreshed)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                league_data,
-            )
+        Returns:
+            Dict of change counts plus resulting cache totals
+        """
+        now = datetime.utcnow().isoformat() + "Z"
 
-            # Deduplicate teams by (provider, provider_team_id, league)
-            # Skip teams without names (required field)
-            seen: set = set()
-            unique_teams = []
-            for team in teams:
-                # Skip teams without required name field
-                if not team.get("team_name"):
-                    continue
-                key = (team["provider"], team["provider_team_id"], team["league"])
-                if key not in seen:
-                    seen.add(key)
-                    unique_teams.append(team)
-
-            # Batch insert teams using executemany (much faster than one-by-one)
-            team_data = [
-                (
+        scope = {
+            (league["league_slug"], league["provider"])
+            for league in leagues
+            if not league.get("failed")
+        }
+        scoped_leagues = [lg for lg in leagues if (lg["league_slug"], lg["provider"]) in scope]
+        discovered = {(lg["league_slug"], lg["provider"]) for lg in leagues}
+
+        # Deduplicate teams by (provider, provider_team_id, league)
+        # Skip teams without names (required field)
+        wanted: dict[tuple, tuple] = {}
+        for team in teams:
+            if not team.get("team_name") or (team["league"], team["provider"]) not in scope:
+                continue
+            key = (team["provider"], team["provider_team_id"], team["league"])
+            if key not in wanted:
+                wanted[key] = (
                     team["team_name"],
                     team.get("team_abbrev"),
                     team.get("team_short_name"),
-                    team["provider"],
-                    team["provider_team_id"],
-                    team["league"],
                     team["sport"],
                     team.get("logo_url"),
-                    now,
                 )
-                for team in unique_teams
-            ]
-            cursor.executemany(
+
+        stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        with self._db() as conn:
+            existing: dict[tuple, tuple[int, tuple]] = {}
+            orphan_ids: list[int] = []
+            for row in conn.execute(
+                """SELECT id, provider, provider_team_id, league, team_name, team_abbrev,
+                          team_short_name, sport, logo_url
+                   FROM team_cache"""
+            ):
+                if (row["league"], row["provider"]) in scope:
+                    key = (row["provider"], row["provider_team_id"], row["league"])
+                    existing[key] = (row["id"], tuple(row)[4:])
+                elif full and (row["league"], row["provider"]) not in discovered:
+                    orphan_ids.append(row["id"])
+
+            inserts = []
+            updates = []
+            for key, values in wanted.items():
+                current = existing.pop(key, None)
+                if current is None:
+                    inserts.append((*values[:3], *key, *values[3:], now))
+                elif current[1] != values:
+                    updates.append((*values, now, current[0]))
+                else:
+                    stats["unchanged"] += 1
+            # Whatever is left in scope was not rediscovered; on a full refresh
+            # teams of leagues that vanished altogether go too
+            deleted_ids = [team_id for team_id, _values in existing.values()] + orphan_ids
+
+            conn.executemany(
+                "DELETE FROM team_cache WHERE id = ?", [(team_id,) for team_id in deleted_ids]
+            )
+            conn.executemany(
                 """
-                INSERT INTO team_cache
-                (team_name, team_abbrev, team_short_name, provider,
-                 provider_team_id, league, sport, logo_url, last_seen)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                UPDATE team_cache SET team_name = ?, team_abbrev = ?, team_short_name = ?,
+                    sport = ?, logo_url = ?, last_seen = ?
+                WHERE id = ?
                 """,
-                team_data,
+                updates,
             )
+            inserted_ids = []
+            for row in inserts:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO team_cache
+                    (team_name, team_abbrev, team_short_name, provider,
+                     provider_team_id, league, sport, logo_url, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    row,
+                )
+                inserted_ids.append(cursor.lastrowid)
 
-            # Update cached_team_count in the leagues table for configured leagues
-            self._update_leagues_team_counts(cursor, leagues)
+            stats["inserted"] = len(inserts)
+            stats["updated"] = len(updates)
+            stats["deleted"] = len(deleted_ids)
+
+            # Keep the trigram search index in step with the changed rows
+            update_team_search_index(conn, [*deleted_ids, *(u[-1] for u in updates), *inserted_ids])
 
-            logger.debug(
-                "[SAVED] Cache: %d leagues, %d teams",
-                len(leagues),
-                len(unique_teams),
+            # Leagues: refreshed ones get new metadata and a fresh timestamp
+            conn.executemany(
+                """
+                INSERT INTO league_cache
+                (league_slug, provider, league_name, sport, logo_url,
+                 team_count, last_refreshed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (league_slug, provider) DO UPDATE SET
+                    league_name = excluded.league_name,
+                    sport = excluded.sport,
+                    logo_url = excluded.logo_url,
+                    team_count = excluded.team_count,
+                    last_refreshed = excluded.last_refreshed
+                """,
+                [
+                    (
+                        league["league_slug"],
+                        league["provider"],
+                        league.get("league_name"),
+                        league["sport"],
+                        league.get("logo_url"),
+                        league.get("team_count", 0),
+                        now,
+                    )
+                    for league in scoped_leagues
+                ],
             )
+            if full:
+                vanished = [
+                    (row["league_slug"], row["provider"])
+                    for row in conn.execute("SELECT league_slug, provider FROM league_cache")
+                    if (row["league_slug"], row["provider"]) not in discovered
+                ]
+                conn.executemany(
+                    "DELETE FROM league_cache WHERE league_slug = ? AND provider = ?", vanished
+                )
+                stats["leagues_deleted"] = len(vanished)
+
+            # Update cached_team_count in the leagues table for configured leagues
+            self._update_leagues_team_counts(conn.cursor(), scoped_leagues)
+
+            stats["teams_total"] = conn.execute("SELECT COUNT(*) FROM team_cache").fetchone()[0]
+            stats["leagues_total"] = conn.execute("SELECT COUNT(*) FROM league_cache").fetchone()[0]
+
+        logger.debug(
+            "[SAVED] Cache diff: %d leagues refreshed; teams +%d ~%d -%d (%d unchanged)",
+            len(scoped_leagues),
+            stats["inserted"],
+            stats["updated"],
+            stats["deleted"],
+            stats["unchanged"],
+        )
+        return stats
 
     def _update_leagues_team_counts(self, cursor, leagues: list[dict]) -> None:
         """Update cached_team_count in the leagues table.
@@ -576,12 +754,29 @@ class CacheRefresher:
         teams_count: int,
         duration: float,
         error: str | None,
+        full: bool = True,
     ) -> None:
-        """Update cache metadata."""
+        """Update cache metadata.
+
+        Incremental refreshes update counts but not last_full_refresh.
+        """
         now = datetime.utcnow().isoformat() + "Z"
 
         with self._db() as conn:
             cursor = conn.cursor()
+            if not full:
+                cursor.execute(
+                    """
+                    UPDATE cache_meta SET
+                        leagues_count = ?,
+                        teams_count = ?,
+                        refresh_duration_seconds = ?,
+                        last_error = ?
+                    WHERE id = 1
+                    """,
+                    (leagues_count, teams_count, duration, error),
+                )
+                return
             cursor.execute(
                 """
                 UPDATE cache_meta SET
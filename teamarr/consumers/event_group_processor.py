@@ -12,6 +12,8 @@ Connects stream matching to channel lifecycle:
 This is the main entry point for event-based EPG generation.
 """
 
+import hashlib
+import json
 import logging
 import os
 from collections.abc import Callable
@@ -39,7 +41,14 @@ from teamarr.consumers.filler.event_filler import (
     EventFillerResult,
     template_to_event_filler_config,
 )
-from teamarr.consumers.matching import BatchMatchResult, StreamMatcher
+from teamarr.consumers.lifecycle.write_pipeline import WritePipelineStats
+from teamarr.consumers.matching import (
+    BatchMatchResult,
+    EventPrefetchPlanner,
+    EventStore,
+    StreamMatcher,
+)
+from teamarr.consumers.stream_match_cache import compute_fingerprint
 from teamarr.core import Event
 from teamarr.database.groups import (
     EventEPGGroup,
@@ -47,8 +56,12 @@ from teamarr.database.groups import (
     get_all_groups,
     get_enabled_soccer_leagues,
     get_group,
+    get_group_stream_snapshot,
     get_group_templates,
+    get_group_xmltv,
     get_template_for_event,
+    store_group_match_snapshot,
+    store_group_stream_snapshot,
     update_group_stats,
 )
 from teamarr.database.stats import (
@@ -61,7 +74,13 @@ from teamarr.database.stats import (
 )
 from teamarr.services import SportsDataService, create_default_service
 from teamarr.services.stream_filter import FilterResult
-from teamarr.utilities.xmltv import merge_xmltv_content, programmes_to_xmltv
+from teamarr.utilities.xmltv import (
+    merge_xmltv_content,
+    programmes_to_xmltv,
+    serialize_xmltv,
+    splice_xmltv_tree,
+    xmltv_channel_ids,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +88,9 @@ logger = logging.getLogger(__name__)
 # Configurable via ESPN_MAX_WORKERS for users with DNS throttling (PiHole, AdGuard)
 MAX_WORKERS = int(os.environ.get("ESPN_MAX_WORKERS", 100))
 
+# Days of past events fetched for EPG (weekly sports like NFL)
+EVENT_FETCH_DAYS_BACK = 7
+
 
 @dataclass
 class ProcessingResult:
@@ -113,6 +135,9 @@ class ProcessingResult:
     postgame_count: int = 0  # Postgame filler programmes
     xmltv_size: int = 0
 
+    # Dispatcharr write pipeline stats (queue depth, coalesced, latency)
+    dispatcharr_writes: dict = field(default_factory=dict)
+
     # Errors
     errors: list[str] = field(default_factory=list)
 
@@ -147,6 +172,7 @@ class ProcessingResult:
                 "postgame": self.postgame_count,
                 "xmltv_bytes": self.xmltv_size,
             },
+            "dispatcharr_writes": self.dispatcharr_writes,
             "errors": self.errors,
         }
 
@@ -159,6 +185,8 @@ class BatchProcessingResult:
     completed_at: datetime | None = None
     results: list[ProcessingResult] = field(default_factory=list)
     total_xmltv: str = ""
+    # Dispatcharr write pipeline stats aggregated across all groups
+    write_stats: WritePipelineStats = field(default_factory=WritePipelineStats)
 
     @property
     def groups_processed(self) -> int:
@@ -219,6 +247,7 @@ class BatchProcessingResult:
             "groups_processed": self.groups_processed,
             "total_channels_created": self.total_channels_created,
             "total_errors": self.total_errors,
+            "dispatcharr_writes": self.write_stats.to_dict(),
             "results": [r.to_dict() for r in self.results],
         }
 
@@ -278,6 +307,10 @@ class PreviewResult:
     cache_hits: int = 0
     cache_misses: int = 0
 
+    # Snapshot preview: when the streams were captured, how many were re-matched
+    snapshot_at: str | None = None
+    rematched_count: int | None = None
+
     # Stream details
     streams: list[PreviewStream] = field(default_factory=list)
 
@@ -298,6 +331,8 @@ class PreviewResult:
             "filtered_exclude_regex": self.filtered_exclude_regex,
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
+            "snapshot_at": self.snapshot_at,
+            "rematched_count": self.rematched_count,
             "streams": [s.to_dict() for s in self.streams],
             "errors": self.errors,
         }
@@ -352,6 +387,13 @@ class EventGroupProcessor:
         # while ensuring groups that need fresh API data can still get it
         self._shared_events: dict[str, tuple[list[Event], bool]] = {}
 
+        # Events prefetched once for all groups in process_all_groups (None outside a run)
+        self._event_store: EventStore | None = None
+
+        # Dispatcharr write pipeline stats (last group processed, and whole batch)
+        self._last_write_stats = WritePipelineStats()
+        self._write_stats = WritePipelineStats()
+
     def _resolve_effective_leagues(
         self, conn: Connection, group: EventEPGGroup
     ) -> list[str]:
@@ -413,6 +455,87 @@ class EventGroupProcessor:
 
             return self._process_group_internal(conn, group, target_date)
 
+    def rerender_event_channels(
+        self,
+        group_id: int,
+        events: dict[str, Event],
+    ) -> tuple[set[str], str] | None:
+        """Re-render a group's existing channels for some refreshed events.
+
+        Used by the live-score fast path. Builds the matched streams from the
+        group's active managed channels and their primary streams instead of
+        fetching and matching streams, and never creates, updates or deletes
+        channels. The new XMLTV is spliced into the group's stored XMLTV.
+        UFC segment channels (segment-suffixed event IDs) are left alone.
+
+        Args:
+            group_id: Event group ID
+            events: Refreshed events by event ID
+
+        Returns:
+            (tvg_ids re-rendered, their XMLTV), or None if there is nothing
+            to re-render or it needs a full run (no stored XMLTV, or the
+            rendered channels don't line up with the managed ones)
+        """
+        import xml.etree.ElementTree as ET
+
+        if not events:
+            return None
+        with self._db_factory() as conn:
+            group = get_group(conn, group_id)
+            stored = get_group_xmltv(conn, group_id)
+            if not group or not group.enabled or not stored:
+                return None
+            placeholders = ",".join("?" * len(events))
+            rows = conn.execute(
+                f"""SELECT mc.event_id, mc.tvg_id, mc.channel_name, mc.primary_stream_id,
+                           mcs.stream_name
+                    FROM managed_channels mc
+                    LEFT JOIN managed_channel_streams mcs
+                      ON mcs.managed_channel_id = mc.id
+                     AND mcs.dispatcharr_stream_id = mc.primary_stream_id
+                     AND mcs.removed_at IS NULL
+                    WHERE mc.event_epg_group_id = ? AND mc.deleted_at IS NULL
+                      AND mc.event_id IN ({placeholders})""",
+                [group_id, *events],
+            ).fetchall()
+
+            matched: dict[str, dict] = {}
+            for row in rows:
+                matched.setdefault(
+                    row["tvg_id"],
+                    {
+                        "stream": {
+                            "id": row["primary_stream_id"],
+                            "name": row["stream_name"] or row["channel_name"],
+                        },
+                        "event": events[row["event_id"]],
+                    },
+                )
+            if not matched:
+                return None
+
+            xmltv_content, *_counts = self._generate_xmltv(list(matched.values()), group, conn)
+            channel_ids = set(matched)
+            rendered = xmltv_channel_ids(xmltv_content)
+            if not rendered or not rendered <= channel_ids:
+                logger.info(
+                    "[LIVE] Group %d: re-rendered channels %s don't match managed %s; "
+                    "leaving them for the next full run",
+                    group_id,
+                    sorted(rendered - channel_ids),
+                    sorted(channel_ids),
+                )
+                return None
+
+            try:
+                root = ET.fromstring(stored)
+            except ET.ParseError:
+                return None
+            spliced = splice_xmltv_tree(root, channel_ids, xmltv_content)
+            self._store_group_xmltv(conn, group_id, serialize_xmltv(spliced))
+        return channel_ids, xmltv_content
+
     def preview_group(
         self,
         group_id: int,
@@ -488,21 +611,13 @@ class EventGroupProcessor:
                 return result
 
             # Convert DispatcharrStream objects to dict format
-            streams = [{"id": s.id, "name": s.name} for s in raw_streams]
+            streams = self._stream_dicts(raw_streams)
             result.total_streams = len(streams)
+            self._store_stream_snapshot(group.id, streams)
 
             # Step 2: Apply stream filtering
             streams, filter_result = self._filter_streams(streams, group)
-            result.filtered_count = result.total_streams - filter_result.passed_count
-            result.filtered_stale = filter_result.filtered_stale
-            # Combine all built-in eligibility filters into filtered_not_event
-            result.filtered_not_event = (
-                filter_result.filtered_not_event
-                + filter_result.filtered_placeholder
-                + filter_result.filtered_unsupported_sport
-            )
-            result.filtered_include_regex = filter_result.filtered_include
-            result.filtered_exclude_regex = filter_result.filtered_exclude
+            self._apply_preview_filter_counts(result, filter_result)
 
             if not streams:
                 result.errors.append("All streams filtered out")
@@ -516,34 +631,184 @@ class EventGroupProcessor:
             result.cache_misses = match_result.cache_misses
 
             # Build preview stream list
-            for r in match_result.results:
-                stream_id = r.stream_id if hasattr(r, "stream_id") else 0
-                stream_name = r.stream_name
-
-                preview_stream = PreviewStream(
-                    stream_id=stream_id,
-                    stream_name=stream_name,
-                    matched=r.matched,
-                    event_id=r.event.id if r.event else None,
-                    event_name=r.event.name if r.event else None,
-                    home_team=r.event.home_team.name if r.event else None,
-                    away_team=r.event.away_team.name if r.event else None,
-                    league=r.league,
-                    start_time=r.event.start_time.isoformat() if r.event else None,
-                    from_cache=getattr(r, "from_cache", False),
-                    exclusion_reason=r.exclusion_reason,
-                )
-                result.streams.append(preview_stream)
+            result.streams = [self._preview_stream(r) for r in match_result.results]
+            self._store_match_snapshot(group, match_result)
+            return self._finish_preview(result)
+
+    def preview_group_fast(
+        self,
+        group_id: int,
+        target_date: date | None = None,
+    ) -> PreviewResult:
+        """Preview stream matching from the group's last stream snapshot.
+
+        Re-applies the group's current filters to the streams captured by the
+        last run (or full preview), reuses match results whose stream
+        fingerprint and matching settings are unchanged and matches only new
+        or renamed streams (all of them after the group's leagues or
+        extraction regexes change).
+        Never refreshes the M3U account or refetches streams, so it returns
+        quickly enough to iterate on filter settings. Read-only: re-matched
+        streams are not written back to the snapshot (runs and full previews
+        keep it current).
 
-            # Sort: matched first, then unmatched; within each, natural sort by name
-            from teamarr.api.routes import natural_sort_key
+        Args:
+            group_id: Group ID to preview
+            target_date: Target date (defaults to today)
 
-            result.streams.sort(
-                key=lambda s: (not s.matched, natural_sort_key(s.stream_name)),
-            )
+        Returns:
+            PreviewResult with stream matching details
+        """
+        target_date = target_date or date.today()
 
+        with self._db_factory() as conn:
+            group = get_group(conn, group_id)
+            snapshot = get_group_stream_snapshot(conn, group_id) if group else None
+
+        if not group:
+            result = PreviewResult(group_id=group_id, group_name="Unknown")
+            result.errors.append(f"Group {group_id} not found")
+            return result
+
+        result = PreviewResult(group_id=group_id, group_name=group.name)
+        if snapshot is None:
+            result.errors.append("No stream snapshot yet - run a full preview")
+            return result
+        result.snapshot_at = snapshot["captured_at"]
+        streams = snapshot["streams"]
+        result.total_streams = len(streams)
+
+        streams, filter_result = self._filter_streams(streams, group)
+        self._apply_preview_filter_counts(result, filter_result)
+
+        if not streams:
+            result.errors.append("All streams filtered out")
             return result
 
+        # Results matched for another day may no longer hold (dates, finals)
+        known = snapshot["results"] if snapshot["target_date"] == target_date.isoformat() else {}
+
+        # Keys include the matching settings, so edited regexes/leagues re-match
+        config_key = self._match_config_key(group)
+        changed = []
+        exceptions = 0
+        for stream in streams:
+            fingerprint = compute_fingerprint(group.id, stream["id"], stream["name"])
+            cached = known.get(f"{config_key}:{fingerprint}")
+            if cached:
+                cached = dict(cached)
+                exceptions += cached.pop("exception", False)
+                result.streams.append(PreviewStream(**cached))
+                result.cache_hits += 1
+            else:
+                changed.append(stream)
+
+        result.rematched_count = len(changed)
+        if changed:
+            match_result = self._match_streams(changed, group, target_date)
+            result.cache_hits += match_result.cache_hits
+            result.cache_misses += match_result.cache_misses
+            result.streams.extend(self._preview_stream(r) for r in match_result.results)
+            exceptions += sum(1 for r in match_result.results if r.is_exception)
+
+        # Same counting as BatchMatchResult (exception streams are neither)
+        result.matched_count = sum(1 for s in result.streams if s.matched)
+        result.unmatched_count = len(result.streams) - result.matched_count - exceptions
+        return self._finish_preview(result)
+
+    @staticmethod
+    def _apply_preview_filter_counts(result: PreviewResult, filter_result: FilterResult) -> None:
+        """Copy filter breakdown into a preview result."""
+        result.filtered_count = result.total_streams - filter_result.passed_count
+        result.filtered_stale = filter_result.filtered_stale
+        # Combine all built-in eligibility filters into filtered_not_event
+        result.filtered_not_event = (
+            filter_result.filtered_not_event
+            + filter_result.filtered_placeholder
+            + filter_result.filtered_unsupported_sport
+        )
+        result.filtered_include_regex = filter_result.filtered_include
+        result.filtered_exclude_regex = filter_result.filtered_exclude
+
+    @staticmethod
+    def _preview_stream(r) -> PreviewStream:
+        """Convert a stream match result into a preview row."""
+        return PreviewStream(
+            stream_id=r.stream_id if hasattr(r, "stream_id") else 0,
+            stream_name=r.stream_name,
+            matched=r.matched,
+            event_id=r.event.id if r.event else None,
+            event_name=r.event.name if r.event else None,
+            home_team=r.event.home_team.name if r.event else None,
+            away_team=r.event.away_team.name if r.event else None,
+            league=r.league,
+            start_time=r.event.start_time.isoformat() if r.event else None,
+            from_cache=getattr(r, "from_cache", False),
+            exclusion_reason=r.exclusion_reason,
+        )
+
+    @staticmethod
+    def _finish_preview(result: PreviewResult) -> PreviewResult:
+        """Sort preview rows for display."""
+        # Sort: matched first, then unmatched; within each, natural sort by name
+        from teamarr.api.routes import natural_sort_key
+
+        result.streams.sort(
+            key=lambda s: (not s.matched, natural_sort_key(s.stream_name)),
+        )
+        return result
+
+    def _store_stream_snapshot(self, group_id: int, streams: list[dict]) -> None:
+        """Remember the streams just fetched for fast previews."""
+        try:
+            with self._db_factory() as conn:
+                store_group_stream_snapshot(conn, group_id, streams)
+        except Exception as e:
+            logger.warning(
+                "[EVENT_EPG] Failed to store stream snapshot for group %d: %s", group_id, e
+            )
+
+    @staticmethod
+    def _match_config_key(group: EventEPGGroup) -> str:
+        """Hash of the group settings that decide how its streams match.
+
+        Prefixes snapshot result keys, so editing a group's leagues or
+        extraction regexes makes fast previews re-match instead of showing
+        results from the old settings.
+        """
+        config = {
+            "leagues": group.leagues,
+            "soccer_mode": group.soccer_mode,
+            "soccer_followed_teams": group.soccer_followed_teams,
+            "stream_timezone": group.stream_timezone,
+            **{
+                f"{name}{suffix}": getattr(group, f"custom_regex_{name}{suffix}")
+                for name in ("teams", "date", "time", "league", "fighters", "event_name")
+                for suffix in ("", "_enabled")
+            },
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _store_match_snapshot(self, group: EventEPGGroup, match_result: BatchMatchResult) -> None:
+        """Remember per-stream match results (by config and fingerprint) for fast previews."""
+        config_key = self._match_config_key(group)
+        results = {
+            f"{config_key}:{compute_fingerprint(group.id, r.stream_id, r.stream_name)}": {
+                **self._preview_stream(r).to_dict(),
+                "exception": r.is_exception,
+            }
+            for r in match_result.results
+        }
+        try:
+            with self._db_factory() as conn:
+                store_group_match_snapshot(
+                    conn, group.id, match_result.target_date.isoformat(), results
+                )
+        except Exception as e:
+            logger.warning(
+                "[EVENT_EPG] Failed to store match snapshot for group %d: %s", group.id, e
+            )
+
     def process_all_groups(
         self,
         target_date: date | None = None,
@@ -576,6 +841,7 @@ class EventGroupProcessor:
         # Clear shared events cache at start of new generation run
         # This ensures fresh data and allows cross-group reuse within this run
         self._shared_events.clear()
+        self._write_stats = WritePipelineStats()
 
         with self._db_factory() as conn:
             groups = get_all_groups(conn, include_disabled=False)
@@ -592,193 +858,219 @@ class EventGroupProcessor:
                 else:
                     progress_callback(0, 1, "No event groups configured")
 
-            processed_group_ids = []
-            multi_league_ids = [g.id for g in multi_league_groups]
+            # Plan every (league, date) any group needs; fetched once below
+            planner = self._plan_event_prefetch(conn, groups, target_date) if groups else None
 
-            # Phase 1: Process parent groups (create channels, generate EPG)
-            for group in parent_groups:
-                # Send "Loading..." message before expensive fetch operations
+        try:
+            # Prefetch outside the connection: this is all provider HTTP calls
+            if planner is not None:
+                status_cb = None
                 if progress_callback:
-                    leagues_count = len(group.leagues) if group.leagues else 0
                     progress_callback(
-                        processed_count,
+                        0,
                         total_groups,
-                        f"Loading {group.name}... ({leagues_count} leagues)",
+                        f"Prefetching events: {len(planner)} league-days "
+                        f"for {len(groups)} groups",
                     )
 
-                # Create stream progress callback that reports during matching
-                stream_cb = None
-                if progress_callback:
+                    def status_cb(msg: str):
+                        progress_callback(0, total_groups, msg)
 
-                    def make_stream_cb(grp_name: str, grp_idx: int):
-                        def cb(current: int, total: int, stream_name: str, matched: bool):
-                            icon = "✓" if matched else "✗"
-                            msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
-                            progress_callback(grp_idx, total_groups, msg)
+                self._event_store = planner.execute(status_callback=status_cb)
 
-                        return cb
+            with self._db_factory() as conn:
+                processed_group_ids = []
+                multi_league_ids = [g.id for g in multi_league_groups]
+
+                # Phase 1: Process parent groups (create channels, generate EPG)
+                for group in parent_groups:
+                    # Send "Loading..." message before expensive fetch operations
+                    if progress_callback:
+                        leagues_count = len(group.leagues) if group.leagues else 0
+                        progress_callback(
+                            processed_count,
+                            total_groups,
+                            f"Loading {group.name}... ({leagues_count} leagues)",
+                        )
 
-                    stream_cb = make_stream_cb(group.name, processed_count + 1)
+                    # Create stream progress callback that reports during matching
+                    stream_cb = None
+                    if progress_callback:
 
-                # Create status callback for post-matching phases
-                status_cb = None
-                if progress_callback:
-                    grp_idx = processed_count + 1
+                        def make_stream_cb(grp_name: str, grp_idx: int):
+                            def cb(current: int, total: int, stream_name: str, matched: bool):
+                                icon = "✓" if matched else "✗"
+                                msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
+                                progress_callback(grp_idx, total_groups, msg)
 
-                    def make_status_cb(grp_name: str, idx: int):
-                        def cb(msg: str):
-                            progress_callback(idx, total_groups, f"{grp_name}: {msg}")
+                            return cb
 
-                        return cb
+                        stream_cb = make_stream_cb(group.name, processed_count + 1)
 
-                    status_cb = make_status_cb(group.name, grp_idx)
+                    # Create status callback for post-matching phases
+                    status_cb = None
+                    if progress_callback:
+                        grp_idx = processed_count + 1
 
-                result = self._process_group_internal(
-                    conn,
-                    group,
-                    target_date,
-                    stream_progress_callback=stream_cb,
-                    status_callback=status_cb,
-                )
-                batch_result.results.append(result)
-                processed_group_ids.append(group.id)
-                processed_count += 1
-                if progress_callback:
-                    # Include stream stats in progress: "Group Name (5/8 streams matched)"
-                    stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
-                    progress_callback(processed_count, total_groups, f"{group.name} {stats}")
+                        def make_status_cb(grp_name: str, idx: int):
+                            def cb(msg: str):
+                                progress_callback(idx, total_groups, f"{grp_name}: {msg}")
 
-            # Phase 2: Process child groups (add streams to parent channels)
-            for group in child_groups:
-                # Send "Loading..." message before expensive fetch operations
-                if progress_callback:
-                    progress_callback(
-                        processed_count, total_groups, f"Loading {group.name}... (child group)"
-                    )
+                            return cb
 
-                # Child groups use same stream progress pattern
-                stream_cb = None
-                if progress_callback:
+                        status_cb = make_status_cb(group.name, grp_idx)
 
-                    def make_stream_cb(grp_name: str, grp_idx: int):
-                        def cb(current: int, total: int, stream_name: str, matched: bool):
-                            icon = "✓" if matched else "✗"
-                            msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
-                            progress_callback(grp_idx, total_groups, msg)
+                    result = self._process_group_internal(
+                        conn,
+                        group,
+                        target_date,
+                        stream_progress_callback=stream_cb,
+                        status_callback=status_cb,
+                    )
+                    batch_result.results.append(result)
+                    processed_group_ids.append(group.id)
+                    processed_count += 1
+                    if progress_callback:
+                        # Include stream stats in progress: "Group Name (5/8 streams matched)"
+                        stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
+                        progress_callback(processed_count, total_groups, f"{group.name} {stats}")
+
+                # Phase 2: Process child groups (add streams to parent channels)
+                for group in child_groups:
+                    # Send "Loading..." message before expensive fetch operations
+                    if progress_callback:
+                        progress_callback(
+                            processed_count, total_groups, f"Loading {group.name}... (child group)"
+                        )
 
-                        return cb
+                    # Child groups use same stream progress pattern
+                    stream_cb = None
+                    if progress_callback:
 
-                    stream_cb = make_stream_cb(group.name, processed_count + 1)
+                        def make_stream_cb(grp_name: str, grp_idx: int):
+                            def cb(current: int, total: int, stream_name: str, matched: bool):
+                                icon = "✓" if matched else "✗"
+                                msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
+                                progress_callback(grp_idx, total_groups, msg)
 
-                # Create status callback for prefetch progress
-                status_cb = None
-                if progress_callback:
-                    grp_idx = processed_count + 1
+                            return cb
 
-                    def make_status_cb(grp_name: str, idx: int):
-                        def cb(msg: str):
-                            progress_callback(idx, total_groups, f"{grp_name}: {msg}")
+                        stream_cb = make_stream_cb(group.name, processed_count + 1)
 
-                        return cb
+                    # Create status callback for prefetch progress
+                    status_cb = None
+                    if progress_callback:
+                        grp_idx = processed_count + 1
 
-                    status_cb = make_status_cb(group.name, grp_idx)
+                        def make_status_cb(grp_name: str, idx: int):
+                            def cb(msg: str):
+                                progress_callback(idx, total_groups, f"{grp_name}: {msg}")
 
-                result = self._process_child_group_internal(
-                    conn,
-                    group,
-                    target_date,
-                    stream_progress_callback=stream_cb,
-                    status_callback=status_cb,
-                )
-                batch_result.results.append(result)
-                # Child groups don't generate their own XMLTV
-                processed_count += 1
-                if progress_callback:
-                    stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
-                    progress_callback(processed_count, total_groups, f"{group.name} {stats}")
+                            return cb
 
-            # Phase 3: Process multi-league groups
-            for group in multi_league_groups:
-                # Send "Loading..." message before expensive fetch operations
-                if progress_callback:
-                    leagues_count = len(group.leagues) if group.leagues else 0
-                    progress_callback(
-                        processed_count,
-                        total_groups,
-                        f"Loading {group.name}... ({leagues_count} leagues)",
-                    )
+                        status_cb = make_status_cb(group.name, grp_idx)
 
-                stream_cb = None
-                if progress_callback:
+                    result = self._process_child_group_internal(
+                        conn,
+                        group,
+                        target_date,
+                        stream_progress_callback=stream_cb,
+                        status_callback=status_cb,
+                    )
+                    batch_result.results.append(result)
+                    # Child groups don't generate their own XMLTV
+                    processed_count += 1
+                    if progress_callback:
+                        stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
+                        progress_callback(processed_count, total_groups, f"{group.name} {stats}")
+
+                # Phase 3: Process multi-league groups
+                for group in multi_league_groups:
+                    # Send "Loading..." message before expensive fetch operations
+                    if progress_callback:
+                        leagues_count = len(group.leagues) if group.leagues else 0
+                        progress_callback(
+                            processed_count,
+                            total_groups,
+                            f"Loading {group.name}... ({leagues_count} leagues)",
+                        )
 
-                    def make_stream_cb(grp_name: str, grp_idx: int):
-                        def cb(current: int, total: int, stream_name: str, matched: bool):
-                            icon = "✓" if matched else "✗"
-                            msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
-                            progress_callback(grp_idx, total_groups, msg)
+                    stream_cb = None
+                    if progress_callback:
 
-                        return cb
+                        def make_stream_cb(grp_name: str, grp_idx: int):
+                            def cb(current: int, total: int, stream_name: str, matched: bool):
+                                icon = "✓" if matched else "✗"
+                                msg = f"{icon} {current}/{total} — {grp_name}: {stream_name}"
+                                progress_callback(grp_idx, total_groups, msg)
 
-                    stream_cb = make_stream_cb(group.name, processed_count + 1)
+                            return cb
 
-                # Create status callback for post-matching phases
-                status_cb = None
-                if progress_callback:
-                    grp_idx = processed_count + 1
+                        stream_cb = make_stream_cb(group.name, processed_count + 1)
 
-                    def make_status_cb(grp_name: str, idx: int):
-                        def cb(msg: str):
-                            progress_callback(idx, total_groups, f"{grp_name}: {msg}")
+                    # Create status callback for post-matching phases
+                    status_cb = None
+                    if progress_callback:
+                        grp_idx = processed_count + 1
 
-                        return cb
+                        def make_status_cb(grp_name: str, idx: int):
+                            def cb(msg: str):
+                                progress_callback(idx, total_groups, f"{grp_name}: {msg}")
 
-                    status_cb = make_status_cb(group.name, grp_idx)
+                            return cb
 
-                result = self._process_group_internal(
-                    conn,
-                    group,
-                    target_date,
-                    stream_progress_callback=stream_cb,
-                    status_callback=status_cb,
-                )
-                batch_result.results.append(result)
-                processed_group_ids.append(group.id)
-                processed_count += 1
-                if progress_callback:
-                    stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
-                    progress_callback(processed_count, total_groups, f"{group.name} {stats}")
-
-            # Phase 4: Run enforcement (keyword, cross-group, ordering, orphans)
-            if run_enforcement:
-                # Create lifecycle_service for orphan cleanup
-                enforcement_lifecycle = None
-                if self._dispatcharr_client:
-                    enforcement_lifecycle = create_lifecycle_service(
-                        db_factory=self._db_factory,
-                        sports_service=self._service,
-                        dispatcharr_client=self._dispatcharr_client,
-                    )
-                self._run_enforcement(
-                    conn, multi_league_ids, lifecycle_service=enforcement_lifecycle
-                )
+                        status_cb = make_status_cb(group.name, grp_idx)
 
-            # Aggregate XMLTV from all processed groups (parents + multi-league)
-            if processed_group_ids:
-                xmltv_contents = get_all_group_xmltv(conn, processed_group_ids)
-                if xmltv_contents:
-                    from teamarr.database.settings import get_display_settings
-
-                    display_settings = get_display_settings(conn)
-                    batch_result.total_xmltv = merge_xmltv_content(
-                        xmltv_contents,
-                        generator_name=display_settings.xmltv_generator_name,
-                        generator_url=display_settings.xmltv_generator_url,
+                    result = self._process_group_internal(
+                        conn,
+                        group,
+                        target_date,
+                        stream_progress_callback=stream_cb,
+                        status_callback=status_cb,
                     )
-                    logger.info(
-                        f"Aggregated XMLTV from {len(xmltv_contents)} groups, "
-                        f"{len(batch_result.total_xmltv)} bytes"
+                    batch_result.results.append(result)
+                    processed_group_ids.append(group.id)
+                    processed_count += 1
+                    if progress_callback:
+                        stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
+                        progress_callback(processed_count, total_groups, f"{group.name} {stats}")
+
+                # Phase 4: Run enforcement (keyword, cross-group, ordering, orphans)
+                if run_enforcement:
+                    # Create lifecycle_service for orphan cleanup
+                    enforcement_lifecycle = None
+                    if self._dispatcharr_client:
+                        enforcement_lifecycle = create_lifecycle_service(
+                            db_factory=self._db_factory,
+                            sports_service=self._service,
+                            dispatcharr_client=self._dispatcharr_client,
+                        )
+                    self._run_enforcement(
+                        conn, multi_league_ids, lifecycle_service=enforcement_lifecycle
                     )
 
+                # Aggregate XMLTV from all processed groups (parents + multi-league)
+                if processed_group_ids:
+                    xmltv_contents = get_all_group_xmltv(conn, processed_group_ids)
+                    if xmltv_contents:
+                        from teamarr.database.settings import get_display_settings
+
+                        display_settings = get_display_settings(conn)
+                        batch_result.total_xmltv = merge_xmltv_content(
+                            xmltv_contents,
+                            generator_name=display_settings.xmltv_generator_name,
+                            generator_url=display_settings.xmltv_generator_url,
+                        )
+                        logger.info(
+                            f"Aggregated XMLTV from {len(xmltv_contents)} groups, "
+                            f"{len(batch_result.total_xmltv)} bytes"
+                        )
+
+        finally:
+            # Release the run-wide store; later previews fetch on demand
+            self._event_store = None
+
+        batch_result.write_stats = self._write_stats
         batch_result.completed_at = datetime.now()
         return batch_result
 
@@ -954,6 +1246,7 @@ class EventGroupProcessor:
                 streams=streams,
                 match_result=match_result,
             )
+            self._store_match_snapshot(group, match_result)
 
             # Step 4: Add matched streams to parent's channels
             matched_streams = self._build_matched_stream_list(
@@ -1298,6 +1591,7 @@ class EventGroupProcessor:
                 streams=streams,
                 match_result=match_result,
             )
+            self._store_match_snapshot(group, match_result)
 
             # Step 4: Create/update channels
             matched_streams = self._build_matched_stream_list(
@@ -1424,6 +1718,7 @@ class EventGroupProcessor:
                 result.channels_skipped = len(lifecycle_result.skipped)
                 result.channels_deleted = len(lifecycle_result.deleted)
                 result.channel_errors = len(lifecycle_result.errors)
+                result.dispatcharr_writes = self._last_write_stats.to_dict()
                 # Add lifecycle exclusions to total
                 result.streams_excluded += len(lifecycle_result.excluded)
 
@@ -1539,28 +1834,36 @@ class EventGroupProcessor:
                 # Fetch all streams if no group filter
                 streams = m3u_manager.list_streams()
 
-            # Convert to dicts for matcher (sorted by name for consistent order)
-            stream_dicts = [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "tvg_id": s.tvg_id,
-                    "tvg_name": s.tvg_name,
-                    "channel_group": s.channel_group,
-                    "channel_group_id": s.channel_group_id,
-                    "m3u_account_id": s.m3u_account_id,
-                    "is_stale": s.is_stale,
-                }
-                for s in streams
-            ]
-            # Sort by stream ID ascending for consistent processing order
-            stream_dicts.sort(key=lambda s: s["id"])
-            return stream_dicts
+            stream_dicts = self._stream_dicts(streams)
 
         except Exception as e:
             logger.error("[EVENT_EPG] Failed to fetch streams: %s", e)
             return []
 
+        if stream_dicts:
+            self._store_stream_snapshot(group.id, stream_dicts)
+        return stream_dicts
+
+    @staticmethod
+    def _stream_dicts(streams: list) -> list[dict]:
+        """Convert DispatcharrStream objects to dicts for filtering/matching."""
+        stream_dicts = [
+            {
+                "id": s.id,
+                "name": s.name,
+                "tvg_id": s.tvg_id,
+                "tvg_name": s.tvg_name,
+                "channel_group": s.channel_group,
+                "channel_group_id": s.channel_group_id,
+                "m3u_account_id": s.m3u_account_id,
+                "is_stale": s.is_stale,
+            }
+            for s in streams
+        ]
+        # Sort by stream ID ascending for consistent processing order
+        stream_dicts.sort(key=lambda s: s["id"])
+        return stream_dicts
+
     def _filter_streams(
         self,
         streams: list[dict],
@@ -1641,6 +1944,56 @@ class EventGroupProcessor:
             cursor = conn.execute("SELECT league_slug FROM league_cache")
             return [row[0] for row in cursor.fetchall()]
 
+    def _load_days_ahead(self) -> int:
+        """Load event_match_days_ahead setting (default 3)."""
+        with self._db_factory() as conn:
+            row = conn.execute(
+                "SELECT event_match_days_ahead FROM settings WHERE id = 1"
+            ).fetchone()
+        return row["event_match_days_ahead"] if row and row["event_match_days_ahead"] else 3
+
+    def _event_fetch_dates(self, target_date: date, days_ahead: int | None = None) -> list[date]:
+        """Date range fetched for EPG: [target - EVENT_FETCH_DAYS_BACK, target + days_ahead]."""
+        if days_ahead is None:
+            days_ahead = self._load_days_ahead()
+        return [
+            target_date + timedelta(days=offset)
+            for offset in range(-EVENT_FETCH_DAYS_BACK, days_ahead + 1)
+        ]
+
+    def _plan_event_prefetch(
+        self,
+        conn: Connection,
+        groups: list[EventEPGGroup],
+        target_date: date,
+    ) -> EventPrefetchPlanner:
+        """Plan the union of events all groups need for this run.
+
+        Covers both the EPG fetch window of each group's effective leagues
+        (_fetch_events) and the matcher's search window over all known
+        leagues (StreamMatcher._prefetch_events), so neither walks its
+        (league, date) pairs one call at a time per group.
+        """
+        days_ahead = self._load_days_ahead()
+        fetch_dates = self._event_fetch_dates(target_date, days_ahead)
+        search_leagues = self._get_all_known_leagues()
+        groups_by_id = {g.id: g for g in groups}
+
+        planner = EventPrefetchPlanner(self._service)
+        for group in groups:
+            leagues = self._resolve_effective_leagues(conn, group)
+            if not leagues and group.parent_group_id:
+                # Child groups inherit their parent's leagues
+                parent = groups_by_id.get(group.parent_group_id)
+                if parent:
+                    leagues = self._resolve_effective_leagues(conn, parent)
+            planner.add_fetch_window(leagues or [], fetch_dates)
+            if len(search_leagues) > 1:
+                planner.add_match_window(
+                    search_leagues, leagues or group.leagues or [], target_date, days_ahead
+                )
+        return planner
+
     def _fetch_events(self, leagues: list[str], target_date: date) -> list[Event]:
         """Fetch events from data providers for leagues in parallel.
 
@@ -1651,23 +2004,8 @@ class EventGroupProcessor:
             return []
 
         all_events: list[Event] = []
-        num_workers = min(MAX_WORKERS, len(leagues))
-
-        # Load date range settings
-        # Note: days_back is hardcoded to 7 for weekly sports like NFL
-        with self._db_factory() as conn:
-            row = conn.execute(
-                "SELECT event_match_days_ahead FROM settings WHERE id = 1"
-            ).fetchone()
-            days_back = 7  # Hardcoded for weekly sports
-            days_ahead = (
-                row["event_match_days_ahead"] if row and row["event_match_days_ahead"] else 3
-            )
 
-        # Build date range: [target - days_back, target + days_ahead]
-        dates_to_fetch = [
-            target_date + timedelta(days=offset) for offset in range(-days_back, days_ahead + 1)
-        ]
+        dates_to_fetch = self._event_fetch_dates(target_date)
         logger.debug(
             "[EVENT_EPG] Fetching events from %s to %s (%d days)",
             dates_to_fetch[0],
@@ -1675,6 +2013,22 @@ class EventGroupProcessor:
             len(dates_to_fetch),
         )
 
+        # Serve what the run-wide prefetch already has; fetch only the rest
+        to_fetch: list[tuple[str, date]] = []
+        for league in leagues:
+            is_tsdb = self._service.get_provider_name(league) == "tsdb"
+            for fetch_date in dates_to_fetch:
+                stored = None
+                if self._event_store is not None:
+                    stored = self._event_store.lookup(league, fetch_date, cache_only=is_tsdb)
+                if stored is None:
+                    to_fetch.append((league, fetch_date))
+                else:
+                    all_events.extend(stored)
+
+        if not to_fetch:
+            return all_events
+
         def fetch_league_events(league: str, fetch_date: date) -> tuple[str, date, list[Event]]:
             """Fetch events for a single league/date (for parallel execution)."""
             try:
@@ -1689,13 +2043,12 @@ class EventGroupProcessor:
                 )
                 return (league, fetch_date, [])
 
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Create tasks for all league/date combinations
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(to_fetch))) as executor:
+            # Create tasks for all league/date combinations not already prefetched
             futures = {}
-            for league in leagues:
-                for fetch_date in dates_to_fetch:
-                    future = executor.submit(fetch_league_events, league, fetch_date)
-                    futures[future] = (league, fetch_date)
+            for league, fetch_date in to_fetch:
+                future = executor.submit(fetch_league_events, league, fetch_date)
+                futures[future] = (league, fetch_date)
 
             for future in as_completed(futures):
                 try:
@@ -1768,6 +2121,7 @@ class EventGroupProcessor:
             custom_regex_league=group.custom_regex_league,
             custom_regex_league_enabled=group.custom_regex_league_enabled,
             shared_events=self._shared_events,  # Reuse events across groups in same run
+            event_store=self._event_store,  # Run-wide prefetched events (if planned)
             stream_timezone=group.stream_timezone,  # TZ for interpreting stream dates
         )
 
@@ -2548,6 +2902,10 @@ class EventGroupProcessor:
         except Exception as e:
             logger.debug("[EVENT_EPG] Error reassigning channel numbers: %s", e)
 
+        # Record Dispatcharr write stats for this group and the whole batch
+        self._last_write_stats = lifecycle_service.write_stats
+        self._write_stats.merge(lifecycle_service.write_stats)
+
         return combined_result
 
     def _load_event_template(self, conn: Connection, template_id: int):
@@ -3087,6 +3445,7 @@ def preview_event_group(
     group_id: int,
     dispatcharr_client: Any = None,
     target_date: date | None = None,
+    from_snapshot: bool = False,
 ) -> PreviewResult:
     """Preview stream matching for an event group.
 
@@ -3098,6 +3457,7 @@ def preview_event_group(
         group_id: Group ID to preview
         dispatcharr_client: Optional DispatcharrClient
         target_date: Target date (defaults to today)
+        from_snapshot: Answer from the last stream snapshot (preview_group_fast)
 
     Returns:
         PreviewResult with stream matching details
@@ -3106,4 +3466,6 @@ def preview_event_group(
         db_factory=db_factory,
         dispatcharr_client=dispatcharr_client,
     )
+    if from_snapshot:
+        return processor.preview_group_fast(group_id, target_date)
     return processor.preview_group(group_id, target_date)
@@ -15,6 +15,7 @@ Design principles:
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import date as date_type
 from datetime import datetime, timedelta
 
@@ -38,6 +39,51 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
+class _EventSchedule:
+    """A team's events with local dates computed once, for per-day lookups.
+
+    Each event's date in the user timezone is converted a single time.
+    Day queries bisect the parallel date/start arrays instead of rescanning
+    (and re-converting) the whole schedule for every EPG day.
+    """
+
+    __slots__ = ("_by_date", "_dates", "_by_start", "_starts")
+
+    def __init__(self, events: list[Event]):
+        """events must be sorted by start_time."""
+        dated = [(to_user_tz(e.start_time).date(), e) for e in events]
+        # Already in date order except across a DST change at midnight;
+        # the sort is stable so each day keeps start-time order
+        dated.sort(key=lambda pair: pair[0])
+        self._by_date = [e for _, e in dated]
+        self._dates = [d for d, _ in dated]
+        self._by_start = events
+        self._starts = [e.start_time for e in events]
+
+    def __len__(self) -> int:
+        return len(self._by_start)
+
+    def on(self, day: date_type) -> list[Event]:
+        """Events on a local date, by start time."""
+        lo = bisect_left(self._dates, day)
+        return self._by_date[lo : bisect_right(self._dates, day, lo)]
+
+    def last_on(self, day: date_type) -> Event | None:
+        """Last event on a local date."""
+        i = bisect_right(self._dates, day)
+        return self._by_date[i - 1] if i and self._dates[i - 1] == day else None
+
+    def first_after(self, day: date_type) -> Event | None:
+        """First event on a later local date."""
+        i = bisect_right(self._dates, day)
+        return self._by_date[i] if i < len(self._by_date) else None
+
+    def last_before(self, instant: datetime) -> Event | None:
+        """Last event starting before an instant."""
+        i = bisect_left(self._starts, instant)
+        return self._by_start[i - 1] if i else None
+
+
 class FillerGenerator:
     """Generates filler programmes between events.
 
@@ -99,6 +145,7 @@ class FillerGenerator:
 
         # Sort events by start time
         sorted_events = sorted(events, key=lambda e: e.start_time)
+        schedule = _EventSchedule(sorted_events)
 
         # Calculate EPG window
         # Key insight from V1: EPG start should be synchronized with earliest event
@@ -134,7 +181,7 @@ class FillerGenerator:
         while current_date <= end_date:
             day_fillers = self._generate_day_fillers(
                 date=current_date,
-                events=sorted_events,
+                schedule=schedule,
                 team_config=team_config,
                 team_stats=team_stats,
                 channel_id=channel_id,
@@ -157,7 +204,7 @@ class FillerGenerator:
     def _generate_day_fillers(
         self,
         date,  # date object
-        events: list[Event],
+        schedule: _EventSchedule,
         team_config: TeamChannelContext,
         team_stats: TeamStats | None,
         channel_id: str,
@@ -179,38 +226,36 @@ class FillerGenerator:
         if date == epg_start.date():
             day_start = epg_start.replace(second=0, microsecond=0)
 
-        # Helper to get event date in user timezone
-        def event_date(e: Event) -> date_type:
-            return to_user_tz(e.start_time).date()
-
         # Get events for this day
-        day_events = [e for e in events if event_date(e) == date]
+        day_events = schedule.on(date)
 
         # Get previous day's last event (for midnight crossover)
-        prev_day_events = [e for e in events if event_date(e) == date - timedelta(days=1)]
-        prev_day_last_event = prev_day_events[-1] if prev_day_events else None
+        prev_day_last_event = schedule.last_on(date - timedelta(days=1))
 
         # Get next event after this day (for .next context)
-        future_events = [e for e in events if event_date(e) > date]
-        next_future_event = future_events[0] if future_events else None
+        next_future_event = schedule.first_after(date)
 
         # Debug logging for idle day .next context
         if not day_events and next_future_event:
             logger.debug(
-                f"Idle day {date}: next_future_event={next_future_event.name} on "
-                f"{event_date(next_future_event)} ({next_future_event.home_team.name} vs "
-                f"{next_future_event.away_team.name})"
+                "Idle day %s: next_future_event=%s on %s (%s vs %s)",
+                date,
+                next_future_event.name,
+                to_user_tz(next_future_event.start_time).date(),
+                next_future_event.home_team.name,
+                next_future_event.away_team.name,
             )
         elif not day_events and not next_future_event:
             logger.debug(
-                f"Idle day {date}: NO next_future_event found. Total events in schedule: {len(events)}"  # noqa: E501
+                "Idle day %s: NO next_future_event found. Total events in schedule: %d",
+                date,
+                len(schedule),
             )
 
         # Find last completed event relative to THIS DAY (for .last context)
         # Important: use day_start (the EPG date) not epg_start (actual now)
         # This ensures .last refers to the most recent game before the programme being generated
-        past_events = [e for e in events if e.start_time < day_start]
-        last_past_event = past_events[-1] if past_events else None
+        last_past_event = schedule.last_before(day_start)
 
         fillers: list[Programme] = []
 
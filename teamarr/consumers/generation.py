@@ -7,16 +7,32 @@ Both the streaming API endpoint and the background scheduler call this.
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from teamarr.utilities import metrics
+
 logger = logging.getLogger(__name__)
 
-# Global lock to prevent concurrent EPG generation runs
+# Global lock held for the whole of a full or scoped generation run. Both
+# touch channel lifecycle and numbering, so they never overlap.
 _generation_lock = threading.Lock()
+# True while a full run holds _generation_lock
 _generation_running = False
+# True while a full run waits for an in-flight scoped run to finish
+_full_run_pending = False
+# Guards the two flags above together with lock acquisition
+_generation_state_guard = threading.Lock()
+
+# How long a full run waits for an in-flight scoped run before giving up
+SCOPED_RUN_WAIT_SECONDS = 600
+
+# Held while writing or splicing the output files (full and scoped runs)
+_xmltv_output_lock = threading.Lock()
 
 
 @dataclass
@@ -30,6 +46,8 @@ class GenerationResult:
     started_at: float = 0.0
     completed_at: float = 0.0
     duration_seconds: float = 0.0
+    # Per-phase spans and counters recorded during the run (see utilities.metrics)
+    timings: dict = field(default_factory=dict)
 
     # EPG stats
     teams_processed: int = 0
@@ -52,6 +70,8 @@ class GenerationResult:
     reconciliation: dict = field(default_factory=dict)
     cleanup: dict = field(default_factory=dict)
     logo_cleanup: dict = field(default_factory=dict)
+    # Dispatcharr write pipeline: queue depth, coalesced writes, latency histogram
+    dispatcharr_writes: dict = field(default_factory=dict)
 
     # For stats run tracking
     run_id: int | None = None
@@ -73,9 +93,9 @@ def run_full_generation(
     streaming API endpoint and the background scheduler call this function.
 
     Workflow:
-    1. Refresh M3U accounts (0-5%)
-    2. Process all teams (5-50%) - 45% budget
-    3. Process all event groups (50-95%) - 45% budget
+    1. Refresh M3U accounts in the background (0-5%)
+    2. Process all teams in the background (5-92%, shared with step 3)
+    3. Process all event groups once M3U refresh is done (5-92%, shared with step 2)
     4. Merge and save XMLTV (95-96%)
     5. Dispatcharr EPG refresh + channel association (96-98%)
     6. Process scheduled deletions (98-99%)
@@ -89,35 +109,18 @@ def run_full_generation(
     Returns:
         GenerationResult with all stats and sub-task results
     """
-    global _generation_running
-
-    # Prevent concurrent generation runs
-    if not _generation_lock.acquire(blocking=False):
+    # Prevent concurrent generation runs; wait out an in-flight scoped run
+    if not _acquire_full_generation():
         logger.warning("[GENERATION] Already in progress, skipping duplicate run")
         result = GenerationResult()
         result.success = False
         result.error = "Generation already in progress"
         return result
 
-    if _generation_running:
-        _generation_lock.release()
-        logger.warning("[GENERATION] Already in progress (flag check), skipping")
-        result = GenerationResult()
-        result.success = False
-        result.error = "Generation already in progress"
-        return result
-
-    _generation_running = True
-
-    from teamarr.consumers import (
-        create_lifecycle_service,
-        create_reconciler,
-        process_all_event_groups,
-        process_all_teams,
-    )
+    from teamarr.consumers import create_lifecycle_service, create_reconciler
     from teamarr.consumers.team_processor import get_all_team_xmltv
     from teamarr.database.channels import get_reconciliation_settings
-    from teamarr.database.groups import get_all_group_xmltv
+    from teamarr.database.groups import get_all_group_xmltv, get_group_xmltv_source_key
     from teamarr.database.settings import (
         get_dispatcharr_settings,
         get_display_settings,
@@ -125,9 +128,16 @@ def run_full_generation(
         get_gold_zone_settings,
     )
     from teamarr.database.stats import create_run
+    from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, SCOPE_FULL
     from teamarr.dispatcharr import EPGManager
     from teamarr.services import create_default_service
-    from teamarr.utilities.xmltv import merge_xmltv_content
+    from teamarr.services.sports_data import reset_league_stats_misses
+    from teamarr.utilities.xmltv import (
+        analyze_xmltv_tree,
+        merge_xmltv_content,
+        merge_xmltv_tree,
+        serialize_xmltv,
+    )
 
     result = GenerationResult()
     result.started_at = time.time()
@@ -163,8 +173,7 @@ def run_full_generation(
 
             if recent_running:
                 conn.execute("ROLLBACK")
-                _generation_running = False
-                _generation_lock.release()
+                _release_full_generation()
                 logger.warning(
                     "[GENERATION] Already in progress (run %d), skipping", recent_running["id"]
                 )
@@ -185,14 +194,14 @@ def run_full_generation(
                 logger.debug(
                     "[GENERATION] Rollback failed during lock acquisition: %s", rollback_err
                 )
-            _generation_running = False
-            _generation_lock.release()
+            _release_full_generation()
             logger.error("[GENERATION] Failed to acquire lock: %s", e)
             result = GenerationResult()
             result.success = False
             result.error = f"Failed to acquire lock: {e}"
             return result
 
+    metrics.begin_run()
     try:
         # Increment generation counter ONCE at start of full EPG run
         # This ensures all groups in this run share the same generation
@@ -205,6 +214,7 @@ def run_full_generation(
         # This ensures the event cache stays warm throughout the entire run
         # (Previously each consumer created its own service with a cold cache)
         shared_service = create_default_service()
+        reset_league_stats_misses()
 
         # Get settings
         with db_factory() as conn:
@@ -218,99 +228,65 @@ def run_full_generation(
         try:
             from teamarr.services.linear_epg_service import LinearEpgService
             linear_service = LinearEpgService(db_factory=db_factory)
-            linear_service.refresh_cache()
+            with metrics.span("generation_phase", phase="linear_epg"):
+                linear_service.refresh_cache()
         except Exception as e:
             logger.warning("[GENERATION] Linear EPG refresh failed: %s", e)
 
         # Step 1: Refresh M3U accounts (2-5%)
-        update_progress("init", 3, "Refreshing M3U accounts...")
+        # Teams don't use M3U streams, so the refresh runs in the background
+        # during the team phase and is only awaited before groups start.
+        m3u_future: Future | None = None
         if dispatcharr_client:
-            result.m3u_refresh = _refresh_m3u_accounts(db_factory, dispatcharr_client)
-
-        # Step 2: Process all teams (5-50%) - 45% budget
-        update_progress("teams", 5, "Processing teams...")
+            update_progress("init", 3, "Refreshing M3U accounts in background...")
+            m3u_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="m3u-refresh")
+            m3u_future = m3u_executor.submit(
+                _timed_phase, "m3u_refresh", _refresh_m3u_accounts, db_factory, dispatcharr_client
+            )
+            m3u_executor.shutdown(wait=False)
 
+        # Steps 2-3: Teams and event groups (5-92%) run as overlapping phases
         teams_start_time = time.time()
-
-        def team_progress(current: int, total: int, name: str):
-            # Maps 0-100% within teams to 5-50% overall
-            pct = 5 + int((current / total) * 45) if total > 0 else 5
-            elapsed = time.time() - teams_start_time
-            remaining = total - current
-
-            # Messages from team_processor already include context
-            # (Processing X..., Finished X, now processing: Y, Z)
-            # Just add timing and counts
-            if remaining > 0:
-                msg = f"{name} ({current}/{total}) - {remaining} remaining [{elapsed:.1f}s]"
-            else:
-                msg = f"{name} ({current}/{total}) [{elapsed:.1f}s]"
-            update_progress("teams", pct, msg, current, total, name)
-
-        team_result = process_all_teams(db_factory=db_factory, progress_callback=team_progress)
-        result.teams_processed = team_result.teams_processed
-        result.teams_programmes = team_result.total_programmes
-
-        # Transition message - teams done, starting groups
-        logger.info("[GENERATION] Sending transition message: teams -> groups")
-        update_progress(
-            "groups",
-            50,
-            f"Teams complete ({result.teams_processed} processed), loading event groups...",
-            0,
-            1,
-            "Loading event groups...",
-        )
-        logger.info("[GENERATION] Transition message sent")
-
-        # Step 3: Process all event groups (50-95%) - 45% budget
-
-        groups_start_time = time.time()
-
-        def group_progress(current: int, total: int, name: str):
-            # Maps 0-100% within groups to 50-95% overall
-            pct = 50 + int((current / total) * 45) if total > 0 else 50
-            elapsed = time.time() - groups_start_time
-
-            # Check if this is a stream-level progress update (contains ✓ or ✗)
-            if "✓" in name or "✗" in name:
-                # Stream-level progress - name contains "GroupName: StreamName ✓/✗ (x/y)"
-                # Pass the full message as item_name for display in toast
-                update_progress("groups", pct, name, current, total, name)
-            else:
-                # Group completion - add context
-                remaining = total - current
-                if remaining > 0:
-                    msg = f"Finished {name} ({current}/{total}) - {remaining} remaining [{elapsed:.1f}s]"  # noqa: E501
-                else:
-                    msg = f"Finished {name} ({current}/{total}) [{elapsed:.1f}s]"
-                update_progress("groups", pct, msg, current, total, name)
-
-        group_result = process_all_event_groups(
-            db_factory=db_factory,
-            dispatcharr_client=dispatcharr_client,
-            progress_callback=group_progress,
-            generation=current_generation,  # Share generation across all groups
-            service=shared_service,  # Reuse service to maintain warm cache
+        team_result, group_result = _process_teams_and_groups(
+            db_factory,
+            dispatcharr_client,
+            m3u_future,
+            result,
+            update_progress,
+            generation=current_generation,
+            service=shared_service,
         )
         result.groups_processed = group_result.groups_processed
         result.groups_programmes = group_result.total_programmes
+        result.dispatcharr_writes = group_result.write_stats.to_dict()
+        result.teams_processed = team_result.teams_processed
+        result.teams_programmes = team_result.total_programmes
         result.programmes_total = result.teams_programmes + result.groups_programmes
+        logger.info(
+            "[GENERATION] Teams and groups complete in %.1fs (overlapped)",
+            time.time() - teams_start_time,
+        )
 
         # Step 3b: Global channel reassignment (if enabled)
-        _sync_global_channels(db_factory, dispatcharr_client, update_progress)
+        with metrics.span("generation_phase", phase="global_channels"):
+            _sync_global_channels(db_factory, dispatcharr_client, update_progress)
 
         # Step 3b: Apply stream ordering rules to all channels (93-95%)
         update_progress("ordering", 93, "Applying stream ordering rules...")
-        result.stream_ordering = _apply_stream_ordering(
-            db_factory, dispatcharr_client, update_progress
+        result.stream_ordering = _timed_phase(
+            "stream_ordering",
+            _apply_stream_ordering,
+            db_factory,
+            dispatcharr_client,
+            update_progress,
         )
 
         # Step 3c: Gold Zone channel (if enabled)
         gold_zone_result: GoldZoneResult | None = None
         if gold_zone_settings.enabled and dispatcharr_client:
             update_progress("gold_zone", 94, "Processing Gold Zone...")
-            gold_zone_result = _process_gold_zone(
+            gold_zone_result = _timed_phase(
+                "gold_zone", _process_gold_zone,
                 db_factory, dispatcharr_client, gold_zone_settings,
                 settings, update_progress,
             )
@@ -318,42 +294,65 @@ def run_full_generation(
         # Step 4: Merge and save XMLTV (95-96%)
         update_progress("saving", 95, "Saving XMLTV...")
 
-        xmltv_contents: list[str] = []
-        with db_factory() as conn:
-            team_xmltv = get_all_team_xmltv(conn)
-            xmltv_contents.extend(team_xmltv)
-            group_xmltv = get_all_group_xmltv(conn)
-            xmltv_contents.extend(group_xmltv)
-
-        # Inject Gold Zone external EPG if available
-        if gold_zone_result and gold_zone_result.epg_xml:
-            xmltv_contents.append(gold_zone_result.epg_xml)
-            logger.info(
-                "[GOLD_ZONE] Injected EPG into merge (%d bytes, channel_id=%s)",
-                len(gold_zone_result.epg_xml),
-                gold_zone_result.dispatcharr_channel_id,
-            )
-        elif gold_zone_result:
-            logger.warning("[GOLD_ZONE] Result present but no EPG XML")
-        elif gold_zone_settings.enabled:
-            logger.warning("[GOLD_ZONE] Enabled but no result returned")
-
-        output_path = settings.epg_output_path
-        if xmltv_contents and output_path:
-            merged_xmltv = merge_xmltv_content(
-                xmltv_contents,
-                generator_name=display_settings.xmltv_generator_name,
-                generator_url=display_settings.xmltv_generator_url,
-            )
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(merged_xmltv, encoding="utf-8")
-            result.file_written = True
-            result.file_path = str(output_file.absolute())
-            result.file_size = len(merged_xmltv)
-            logger.info(
-                "[GENERATION] EPG written to %s (%s bytes)", output_path, f"{result.file_size:,}"
-            )
+        with metrics.span("generation_phase", phase="xmltv_save"):
+            xmltv_contents: list[str] = []
+            with db_factory() as conn:
+                team_xmltv = get_all_team_xmltv(conn)
+                xmltv_contents.extend(team_xmltv)
+                group_xmltv = get_all_group_xmltv(conn)
+                xmltv_contents.extend(group_xmltv)
+                group_source_key = get_group_xmltv_source_key(conn)
+
+            # Inject Gold Zone external EPG if available
+            if gold_zone_result and gold_zone_result.epg_xml:
+                xmltv_contents.append(gold_zone_result.epg_xml)
+                logger.info(
+                    "[GOLD_ZONE] Injected EPG into merge (%d bytes, channel_id=%s)",
+                    len(gold_zone_result.epg_xml),
+                    gold_zone_result.dispatcharr_channel_id,
+                )
+            elif gold_zone_result:
+                logger.warning("[GOLD_ZONE] Result present but no EPG XML")
+            elif gold_zone_settings.enabled:
+                logger.warning("[GOLD_ZONE] Enabled but no result returned")
+
+            output_path = settings.epg_output_path
+            if xmltv_contents and output_path:
+                # Analyze the merged tree before serializing so the analysis
+                # endpoint never has to parse the written guide again
+                merged_root = merge_xmltv_tree(
+                    xmltv_contents,
+                    generator_name=display_settings.xmltv_generator_name,
+                    generator_url=display_settings.xmltv_generator_url,
+                )
+                analysis = analyze_xmltv_tree(merged_root)
+                merged_xmltv = serialize_xmltv(merged_root)
+                del merged_root
+                output_file = Path(output_path)
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with _xmltv_output_lock, db_factory() as conn:
+                    _write_xmltv_artifact(
+                        conn, SCOPE_FULL, output_file, merged_xmltv, result.run_id,
+                        analysis=analysis,
+                    )
+                    if group_xmltv:
+                        events_xmltv = merge_xmltv_content(
+                            group_xmltv,
+                            generator_name=display_settings.xmltv_generator_name,
+                            generator_url=display_settings.xmltv_generator_url,
+                        )
+                        _write_xmltv_artifact(
+                            conn, SCOPE_EVENTS, _events_output_path(output_file),
+                            events_xmltv, result.run_id, source_key=group_source_key,
+                        )
+                result.file_written = True
+                result.file_path = str(output_file.absolute())
+                result.file_size = len(merged_xmltv)
+                logger.info(
+                    "[GENERATION] EPG written to %s (%s bytes)",
+                    output_path,
+                    f"{result.file_size:,}",
+                )
 
         # Create lifecycle service once for steps 5-6
         # Reuse shared_service to maintain cache warmth
@@ -375,7 +374,10 @@ def run_full_generation(
             )
             epg_manager = EPGManager(raw_client)
             # Increased timeout from 60s to 120s for large EPGs
-            refresh_result = epg_manager.wait_for_refresh(dispatcharr_settings.epg_id, timeout=120)
+            with metrics.span("generation_phase", phase="dispatcharr_epg_refresh"):
+                refresh_result = epg_manager.wait_for_refresh(
+                    dispatcharr_settings.epg_id, timeout=120
+                )
             result.epg_refresh = {
                 "success": refresh_result.success,
                 "message": refresh_result.message,
@@ -383,15 +385,19 @@ def run_full_generation(
             }
 
             update_progress("dispatcharr", 97, "Associating EPG with channels...")
-            result.epg_association = lifecycle_service.associate_epg_with_channels(
-                dispatcharr_settings.epg_id
+            result.epg_association = _timed_phase(
+                "epg_association",
+                lifecycle_service.associate_epg_with_channels,
+                dispatcharr_settings.epg_id,
             )
 
         # Step 6: Process scheduled deletions (98-99%)
         update_progress("lifecycle", 98, "Processing scheduled deletions...")
         channels_deleted_count = 0
         try:
-            deletion_result = lifecycle_service.process_scheduled_deletions()
+            deletion_result = _timed_phase(
+                "deletions", lifecycle_service.process_scheduled_deletions
+            )
             channels_deleted_count = len(deletion_result.deleted)
             result.deletions = {
                 "deleted_count": channels_deleted_count,
@@ -410,7 +416,8 @@ def run_full_generation(
                 recon_settings = get_reconciliation_settings(conn)
             if recon_settings.get("reconcile_on_epg_generation", True):
                 reconciler = create_reconciler(db_factory, dispatcharr_client)
-                recon_result = reconciler.reconcile(auto_fix=False)
+                with metrics.span("generation_phase", phase="reconciliation"):
+                    recon_result = reconciler.reconcile(auto_fix=False)
                 result.reconciliation = recon_result.summary
                 if recon_result.issues_found:
                     logger.info("[RECONCILE] Found %d issue(s)", len(recon_result.issues_found))
@@ -420,7 +427,9 @@ def run_full_generation(
 
         # Cleanup (history, old runs, unused logos — part of step 7)
         update_progress("cleanup", 99, "Cleaning up history...")
-        cleanup_results = _run_cleanup_tasks(db_factory, dispatcharr_client, update_progress)
+        cleanup_results = _timed_phase(
+            "cleanup", _run_cleanup_tasks, db_factory, dispatcharr_client, update_progress
+        )
         result.cleanup = cleanup_results["history"]
         result.logo_cleanup = cleanup_results["logos"]
 
@@ -432,6 +441,7 @@ def run_full_generation(
 
         result.completed_at = time.time()
         result.duration_seconds = round(result.completed_at - result.started_at, 1)
+        result.timings = metrics.run_summary()
         result.success = True
 
         update_progress("complete", 100, "Generation complete")
@@ -443,6 +453,13 @@ def run_full_generation(
         if flushed > 0:
             logger.debug("[CACHE] Flushed %d entries to SQLite", flushed)
 
+        # Provider responses are written through; just drop expired ones
+        from teamarr.utilities.cache import cleanup_provider_response_caches
+
+        removed = cleanup_provider_response_caches()
+        if removed > 0:
+            logger.debug("[CACHE] Removed %d expired provider responses", removed)
+
     except Exception as e:
         logger.exception("[GENERATION] Failed: %s", e)
         result.success = False
@@ -450,10 +467,13 @@ def run_full_generation(
         result.completed_at = time.time()
         result.duration_seconds = round(result.completed_at - result.started_at, 1)
 
+        result.timings = metrics.run_summary()
+
         # Save failed run
         try:
             from teamarr.database.stats import save_run as _save_run
 
+            stats_run.extra_metrics["timings"] = result.timings
             stats_run.complete(status="failed", error=str(e))
             with db_factory() as conn:
                 _save_run(conn, stats_run)
@@ -461,15 +481,615 @@ def run_full_generation(
             logger.warning("[GENERATION] Failed to save failed run stats: %s", save_err)
 
     finally:
+        metrics.end_run()
         # Always release the lock
+        _release_full_generation()
+
+    return result
+
+
+def _acquire_full_generation() -> bool:
+    """Take the generation lock for a full run.
+
+    Returns False if another full run is running or already waiting. If a
+    scoped run holds the lock, waits for it (up to SCOPED_RUN_WAIT_SECONDS);
+    new scoped runs are refused meanwhile so the full run isn't starved.
+    """
+    global _full_run_pending, _generation_running
+
+    with _generation_state_guard:
+        if _generation_running or _full_run_pending:
+            return False
+        if _generation_lock.acquire(blocking=False):
+            _generation_running = True
+            return True
+        _full_run_pending = True
+
+    logger.info("[GENERATION] Waiting for scoped regeneration to finish")
+    acquired = _generation_lock.acquire(timeout=SCOPED_RUN_WAIT_SECONDS)
+    with _generation_state_guard:
+        _full_run_pending = False
+        _generation_running = acquired
+    return acquired
+
+
+def _release_full_generation() -> None:
+    """Release the generation lock taken by _acquire_full_generation."""
+    global _generation_running
+
+    with _generation_state_guard:
         _generation_running = False
         _generation_lock.release()
 
+
+def generation_in_progress() -> bool:
+    """Whether a full or scoped run holds (or a full run awaits) the generation lock."""
+    with _generation_state_guard:
+        return _generation_running or _full_run_pending or _generation_lock.locked()
+
+
+@contextmanager
+def _scoped_generation_slot() -> Iterator[str | None]:
+    """Hold the generation lock for a scoped update, if it is free.
+
+    Yields None while holding the lock, or the reason it isn't available
+    (without holding anything). Refused while a full run is running or
+    waiting, so full runs aren't starved.
+    """
+    with _generation_state_guard:
+        if _generation_running or _full_run_pending:
+            busy = "Full generation in progress"
+        elif not _generation_lock.acquire(blocking=False):
+            busy = "Generation already in progress"
+        else:
+            busy = None
+    if busy:
+        yield busy
+        return
+    try:
+        yield None
+    finally:
+        _generation_lock.release()
+
+
+def run_scoped_generation(
+    db_factory: Callable[[], Any],
+    group_id: int | None = None,
+    team_id: int | None = None,
+    dispatcharr_client: Any | None = None,
+) -> GenerationResult:
+    """Regenerate EPG for one event group or one team.
+
+    Reprocesses just that unit (which stores its per-unit XMLTV row), then
+    splices the unit's channels into the written guide instead of
+    re-merging everything. Holds the generation lock for the whole run, so
+    scoped runs never overlap each other or a full run; a full run started
+    meanwhile waits for this one to finish.
+
+    Skips the steps a full run does for the whole lineup: M3U refresh, other
+    units, waiting on Dispatcharr's EPG import, EPG association, deletions
+    and reconciliation. Dispatcharr's EPG refresh is triggered, not awaited.
+
+    Args:
+        db_factory: Factory function returning database connection context manager
+        group_id: Event group to regenerate
+        team_id: Team to regenerate (exactly one of group_id/team_id)
+        dispatcharr_client: Optional DispatcharrClient for Dispatcharr operations
+
+    Returns:
+        GenerationResult (file_* fields describe the rewritten guide)
+    """
+    if (group_id is None) == (team_id is None):
+        raise ValueError("Exactly one of group_id or team_id is required")
+
+    unit = ("group", group_id) if group_id is not None else ("team", team_id)
+    result = GenerationResult()
+    result.started_at = time.time()
+
+    def fail(error: str) -> GenerationResult:
+        result.success = False
+        result.error = error
+        result.completed_at = time.time()
+        result.duration_seconds = result.completed_at - result.started_at
+        return result
+
+    with _scoped_generation_slot() as busy:
+        if busy:
+            return fail(busy)
+        try:
+            with metrics.span("scoped_generation", scope=unit[0]):
+                _run_scoped_generation(db_factory, unit, dispatcharr_client, result)
+        except Exception as e:
+            logger.exception("[GENERATION] Scoped run for %s %s failed", *unit)
+            return fail(str(e))
+
+    result.completed_at = time.time()
+    result.duration_seconds = result.completed_at - result.started_at
+    if result.success:
+        logger.info(
+            "[GENERATION] Regenerated %s %s: %d programmes in %.1fs",
+            unit[0],
+            unit[1],
+            result.programmes_total,
+            result.duration_seconds,
+        )
+    return result
+
+
+def _run_scoped_generation(
+    db_factory: Callable[[], Any],
+    unit: tuple[str, int],
+    dispatcharr_client: Any | None,
+    result: GenerationResult,
+) -> None:
+    """Process one unit and splice it into the guide (see run_scoped_generation)."""
+    from teamarr.consumers import process_event_group, process_team
+    from teamarr.consumers.team_processor import get_all_team_xmltv, get_team_xmltv
+    from teamarr.database.groups import get_group, get_group_xmltv
+    from teamarr.database.teams import get_team
+    from teamarr.utilities.xmltv import xmltv_channel_ids
+
+    kind, unit_id = unit
+    with db_factory() as conn:
+        if kind == "group":
+            exists = get_group(conn, unit_id) is not None
+            old_xmltv = get_group_xmltv(conn, unit_id)
+            events_current = _events_guide_current(conn)
+        else:
+            exists = get_team(conn, unit_id) is not None
+            old_xmltv = get_team_xmltv(conn, unit_id)
+            events_current = False
+    if not exists:
+        result.success = False
+        result.error = f"{kind.capitalize()} {unit_id} not found"
+        return
+
+    if kind == "group":
+        group_result = _timed_phase(
+            "scoped_process", process_event_group, db_factory, unit_id, dispatcharr_client
+        )
+        errors = group_result.errors
+        result.groups_processed = 1
+        result.groups_programmes = group_result.programmes_generated
+    else:
+        team_result = _timed_phase("scoped_process", process_team, db_factory, unit_id)
+        errors = team_result.errors
+        result.teams_processed = 1
+        result.teams_programmes = team_result.programmes_generated
+    result.programmes_total = result.groups_programmes + result.teams_programmes
+    for error in errors:
+        logger.warning("[GENERATION] %s %s: %s", kind, unit_id, error)
+
+    with db_factory() as conn:
+        # Disabled groups / inactive teams drop out of the guide entirely
+        if kind == "group":
+            group = get_group(conn, unit_id)
+            new_xmltv = get_group_xmltv(conn, unit_id) if group and group.enabled else None
+        else:
+            active = get_all_team_xmltv(conn, [unit_id])
+            new_xmltv = active[0] if active else None
+
+    channel_ids = xmltv_channel_ids(old_xmltv) | xmltv_channel_ids(new_xmltv)
+    _splice_into_guide(
+        db_factory, channel_ids, new_xmltv, events_current, dispatcharr_client, result
+    )
+
+
+def run_live_update(
+    db_factory: Callable[[], Any],
+    events: list[Any],
+    group_ids: set[int],
+    team_ids: set[int],
+    dispatcharr_client: Any | None = None,
+    service: Any | None = None,
+) -> GenerationResult:
+    """Re-render the channels showing some refreshed events.
+
+    The live-score fast path. Event groups aren't reprocessed: their
+    existing channels for the events are re-rendered from the stored
+    matches (EventGroupProcessor.rerender_event_channels), so no streams
+    are fetched and channel lifecycle isn't touched. Teams are reprocessed,
+    which reads the patched schedule cache. Everything is spliced into the
+    guide in one pass, under the generation lock like a scoped run.
+
+    Args:
+        db_factory: Factory function returning database connection context manager
+        events: Refreshed events whose score or state changed
+        group_ids: Event groups with channels for the events
+        team_ids: Teams playing in the events
+        dispatcharr_client: Optional DispatcharrClient for the EPG refresh
+        service: SportsDataService for rendering (defaults to a new one)
+
+    Returns:
+        GenerationResult; groups_processed/teams_processed count the units
+        re-rendered, error is set if the lock wasn't available
+    """
+    from teamarr.consumers import EventGroupProcessor, process_team
+    from teamarr.consumers.team_processor import get_all_team_xmltv, get_team_xmltv
+    from teamarr.utilities.xmltv import merge_xmltv_content, xmltv_channel_ids
+
+    result = GenerationResult()
+    result.started_at = time.time()
+    events_by_id = {event.id: event for event in events}
+
+    with _scoped_generation_slot() as busy:
+        if busy:
+            result.success = False
+            result.error = busy
+        else:
+            with db_factory() as conn:
+                events_current = _events_guide_current(conn)
+
+            channel_ids: set[str] = set()
+            parts: list[str] = []
+            processor = EventGroupProcessor(db_factory=db_factory, service=service)
+            for group_id in sorted(group_ids):
+                try:
+                    update = processor.rerender_event_channels(group_id, events_by_id)
+                except Exception as e:
+                    logger.warning("[LIVE] Re-rendering group %d failed: %s", group_id, e)
+                    continue
+                if update:
+                    channel_ids |= update[0]
+                    parts.append(update[1])
+                    result.groups_processed += 1
+
+            for team_id in sorted(team_ids):
+                with db_factory() as conn:
+                    old_xmltv = get_team_xmltv(conn, team_id)
+                team_result = process_team(db_factory, team_id)
+                if team_result.errors:
+                    logger.warning("[LIVE] Team %d: %s", team_id, "; ".join(team_result.errors))
+                with db_factory() as conn:
+                    active = get_all_team_xmltv(conn, [team_id])
+                new_xmltv = active[0] if active else None
+                channel_ids |= xmltv_channel_ids(old_xmltv) | xmltv_channel_ids(new_xmltv)
+                if new_xmltv:
+                    parts.append(new_xmltv)
+                result.teams_processed += 1
+                result.teams_programmes += team_result.programmes_generated
+
+            if channel_ids:
+                _splice_into_guide(
+                    db_factory,
+                    channel_ids,
+                    merge_xmltv_content(parts) if parts else None,
+                    events_current,
+                    dispatcharr_client,
+                    result,
+                )
+
+    result.completed_at = time.time()
+    result.duration_seconds = result.completed_at - result.started_at
     return result
 
 
+def _events_guide_current(conn: Any) -> bool:
+    """Whether the written events-only guide matches the stored group XMLTV.
+
+    Check before storing new group XMLTV: a stale events guide is left to
+    the next full run rather than spliced.
+    """
+    from teamarr.database.groups import get_group_xmltv_source_key
+    from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, get_xmltv_artifact
+
+    events_artifact = get_xmltv_artifact(conn, SCOPE_EVENTS)
+    return bool(
+        events_artifact
+        and events_artifact.source_key == get_group_xmltv_source_key(conn)
+        and events_artifact.is_current()
+    )
+
+
+def _splice_into_guide(
+    db_factory: Callable[[], Any],
+    channel_ids: set[str],
+    new_xmltv: str | None,
+    events_current: bool,
+    dispatcharr_client: Any | None,
+    result: GenerationResult,
+) -> None:
+    """Replace some channels in the written guide(s) and nudge Dispatcharr."""
+    from teamarr.database.groups import get_all_group_xmltv, get_group_xmltv_source_key
+    from teamarr.database.settings import (
+        get_dispatcharr_settings,
+        get_display_settings,
+        get_epg_settings,
+    )
+    from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, SCOPE_FULL
+
+    with db_factory() as conn:
+        epg_settings = get_epg_settings(conn)
+        display_settings = get_display_settings(conn)
+        dispatcharr_settings = get_dispatcharr_settings(conn)
+
+    output_path = epg_settings.epg_output_path
+    if not output_path:
+        return
+    output_file = Path(output_path)
+
+    with metrics.span("generation_phase", phase="scoped_splice"):
+        with _xmltv_output_lock, db_factory() as conn:
+            full_size = _splice_xmltv_artifact(
+                conn, SCOPE_FULL, output_file, channel_ids, new_xmltv, display_settings,
+                rebuild=lambda: _stored_unit_xmltv(conn),
+            )
+            if events_current:
+                _splice_xmltv_artifact(
+                    conn, SCOPE_EVENTS, _events_output_path(output_file), channel_ids,
+                    new_xmltv, display_settings,
+                    rebuild=lambda: get_all_group_xmltv(conn),
+                    source_key=get_group_xmltv_source_key(conn),
+                )
+    result.file_written = True
+    result.file_path = str(output_file.absolute())
+    result.file_size = full_size
+
+    # Let Dispatcharr pick up the new guide; don't wait for the import
+    if dispatcharr_client and dispatcharr_settings.epg_id:
+        from teamarr.dispatcharr import EPGManager
+        from teamarr.dispatcharr.factory import DispatcharrConnection
+
+        raw_client = (
+            dispatcharr_client.client
+            if isinstance(dispatcharr_client, DispatcharrConnection)
+            else dispatcharr_client
+        )
+        refresh_result = EPGManager(raw_client).refresh(dispatcharr_settings.epg_id)
+        result.epg_refresh = {
+            "success": refresh_result.success,
+            "message": refresh_result.message,
+            "duration": refresh_result.duration,
+        }
+
+
+def _splice_xmltv_artifact(
+    conn: Any,
+    scope: str,
+    path: Path,
+    channel_ids: set[str],
+    xmltv_content: str | None,
+    display_settings: Any,
+    rebuild: Callable[[], list[str]],
+    source_key: str | None = None,
+) -> int:
+    """Splice one unit's XMLTV into a written guide and record the artifact.
+
+    Rebuilds the guide from the stored per-unit rows if no file exists yet.
+    Returns the size of the written guide in bytes.
+    """
+    import xml.etree.ElementTree as ET
+
+    from teamarr.database.xmltv_artifacts import SCOPE_FULL
+    from teamarr.utilities.xmltv import (
+        analyze_xmltv_tree,
+        merge_xmltv_tree,
+        serialize_xmltv,
+        splice_xmltv_tree,
+    )
+
+    root = None
+    if path.exists():
+        try:
+            root = splice_xmltv_tree(ET.parse(path).getroot(), channel_ids, xmltv_content)
+        except ET.ParseError as e:
+            logger.warning("[GENERATION] Rebuilding unreadable guide %s: %s", path, e)
+    if root is None:
+        root = merge_xmltv_tree(
+            rebuild(),
+            generator_name=display_settings.xmltv_generator_name,
+            generator_url=display_settings.xmltv_generator_url,
+        )
+
+    analysis = analyze_xmltv_tree(root) if scope == SCOPE_FULL else None
+    content = serialize_xmltv(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_xmltv_artifact(conn, scope, path, content, None, source_key, analysis)
+    return len(content)
+
+
+def _stored_unit_xmltv(conn: Any) -> list[str]:
+    """XMLTV of all active teams and enabled groups, as a full run merges it."""
+    from teamarr.consumers.team_processor import get_all_team_xmltv
+    from teamarr.database.groups import get_all_group_xmltv
+
+    return get_all_team_xmltv(conn) + get_all_group_xmltv(conn)
+
+
+def _events_output_path(output_file: Path) -> Path:
+    """Events-only guide written next to the main output file."""
+    return output_file.with_name(f"{output_file.stem}-events{output_file.suffix}")
+
+
+def _timed_phase(phase: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Call fn inside a generation_phase timing span."""
+    with metrics.span("generation_phase", phase=phase):
+        return fn(*args, **kwargs)
+
+
+def _process_teams_and_groups(
+    db_factory: Callable[[], Any],
+    dispatcharr_client: Any,
+    m3u_future: Future | None,
+    result: GenerationResult,
+    update_progress: Callable,
+    generation: int,
+    service: Any,
+) -> tuple[Any, Any]:
+    """Process teams in the background while event groups run here.
+
+    Team EPG only needs provider schedules and templates; groups need the
+    refreshed M3U streams. Nothing joins the two until the XMLTV merge.
+    Groups hold write transactions across Dispatcharr calls, so team XMLTV
+    is only stored once groups finish (or fail) - the team worker never
+    competes with them for the SQLite write lock.
+
+    Returns:
+        (BatchTeamResult, group BatchProcessingResult)
+    """
+    from teamarr.consumers import process_all_event_groups, process_all_teams
+    from teamarr.consumers.team_processor import store_team_results
+
+    phase_progress = _PhaseProgress(update_progress, ("teams", "groups"), 5, 92)
+
+    teams_start_time = time.time()
+
+    def team_progress(current: int, total: int, name: str):
+        elapsed = time.time() - teams_start_time
+        remaining = total - current
+
+        # Messages from team_processor already include context
+        # (Processing X..., Finished X, now processing: Y, Z)
+        # Just add timing and counts
+        if remaining > 0:
+            msg = f"{name} ({current}/{total}) - {remaining} remaining [{elapsed:.1f}s]"
+        else:
+            msg = f"{name} ({current}/{total}) [{elapsed:.1f}s]"
+        phase_progress.report("teams", msg, current, total, name)
+
+    phase_progress.report("teams", "Processing teams...")
+    teams_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="team-epg")
+    teams_future = teams_executor.submit(
+        _timed_phase,
+        "teams",
+        process_all_teams,
+        db_factory=db_factory,
+        progress_callback=team_progress,
+        # Team XMLTV is stored below, once groups no longer hold write locks
+        defer_writes=True,
+    )
+    teams_executor.shutdown(wait=False)
+
+    groups_start_time = time.time()
+
+    def group_progress(current: int, total: int, name: str):
+        elapsed = time.time() - groups_start_time
+
+        # Check if this is a stream-level progress update (contains ✓ or ✗)
+        if "✓" in name or "✗" in name:
+            # Stream-level progress - name contains "GroupName: StreamName ✓/✗ (x/y)"
+            # Pass the full message as item_name for display in toast
+            phase_progress.report("groups", name, current, total, name)
+        else:
+            # Group completion - add context
+            remaining = total - current
+            if remaining > 0:
+                msg = f"Finished {name} ({current}/{total}) - {remaining} remaining [{elapsed:.1f}s]"  # noqa: E501
+            else:
+                msg = f"Finished {name} ({current}/{total}) [{elapsed:.1f}s]"
+            phase_progress.report("groups", msg, current, total, name)
+
+    try:
+        # Groups match against M3U streams - wait for the background refresh
+        if m3u_future is not None:
+            if not m3u_future.done():
+                phase_progress.report("groups", "Waiting for M3U refresh to complete...")
+            result.m3u_refresh = m3u_future.result()
+
+        phase_progress.report("groups", "Loading event groups...")
+        group_result = _timed_phase(
+            "groups",
+            process_all_event_groups,
+            db_factory=db_factory,
+            dispatcharr_client=dispatcharr_client,
+            progress_callback=group_progress,
+            generation=generation,  # Share generation across all groups
+            service=service,  # Reuse service to maintain warm cache
+        )
+    finally:
+        # Never leave team processing running past this point, even on failure
+        if not teams_future.done():
+            phase_progress.report("teams", "Event groups complete, finishing teams...")
+        wait([teams_future])
+        if teams_future.exception() is None:
+            store_team_results(db_factory, teams_future.result())
+
+    phase_progress.complete("groups")
+    team_result = teams_future.result()
+    phase_progress.complete("teams")
+    return team_result, group_result
+
+
+class _PhaseProgress:
+    """Combine progress of concurrently running phases into one overall percent.
+
+    Each phase reports its own current/total; the overall percent spans
+    start_pct..end_pct by the average completion of all phases. Messages keep
+    their phase name so the status tracker can show per-phase progress.
+    """
+
+    def __init__(
+        self,
+        update_progress: Callable,
+        phases: tuple[str, ...],
+        start_pct: int,
+        end_pct: int,
+    ):
+        self._update_progress = update_progress
+        self._fractions = dict.fromkeys(phases, 0.0)
+        self._start_pct = start_pct
+        self._end_pct = end_pct
+        self._lock = threading.Lock()
+
+    def _percent(self) -> int:
+        overall = sum(self._fractions.values()) / len(self._fractions)
+        return self._start_pct + int(overall * (self._end_pct - self._start_pct))
+
+    def report(
+        self, phase: str, message: str, current: int = 0, total: int = 0, item_name: str = ""
+    ) -> None:
+        """Report progress for one phase (total=0 leaves its completion unchanged)."""
+        with self._lock:
+            if total > 0:
+                self._fractions[phase] = min(current / total, 1.0)
+            percent = self._percent()
+        self._update_progress(phase, percent, message, current, total, item_name)
+
+    def complete(self, phase: str) -> None:
+        """Mark a phase finished without emitting a progress update."""
+        with self._lock:
+            self._fractions[phase] = 1.0
+
+
+def _write_xmltv_artifact(
+    conn: Any,
+    scope: str,
+    path: Path,
+    content: str,
+    run_id: int | None,
+    source_key: str | None = None,
+    analysis: dict | None = None,
+) -> None:
+    """Write a guide file and record it as the current artifact for its scope."""
+    from teamarr.database.xmltv_artifacts import (
+        XMLTVArtifact,
+        save_xmltv_artifact,
+        xmltv_etag,
+    )
+
+    path.write_text(content, encoding="utf-8")
+    stat = path.stat()
+    save_xmltv_artifact(
+        conn,
+        XMLTVArtifact(
+            scope=scope,
+            path=str(path.absolute()),
+            etag=xmltv_etag(content, run_id),
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            run_id=run_id,
+            source_key=source_key,
+            analysis=analysis,
+        ),
+    )
+
+
 def _refresh_m3u_accounts(db_factory: Callable[[], Any], dispatcharr_client: Any) -> dict:
-    """Refresh M3U accounts for all event groups."""
+    """Refresh M3U accounts for all event groups.
+
+    The accounts refresh together and share one 120s deadline
+    (refresh_multiple's timeout covers the whole batch, not each account).
+    """
     from teamarr.database.groups import get_all_groups
     from teamarr.dispatcharr import M3UManager
 
@@ -738,7 +1358,7 @@ def _finalize_stats_run(
 ) -> None:
     """Populate stats run with generation results and save to database."""
     from teamarr.database.channels import get_all_managed_channels
-    from teamarr.database.stats import save_run
+    from teamarr.database.stats import save_run, update_dashboard_run_rollup
 
     stats_run.programmes_total = result.programmes_total
     stats_run.programmes_events = team_result.total_events + group_result.total_events
@@ -754,6 +1374,9 @@ def _finalize_stats_run(
     stats_run.extra_metrics["teams_processed"] = result.teams_processed
     stats_run.extra_metrics["groups_processed"] = result.groups_processed
     stats_run.extra_metrics["file_written"] = result.file_written
+    stats_run.extra_metrics["dispatcharr_writes"] = result.dispatcharr_writes
+    # Phase/provider/matching spans so far (the remaining steps are sub-second)
+    stats_run.extra_metrics["timings"] = metrics.run_summary()
 
     with db_factory() as conn:
         active_channels = get_all_managed_channels(conn, include_deleted=False)
@@ -764,6 +1387,8 @@ def _finalize_stats_run(
 
     with db_factory() as conn:
         save_run(conn, stats_run)
+        # Dashboard reads this summary instead of re-aggregating match history
+        update_dashboard_run_rollup(conn, stats_run.id)
 
 
 # =============================================================================
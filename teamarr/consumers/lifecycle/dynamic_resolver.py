@@ -10,6 +10,7 @@ from sqlite3 import Connection as SQLiteConnection
 from typing import Any
 
 from teamarr.core.sports import get_sport_display_names_from_db
+from teamarr.dispatcharr.managers.metadata import CHANNEL_GROUPS, CHANNEL_PROFILES
 
 logger = logging.getLogger(__name__)
 
@@ -196,6 +197,7 @@ class DynamicResolver:
         try:
             result = dispatcharr.m3u.create_channel_group(name)
             if result.success and result.data:
+                dispatcharr.metadata.invalidate(CHANNEL_GROUPS)
                 gid = result.data.get("id")
                 if gid:
                     self._groups_by_name[name_lower] = gid
@@ -233,6 +235,7 @@ class DynamicResolver:
         try:
             result = dispatcharr.channels.create_profile(name)
             if result.success and result.data:
+                dispatcharr.metadata.invalidate(CHANNEL_PROFILES)
                 pid = result.data.get("id")
                 if pid:
                     self._profiles_by_name[name_lower] = pid
@@ -13,6 +13,7 @@ from typing import Any
 
 from teamarr.consumers.event_epg import POSTPONED_LABEL, is_event_postponed
 from teamarr.core import Event
+from teamarr.database.channel_numbers import ChannelNumberAllocator
 from teamarr.templates import ContextBuilder, TemplateResolver
 
 from .dynamic_resolver import DynamicResolver
@@ -24,6 +25,7 @@ from .types import (
     StreamProcessResult,
     generate_event_tvg_id,
 )
+from .write_pipeline import DispatcharrWritePipeline, WriteFailure, WritePipelineStats
 
 logger = logging.getLogger(__name__)
 
@@ -150,9 +152,13 @@ class ChannelLifecycleService:
         # Cache exception keywords
         self._exception_keywords: list | None = None
 
-        # Pending profile changes for bulk application
-        # Structure: {profile_id: {"add": set(channel_ids), "remove": set(channel_ids)}}
-        self._pending_profile_changes: dict[int, dict[str, set[int]]] = {}
+        # Queued channel PATCHes and profile changes, applied in batches by
+        # flush_pending_writes() (coalesced per channel, bounded concurrency)
+        self._write_pipeline = DispatcharrWritePipeline(channel_manager)
+
+        # Channel number allocator for the current process_matched_streams batch
+        # (loaded on first allocation, dropped when the batch ends)
+        self._channel_allocator: ChannelNumberAllocator | None = None
 
         # Template engine
         self._context_builder = ContextBuilder(sports_service)
@@ -176,7 +182,13 @@ class ChannelLifecycleService:
         if self._logo_manager:
             self._logo_manager.clear_cache()
         self._exception_keywords = None
-        self._pending_profile_changes = {}
+        self._write_pipeline = DispatcharrWritePipeline(self._channel_manager)
+        self._channel_allocator = None
+
+    @property
+    def write_stats(self) -> WritePipelineStats:
+        """Dispatcharr write pipeline stats (queue depth, coalesced, latency)."""
+        return self._write_pipeline.stats
 
     def _collect_profile_change(
         self,
@@ -191,66 +203,53 @@ class ChannelLifecycleService:
             channel_id: Channel ID to add/remove
             action: "add" or "remove"
         """
-        if profile_id not in self._pending_profile_changes:
-            self._pending_profile_changes[profile_id] = {"add": set(), "remove": set()}
-        self._pending_profile_changes[profile_id][action].add(channel_id)
+        self._write_pipeline.queue_profile_change(profile_id, channel_id, action)
 
-    def _apply_pending_profile_changes(self) -> dict:
-        """Apply all pending profile changes using bulk API.
+    def _queue_channel_update(self, dispatcharr_channel_id: int | None, data: dict) -> None:
+        """Queue a Dispatcharr channel PATCH (merged with other pending updates)."""
+        if self._channel_manager:
+            self._write_pipeline.queue_update(dispatcharr_channel_id, data)
 
-        Returns:
-            Dict with stats: {profiles_updated, channels_added, channels_removed, errors}
-        """
-        if not self._pending_profile_changes or not self._channel_manager:
-            return {"profiles_updated": 0, "channels_added": 0, "channels_removed": 0}
+    def flush_pending_writes(self, conn: Connection | None = None) -> list[dict]:
+        """Apply all queued Dispatcharr writes.
 
-        stats = {"profiles_updated": 0, "channels_added": 0, "channels_removed": 0, "errors": []}
+        Channel PATCHes are coalesced per channel and executed concurrently,
+        profile membership changes are applied with the bulk profile API.
+        Channels whose write failed are marked drifted, so the next sync
+        resends them.
 
-        with self._dispatcharr_lock:
-            for profile_id, changes in self._pending_profile_changes.items():
-                add_ids = list(changes["add"])
-                remove_ids = list(changes["remove"])
+        Args:
+            conn: Open connection to mark failures with (a new one if None)
 
-                if not add_ids and not remove_ids:
-                    continue
+        Returns:
+            Error dicts for failed writes, one per channel
+        """
+        if not self._channel_manager:
+            return []
+        failures = self._write_pipeline.flush()
+        if not failures:
+            return []
 
-                try:
-                    result = self._channel_manager.bulk_update_profile_channels(
-                        profile_id=profile_id,
-                        add_channel_ids=add_ids if add_ids else None,
-                        remove_channel_ids=remove_ids if remove_ids else None,
-                    )
-                    if result.success:
-                        stats["profiles_updated"] += 1
-                        stats["channels_added"] += len(add_ids)
-                        stats["channels_removed"] += len(remove_ids)
-                        logger.debug(
-                            f"Bulk profile update for profile {profile_id}: "
-                            f"+{len(add_ids)} -{len(remove_ids)} channels"
-                        )
-                    else:
-                        stats["errors"].append(f"Profile {profile_id}: {result.error}")
-                        logger.warning(
-                            "[LIFECYCLE] Bulk profile update failed for profile %d: %s",
-                            profile_id,
-                            result.error,
-                        )
-                except Exception as e:
-                    stats["errors"].append(f"Profile {profile_id}: {e}")
-                    logger.warning(
-                        "[LIFECYCLE] Bulk profile update error for profile %d: %s", profile_id, e
-                    )
+        if conn is None:
+            with self._db_factory() as conn:
+                return self._mark_write_failures(conn, failures)
+        return self._mark_write_failures(conn, failures)
 
-        # Clear pending changes after applying
-        self._pending_profile_changes = {}
+    def _mark_write_failures(self, conn: Connection, failures: list[WriteFailure]) -> list[dict]:
+        """Mark channels from failed writes as drifted and build error dicts."""
+        from teamarr.database.channels import mark_channels_drifted
 
-        if stats["profiles_updated"] > 0:
-            logger.info(
-                f"Bulk profile updates: {stats['profiles_updated']} profiles, "
-                f"+{stats['channels_added']} -{stats['channels_removed']} channel assignments"
+        errors = []
+        for failure in failures:
+            if failure.profile_id is not None:
+                message = f"Profile {failure.profile_id} update failed: {failure.error}"
+            else:
+                message = f"Dispatcharr update failed: {failure.error}"
+            mark_channels_drifted(conn, list(failure.channel_ids), message)
+            errors.extend(
+                {"channel_id": channel_id, "error": message} for channel_id in failure.channel_ids
             )
-
-        return stats
+        return errors
 
     def _get_exception_keywords(self, conn: Connection) -> list:
         """Get exception keywords with caching."""
@@ -351,6 +350,10 @@ class ChannelLifecycleService:
         if self._logo_manager:
             self._logo_manager.clear_cache()
 
+        # Fresh channel number allocator per batch: reassignment and deletions
+        # that ran before this call may have moved numbers
+        self._channel_allocator = None
+
         try:
             with self._db_factory() as conn:
                 # Initialize dynamic resolver for this batch
@@ -638,20 +641,22 @@ class ChannelLifecycleService:
                         )
                         continue
 
-                # Apply all pending profile changes in bulk
-                self._apply_pending_profile_changes()
+                # Apply all queued channel updates and profile changes in batches
+                result.errors.extend(self.flush_pending_writes(conn))
 
         except Exception as e:
             logger.exception("Error in matched streams setup")
             result.errors.append({"error": str(e)})
-            # Still try to apply pending profile changes even on error
+            # Still try to apply queued writes even on error
             try:
-                self._apply_pending_profile_changes()
-            except Exception as profile_err:
+                result.errors.extend(self.flush_pending_writes())
+            except Exception as flush_err:
                 logger.debug(
-                    "[LIFECYCLE] Failed to apply pending profile changes after error: %s",
-                    profile_err,
+                    "[LIFECYCLE] Failed to apply pending Dispatcharr writes after error: %s",
+                    flush_err,
                 )
+        finally:
+            self._channel_allocator = None
 
         return result
 
@@ -784,13 +789,12 @@ class ChannelLifecycleService:
 
                 # Sync with Dispatcharr - use ordered stream list to respect rules
                 if self._channel_manager and existing.dispatcharr_channel_id:
-                    with self._dispatcharr_lock:
-                        # Get streams in priority order from DB
-                        ordered_streams = get_ordered_stream_ids(conn, existing.id)
-                        self._channel_manager.update_channel(
-                            existing.dispatcharr_channel_id,
-                            {"streams": tuple(ordered_streams)},
-                        )
+                    # Get streams in priority order from DB
+                    ordered_streams = get_ordered_stream_ids(conn, existing.id)
+                    self._queue_channel_update(
+                        existing.dispatcharr_channel_id,
+                        {"streams": list(ordered_streams)},
+                    )
 
                 log_channel_history(
                     conn=conn,
@@ -884,6 +888,9 @@ class ChannelLifecycleService:
                         existing.id,
                         reason=f"Missing from Dispatcharr (ID {existing.dispatcharr_channel_id})",
                     )
+                    self._release_channel_number(
+                        existing.event_epg_group_id, existing.channel_number
+                    )
                     log_channel_history(
                         conn=conn,
                         managed_channel_id=existing.id,
@@ -946,13 +953,12 @@ class ChannelLifecycleService:
 
                 # Sync with Dispatcharr - use ordered stream list to respect rules
                 if self._channel_manager:
-                    with self._dispatcharr_lock:
-                        # Get streams in priority order from DB
-                        ordered_streams = get_ordered_stream_ids(conn, existing.id)
-                        self._channel_manager.update_channel(
-                            existing.dispatcharr_channel_id,
-                            {"streams": ordered_streams},
-                        )
+                    # Get streams in priority order from DB
+                    ordered_streams = get_ordered_stream_ids(conn, existing.id)
+                    self._queue_channel_update(
+                        existing.dispatcharr_channel_id,
+                        {"streams": ordered_streams},
+                    )
 
                 # Log history
                 log_channel_history(
@@ -1111,6 +1117,7 @@ class ChannelLifecycleService:
                 )
 
                 if not create_result.success:
+                    self._release_channel_number(group_id, channel_number)
                     return ChannelCreationResult(
                         success=False,
                         error=create_result.error or "Failed to create channel in Dispatcharr",
@@ -1168,7 +1175,6 @@ class ChannelLifecycleService:
                 source_group_id=group_id,
             )
 
-            # Commit immediately so next channel number query sees this channel
             conn.commit()
 
         except Exception as e:
@@ -1186,6 +1192,7 @@ class ChannelLifecycleService:
                         "[LIFECYCLE] Failed to cleanup Dispatcharr channel: %s", cleanup_err
                     )
 
+            self._release_channel_number(group_id, channel_number)
             return ChannelCreationResult(
                 success=False,
                 error=f"DB insert failed: {e}",
@@ -1389,8 +1396,8 @@ class ChannelLifecycleService:
     ) -> int | None:
         """Get next available channel number for a group.
 
-        Uses the channel_numbers module for AUTO/MANUAL mode support
-        with range validation and 10-block intervals.
+        Uses the batch's ChannelNumberAllocator (AUTO/MANUAL mode support
+        with range validation and 10-block intervals), loading it on first use.
 
         Args:
             conn: Database connection
@@ -1400,14 +1407,20 @@ class ChannelLifecycleService:
         Returns:
             Next available channel number as int, or None if range exhausted
         """
-        from teamarr.database.channel_numbers import get_next_channel_number
+        if self._channel_allocator is None:
+            self._channel_allocator = ChannelNumberAllocator(conn)
 
-        next_num = get_next_channel_number(conn, group_id, auto_assign=True)
+        next_num = self._channel_allocator.allocate(group_id, auto_assign=True)
         if next_num is None:
             logger.warning("[LIFECYCLE] Could not allocate channel number for group %d", group_id)
             return None
         return next_num
 
+    def _release_channel_number(self, group_id: int | None, channel_number: Any) -> None:
+        """Return a channel number to the batch allocator, if one is active."""
+        if self._channel_allocator is not None and group_id is not None:
+            self._channel_allocator.release(group_id, channel_number)
+
     def _sync_channel_settings(
         self,
         conn: Connection,
@@ -1447,11 +1460,21 @@ class ChannelLifecycleService:
                 current_channel = self._channel_manager.get_channel(existing.dispatcharr_channel_id)
                 if not current_channel:
                     return result
+            # Compare against queued-but-unflushed state, not the stale cached copy
+            current_channel = self._write_pipeline.pending_view(current_channel)
 
             update_data = {}
             db_updates = {}
             changes_made = []
 
+            # A write failed on the last flush: Dispatcharr may lag the DB-tracked
+            # fields (profiles, logo), so resend those instead of trusting the DB
+            retry = getattr(existing, "sync_status", None) == "drifted"
+            if retry:
+                db_updates["sync_status"] = "in_sync"
+                db_updates["sync_message"] = None
+                changes_made.append("retrying failed Dispatcharr write")
+
             # 1. Check channel name (template resolution) - V1 parity
             matched_keyword = getattr(existing, "exception_keyword", None)
             expected_name = self._generate_channel_name(
@@ -1537,13 +1560,9 @@ class ChannelLifecycleService:
                     db_updates["scheduled_delete_at"] = expected_delete_str
                     changes_made.append("scheduled_delete_at updated")
 
-            # Apply Dispatcharr updates
+            # Queue Dispatcharr updates (coalesced with profile/logo/stream profile below)
             if update_data:
-                with self._dispatcharr_lock:
-                    self._channel_manager.update_channel(
-                        existing.dispatcharr_channel_id,
-                        update_data,
-                    )
+                self._queue_channel_update(existing.dispatcharr_channel_id, update_data)
 
             # Apply DB updates
             if db_updates:
@@ -1551,12 +1570,12 @@ class ChannelLifecycleService:
 
             # 7. Sync channel_profile_ids
             self._sync_channel_profiles(
-                conn, existing, group_config, event_sport, event_league, changes_made
+                conn, existing, group_config, event_sport, event_league, changes_made, retry
             )
 
             # 8. Sync logo
             self._sync_channel_logo(
-                conn, existing, event, template, matched_keyword, segment, changes_made
+                conn, existing, event, template, matched_keyword, segment, changes_made, retry
             )
 
             # 9. Sync stream_profile_id
@@ -1601,11 +1620,14 @@ class ChannelLifecycleService:
         event_sport: str | None,
         event_league: str | None,
         changes_made: list[str],
+        retry: bool = False,
     ) -> None:
         """Sync channel_profile_ids (supports dynamic {sport}/{league} resolution).
 
         Dispatcharr profile semantics:
           [] = NO profiles, [0] = ALL profiles (sentinel), [1,2,...] = specific IDs
+
+        With retry, every effective profile is resent even if the DB matches.
         """
         from teamarr.database.channels import update_managed_channel
 
@@ -1631,7 +1653,7 @@ class ChannelLifecycleService:
             f"stored={stored_profile_ids}"
         )
 
-        if effective_profile_ids == stored_profile_ids:
+        if effective_profile_ids == stored_profile_ids and not retry:
             return
 
         logger.info(
@@ -1641,11 +1663,10 @@ class ChannelLifecycleService:
         is_sentinel = effective_profile_ids in ([0], [])
 
         if is_sentinel:
-            with self._dispatcharr_lock:
-                self._channel_manager.update_channel(
-                    existing.dispatcharr_channel_id,
-                    {"channel_profile_ids": effective_profile_ids},
-                )
+            self._queue_channel_update(
+                existing.dispatcharr_channel_id,
+                {"channel_profile_ids": effective_profile_ids},
+            )
             if effective_profile_ids == [0]:
                 changes_made.append("profiles: all profiles")
             else:
@@ -1653,6 +1674,8 @@ class ChannelLifecycleService:
         else:
             profiles_to_add = set(effective_profile_ids) - set(stored_profile_ids)
             profiles_to_remove = set(stored_profile_ids) - set(effective_profile_ids)
+            if retry:
+                profiles_to_add = set(effective_profile_ids)
 
             channel_id = existing.dispatcharr_channel_id
             for profile_id in profiles_to_remove:
@@ -1676,8 +1699,9 @@ class ChannelLifecycleService:
         matched_keyword: str | None,
         segment: str | None,
         changes_made: list[str],
+        retry: bool = False,
     ) -> None:
-        """Sync logo — handles both updates and removals."""
+        """Sync logo — handles both updates and removals (resent on retry)."""
         from teamarr.database.channels import update_managed_channel
 
         logo_url = self._resolve_logo_url(event, template, matched_keyword, segment)
@@ -1685,9 +1709,12 @@ class ChannelLifecycleService:
         stored_logo_url = getattr(existing, "logo_url", None)
 
         if logo_url and self._logo_manager:
-            needs_logo_update = logo_url != stored_logo_url or not current_logo_id
+            needs_logo_update = retry or logo_url != stored_logo_url or not current_logo_id
             if needs_logo_update:
-                reason = "URL changed" if logo_url != stored_logo_url else "missing logo_id"
+                if logo_url != stored_logo_url:
+                    reason = "URL changed"
+                else:
+                    reason = "missing logo_id" if not current_logo_id else "retry"
                 logger.debug(
                     "[LIFECYCLE] Logo sync for '%s': %s (stored=%s, new=%s, logo_id=%s)",
                     existing.channel_name,
@@ -1696,36 +1723,37 @@ class ChannelLifecycleService:
                     logo_url,
                     current_logo_id,
                 )
+                # Logo upload stays synchronous (we need the logo ID);
+                # the channel PATCH is queued and coalesced
                 with self._dispatcharr_lock:
                     logo_result = self._logo_manager.upload(
                         name=f"{existing.channel_name} Logo",
                         url=logo_url,
                     )
-                    if logo_result.success and logo_result.logo:
-                        new_logo_id = logo_result.logo.get("id")
-                        self._channel_manager.update_channel(
-                            existing.dispatcharr_channel_id,
-                            {"logo_id": new_logo_id},
-                        )
-                        update_managed_channel(
-                            conn,
-                            existing.id,
-                            {"logo_url": logo_url, "dispatcharr_logo_id": new_logo_id},
-                        )
-                        changes_made.append("logo updated")
+                if logo_result.success and logo_result.logo:
+                    new_logo_id = logo_result.logo.get("id")
+                    self._queue_channel_update(
+                        existing.dispatcharr_channel_id,
+                        {"logo_id": new_logo_id},
+                    )
+                    update_managed_channel(
+                        conn,
+                        existing.id,
+                        {"logo_url": logo_url, "dispatcharr_logo_id": new_logo_id},
+                    )
+                    changes_made.append("logo updated")
 
         elif stored_logo_url and self._logo_manager:
-            with self._dispatcharr_lock:
-                self._channel_manager.update_channel(
-                    existing.dispatcharr_channel_id,
-                    {"logo_id": None},
-                )
-                update_managed_channel(
-                    conn,
-                    existing.id,
-                    {"logo_url": None, "dispatcharr_logo_id": None},
-                )
-                changes_made.append("logo removed")
+            self._queue_channel_update(
+                existing.dispatcharr_channel_id,
+                {"logo_id": None},
+            )
+            update_managed_channel(
+                conn,
+                existing.id,
+                {"logo_url": None, "dispatcharr_logo_id": None},
+            )
+            changes_made.append("logo removed")
 
     def _sync_stream_profile(
         self,
@@ -1754,17 +1782,15 @@ class ChannelLifecycleService:
             expected_stream_profile,
         )
         if expected_stream_profile != current_stream_profile:
-            with self._dispatcharr_lock:
-                update_result = self._channel_manager.update_channel(
-                    existing.dispatcharr_channel_id,
-                    {"stream_profile_id": expected_stream_profile},
-                )
+            self._queue_channel_update(
+                existing.dispatcharr_channel_id,
+                {"stream_profile_id": expected_stream_profile},
+            )
             logger.debug(
-                "[LIFECYCLE] Stream profile PATCH for '%s': %s → %s (success=%s)",
+                "[LIFECYCLE] Stream profile PATCH queued for '%s': %s → %s",
                 existing.channel_name,
                 current_stream_profile,
                 expected_stream_profile,
-                update_result.success if update_result else "no_result",
             )
             changes_made.append(
                 f"stream_profile: {current_stream_profile} → {expected_stream_profile}"
@@ -1789,20 +1815,18 @@ class ChannelLifecycleService:
 
         with self._dispatcharr_lock:
             current = self._channel_manager.get_channel(dispatcharr_channel_id)
-            if not current:
-                return False
-
-            # streams is tuple[int, ...] of IDs
-            current_ids = list(current.streams) if current.streams else []
-            if stream_id not in current_ids:
-                return False
-
-            current_ids.remove(stream_id)
-            self._channel_manager.update_channel(
-                dispatcharr_channel_id,
-                {"streams": current_ids},
-            )
-            return True
+        current = self._write_pipeline.pending_view(current)
+        if not current:
+            return False
+
+        # streams is tuple[int, ...] of IDs
+        current_ids = list(current.streams) if current.streams else []
+        if stream_id not in current_ids:
+            return False
+
+        current_ids.remove(stream_id)
+        self._queue_channel_update(dispatcharr_channel_id, {"streams": current_ids})
+        return True
 
     def delete_managed_channel(
         self,
@@ -1833,8 +1857,9 @@ class ChannelLifecycleService:
         if not channel:
             return False
 
-        # Delete channel from Dispatcharr
+        # Delete channel from Dispatcharr (dropping any writes still queued for it)
         if self._channel_manager and channel.dispatcharr_channel_id:
+            self._write_pipeline.discard(channel.dispatcharr_channel_id)
             with self._dispatcharr_lock:
                 result = self._channel_manager.delete_channel(channel.dispatcharr_channel_id)
                 if not result.success:
@@ -1845,6 +1870,7 @@ class ChannelLifecycleService:
 
         # Mark as deleted in DB
         mark_channel_deleted(conn, managed_channel_id, reason)
+        self._release_channel_number(channel.event_epg_group_id, channel.channel_number)
 
         # Log history
         log_channel_history(
@@ -2249,6 +2275,8 @@ class ChannelLifecycleService:
             logger.exception(f"Error cleaning up deleted streams for group {group_id}")
             result.errors.append({"error": str(e)})
 
+        result.errors.extend(self.flush_pending_writes())
+
         if result.deleted:
             logger.info(
                 "[LIFECYCLE] Deleted %d channels with missing/changed streams", len(result.deleted)
@@ -2335,13 +2363,11 @@ class ChannelLifecycleService:
                         )
                         continue
 
-                    # Update Dispatcharr
-                    if self._channel_manager:
-                        with self._dispatcharr_lock:
-                            self._channel_manager.update_channel(
-                                channel.dispatcharr_channel_id,
-                                {"channel_number": next_number},
-                            )
+                    # Update Dispatcharr (queued, flushed in one batch below)
+                    self._queue_channel_update(
+                        channel.dispatcharr_channel_id,
+                        {"channel_number": next_number},
+                    )
 
                     # Update DB
                     update_managed_channel(conn, channel.id, {"channel_number": next_number})
@@ -2370,6 +2396,8 @@ class ChannelLifecycleService:
             logger.exception(f"Error reassigning channels for group {group_id}")
             result["errors"].append({"error": str(e)})
 
+        result["errors"].extend(self.flush_pending_writes())
+
         if result["reassigned"]:
             logger.info(
                 "[LIFECYCLE] Reassigned %d channels in group %d",
@@ -2477,13 +2505,11 @@ class ChannelLifecycleService:
                             next_number += 1
                             continue
 
-                        # Need to reassign
-                        if self._channel_manager:
-                            with self._dispatcharr_lock:
-                                self._channel_manager.update_channel(
-                                    channel.dispatcharr_channel_id,
-                                    {"channel_number": next_number},
-                                )
+                        # Need to reassign (queued, flushed in one batch below)
+                        self._queue_channel_update(
+                            channel.dispatcharr_channel_id,
+                            {"channel_number": next_number},
+                        )
 
                         update_managed_channel(conn, channel.id, {"channel_number": next_number})
 
@@ -2504,6 +2530,8 @@ class ChannelLifecycleService:
             logger.exception("Error in global AUTO group reassignment")
             result["errors"].append({"error": str(e)})
 
+        result["errors"].extend(self.flush_pending_writes())
+
         if result["channels_reassigned"]:
             logger.info(
                 f"Global reassignment: {result['channels_reassigned']} channels "
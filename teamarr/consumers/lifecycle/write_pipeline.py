@@ -0,0 +1,332 @@
+"""Batched, coalescing write pipeline for Dispatcharr channel mutations.
+
+The lifecycle service used to PATCH Dispatcharr once per changed field
+(streams, name, logo, stream profile, ...), serialized behind a single lock,
+so processing time was the sum of every round trip. The pipeline instead
+records *intended* mutations and applies them at flush time:
+
+- Multiple updates to the same channel are merged into a single PATCH
+  (later values win, so the final payload reflects the latest intent).
+- Profile membership changes use the bulk profile endpoint, one request
+  per profile regardless of channel count.
+- The remaining per-channel PATCHes run on a bounded thread pool. Each
+  channel has exactly one coalesced payload per flush, so writes to the
+  same channel are never reordered or raced.
+
+Reads that happen between queueing and flushing should go through
+``pending_view()`` so that comparisons see the queued state rather than the
+(stale) cached Dispatcharr channel.
+
+``flush()`` returns the writes Dispatcharr rejected, so callers can report
+them and mark the affected channels for retry.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from teamarr.dispatcharr.types import DispatcharrChannel
+
+logger = logging.getLogger(__name__)
+
+# Maximum concurrent PATCH requests against Dispatcharr during a flush
+MAX_WRITE_WORKERS = int(os.environ.get("DISPATCHARR_WRITE_WORKERS", 8))
+
+# Upper bounds (milliseconds) for write latency histogram buckets
+LATENCY_BUCKETS_MS: tuple[float, ...] = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# PATCH payload keys that map directly onto DispatcharrChannel fields
+_VIEW_FIELDS = {
+    "name",
+    "channel_number",
+    "tvg_id",
+    "channel_group_id",
+    "logo_id",
+    "streams",
+    "stream_profile_id",
+}
+
+
+@dataclass
+class WriteFailure:
+    """A flushed write that Dispatcharr rejected (or that raised)."""
+
+    channel_ids: tuple[int, ...]  # Dispatcharr channel IDs the write covered
+    error: str
+    profile_id: int | None = None  # Set for bulk profile membership updates
+
+
+@dataclass
+class WritePipelineStats:
+    """Counters and latency histogram for Dispatcharr writes."""
+
+    queued: int = 0  # Mutations requested by callers
+    coalesced: int = 0  # Mutations merged into an already-queued PATCH
+    channel_patches: int = 0  # PATCH requests actually sent
+    profile_batches: int = 0  # Bulk profile requests actually sent
+    failed: int = 0
+    max_queue_depth: int = 0  # Peak number of channels with pending writes
+    latency_buckets: dict[str, int] = field(
+        default_factory=lambda: {str(b): 0 for b in LATENCY_BUCKETS_MS} | {"+Inf": 0}
+    )
+    latency_total_ms: float = 0.0
+    latency_count: int = 0
+
+    def observe_latency(self, elapsed_ms: float) -> None:
+        """Record a single request latency (cumulative buckets)."""
+        self.latency_total_ms += elapsed_ms
+        self.latency_count += 1
+        for bound in LATENCY_BUCKETS_MS:
+            if elapsed_ms <= bound:
+                self.latency_buckets[str(bound)] += 1
+        self.latency_buckets["+Inf"] += 1
+
+    def merge(self, other: "WritePipelineStats") -> None:
+        """Merge another stats object into this one."""
+        self.queued += other.queued
+        self.coalesced += other.coalesced
+        self.channel_patches += other.channel_patches
+        self.profile_batches += other.profile_batches
+        self.failed += other.failed
+        self.max_queue_depth = max(self.max_queue_depth, other.max_queue_depth)
+        for bucket, count in other.latency_buckets.items():
+            self.latency_buckets[bucket] = self.latency_buckets.get(bucket, 0) + count
+        self.latency_total_ms += other.latency_total_ms
+        self.latency_count += other.latency_count
+
+    def to_dict(self) -> dict:
+        """Convert to dict for JSON serialization."""
+        avg = self.latency_total_ms / self.latency_count if self.latency_count else 0.0
+        return {
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "channel_patches": self.channel_patches,
+            "profile_batches": self.profile_batches,
+            "failed": self.failed,
+            "max_queue_depth": self.max_queue_depth,
+            "latency_ms": {
+                "count": self.latency_count,
+                "avg": round(avg, 1),
+                "buckets": dict(self.latency_buckets),
+            },
+        }
+
+
+class DispatcharrWritePipeline:
+    """Queues, coalesces and executes Dispatcharr channel writes.
+
+    Thread-safe for queueing from multiple threads. Flushing is serialized.
+
+    Usage:
+        pipeline = DispatcharrWritePipeline(channel_manager)
+        pipeline.queue_update(42, {"name": "Giants @ Cowboys"})
+        pipeline.queue_update(42, {"logo_id": 7})  # merged into one PATCH
+        pipeline.queue_profile_change(3, 42, "add")
+        pipeline.flush()
+    """
+
+    def __init__(self, channel_manager: Any, max_workers: int = MAX_WRITE_WORKERS):
+        self._channel_manager = channel_manager
+        self._max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        # {dispatcharr_channel_id: merged PATCH payload}, insertion-ordered
+        self._pending_updates: dict[int, dict] = {}
+        # {profile_id: {"add": set(channel_ids), "remove": set(channel_ids)}}
+        self._pending_profiles: dict[int, dict[str, set[int]]] = {}
+
+        self.stats = WritePipelineStats()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of channels with pending PATCHes."""
+        return len(self._pending_updates)
+
+    def queue_update(self, channel_id: int | None, data: dict) -> None:
+        """Queue a PATCH for a channel, merging with any pending update."""
+        if not channel_id or not data:
+            return
+        with self._lock:
+            self.stats.queued += 1
+            pending = self._pending_updates.get(channel_id)
+            if pending is None:
+                self._pending_updates[channel_id] = dict(data)
+                self.stats.max_queue_depth = max(
+                    self.stats.max_queue_depth, len(self._pending_updates)
+                )
+            else:
+                pending.update(data)
+                self.stats.coalesced += 1
+
+    def queue_profile_change(self, profile_id: int, channel_id: int, action: str) -> None:
+        """Queue a channel profile membership change ("add" or "remove")."""
+        with self._lock:
+            self.stats.queued += 1
+            changes = self._pending_profiles.setdefault(profile_id, {"add": set(), "remove": set()})
+            opposite = "remove" if action == "add" else "add"
+            # A later add cancels an earlier remove (and vice versa)
+            changes[opposite].discard(channel_id)
+            changes[action].add(channel_id)
+
+    def discard(self, channel_id: int | None) -> None:
+        """Drop pending writes for a channel (e.g., after it was deleted)."""
+        if not channel_id:
+            return
+        with self._lock:
+            self._pending_updates.pop(channel_id, None)
+            for changes in self._pending_profiles.values():
+                changes["add"].discard(channel_id)
+                changes["remove"].discard(channel_id)
+
+    def pending_view(self, channel: DispatcharrChannel | None) -> DispatcharrChannel | None:
+        """Return the channel with any queued field updates applied."""
+        if channel is None:
+            return None
+        with self._lock:
+            pending = self._pending_updates.get(channel.id)
+            if not pending:
+                return channel
+            overrides = {k: v for k, v in pending.items() if k in _VIEW_FIELDS}
+        if "streams" in overrides:
+            overrides["streams"] = tuple(overrides["streams"] or ())
+        if "channel_number" in overrides and overrides["channel_number"] is not None:
+            overrides["channel_number"] = str(overrides["channel_number"])
+        return replace(channel, **overrides)
+
+    def flush(self) -> list[WriteFailure]:
+        """Apply all queued writes.
+
+        Channel PATCHes are sent first (bounded concurrency, one per channel),
+        then profile membership changes are applied in bulk per profile.
+        Cumulative counters stay available on ``stats``.
+
+        Returns:
+            Writes that failed in this flush (empty when all succeeded)
+        """
+        failures: list[WriteFailure] = []
+        with self._flush_lock:
+            with self._lock:
+                updates = self._pending_updates
+                profiles = self._pending_profiles
+                self._pending_updates = {}
+                self._pending_profiles = {}
+
+            if self._channel_manager:
+                if updates:
+                    failures += self._flush_channel_updates(updates)
+                if profiles:
+                    failures += self._flush_profile_changes(profiles)
+
+        return failures
+
+    def _timed(self, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.stats.observe_latency(elapsed_ms)
+
+    def _flush_channel_updates(self, updates: dict[int, dict]) -> list[WriteFailure]:
+        failures: list[WriteFailure] = []
+
+        def patch(channel_id: int, data: dict):
+            return self._timed(self._channel_manager.update_channel, channel_id, data)
+
+        workers = min(self._max_workers, len(updates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(patch, channel_id, data): channel_id
+                for channel_id, data in updates.items()
+            }
+            for future in as_completed(futures):
+                channel_id = futures[future]
+                try:
+                    result = future.result()
+                    ok = bool(result and result.success)
+                    error = None if ok else getattr(result, "error", "no result")
+                except Exception as e:
+                    ok, error = False, str(e)
+                with self._lock:
+                    self.stats.channel_patches += 1
+                    if not ok:
+                        self.stats.failed += 1
+                if not ok:
+                    failures.append(WriteFailure((channel_id,), str(error)))
+                    logger.warning(
+                        "[LIFECYCLE] Dispatcharr update failed for channel %s: %s",
+                        channel_id,
+                        error,
+                    )
+
+        logger.debug(
+            "[LIFECYCLE] Flushed %d channel update(s) with %d worker(s)", len(updates), workers
+        )
+        return failures
+
+    def _flush_profile_changes(
+        self, profiles: dict[int, dict[str, set[int]]]
+    ) -> list[WriteFailure]:
+        failures: list[WriteFailure] = []
+        added = removed = updated = 0
+        for profile_id, changes in profiles.items():
+            add_ids = sorted(changes["add"])
+            remove_ids = sorted(changes["remove"])
+            if not add_ids and not remove_ids:
+                continue
+
+            error = "no result"
+            try:
+                result = self._timed(
+                    self._channel_manager.bulk_update_profile_channels,
+                    profile_id=profile_id,
+                    add_channel_ids=add_ids or None,
+                    remove_channel_ids=remove_ids or None,
+                )
+            except Exception as e:
+                result = None
+                error = str(e)
+                logger.warning(
+                    "[LIFECYCLE] Bulk profile update error for profile %d: %s", profile_id, e
+                )
+
+            with self._lock:
+                self.stats.profile_batches += 1
+                if not (result and result.success):
+                    self.stats.failed += 1
+
+            if result and result.success:
+                updated += 1
+                added += len(add_ids)
+                removed += len(remove_ids)
+                logger.debug(
+                    "[LIFECYCLE] Bulk profile update for profile %d: +%d -%d channels",
+                    profile_id,
+                    len(add_ids),
+                    len(remove_ids),
+                )
+                continue
+
+            if result is not None:
+                error = result.error or error
+                logger.warning(
+                    "[LIFECYCLE] Bulk profile update failed for profile %d: %s",
+                    profile_id,
+                    result.error,
+                )
+            failures.append(WriteFailure(tuple(add_ids + remove_ids), error, profile_id))
+
+        if updated:
+            logger.info(
+                "[LIFECYCLE] Bulk profile updates: %d profiles, +%d -%d channel assignments",
+                updated,
+                added,
+                removed,
+            )
+        return failures
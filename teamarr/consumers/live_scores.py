@@ -0,0 +1,226 @@
+"""Live-score fast path between full generation runs.
+
+Scores and status only change for games that are actually on, but full
+generation runs hourly and today's scoreboard is cached for 30 minutes.
+refresh_live_scores() runs every minute or two from CronScheduler:
+
+1. Find events in today's/yesterday's cached scoreboards (no API calls)
+   whose game window overlaps now and that aren't final yet
+2. Refresh just those via SportsDataService.refresh_event_status and write
+   them back into the cached scoreboard and team schedules
+3. For events whose score or state changed, re-render only the channels
+   showing them (run_live_update) and splice them into the written guide.
+   Event groups re-render from their stored matches - no stream fetch, no
+   channel lifecycle - and teams re-read the patched schedule cache.
+
+Rendered programmes don't keep their template context, so re-rendering
+goes through the templates rather than patching XML text in place.
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from teamarr.core import Event
+from teamarr.utilities.event_status import is_event_final
+from teamarr.utilities.sports import get_sport_duration
+from teamarr.utilities.tz import to_user_tz
+
+logger = logging.getLogger(__name__)
+
+# How often CronScheduler runs the fast path
+LIVE_REFRESH_INTERVAL_SECONDS = 90
+
+# Start refreshing shortly before the listed start time (early kickoffs)
+LIVE_LEAD_MINUTES = 10
+
+# Changed events whose re-render was skipped (lock busy), retried next pass:
+# the cache already holds their new score, so they won't show as changed again
+_pending_changes: dict[tuple[str, str], Event] = {}
+_pending_lock = threading.Lock()
+
+
+@dataclass
+class LiveRefreshResult:
+    """Result of one live-score refresh pass."""
+
+    events_live: int = 0
+    events_changed: int = 0
+    cache_entries_updated: int = 0
+    groups_regenerated: int = 0
+    teams_regenerated: int = 0
+    # Re-render skipped because a generation run holds the lock
+    skipped: bool = False
+    reason: str | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to dict for scheduler results."""
+        return asdict(self)
+
+
+def _score_key(event: Event) -> tuple:
+    """What a re-render depends on: state and score (not the running clock)."""
+    state = event.status.state if event.status else None
+    return (state, event.home_score, event.away_score)
+
+
+def find_live_events(
+    conn: Any,
+    service: Any,
+    now: datetime,
+) -> list[tuple[Event, date]]:
+    """Find cached events whose game window overlaps now.
+
+    Only leagues with active event channels or active teams are checked,
+    and only cached scoreboards are read (cache_only=True).
+
+    Args:
+        conn: Database connection
+        service: SportsDataService
+        now: Current time (timezone-aware)
+
+    Returns:
+        List of (event, scoreboard date) for live, non-final events
+    """
+    from teamarr.database.settings import get_all_settings
+
+    leagues: set[str] = set()
+    for row in conn.execute(
+        """SELECT DISTINCT league FROM managed_channels
+           WHERE deleted_at IS NULL AND league IS NOT NULL"""
+    ):
+        leagues.add(row["league"])
+    for row in conn.execute("SELECT primary_league, leagues FROM teams WHERE active = 1"):
+        leagues.add(row["primary_league"])
+        leagues.update(json.loads(row["leagues"] or "[]"))
+
+    durations = asdict(get_all_settings(conn).durations)
+    lead = timedelta(minutes=LIVE_LEAD_MINUTES)
+    # Scoreboards are keyed by the user's (EPG) local date
+    today = to_user_tz(now).date()
+
+    live: dict[tuple[str, str], tuple[Event, date]] = {}
+    for league in sorted(leagues):
+        # Yesterday's scoreboard holds games running past midnight
+        for target_date in (today - timedelta(days=1), today):
+            for event in service.get_events(league, target_date, cache_only=True):
+                if is_event_final(event) or (event.league, event.id) in live:
+                    continue
+                hours = get_sport_duration(event.sport or "", durations, durations["default"])
+                start = event.start_time
+                if start - lead <= now <= start + timedelta(hours=hours):
+                    live[(event.league, event.id)] = (event, target_date)
+    return list(live.values())
+
+
+def _units_for_events(conn: Any, events: list[Event]) -> tuple[set[int], set[int]]:
+    """Event groups and teams whose channels show any of the events."""
+    event_ids = sorted({e.id for e in events})
+    group_ids: set[int] = set()
+    if event_ids:
+        placeholders = ",".join("?" * len(event_ids))
+        rows = conn.execute(
+            f"""SELECT DISTINCT event_epg_group_id FROM managed_channels
+                WHERE deleted_at IS NULL AND event_id IN ({placeholders})""",
+            event_ids,
+        ).fetchall()
+        group_ids = {row["event_epg_group_id"] for row in rows}
+
+    playing: set[tuple[str, str]] = set()
+    for event in events:
+        for team in (event.home_team, event.away_team):
+            if team and team.id:
+                playing.add((event.league, team.id))
+
+    team_ids: set[int] = set()
+    for row in conn.execute(
+        "SELECT id, provider_team_id, primary_league, leagues FROM teams WHERE active = 1"
+    ):
+        leagues = {row["primary_league"], *json.loads(row["leagues"] or "[]")}
+        if any((league, row["provider_team_id"]) in playing for league in leagues):
+            team_ids.add(row["id"])
+    return group_ids, team_ids
+
+
+def refresh_live_scores(
+    db_factory: Callable[[], Any],
+    service: Any | None = None,
+    dispatcharr_client: Any | None = None,
+    now: datetime | None = None,
+) -> LiveRefreshResult:
+    """Refresh in-progress events and re-render the units showing them.
+
+    Args:
+        db_factory: Factory function returning database connection context manager
+        service: SportsDataService (defaults to a new one on the shared cache)
+        dispatcharr_client: Optional DispatcharrClient for the EPG refresh
+        now: Current time (defaults to now, for tests)
+
+    Returns:
+        LiveRefreshResult
+    """
+    from teamarr.consumers.generation import run_live_update
+
+    if service is None:
+        from teamarr.services import create_default_service
+
+        service = create_default_service()
+    now = now or datetime.now(UTC)
+    result = LiveRefreshResult()
+
+    with db_factory() as conn:
+        live = find_live_events(conn, service, now)
+    result.events_live = len(live)
+
+    with _pending_lock:
+        pending = dict(_pending_changes)
+        _pending_changes.clear()
+    for event, target_date in live:
+        refreshed = service.refresh_event_status(event)
+        if refreshed is event:
+            continue  # Provider refresh failed; keep cached data
+        result.cache_entries_updated += service.update_cached_event(refreshed, target_date)
+        key = (refreshed.league, refreshed.id)
+        if key in pending or _score_key(refreshed) != _score_key(event):
+            pending[key] = refreshed
+    changed = list(pending.values())
+    result.events_changed = len(changed)
+    if not changed:
+        return result
+
+    with db_factory() as conn:
+        group_ids, team_ids = _units_for_events(conn, changed)
+    if not group_ids and not team_ids:
+        return result
+
+    update = run_live_update(
+        db_factory,
+        changed,
+        group_ids,
+        team_ids,
+        dispatcharr_client=dispatcharr_client,
+        service=service,
+    )
+    if not update.success:
+        # Another generation run holds the lock; retry these next pass
+        with _pending_lock:
+            for key, event in pending.items():
+                _pending_changes.setdefault(key, event)
+        result.skipped = True
+        result.reason = update.error
+        return result
+    result.groups_regenerated = update.groups_processed
+    result.teams_regenerated = update.teams_processed
+
+    logger.info(
+        "[LIVE] %d live, %d changed: re-rendered %d groups, %d teams",
+        result.events_live,
+        result.events_changed,
+        result.groups_regenerated,
+        result.teams_regenerated,
+    )
+    return result
@@ -36,6 +36,10 @@ from teamarr.consumers.matching.normalizer import (
     normalize_for_matching,
     normalize_stream,
 )
+from teamarr.consumers.matching.prefetch import (
+    EventPrefetchPlanner,
+    EventStore,
+)
 from teamarr.consumers.matching.result import (
     FailedReason,
     FilteredReason,
@@ -59,6 +63,9 @@ __all__ = [
     "StreamMatcher",
     "MatchedStreamResult",
     "BatchMatchResult",
+    # Run-wide event prefetch
+    "EventPrefetchPlanner",
+    "EventStore",
     # Result types
     "ResultCategory",
     "FilteredReason",
@@ -35,6 +35,7 @@ from teamarr.consumers.matching.classifier import (
 )
 from teamarr.consumers.matching.constants import MATCH_WINDOW_DAYS
 from teamarr.consumers.matching.event_matcher import EventCardMatcher
+from teamarr.consumers.matching.prefetch import EventStore
 from teamarr.consumers.matching.result import (
     ExcludedReason,
     FailedReason,
@@ -52,6 +53,7 @@ from teamarr.consumers.stream_match_cache import (
 from teamarr.core import Event
 from teamarr.database.leagues import get_league
 from teamarr.services import SportsDataService
+from teamarr.utilities import metrics
 from teamarr.utilities.event_status import is_event_final
 
 logger = logging.getLogger(__name__)
@@ -183,6 +185,7 @@ class StreamMatcher:
         days_ahead: int | None = None,
         shared_events: dict[str, tuple[list[Event], bool]] | None = None,
         stream_timezone: str | None = None,
+        event_store: EventStore | None = None,
     ):
         """Initialize the matcher.
 
@@ -210,6 +213,8 @@ class StreamMatcher:
                            Values are (events, was_cache_only) tuples where was_cache_only
                            indicates if the result came from a cache-only lookup.
             stream_timezone: IANA timezone for interpreting stream dates (group setting)
+            event_store: Read-only events prefetched for the whole run by
+                         EventPrefetchPlanner; consulted before shared_events.
         """
         self._service = service
         self._db_factory = db_factory
@@ -280,6 +285,9 @@ class StreamMatcher:
         # Keys are "league:date" strings, values are (events, was_cache_only) tuples
         self._shared_events = shared_events
 
+        # Run-wide prefetched events (read-only, checked before shared_events)
+        self._event_store = event_store
+
         # Prefetched events (populated in match_all for multi-league matching)
         self._prefetched_events: dict[str, list[Event]] | None = None
 
@@ -319,7 +327,8 @@ class StreamMatcher:
         # Prefetch events for multi-league matching (significant performance boost)
         # This fetches events ONCE for all streams instead of per-stream
         if len(self._search_leagues) > 1:
-            self._prefetch_events(target_date, status_callback=status_callback)
+            with metrics.span("match_prefetch"):
+                self._prefetch_events(target_date, status_callback=status_callback)
         else:
             self._prefetched_events = None
 
@@ -334,17 +343,19 @@ class StreamMatcher:
             stream_id = stream.get("id", 0)
             stream_name = stream.get("name", "")
 
-            match_result = self._match_single(
-                stream_id=stream_id,
-                stream_name=stream_name,
-                target_date=target_date,
-            )
+            with metrics.span("stream_match"):
+                match_result = self._match_single(
+                    stream_id=stream_id,
+                    stream_name=stream_name,
+                    target_date=target_date,
+                )
 
             # Track cache stats
             if match_result.from_cache:
                 result.cache_hits += 1
             else:
                 result.cache_misses += 1
+            metrics.inc("stream_match_cache", result="hit" if match_result.from_cache else "miss")
 
             result.results.append(match_result)
 
@@ -374,7 +385,8 @@ class StreamMatcher:
         Instead, fetch all events ONCE and reuse for all streams.
 
         Strategy:
-        - Check shared_events first (reuse from prior groups in same generation)
+        - Check the run-wide event_store first (planned once for all groups)
+        - Then shared_events (reuse from prior groups in same generation)
         - Past dates: always cache-only (for stats tracking)
         - Today: fetch from API for group's configured leagues, cache for others
         - Future days: fetch from API ONLY for group's configured leagues
@@ -390,6 +402,7 @@ class StreamMatcher:
         self._prefetched_events = {}
         total_events = 0
         shared_hits = 0
+        store_hits = 0
         service_calls = 0
 
         total_leagues = len(self._search_leagues)
@@ -420,7 +433,15 @@ class StreamMatcher:
                     # Today: fetch from API for group's leagues, cache for others
                     cache_only = not is_group_league
 
-                # Check shared events cache first (from prior groups in same run)
+                # Check the run-wide prefetched store first
+                if self._event_store is not None:
+                    stored = self._event_store.lookup(league, fetch_date, cache_only)
+                    if stored is not None:
+                        league_events.extend(stored)
+                        store_hits += 1
+                        continue
+
+                # Then shared events cache (from prior groups in same run)
                 if self._shared_events is not None and shared_key in self._shared_events:
                     shared_events, was_cache_only = self._shared_events[shared_key]
 
@@ -455,13 +476,14 @@ class StreamMatcher:
                 int((league_idx + 1) / total_leagues * 100)
                 status_callback(
                     f"Prefetching events: {league_idx + 1}/{total_leagues} leagues "
-                    f"({total_events} events, {shared_hits} reused)"
+                    f"({total_events} events, {store_hits + shared_hits} reused)"
                 )
 
         logger.debug(
             f"Prefetched {total_events} events from {len(self._prefetched_events)} leagues "
             f"(window: -{MATCH_WINDOW_DAYS} to +{self._days_ahead} days, "
-            f"shared_hits={shared_hits}, service_calls={service_calls})"
+            f"store_hits={store_hits}, shared_hits={shared_hits}, "
+            f"service_calls={service_calls})"
         )
 
     def _match_single(
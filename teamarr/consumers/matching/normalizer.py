@@ -12,6 +12,7 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import date, time
+from functools import lru_cache
 
 from unidecode import unidecode
 
@@ -19,6 +20,10 @@ from teamarr.utilities.constants import BROADCAST_NETWORKS, CITY_TRANSLATIONS, P
 
 logger = logging.getLogger(__name__)
 
+# Bound on memoized normalize_for_matching results (team/event names recur
+# across every stream compared in a run)
+NORMALIZE_CACHE_SIZE = 16384
+
 
 @dataclass
 class NormalizedStream:
@@ -78,7 +83,8 @@ def fix_mojibake(text: str) -> str:
     Returns:
         Fixed text with proper unicode characters
     """
-    if not text:
+    # Every pattern starts with "Ã"; skip the table for clean text
+    if not text or "Ã" not in text:
         return text
 
     result = text
@@ -122,6 +128,18 @@ def strip_provider_prefix(text: str) -> tuple[str, str | None]:
 # =============================================================================
 
 
+# All variants in one case-insensitive alternation, longest first so a
+# variant never shadows a longer one that contains it
+_CITY_PATTERN = re.compile(
+    "|".join(re.escape(v) for v in sorted(CITY_TRANSLATIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def _translate_city(match: re.Match) -> str:
+    return CITY_TRANSLATIONS[match.group(0).lower()]
+
+
 def apply_city_translations(text: str) -> str:
     """Apply city name translations.
 
@@ -141,18 +159,8 @@ def apply_city_translations(text: str) -> str:
     # This converts München → Munchen
     text = unidecode(text)
 
-    # Second pass: apply manual translations
-    # Work on lowercased version for matching, preserve original case pattern
-    result = text
-    text_lower = text.lower()
-
-    for variant, english in CITY_TRANSLATIONS.items():
-        if variant in text_lower:
-            # Find the position and replace preserving some case
-            pattern = re.compile(re.escape(variant), re.IGNORECASE)
-            result = pattern.sub(english, result)
-
-    return result
+    # Second pass: apply manual translations in a single scan
+    return _CITY_PATTERN.sub(_translate_city, text)
 
 
 # =============================================================================
@@ -571,6 +579,13 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
     )
 
 
+# Broadcast network names as whole words, longest first (ESPN2 before ESPN)
+_NETWORKS = sorted({n.lower() for n in BROADCAST_NETWORKS}, key=lambda n: (-len(n), n))
+_NETWORK_PATTERN = re.compile(r"\b(?:" + "|".join(map(re.escape, _NETWORKS)) + r")\b")
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_for_matching(text: str) -> str:
     """Quick normalization for matching (no metadata extraction).
 
@@ -578,6 +593,8 @@ def normalize_for_matching(text: str) -> str:
     Applies: unidecode, city translations, lowercase, strip punctuation,
     and removes broadcast network names that add noise to fuzzy matching.
 
+    Results are memoized by raw string (bounded LRU).
+
     Args:
         text: Text to normalize
 
@@ -595,11 +612,10 @@ def normalize_for_matching(text: str) -> str:
 
     # Remove broadcast network names (ESPN, FOX, etc.) that add noise
     # These appear in streams like "MIL Bucks ( ESPN Feed )"
-    for network in BROADCAST_NETWORKS:
-        text = re.sub(rf"\b{re.escape(network.lower())}\b", " ", text)
+    text = _NETWORK_PATTERN.sub(" ", text)
 
     # Remove punctuation except spaces (hyphens become spaces for matching)
-    text = re.sub(r"[^\w\s]", " ", text)
+    text = _PUNCTUATION_PATTERN.sub(" ", text)
 
     # Normalize whitespace
     text = " ".join(text.split())
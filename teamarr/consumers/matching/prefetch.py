@@ -0,0 +1,187 @@
+"""Run-wide event prefetch planner.
+
+Every event group in a generation run needs events for overlapping
+(league, date) pairs: the matcher searches all known leagues over the
+match window, and the group itself fetches its configured leagues for EPG.
+Left to themselves, each group walks those pairs one `get_events` call at a
+time. The planner instead collects the union of needs across all groups up
+front, fetches each pair once in parallel (with a concurrency cap per
+provider), and hands every consumer a read-only, date-partitioned store.
+
+Usage:
+    planner = EventPrefetchPlanner(service)
+    planner.add_match_window(all_leagues, group_leagues, target_date, days_ahead)
+    planner.add_fetch_window(group_leagues, dates)
+    store = planner.execute()
+    events = store.lookup("nfl", some_date, cache_only=False)
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from types import MappingProxyType
+
+from teamarr.consumers.matching.constants import MATCH_WINDOW_DAYS
+from teamarr.core import Event
+from teamarr.services import SportsDataService
+
+logger = logging.getLogger(__name__)
+
+# Maximum concurrent get_events calls per provider while prefetching.
+# ESPN shares ESPN_MAX_WORKERS with the rest of the app (DNS-throttled users
+# lower it); TSDB has a strict rate limit and is mostly cache-only anyway.
+PROVIDER_MAX_WORKERS: dict[str, int] = {
+    "espn": int(os.environ.get("ESPN_MAX_WORKERS", 100)),
+    "tsdb": int(os.environ.get("TSDB_MAX_WORKERS", 2)),
+}
+DEFAULT_PROVIDER_WORKERS = 8
+
+
+class EventStore:
+    """Read-only events keyed by date, then league.
+
+    Each entry records whether it came from a cache-only lookup, so callers
+    that need API data don't accept an empty cache-only miss as final.
+    """
+
+    def __init__(self, entries: dict[date, dict[str, tuple[tuple[Event, ...], bool]]]):
+        self._by_date = MappingProxyType(
+            {d: MappingProxyType(leagues) for d, leagues in entries.items()}
+        )
+
+    def __len__(self) -> int:
+        return sum(len(leagues) for leagues in self._by_date.values())
+
+    def lookup(self, league: str, fetch_date: date, cache_only: bool) -> list[Event] | None:
+        """Return events for (league, date), or None if the store can't answer.
+
+        A stored result is usable if it has events, was fetched with API
+        access, or the caller only wanted a cache lookup itself.
+        """
+        entry = self._by_date.get(fetch_date, {}).get(league)
+        if entry is None:
+            return None
+        events, was_cache_only = entry
+        if events or not was_cache_only or cache_only:
+            return list(events)
+        return None
+
+    def events_on(self, fetch_date: date) -> dict[str, tuple[Event, ...]]:
+        """All stored events for a date, keyed by league."""
+        return {league: events for league, (events, _) in self._by_date.get(fetch_date, {}).items()}
+
+
+class EventPrefetchPlanner:
+    """Collects (league, date, cache_only) needs and fetches them once."""
+
+    def __init__(self, service: SportsDataService):
+        self._service = service
+        # (league, date) -> cache_only; API access wins when needs overlap
+        self._needs: dict[tuple[str, date], bool] = {}
+        self._providers: dict[str, str | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._needs)
+
+    def _provider(self, league: str) -> str | None:
+        if league not in self._providers:
+            self._providers[league] = self._service.get_provider_name(league)
+        return self._providers[league]
+
+    def add(self, league: str, fetch_date: date, cache_only: bool) -> None:
+        """Record a single need."""
+        key = (league, fetch_date)
+        self._needs[key] = self._needs.get(key, True) and cache_only
+
+    def add_match_window(
+        self,
+        search_leagues: Iterable[str],
+        include_leagues: Iterable[str],
+        target_date: date,
+        days_ahead: int,
+    ) -> None:
+        """Record what StreamMatcher prefetches for one group.
+
+        Mirrors the matcher's rules: past dates and TSDB are cache-only;
+        today and future hit the API only for the group's own leagues.
+        """
+        include = set(include_leagues)
+        for league in search_leagues:
+            is_tsdb = self._provider(league) == "tsdb"
+            for offset in range(-MATCH_WINDOW_DAYS, days_ahead + 1):
+                cache_only = is_tsdb or offset < 0 or league not in include
+                self.add(league, target_date + timedelta(days=offset), cache_only)
+
+    def add_fetch_window(self, leagues: Iterable[str], dates: Iterable[date]) -> None:
+        """Record what a group fetches for EPG generation (TSDB is cache-only)."""
+        dates = list(dates)
+        for league in leagues:
+            is_tsdb = self._provider(league) == "tsdb"
+            for fetch_date in dates:
+                self.add(league, fetch_date, is_tsdb)
+
+    def execute(self, status_callback: Callable[[str], None] | None = None) -> EventStore:
+        """Fetch every planned (league, date) once and return the store.
+
+        Each provider gets its own bounded pool so a slow or rate-limited
+        provider can't starve the others.
+        """
+        start = time.time()
+        by_provider: dict[str, list[tuple[str, date, bool]]] = {}
+        for (league, fetch_date), cache_only in self._needs.items():
+            provider = self._provider(league) or "unknown"
+            by_provider.setdefault(provider, []).append((league, fetch_date, cache_only))
+
+        def fetch(league: str, fetch_date: date, cache_only: bool) -> tuple[Event, ...]:
+            try:
+                return tuple(self._service.get_events(league, fetch_date, cache_only=cache_only))
+            except Exception as e:
+                logger.warning(
+                    "[PREFETCH] Failed to fetch events for %s on %s: %s", league, fetch_date, e
+                )
+                return ()
+
+        entries: dict[date, dict[str, tuple[tuple[Event, ...], bool]]] = {}
+        executors = {
+            provider: ThreadPoolExecutor(
+                max_workers=min(
+                    PROVIDER_MAX_WORKERS.get(provider, DEFAULT_PROVIDER_WORKERS), len(tasks)
+                ),
+                thread_name_prefix=f"prefetch-{provider}",
+            )
+            for provider, tasks in by_provider.items()
+        }
+        total = len(self._needs)
+        done = 0
+        total_events = 0
+        try:
+            futures = {
+                executors[provider].submit(fetch, *task): task
+                for provider, tasks in by_provider.items()
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                league, fetch_date, cache_only = futures[future]
+                events = future.result()
+                entries.setdefault(fetch_date, {})[league] = (events, cache_only)
+                done += 1
+                total_events += len(events)
+                if status_callback and (done % 500 == 0 or done == total):
+                    status_callback(
+                        f"Prefetching events: {done}/{total} league-days ({total_events} events)"
+                    )
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+        logger.info(
+            "[PREFETCH] %d league-days (%d events) across %d provider(s) in %.1fs",
+            total,
+            total_events,
+            len(by_provider),
+            time.time() - start,
+        )
+        return EventStore(entries)
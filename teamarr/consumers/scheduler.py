@@ -1,8 +1,22 @@
-"""Background scheduler for EPG generation.
-
-Uses cron expressions for scheduling (like V1).
-Runs periodic EPG generation using the unified run_full_generation() function
-which handles everything:
+"""Background scheduler for EPG generation and housekeeping.
+
+Each task has its own schedule (a cron expression or an interval), a
+priority and a few concurrency rules. A single dispatcher thread starts
+due tasks in priority order on worker threads:
+
+- EPG generation follows the main cron expression (like V1), channel reset
+  and backups follow their own crons from settings, the live-score fast
+  path runs on a short interval
+- A task never overlaps itself; runs it missed while busy (or while the
+  app was asleep) are coalesced into one run, then rescheduled from now
+- Channel reset and EPG generation are exclusive with each other
+- Housekeeping (backups, cache and linear EPG refresh, live scores) is
+  deferred while a generation runs, and only high-priority tasks (or the
+  cache refresh generation waits on) may take the last free worker slot
+- Optional jitter spreads provider calls from many installs sharing a cron
+
+EPG generation uses the unified run_full_generation() function which
+handles everything:
 - EPG generation (teams, groups, XMLTV)
 - Dispatcharr integration
 - Channel lifecycle (deletions, reconciliation, cleanup)
@@ -11,20 +25,124 @@ Integrates with FastAPI lifespan for clean startup/shutdown.
 """
 
 import logging
+import random
 import threading
 import time
-from datetime import datetime
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any
 
 from croniter import croniter
 
+from teamarr.consumers.live_scores import LIVE_REFRESH_INTERVAL_SECONDS
+
 logger = logging.getLogger(__name__)
 
+# Lower runs first. Below PRIORITY_NORMAL counts as high priority.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+# Worker threads running tasks at once
+MAX_CONCURRENT_TASKS = 2
+
+# Runs kept per task for get_scheduler_status()
+TASK_HISTORY_SIZE = 20
+
+# How often settings-driven schedules (backup/reset crons) are re-read
+SCHEDULE_REFRESH_SECONDS = 300
+
+# Dispatcher tick
+_TICK_SECONDS = 1.0
+
+
+@dataclass
+class ScheduledTask:
+    """A task with its own schedule, priority and run history.
+
+    schedule() returns a cron expression, an interval in seconds, or None
+    when the task is disabled. It is re-evaluated periodically, so it can
+    read settings. A task doesn't start while any task named in `after` is
+    due or running, so same-tick dependencies run first; a due dependency
+    is dispatched at the waiting task's priority if that is higher.
+    """
+
+    name: str
+    run: Callable[[], dict]
+    schedule: Callable[[], str | float | None]
+    priority: int = PRIORITY_NORMAL
+    defer_while_generating: bool = False
+    exclusive: bool = False
+    jitter_seconds: float = 0
+    run_on_start: bool = False
+    after: tuple[str, ...] = ()
+
+    spec: str | float | None = None
+    next_run: datetime | None = None
+    running: bool = False
+    started_at: datetime | None = None
+    last_run: datetime | None = None
+    last_duration: float | None = None
+    last_status: str | None = None
+    last_error: str | None = None
+    run_count: int = 0
+    error_count: int = 0
+    coalesced_runs: int = 0
+    history: deque = field(default_factory=lambda: deque(maxlen=TASK_HISTORY_SIZE))
+
+    def to_dict(self) -> dict:
+        """Convert to dict for get_scheduler_status()."""
+        return {
+            "name": self.name,
+            "schedule": self.spec,
+            "priority": self.priority,
+            "running": self.running,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_duration_seconds": self.last_duration,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "run_count": self.run_count,
+            "error_count": self.error_count,
+            "coalesced_runs": self.coalesced_runs,
+            "history": list(self.history),
+        }
+
+
+def _next_fire(spec: str | float, after: datetime) -> datetime:
+    """Next time a cron expression or interval fires after a point in time."""
+    if isinstance(spec, str):
+        return croniter(spec, after).get_next(datetime)
+    return after + timedelta(seconds=spec)
+
+
+def _firings_between(spec: str | float, start: datetime, end: datetime) -> int:
+    """How many times a schedule fires in (start, end] (capped)."""
+    if not isinstance(spec, str):
+        return max(0, int((end - start).total_seconds() // spec))
+    count = 0
+    cron = croniter(spec, start)
+    while count < 1000 and cron.get_next(datetime) <= end:
+        count += 1
+    return count
+
+
+def _task_status(result: dict) -> str:
+    """Classify a task's result dict for run history."""
+    if result.get("skipped"):
+        return "skipped"
+    if result.get("error") or result.get("success") is False:
+        return "error"
+    return "ok"
+
 
 class CronScheduler:
-    """Background scheduler using cron expressions.
+    """Background scheduler with per-task schedules and priorities.
 
-    Runs tasks at times specified by a cron expression.
+    EPG generation runs at times specified by a cron expression; the other
+    tasks (see _build_tasks) run on their own schedules.
 
     Usage:
         scheduler = CronScheduler(
@@ -50,6 +168,8 @@ class CronScheduler:
         cron_expression: str = "0 * * * *",
         dispatcharr_client: Any = None,
         run_on_start: bool = True,
+        live_refresh_seconds: float = 0,
+        max_concurrent: int = MAX_CONCURRENT_TASKS,
     ):
         """Initialize the scheduler.
 
@@ -57,18 +177,102 @@ class CronScheduler:
             db_factory: Factory function returning database connection
             cron_expression: Cron expression (e.g., "0 * * * *" for hourly)
             dispatcharr_client: Optional DispatcharrClient for Dispatcharr operations
-            run_on_start: Whether to run tasks immediately on start
+            run_on_start: Whether to run generation and refreshes immediately on start
+            live_refresh_seconds: Interval for the live-score fast path
+                between cron runs (0 = disabled)
+            max_concurrent: Maximum tasks running at once
         """
         self._db_factory = db_factory
         self._cron_expression = cron_expression
         self._dispatcharr_client = dispatcharr_client
         self._run_on_start = run_on_start
+        self._live_refresh_seconds = live_refresh_seconds
+        self._max_concurrent = max(1, max_concurrent)
 
         self._thread: threading.Thread | None = None
+        self._workers: dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._last_live_refresh: datetime | None = None
         self._stop_event = threading.Event()
         self._running = False
         self._last_run: datetime | None = None
-        self._next_run: datetime | None = None
+        self._schedules_checked: datetime | None = None
+        self._tasks = self._build_tasks()
+
+    def _build_tasks(self) -> list[ScheduledTask]:
+        """The scheduler's tasks, in their manual run_once() order."""
+        tasks = [
+            ScheduledTask(
+                name="backup",
+                run=lambda: self._task_backup(check_window=False),
+                schedule=self._backup_schedule,
+                priority=PRIORITY_LOW,
+                defer_while_generating=True,
+            ),
+            ScheduledTask(
+                name="channel_reset",
+                run=lambda: self._task_channel_reset(check_window=False),
+                schedule=self._channel_reset_schedule,
+                priority=PRIORITY_HIGH,
+                exclusive=True,
+            ),
+            ScheduledTask(
+                name="cache_refresh",
+                run=self._task_refresh_cache,
+                schedule=lambda: self._cron_expression,
+                defer_while_generating=True,
+                run_on_start=True,
+            ),
+            ScheduledTask(
+                name="linear_epg_refresh",
+                run=self._task_refresh_linear_epg,
+                schedule=lambda: self._cron_expression,
+                priority=PRIORITY_NORMAL + 1,
+                defer_while_generating=True,
+                run_on_start=True,
+            ),
+            ScheduledTask(
+                name="epg_generation",
+                run=self._task_generate_epg,
+                schedule=lambda: self._cron_expression,
+                priority=PRIORITY_HIGH + 1,
+                exclusive=True,
+                run_on_start=True,
+                # Match against a freshly refreshed cache, as run_once() does;
+                # a slow linear EPG refresh doesn't hold generation back
+                after=("cache_refresh",),
+            ),
+        ]
+        if self._live_refresh_seconds > 0:
+            tasks.append(
+                ScheduledTask(
+                    name="live_scores",
+                    run=self._task_refresh_live_scores,
+                    schedule=lambda: self._live_refresh_seconds,
+                    priority=PRIORITY_HIGH + 2,
+                    defer_while_generating=True,
+                    jitter_seconds=10,
+                )
+            )
+        return tasks
+
+    def _backup_schedule(self) -> str | None:
+        """Backup cron from settings (None = disabled)."""
+        from teamarr.database.settings import get_backup_settings
+
+        with self._db_factory() as conn:
+            settings = get_backup_settings(conn)
+        return settings.cron if settings.enabled and settings.cron else None
+
+    def _channel_reset_schedule(self) -> str | None:
+        """Channel reset cron from settings (None = disabled)."""
+        from teamarr.database.settings import get_scheduler_settings
+
+        with self._db_factory() as conn:
+            settings = get_scheduler_settings(conn)
+        if settings.channel_reset_enabled and settings.channel_reset_cron:
+            return settings.channel_reset_cron
+        return None
 
     @property
     def is_running(self) -> bool:
@@ -77,19 +281,34 @@ class CronScheduler:
 
     @property
     def last_run(self) -> datetime | None:
-        """Get time of last task run."""
+        """Get time of last EPG generation run."""
         return self._last_run
 
     @property
     def next_run(self) -> datetime | None:
-        """Get time of next scheduled run."""
-        return self._next_run
+        """Get time of next scheduled EPG generation."""
+        task = self.get_task("epg_generation")
+        return task.next_run if task else None
+
+    @property
+    def last_live_refresh(self) -> datetime | None:
+        """Get time of last live-score refresh."""
+        return self._last_live_refresh
 
     @property
     def cron_expression(self) -> str:
         """Get the cron expression."""
         return self._cron_expression
 
+    def get_task(self, name: str) -> ScheduledTask | None:
+        """Get a scheduled task by name."""
+        return next((t for t in self._tasks if t.name == name), None)
+
+    def task_status(self) -> list[dict]:
+        """Per-task schedule, state and run history, in priority order."""
+        with self._lock:
+            return [t.to_dict() for t in sorted(self._tasks, key=lambda t: t.priority)]
+
     def start(self) -> bool:
         """Start the scheduler.
 
@@ -121,8 +340,10 @@ class CronScheduler:
     def stop(self, timeout: float = 30.0) -> bool:
         """Stop the scheduler gracefully.
 
+        Running tasks are allowed to finish (up to the timeout).
+
         Args:
-            timeout: Maximum seconds to wait for thread to stop
+            timeout: Maximum seconds to wait for threads to stop
 
         Returns:
             True if stopped, False if timeout
@@ -134,11 +355,17 @@ class CronScheduler:
         self._stop_event.set()
         self._running = False
 
+        deadline = time.monotonic() + timeout
         if self._thread:
             self._thread.join(timeout=timeout)
-            if self._thread.is_alive():
-                logger.warning("[CRON] Scheduler thread did not stop in time")
-                return False
+        with self._lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        if (self._thread and self._thread.is_alive()) or any(w.is_alive() for w in workers):
+            logger.warning("[CRON] Scheduler threads did not stop in time")
+            return False
 
         logger.info("[CRON] Scheduler stopped")
         return True
@@ -146,48 +373,204 @@ class CronScheduler:
     def run_once(self) -> dict:
         """Run all scheduled tasks once (for testing/manual trigger).
 
+        Runs sequentially, outside the dispatcher; backup and channel reset
+        still only run if their own cron fired within the last hour.
+
         Returns:
             Dict with task results
         """
         return self._run_tasks()
 
     def _run_loop(self) -> None:
-        """Main scheduler loop - runs in background thread."""
-        # Run immediately on startup if configured
-        if self._run_on_start:
+        """Dispatcher loop - runs in background thread."""
+        now = datetime.now()
+        self._refresh_schedules(now, initial=True)
+
+        while not self._stop_event.is_set():
+            now = datetime.now()
+            if (now - self._schedules_checked).total_seconds() >= SCHEDULE_REFRESH_SECONDS:
+                self._refresh_schedules(now)
             try:
-                logger.info("[CRON] Running initial scheduled tasks")
-                self._run_tasks()
+                self._dispatch(now)
             except Exception as e:
-                logger.exception("[CRON] Error in initial run: %s", e)
+                logger.exception("[CRON] Dispatcher error: %s", e)
+            self._stop_event.wait(_TICK_SECONDS)
 
-        while not self._stop_event.is_set():
-            # Calculate next run time
-            cron = croniter(self._cron_expression, datetime.now())
-            self._next_run = cron.get_next(datetime)
-
-            wait_seconds = (self._next_run - datetime.now()).total_seconds()
-            logger.debug(
-                "[CRON] Next run: %s (%.0fs)",
-                self._next_run.strftime("%Y-%m-%d %H:%M:%S"),
-                wait_seconds,
+    def _refresh_schedules(self, now: datetime, initial: bool = False) -> None:
+        """Re-read task schedules and reschedule tasks whose schedule changed."""
+        self._schedules_checked = now
+        for task in self._tasks:
+            try:
+                spec = task.schedule()
+            except Exception as e:
+                logger.warning("[CRON] Could not read schedule for %s: %s", task.name, e)
+                continue
+            with self._lock:
+                if task.running or (not initial and spec == task.spec):
+                    task.spec = spec
+                    continue
+                task.spec = spec
+                if initial and self._run_on_start and task.run_on_start:
+                    task.next_run = now
+                else:
+                    task.next_run = self._schedule_next(task, now)
+                if task.next_run:
+                    logger.debug(
+                        "[CRON] %s next run: %s",
+                        task.name,
+                        task.next_run.strftime("%Y-%m-%d %H:%M:%S"),
+                    )
+
+    def _schedule_next(self, task: ScheduledTask, after: datetime) -> datetime | None:
+        """Next run time for a task (with jitter), None if disabled or invalid."""
+        if task.spec is None:
+            return None
+        try:
+            next_run = _next_fire(task.spec, after)
+        except (KeyError, ValueError) as e:
+            logger.warning("[CRON] Invalid schedule for %s '%s': %s", task.name, task.spec, e)
+            return None
+        if task.jitter_seconds:
+            next_run += timedelta(seconds=random.uniform(0, task.jitter_seconds))
+        return next_run
+
+    def _dispatch(self, now: datetime) -> list[str]:
+        """Start due tasks in priority order, within the concurrency rules.
+
+        Returns:
+            Names of the tasks started
+        """
+        from teamarr.api.generation_status import is_in_progress
+        from teamarr.consumers.generation import generation_in_progress
+
+        generating = is_in_progress() or generation_in_progress()
+        started: list[str] = []
+        with self._lock:
+            due = [t for t in self._tasks if t.next_run and t.next_run <= now and not t.running]
+            # A dependency runs at the priority of the due task waiting on it,
+            # so a busy slot can't hold generation back behind its refresh
+            priority = {t.name: t.priority for t in due}
+            for task in due:
+                for dep in task.after:
+                    if dep in priority:
+                        priority[dep] = min(priority[dep], task.priority)
+            due.sort(key=lambda t: (priority[t.name], t.next_run))
+            for task in due:
+                running = [t for t in self._tasks if t.running]
+                if len(running) >= self._max_concurrent:
+                    break
+                # The last free slot is kept for high-priority tasks
+                if (
+                    len(running) == self._max_concurrent - 1
+                    and running
+                    and priority[task.name] >= PRIORITY_NORMAL
+                ):
+                    continue
+                if task.exclusive and any(t.exclusive for t in running):
+                    continue
+                if any(
+                    t.name in task.after and (t.running or (t.next_run and t.next_run <= now))
+                    for t in self._tasks
+                ):
+                    continue
+                if task.defer_while_generating and (
+                    generating or any(t.exclusive for t in running)
+                ):
+                    continue
+
+                # Coalesce firings missed since it became due into this run
+                try:
+                    missed = _firings_between(task.spec, task.next_run, now)
+                except (KeyError, ValueError):
+                    missed = 0
+                if missed:
+                    task.coalesced_runs += missed
+                    logger.info("[CRON] %s: coalesced %d missed runs", task.name, missed)
+
+                task.running = True
+                task.started_at = now
+                task.next_run = None
+                worker = threading.Thread(
+                    target=self._execute,
+                    args=(task,),
+                    name=f"cron-{task.name}",
+                    daemon=True,
+                )
+                self._workers[task.name] = worker
+                started.append(task.name)
+                worker.start()
+        return started
+
+    def _execute(self, task: ScheduledTask) -> None:
+        """Run a task on a worker thread and record the outcome."""
+        logger.info("[CRON] Running %s", task.name)
+        started = datetime.now()
+        if task.name == "epg_generation":
+            self._last_run = started
+        start = time.monotonic()
+        error: str | None = None
+        try:
+            result = task.run() or {}
+            status = _task_status(result)
+            if status == "error":
+                error = str(result.get("error") or "failed")
+        except Exception as e:
+            logger.exception("[CRON] Task %s failed: %s", task.name, e)
+            status, error = "error", str(e)
+        duration = round(time.monotonic() - start, 3)
+
+        finished = datetime.now()
+        with self._lock:
+            task.running = False
+            task.last_run = started
+            task.last_duration = duration
+            task.last_status = status
+            task.last_error = error
+            task.run_count += 1
+            if status == "error":
+                task.error_count += 1
+            task.history.append(
+                {
+                    "started_at": started.isoformat(),
+                    "duration_seconds": duration,
+                    "status": status,
+                    "error": error,
+                }
             )
+            # Firings that passed while running are coalesced too
+            try:
+                missed = _firings_between(task.spec, started, finished) if task.spec else 0
+            except (KeyError, ValueError):
+                missed = 0
+            task.coalesced_runs += missed
+            task.next_run = self._schedule_next(task, finished)
+            self._workers.pop(task.name, None)
+        logger.debug("[CRON] %s finished in %.1fs (%s)", task.name, duration, status)
 
-            # Wait until next run time (checking stop event every second)
-            while wait_seconds > 0 and not self._stop_event.is_set():
-                sleep_time = min(1.0, wait_seconds)
-                time.sleep(sleep_time)
-                wait_seconds = (self._next_run - datetime.now()).total_seconds()
+    def _task_refresh_live_scores(self) -> dict:
+        """Refresh in-progress events and re-render the groups/teams showing them.
 
-            if self._stop_event.is_set():
-                return
+        Skipped while a generation run holds the generation lock (a full run
+        refreshes everything); refresh_live_scores takes the lock itself, so
+        this is only a cheap early exit.
 
-            # Run tasks
-            try:
-                logger.info("[CRON] Scheduled run triggered")
-                self._run_tasks()
-            except Exception as e:
-                logger.exception("[CRON] Error in scheduled run: %s", e)
+        Returns:
+            Dict with refresh status
+        """
+        from teamarr.consumers.generation import generation_in_progress
+        from teamarr.consumers.live_scores import refresh_live_scores
+
+        if generation_in_progress():
+            return {"skipped": True, "reason": "Generation in progress"}
+
+        from teamarr.dispatcharr import get_dispatcharr_connection
+
+        result = refresh_live_scores(
+            self._db_factory,
+            dispatcharr_client=get_dispatcharr_connection(self._db_factory),
+        )
+        self._last_live_refresh = datetime.now()
+        return result.to_dict()
 
     def _run_tasks(self) -> dict:
         """Run all scheduled tasks.
@@ -250,7 +633,7 @@ class CronScheduler:
         results["completed_at"] = datetime.now().isoformat()
         return results
 
-    def _task_channel_reset(self) -> dict:
+    def _task_channel_reset(self, check_window: bool = True) -> dict:
         """Reset all Teamarr channels if scheduled.
 
         Checks if channel reset is enabled and if the reset cron schedule
@@ -261,6 +644,10 @@ class CronScheduler:
         reset right before Jellyfin's guide refresh, channel logos get
         re-downloaded fresh.
 
+        Args:
+            check_window: Only reset if the reset cron fired within the last
+                hour (the dispatcher runs this task on that cron already)
+
         Returns:
             Dict with reset status
         """
@@ -283,7 +670,7 @@ class CronScheduler:
 
             # If last reset time was within the last hour, run the reset
             time_since_reset = (datetime.now() - last_reset_time).total_seconds()
-            if time_since_reset > 3600:  # More than 1 hour ago
+            if check_window and time_since_reset > 3600:  # More than 1 hour ago
                 return {
                     "skipped": True,
                     "reason": "Reset not due yet",
@@ -337,12 +724,16 @@ class CronScheduler:
             "errors": errors if errors else None,
         }
 
-    def _task_backup(self) -> dict:
+    def _task_backup(self, check_window: bool = True) -> dict:
         """Run scheduled backup if enabled and due.
 
         Checks its own cron expression (separate from the main EPG cron).
         Uses the same 1-hour window approach as channel reset.
 
+        Args:
+            check_window: Only back up if the backup cron fired within the
+                last hour (the dispatcher runs this task on that cron already)
+
         Returns:
             Dict with backup status
         """
@@ -360,7 +751,7 @@ class CronScheduler:
             last_backup_time = backup_cron.get_prev(datetime)
 
             time_since_backup = (datetime.now() - last_backup_time).total_seconds()
-            if time_since_backup > 3600:  # More than 1 hour ago
+            if check_window and time_since_backup > 3600:  # More than 1 hour ago
                 return {
                     "skipped": True,
                     "reason": "Backup not due yet",
@@ -403,10 +794,9 @@ class CronScheduler:
     def _task_refresh_cache(self) -> dict:
         """Refresh team/league cache if stale (daily).
 
-        Cache is also refreshed unconditionally on every startup and
-        can be triggered manually via the UI. This scheduled check
-        catches staleness for long-running instances that haven't
-        restarted in over a day.
+        Only leagues last refreshed over a day ago are rediscovered (a full
+        refresh runs weekly). The same check runs in the background on
+        startup, and a full refresh can be triggered manually via the UI.
 
         Returns:
             Dict with refresh status
@@ -597,6 +987,7 @@ def start_lifecycle_scheduler(
         cron_expression=cron,
         dispatcharr_client=dispatcharr_client,
         run_on_start=False,  # Don't run EPG generation on startup
+        live_refresh_seconds=LIVE_REFRESH_INTERVAL_SECONDS,
     )
     return _scheduler.start()
 
@@ -635,6 +1026,8 @@ def get_scheduler_status() -> dict:
         "cron_expression": _scheduler.cron_expression,
         "last_run": _scheduler.last_run.isoformat() if _scheduler.last_run else None,
         "next_run": _scheduler.next_run.isoformat() if _scheduler.next_run else None,
+        "last_live_refresh": (
+            _scheduler.last_live_refresh.isoformat() if _scheduler.last_live_refresh else None
+        ),
+        "tasks": _scheduler.task_status(),
     }
-
-
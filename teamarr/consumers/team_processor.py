@@ -70,6 +70,9 @@ class TeamProcessingResult:
     # Errors
     errors: list[str] = field(default_factory=list)
 
+    # XMLTV held back for store_team_results() (process_all_teams(defer_writes=True))
+    xmltv: str | None = None
+
     def to_dict(self) -> dict:
         """Convert to dict for JSON serialization."""
         return {
@@ -194,14 +197,18 @@ class TeamProcessor:
     def process_all_teams(
         self,
         progress_callback: Callable[[int, int, str], None] | None = None,
+        defer_writes: bool = False,
     ) -> BatchTeamResult:
         """Process all active teams.
 
         ESPN teams are processed in parallel (up to MAX_WORKERS).
-        TSDB teams are processed sequentially (rate limit is ~10/min).
+        TSDB teams are processed in parallel too, after their shared league
+        endpoints are prefetched once through the TSDB rate limiter.
 
         Args:
             progress_callback: Optional callback(current, total, team_name)
+            defer_writes: Keep each team's XMLTV on its result instead of
+                storing it; the caller stores them with store_team_results()
 
         Returns:
             BatchTeamResult with all team results and combined XMLTV
@@ -225,41 +232,41 @@ class TeamProcessor:
 
         channels: list[dict] = []
 
-        # Process ESPN and Euroleague teams in parallel (non-rate-limited APIs)
-        parallel_teams = espn_teams + euro_teams
-        if parallel_teams:
-            num_workers = min(MAX_WORKERS, len(parallel_teams))
+        # Track in-progress teams for accurate progress display
+        in_progress: set[str] = set()
+        in_progress_lock = threading.Lock()
+
+        def process_with_tracking(team: TeamConfig) -> TeamProcessingResult:
+            """Wrapper to track in-progress state."""
+            with in_progress_lock:
+                in_progress.add(team.team_name)
+                # Report which team is now being processed
+                if progress_callback:
+                    progress_callback(
+                        processed_count,
+                        total_teams,
+                        f"Processing {team.team_name}...",
+                    )
+            try:
+                return self._process_team_parallel(team, store=not defer_writes)
+            finally:
+                with in_progress_lock:
+                    in_progress.discard(team.team_name)
+
+        def process_parallel(batch: list[TeamConfig]) -> None:
+            """Process a batch of teams on a thread pool."""
+            nonlocal processed_count
+            num_workers = min(MAX_WORKERS, len(batch))
             logger.info(
                 "[TEAM_BATCH] Parallel (%s): %d teams, %d workers",
-                ", ".join(set(t.provider for t in parallel_teams)),
-                len(parallel_teams),
+                ", ".join(set(t.provider for t in batch)),
+                len(batch),
                 num_workers,
             )
 
-            # Track in-progress teams for accurate progress display
-            in_progress: set[str] = set()
-            in_progress_lock = threading.Lock()
-
-            def process_with_tracking(team: TeamConfig) -> TeamProcessingResult:
-                """Wrapper to track in-progress state."""
-                with in_progress_lock:
-                    in_progress.add(team.team_name)
-                    # Report which team is now being processed
-                    if progress_callback:
-                        progress_callback(
-                            processed_count,
-                            total_teams,
-                            f"Processing {team.team_name}...",
-                        )
-                try:
-                    return self._process_team_parallel(team)
-                finally:
-                    with in_progress_lock:
-                        in_progress.discard(team.team_name)
-
             with ThreadPoolExecutor(max_workers=num_workers) as executor:
                 future_to_team = {
-                    executor.submit(process_with_tracking, team): team for team in parallel_teams
+                    executor.submit(process_with_tracking, team): team for team in batch
                 }
 
                 for future in as_completed(future_to_team):
@@ -300,20 +307,25 @@ class TeamProcessor:
                             msg = f"Finished {team.team_name}"
                         progress_callback(processed_count, total_teams, msg)
 
+        # Process ESPN and Euroleague teams in parallel (non-rate-limited APIs)
+        parallel_teams = espn_teams + euro_teams
+        if parallel_teams:
+            process_parallel(parallel_teams)
             logger.debug("[TEAM_BATCH] ESPN parallel processing complete")
 
-        # Process TSDB teams sequentially (rate limited API)
+        # TSDB teams: fetch what they all need once (rate limited), then
+        # process them in parallel from cache
         if tsdb_teams:
-            # Extract unique leagues and pre-warm cache
-            tsdb_leagues = set()
+            # How many teams read each league (ranks the prefetch)
+            team_counts: dict[str, int] = {}
             for team in tsdb_teams:
-                tsdb_leagues.add(team.primary_league)
-                tsdb_leagues.update(team.leagues)
+                for league in {team.primary_league, *team.leagues}:
+                    team_counts[league] = team_counts.get(league, 0) + 1
 
             logger.info(
-                "[TEAM_BATCH] TSDB: %d teams, %d leagues (sequential)",
+                "[TEAM_BATCH] TSDB: %d teams, %d leagues",
                 len(tsdb_teams),
-                len(tsdb_leagues),
+                len(team_counts),
             )
 
             # Report that we're warming cache (this can take a while)
@@ -321,64 +333,32 @@ class TeamProcessor:
                 progress_callback(
                     processed_count,
                     total_teams,
-                    f"Warming TSDB cache ({len(tsdb_leagues)} leagues)...",
+                    f"Warming TSDB cache ({len(team_counts)} leagues)...",
                 )
 
-            # Pre-warm TSDB cache for all leagues (2 API calls per league)
-            # This ensures cache hits when processing individual teams
-            self._service.prewarm_tsdb_leagues(list(tsdb_leagues))
-
-            # Group teams by primary league for better cache utilization
-            # Teams in the same league share eventsday.php cache entries
-            sorted_tsdb_teams = sorted(tsdb_teams, key=lambda t: t.primary_league)
-
-            for team in sorted_tsdb_teams:
-                processed_count += 1
-                try:
-                    result = self._process_team_parallel(team)
-                    batch_result.results.append(result)
-
-                    if result.programmes_generated > 0:
-                        channels.append(
-                            {
-                                "id": team.channel_id,
-                                "name": team.team_name,
-                                "icon": team.channel_logo_url or team.team_logo_url,
-                            }
-                        )
-                except Exception as e:
-                    logger.exception("[TEAM_ERROR] %s: %s", team.team_name, e)
-                    error_result = TeamProcessingResult(
-                        team_id=team.id,
-                        team_name=team.team_name,
-                        channel_id=team.channel_id,
-                    )
-                    error_result.errors.append(str(e))
-                    error_result.completed_at = datetime.now()
-                    batch_result.results.append(error_result)
-
-                # Report progress
-                if progress_callback:
-                    progress_callback(processed_count, total_teams, team.team_name)
+            self._service.prewarm_tsdb_leagues(list(team_counts), team_counts=team_counts)
+            process_parallel(tsdb_teams)
 
         # Note: Combined XMLTV is read from database in generation.py
-        # Each team's XMLTV is already stored during _process_team_internal
+        # Each team's XMLTV is stored during _process_team_internal (unless
+        # deferred to store_team_results)
 
         batch_result.completed_at = datetime.now()
         logger.info("[TEAM_BATCH] Completed: %d teams", len(teams))
         return batch_result
 
-    def _process_team_parallel(self, team: TeamConfig) -> TeamProcessingResult:
+    def _process_team_parallel(self, team: TeamConfig, store: bool = True) -> TeamProcessingResult:
         """Process a single team with its own DB connection (for parallel execution)."""
         with self._db_factory() as conn:
-            return self._process_team_internal(conn, team)
+            return self._process_team_internal(conn, team, store=store)
 
     def _process_team_internal(
         self,
         conn: Connection,
         team: TeamConfig,
+        store: bool = True,
     ) -> TeamProcessingResult:
-        """Internal processing for a single team."""
+        """Internal processing for a single team (store=False keeps XMLTV on the result)."""
         result = TeamProcessingResult(
             team_id=team.id,
             team_name=team.team_name,
@@ -430,7 +410,10 @@ class TeamProcessor:
                     "icon": team.channel_logo_url or team.team_logo_url,
                 }
                 xmltv_content = programmes_to_xmltv(programmes, [channel_dict])
-                self._store_team_xmltv(conn, team.id, xmltv_content)
+                if store:
+                    self._store_team_xmltv(conn, team.id, xmltv_content)
+                else:
+                    result.xmltv = xmltv_content
 
             logger.debug(
                 "[TEAM] %s: %d programmes",
@@ -537,8 +520,8 @@ class TeamProcessor:
             active=bool(row["active"]),
         )
 
+    @staticmethod
     def _store_team_xmltv(
-        self,
         conn: Connection,
         team_id: int,
         xmltv_content: str,
@@ -571,15 +554,7 @@ class TeamProcessor:
 
     def _get_team_xmltv(self, conn: Connection, team_id: int) -> str | None:
         """Get stored XMLTV for a team."""
-        try:
-            row = conn.execute(
-                "SELECT xmltv_content FROM team_epg_xmltv WHERE team_id = ?",
-                (team_id,),
-            ).fetchone()
-            return row["xmltv_content"] if row else None
-        except Exception as e:
-            logger.debug("[XMLTV] Failed to get for team %d: %s", team_id, e)
-            return None
+        return get_team_xmltv(conn, team_id)
 
     def _generate_all_programmes(
         self,
@@ -612,6 +587,47 @@ class TeamProcessor:
         return all_programmes
 
 
+def store_team_results(db_factory: Any, batch_result: BatchTeamResult) -> int:
+    """Store the XMLTV held back by process_all_teams(defer_writes=True).
+
+    Args:
+        db_factory: Factory function returning database connection
+        batch_result: Result whose team results carry XMLTV
+
+    Returns:
+        Number of teams stored
+    """
+    pending = [r for r in batch_result.results if r.xmltv]
+    if not pending:
+        return 0
+    with db_factory() as conn:
+        for result in pending:
+            TeamProcessor._store_team_xmltv(conn, result.team_id, result.xmltv)
+            result.xmltv = None
+    return len(pending)
+
+
+def get_team_xmltv(conn: Connection, team_id: int) -> str | None:
+    """Get stored XMLTV content for a team (active or not).
+
+    Args:
+        conn: Database connection
+        team_id: Team ID
+
+    Returns:
+        XMLTV content string or None if not found
+    """
+    try:
+        row = conn.execute(
+            "SELECT xmltv_content FROM team_epg_xmltv WHERE team_id = ?",
+            (team_id,),
+        ).fetchone()
+        return row["xmltv_content"] if row else None
+    except Exception as e:
+        logger.debug("[XMLTV] Failed to get for team %d: %s", team_id, e)
+        return None
+
+
 def get_all_team_xmltv(conn: Connection, team_ids: list[int] | None = None) -> list[str]:
     """Get all stored XMLTV content for enabled teams.
 
@@ -674,6 +690,7 @@ def process_team(
 def process_all_teams(
     db_factory: Any,
     progress_callback: Callable[[int, int, str], None] | None = None,
+    defer_writes: bool = False,
 ) -> BatchTeamResult:
     """Process all active teams.
 
@@ -682,9 +699,12 @@ def process_all_teams(
     Args:
         db_factory: Factory function returning database connection
         progress_callback: Optional callback(current, total, team_name)
+        defer_writes: Leave storing team XMLTV to store_team_results()
 
     Returns:
         BatchTeamResult
     """
     processor = TeamProcessor(db_factory=db_factory)
-    return processor.process_all_teams(progress_callback=progress_callback)
+    return processor.process_all_teams(
+        progress_callback=progress_callback, defer_writes=defer_writes
+    )
@@ -163,6 +163,25 @@ class SportsProvider(ABC):
         """
         return None
 
+    def get_league_team_stats(self, league: str) -> dict[str, TeamStats]:
+        """Get detailed statistics for every team in a league at once.
+
+        Lets the service layer fill the team stats cache for a whole league
+        with one request (e.g. a standings endpoint) instead of one request
+        per team.
+
+        Args:
+            league: League identifier
+
+        Returns:
+            Dict of provider team ID -> TeamStats (empty if unsupported)
+
+        Note:
+            This method has a default implementation returning {}.
+            Providers should override if they have a league-wide source.
+        """
+        return {}
+
     def get_league_teams(self, league: str) -> list[Team]:
         """Get all teams in a league.
 
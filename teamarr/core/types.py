@@ -2,13 +2,26 @@
 
 All data structures are dataclasses with attribute access.
 Provider-scoped IDs: every entity carries its `id` and `provider`.
+
+Event, Team, Programme and their parts are slotted: a full prefetch holds
+tens of thousands of events and generation emits hundreds of thousands of
+programmes. Empty collections are shared immutable sentinels (`()` or
+None) rather than a fresh list/dict per instance, and highly repeated
+strings (league, sport, provider, channel_id) are interned.
 """
 
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+def _intern(value):
+    """Intern exact str values; anything else is returned as-is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
 class Venue:
     """Event location."""
 
@@ -18,7 +31,7 @@ class Venue:
     country: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     """Team identity."""
 
@@ -34,8 +47,13 @@ class Team:
     # Combat sports: fighter record (e.g., "8-1-0" for W-L-D)
     record_summary: str | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "provider", _intern(self.provider))
+        object.__setattr__(self, "league", _intern(self.league))
+        object.__setattr__(self, "sport", _intern(self.sport))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EventStatus:
     """Current state of an event."""
 
@@ -45,7 +63,7 @@ class EventStatus:
     clock: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bout:
     """A single bout/fight on a combat sports card.
 
@@ -59,7 +77,7 @@ class Bout:
     order: int  # Position on card (0 = opener, higher = later)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A single sporting event (game/match)."""
 
@@ -77,7 +95,7 @@ class Event:
     home_score: int | None = None
     away_score: int | None = None
     venue: Venue | None = None
-    broadcasts: list[str] = field(default_factory=list)
+    broadcasts: Sequence[str] = ()
     season_year: int | None = None
     season_type: str | None = None
 
@@ -90,10 +108,10 @@ class Event:
     # MMA-specific: exact segment times from ESPN bout-level data
     # Keys: "early_prelims", "prelims", "main_card"
     # Values: datetime of segment start
-    segment_times: dict[str, datetime] = field(default_factory=dict)
+    segment_times: dict[str, datetime] | None = None
 
     # MMA-specific: all bouts on the card (ordered by position)
-    bouts: list["Bout"] = field(default_factory=list)
+    bouts: Sequence[Bout] = ()
 
     # MMA-specific: fight result data (headline bout)
     # Method: 'ko', 'tko', 'submission', 'decision_unanimous', 'decision_split', 'decision_majority'
@@ -105,6 +123,18 @@ class Event:
     fighter1_scores: list[int] | None = None  # home_team/fighter1 scores
     fighter2_scores: list[int] | None = None  # away_team/fighter2 scores
 
+    def __post_init__(self) -> None:
+        self.provider = _intern(self.provider)
+        self.league = _intern(self.league)
+        self.sport = _intern(self.sport)
+        # Providers pass [] / {} for "none"; share the empty sentinels instead
+        if not self.broadcasts:
+            self.broadcasts = ()
+        if not self.segment_times:
+            self.segment_times = None
+        if not self.bouts:
+            self.bouts = ()
+
 
 @dataclass(frozen=True)
 class TeamStats:
@@ -143,7 +173,7 @@ class TeamStats:
     papg: float | None = None  # Points allowed per game
 
 
-@dataclass
+@dataclass(slots=True)
 class Programme:
     """An XMLTV programme entry."""
 
@@ -158,11 +188,16 @@ class Programme:
     # Filler type: 'pregame', 'postgame', 'idle', or None for actual events
     filler_type: str | None = None
     # Categories for XMLTV output (e.g., ["Sports", "Football", "NFL"])
-    categories: list[str] = field(default_factory=list)
+    categories: Sequence[str] = ()
     # XMLTV flags: new, live, date
-    xmltv_flags: dict = field(default_factory=dict)
+    xmltv_flags: dict | None = None
     # XMLTV video: enabled, quality (HDTV/SDTV), aspect (16:9/4:3)
-    xmltv_video: dict = field(default_factory=dict)
+    xmltv_video: dict | None = None
+
+    def __post_init__(self) -> None:
+        self.channel_id = _intern(self.channel_id)
+        if not self.categories:
+            self.categories = ()
 
 
 @dataclass
@@ -18,7 +18,11 @@ Features:
 """
 
 import logging
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from sqlite3 import Connection
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +77,9 @@ def get_next_channel_number(
     - rational_block: Reserve by actual channel count (smaller gaps, low drift)
     - strict_compact: No block reservation (no gaps, higher drift risk)
 
+    One-off lookup. Callers allocating many numbers should hold a
+    ChannelNumberAllocator instead, which loads state once.
+
     Args:
         conn: Database connection
         group_id: The event group ID
@@ -81,107 +88,347 @@ def get_next_channel_number(
     Returns:
         Next available channel number, or None if disabled/would exceed max
     """
-    cursor = conn.execute(
-        """SELECT channel_start_number, channel_assignment_mode, sort_order
-           FROM event_epg_groups WHERE id = ?""",
-        (group_id,),
-    )
-    group = cursor.fetchone()
-    if not group:
+    return ChannelNumberAllocator(conn).next_number(group_id, auto_assign=auto_assign)
+
+
+class _FreeIntervals:
+    """Sorted, disjoint free [start, end] intervals over 1..MAX_CHANNEL.
+
+    Lookups are a bisect over interval starts; taking or releasing a number
+    splits or merges at most one interval. Used numbers are refcounted, since
+    several channels can hold the same number (duplicates, or the shared
+    strict_compact pool): a number is only free again once its last holder
+    releases it.
+    """
+
+    __slots__ = ("_starts", "_ends", "_holders", "used_count")
+
+    def __init__(self, used: Iterable[int] = ()):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._holders: dict[int, int] = {}
+        self.used_count = 0  # Holders, not distinct numbers
+        for number in used:
+            if 1 <= number <= MAX_CHANNEL:
+                self._holders[number] = self._holders.get(number, 0) + 1
+                self.used_count += 1
+        low = 1
+        for number in sorted(self._holders):
+            if number > low:
+                self._starts.append(low)
+                self._ends.append(number - 1)
+            low = number + 1
+        if low <= MAX_CHANNEL:
+            self._starts.append(low)
+            self._ends.append(MAX_CHANNEL)
+
+    def _index(self, number: int) -> int:
+        """Index of the interval that would contain number (may not contain it)."""
+        return bisect_right(self._starts, number) - 1
+
+    def is_free(self, number: int) -> bool:
+        i = self._index(number)
+        return i >= 0 and self._ends[i] >= number
+
+    def first_free(self, start: int) -> int | None:
+        """Smallest free number >= start, or None if none left."""
+        i = self._index(start)
+        if i >= 0 and self._ends[i] >= start:
+            return start
+        i += 1
+        return self._starts[i] if i < len(self._starts) else None
+
+    def min_used(self) -> int | None:
+        """Smallest used number, or None if nothing is used."""
+        if not self.used_count:
+            return None
+        if not self._starts or self._starts[0] > 1:
+            return 1
+        return self._ends[0] + 1
+
+    def take(self, number: int) -> None:
+        if number < 1 or number > MAX_CHANNEL:
+            return
+        holders = self._holders.get(number, 0)
+        self._holders[number] = holders + 1
+        self.used_count += 1
+        if holders:
+            return  # Already used
+        i = self._index(number)
+        start, end = self._starts[i], self._ends[i]
+        if start == end:
+            del self._starts[i]
+            del self._ends[i]
+        elif number == start:
+            self._starts[i] = number + 1
+        elif number == end:
+            self._ends[i] = number - 1
+        else:
+            self._ends[i] = number - 1
+            self._starts.insert(i + 1, number + 1)
+            self._ends.insert(i + 1, end)
+
+    def release(self, number: int) -> None:
+        holders = self._holders.get(number, 0)
+        if not holders:
+            return
+        self.used_count -= 1
+        if holders > 1:
+            self._holders[number] = holders - 1
+            return  # Still held by another channel
+        del self._holders[number]
+        i = bisect_right(self._starts, number)
+        joins_left = i > 0 and self._ends[i - 1] == number - 1
+        joins_right = i < len(self._starts) and self._starts[i] == number + 1
+        if joins_left and joins_right:
+            self._ends[i - 1] = self._ends[i]
+            del self._starts[i]
+            del self._ends[i]
+        elif joins_left:
+            self._ends[i - 1] = number
+        elif joins_right:
+            self._starts[i] = number
+        else:
+            self._starts.insert(i, number)
+            self._ends.insert(i, number)
+
+
+@dataclass
+class _GroupSlot:
+    """Channel numbering state for one event group."""
+
+    id: int
+    assignment_mode: str
+    channel_start: int | None
+    total_stream_count: int
+    is_auto_root: bool  # Enabled AUTO parent group (takes part in block layout)
+    in_compact_pool: bool  # Enabled AUTO group (shares the strict_compact pool)
+    free: _FreeIntervals = field(default_factory=_FreeIntervals)
+
+
+def _as_channel_number(value: Any) -> int | None:
+    """Parse a stored channel number (TEXT or INTEGER, possibly "8121.0")."""
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
         return None
 
-    channel_start = group["channel_start_number"]
-    assignment_mode = group["channel_assignment_mode"] or "manual"
 
-    # Get the numbering mode for AUTO groups
-    numbering_mode = get_channel_numbering_mode(conn)
+class ChannelNumberAllocator:
+    """Per-run channel number allocator.
 
-    # For AUTO mode, calculate effective channel_start dynamically
-    block_end = None
-    if assignment_mode == "auto":
-        # For strict_compact mode, use global allocation across all AUTO groups
-        if numbering_mode == "strict_compact":
-            # Strict compact: find next available globally across all AUTO groups
-            # Skip the per-group logic entirely - return the globally available number
-            return get_next_compact_channel_number(conn)
+    Loads settings, groups and every active channel number once, then keeps
+    a free-interval structure per group (and one shared pool for
+    strict_compact), so each allocation is a bisect instead of a rescan of
+    managed_channels. Numbering rules are the same as get_next_channel_number.
 
-        # strict_block or rational_block: use block-based calculation
-        channel_start = _calculate_auto_channel_start(
-            conn, group_id, group["sort_order"], numbering_mode
-        )
+    The allocator only tracks numbers; the managed_channels rows written as
+    channels are created remain the source of truth, so nothing needs to be
+    flushed. Call release() when a channel is deleted (or its creation fails)
+    so the number can be reused within the run.
 
-        if not channel_start:
-            logger.warning(
-                "[CHANNEL_NUM] Could not calculate auto channel_start for group %d (mode=%s)",
-                group_id,
-                numbering_mode,
+    Not thread-safe; use one allocator per connection/batch.
+    """
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+        self._range_start, range_end = get_global_channel_range(conn)
+        self._effective_end = range_end if range_end else MAX_CHANNEL
+        self._numbering_mode = get_channel_numbering_mode(conn)
+
+        groups = conn.execute(
+            """SELECT id, channel_start_number, channel_assignment_mode, sort_order,
+                      total_stream_count, parent_group_id, enabled
+               FROM event_epg_groups
+               ORDER BY sort_order ASC"""
+        ).fetchall()
+
+        used_by_group: dict[int, list[int]] = {}
+        for row in conn.execute(
+            """SELECT event_epg_group_id, channel_number FROM managed_channels
+               WHERE deleted_at IS NULL"""
+        ):
+            number = _as_channel_number(row["channel_number"])
+            if number is not None:
+                used_by_group.setdefault(row["event_epg_group_id"], []).append(number)
+
+        self._groups: dict[int, _GroupSlot] = {}
+        self._auto_roots: list[_GroupSlot] = []
+        compact_used: list[int] = []
+        for row in groups:
+            mode = row["channel_assignment_mode"] or "manual"
+            is_auto = mode == "auto" and bool(row["enabled"])
+            used = used_by_group.get(row["id"], [])
+            slot = _GroupSlot(
+                id=row["id"],
+                assignment_mode=mode,
+                channel_start=row["channel_start_number"],
+                total_stream_count=row["total_stream_count"] or 0,
+                is_auto_root=is_auto and row["parent_group_id"] is None,
+                in_compact_pool=is_auto,
+                free=_FreeIntervals(used),
             )
+            self._groups[slot.id] = slot
+            if slot.is_auto_root:
+                self._auto_roots.append(slot)
+            if is_auto:
+                compact_used.extend(used)
+        self._compact_pool = _FreeIntervals(compact_used)
+
+        # group_id -> (block_start, block_end) or None; rebuilt lazily when a
+        # change could move a block boundary
+        self._layout: dict[int, tuple[int, int] | None] | None = None
+
+    def next_number(self, group_id: int, auto_assign: bool = True) -> int | None:
+        """Next available number for a group, without taking it."""
+        slot = self._groups.get(group_id)
+        if not slot:
             return None
 
-        # Calculate block_end by finding where the next group starts
-        # This allows dynamic expansion as a group adds more channels
-        block_end = _calculate_auto_block_end(conn, group_id, group["sort_order"], channel_start)
+        if slot.assignment_mode == "auto":
+            if self._numbering_mode == "strict_compact":
+                return self._next_compact()
+            block = self._get_layout().get(group_id)
+            if not block:
+                logger.warning(
+                    "[CHANNEL_NUM] Could not calculate auto channel_start for group %d (mode=%s)",
+                    group_id,
+                    self._numbering_mode,
+                )
+                return None
+            channel_start, block_end = block
+        else:
+            channel_start = slot.channel_start
+            if not channel_start and auto_assign:
+                channel_start = self._assign_manual_start(slot)
+            if not channel_start:
+                return None
+            block_end = None
 
-    # For MANUAL mode with no channel_start, auto-assign if enabled
-    elif not channel_start and auto_assign:
-        channel_start = _get_next_available_range_start(conn)
+        next_num = slot.free.first_free(channel_start)
+        if next_num is None:
+            logger.warning("[CHANNEL_NUM] No channel number available up to max %d", MAX_CHANNEL)
+            return None
+        if block_end and next_num > block_end:
+            logger.warning(
+                "[CHANNEL_NUM] Group %d AUTO range exhausted (%d-%d, mode=%s)",
+                group_id,
+                channel_start,
+                block_end,
+                self._numbering_mode,
+            )
+            return None
+        return next_num
+
+    def allocate(self, group_id: int, auto_assign: bool = True) -> int | None:
+        """Take the next available number for a group.
+
+        Returns:
+            The allocated number, or None if the range is exhausted
+        """
+        number = self.next_number(group_id, auto_assign=auto_assign)
+        if number is not None:
+            self._update(group_id, number, take=True)
+        return number
+
+    def release(self, group_id: int, number: Any) -> None:
+        """Return a number (e.g. of a deleted channel) to the group's free pool."""
+        number = _as_channel_number(number)
+        if number is not None and group_id in self._groups:
+            self._update(group_id, number, take=False)
+
+    def _update(self, group_id: int, number: int, take: bool) -> None:
+        slot = self._groups[group_id]
+        before = (slot.free.min_used(), self._blocks_needed(slot))
+        pools = [slot.free, self._compact_pool] if slot.in_compact_pool else [slot.free]
+        for pool in pools:
+            if take:
+                pool.take(number)
+            else:
+                pool.release(number)
+        # Block boundaries only move when a group's lowest number or its
+        # reserved block count changes
+        if slot.is_auto_root and before != (slot.free.min_used(), self._blocks_needed(slot)):
+            self._layout = None
+
+    def _next_compact(self) -> int | None:
+        next_num = self._compact_pool.first_free(self._range_start)
+        if next_num is None or next_num > self._effective_end:
+            logger.warning(
+                "[CHANNEL_NUM] strict_compact: No available channels (range %d-%d exhausted)",
+                self._range_start,
+                self._effective_end,
+            )
+            return None
+        return next_num
+
+    def _blocks_needed(self, slot: _GroupSlot) -> int:
+        if self._numbering_mode == "rational_block":
+            return _calculate_blocks_needed(slot.free.used_count)
+        return _calculate_blocks_needed(slot.total_stream_count)
+
+    def _get_layout(self) -> dict[int, tuple[int, int] | None]:
+        """Block start/end for every AUTO root group in one pass.
+
+        Start: cumulative blocks of preceding groups, pulled down to the
+        group's lowest existing number. End: just below the lowest number of
+        the next group that has channels, else the global range end.
+        """
+        if self._layout is not None:
+            return self._layout
+
+        starts: dict[int, int | None] = {}
+        current_start = self._range_start
+        for slot in self._auto_roots:
+            start = current_start
+            min_existing = slot.free.min_used()
+            if min_existing and min_existing < start:
+                start = min_existing
+            if start > self._effective_end:
+                logger.warning(
+                    "[CHANNEL_NUM] AUTO group %d would start at %d, exceeds range end %d",
+                    slot.id,
+                    start,
+                    self._effective_end,
+                )
+                starts[slot.id] = None
+            else:
+                starts[slot.id] = start
+            current_start += self._blocks_needed(slot) * 10
+
+        layout: dict[int, tuple[int, int] | None] = {}
+        next_min = None
+        for slot in reversed(self._auto_roots):
+            start = starts[slot.id]
+            block_end = next_min - 1 if next_min else self._effective_end
+            layout[slot.id] = (start, block_end) if start else None
+            next_min = slot.free.min_used() or next_min
+
+        self._layout = layout
+        return layout
+
+    def _assign_manual_start(self, slot: _GroupSlot) -> int | None:
+        """Auto-assign and persist channel_start for a MANUAL group without one."""
+        channel_start = _get_next_available_range_start(self._conn)
         if channel_start:
-            conn.execute(
+            self._conn.execute(
                 "UPDATE event_epg_groups SET channel_start_number = ? WHERE id = ?",
-                (channel_start, group_id),
+                (channel_start, slot.id),
             )
-            conn.commit()
+            self._conn.commit()
+            slot.channel_start = channel_start
             logger.info(
                 "[CHANNEL_NUM] Auto-assigned channel_start %d to MANUAL group %d",
                 channel_start,
-                group_id,
+                slot.id,
             )
         else:
             logger.warning(
-                "[CHANNEL_NUM] Could not auto-assign channel_start for group %d", group_id
+                "[CHANNEL_NUM] Could not auto-assign channel_start for group %d", slot.id
             )
-
-    if not channel_start:
-        return None
-
-    # Get all active channel numbers for this group
-    # Note: channel_number may be stored as TEXT or INTEGER, so cast to int
-    used_rows = conn.execute(
-        """SELECT channel_number FROM managed_channels
-           WHERE event_epg_group_id = ? AND deleted_at IS NULL
-           ORDER BY channel_number""",
-        (group_id,),
-    ).fetchall()
-    used_set = set()
-    for row in used_rows:
-        if row["channel_number"]:
-            try:
-                used_set.add(int(float(row["channel_number"])))
-            except (ValueError, TypeError):
-                pass  # Skip invalid channel numbers
-
-    # Find the first available number starting from channel_start
-    next_num = channel_start
-    while next_num in used_set:
-        next_num += 1
-
-    # For AUTO mode with block reservation, enforce block_end limit
-    if block_end and next_num > block_end:
-        logger.warning(
-            "[CHANNEL_NUM] Group %d AUTO range exhausted (%d-%d, mode=%s)",
-            group_id,
-            channel_start,
-            block_end,
-            numbering_mode,
-        )
-        return None
-
-    # Check global max
-    if next_num > MAX_CHANNEL:
-        logger.warning("[CHANNEL_NUM] Channel number %d exceeds max %d", next_num, MAX_CHANNEL)
-        return None
-
-    return next_num
+        return channel_start
 
 
 def _calculate_strict_compact_start(conn: Connection, group_id: int) -> int | None:
@@ -306,50 +553,6 @@ def _get_max_channel_number(conn: Connection, group_id: int) -> int | None:
     return row["max_ch"] if row and row["max_ch"] else None
 
 
-def _calculate_auto_block_end(
-    conn: Connection,
-    group_id: int,
-    sort_order: int,
-    channel_start: int,
-) -> int:
-    """Calculate the block_end for an AUTO group.
-
-    Uses the minimum channel number from the NEXT group that has channels.
-    This allows groups to grow into empty space between them.
-
-    If no following group has channels, returns the global range end.
-    """
-    range_start, range_end = get_global_channel_range(conn)
-    effective_end = range_end if range_end else MAX_CHANNEL
-
-    # Get all AUTO groups sorted by sort_order, excluding child groups
-    auto_groups = conn.execute(
-        """SELECT id, sort_order
-           FROM event_epg_groups
-           WHERE channel_assignment_mode = 'auto'
-             AND parent_group_id IS NULL
-             AND enabled = 1
-           ORDER BY sort_order ASC""",
-    ).fetchall()
-
-    # Find the first group AFTER us that has actual channels
-    found_self = False
-    for grp in auto_groups:
-        if grp["id"] == group_id:
-            found_self = True
-            continue
-
-        if found_self:
-            # Check if this group has any channels
-            next_min = _get_min_channel_number(conn, grp["id"])
-            if next_min:
-                # Found a following group with channels - our block ends before theirs
-                return next_min - 1
-
-    # No following group has channels - use global range end
-    return effective_end
-
-
 def _calculate_blocks_needed(stream_count: int) -> int:
     """Calculate blocks needed for a group based on total stream count.
 
@@ -881,7 +1084,7 @@ def reassign_channels_globally(conn: Connection) -> dict:
     This function:
     1. Gets all AUTO channels sorted globally
     2. Assigns sequential numbers starting from range_start
-    3. Updates channel_number in database
+    3. Updates channel_number in database (one batched UPDATE)
     4. Logs any drift (channels that changed numbers)
 
     Returns:
@@ -897,11 +1100,10 @@ def reassign_channels_globally(conn: Connection) -> dict:
         logger.info("[CHANNEL_SORT] No AUTO channels to reassign globally")
         return {"channels_processed": 0, "channels_moved": 0, "drift_details": []}
 
-    # Track changes
-    channels_moved = 0
+    # Number channels sequentially in sort order, then persist in one batch
+    updates: list[tuple[int, int]] = []
     drift_details = []
 
-    # Assign sequential numbers
     next_num = range_start
     for ch in sorted_channels:
         old_num = ch["channel_number"]
@@ -915,11 +1117,8 @@ def reassign_channels_globally(conn: Connection) -> dict:
             break
 
         # Update if number changed
-        if old_num != next_num:
-            conn.execute(
-                "UPDATE managed_channels SET channel_number = ? WHERE id = ?",
-                (next_num, ch["id"]),
-            )
+        if _as_channel_number(old_num) != next_num:
+            updates.append((next_num, ch["id"]))
             drift_details.append(
                 {
                     "channel_id": ch["id"],
@@ -929,7 +1128,6 @@ def reassign_channels_globally(conn: Connection) -> dict:
                     "new_number": next_num,
                 }
             )
-            channels_moved += 1
 
             # Log drift at debug level (summary is at INFO)
             logger.debug(
@@ -938,6 +1136,10 @@ def reassign_channels_globally(conn: Connection) -> dict:
 
         next_num += 1
 
+    if updates:
+        conn.executemany("UPDATE managed_channels SET channel_number = ? WHERE id = ?", updates)
+    channels_moved = len(updates)
+
     logger.info(
         "[CHANNEL_SORT] Global reassign complete: %d channels processed, %d moved",
         len(sorted_channels),
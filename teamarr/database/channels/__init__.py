@@ -19,6 +19,7 @@ from .crud import (
     get_managed_channel_by_tvg_id,
     get_managed_channels_for_group,
     mark_channel_deleted,
+    mark_channels_drifted,
     update_managed_channel,
 )
 
@@ -71,6 +72,7 @@ __all__ = [
     "get_all_managed_channels",
     "update_managed_channel",
     "mark_channel_deleted",
+    "mark_channels_drifted",
     "find_existing_channel",
     "find_parent_channel_for_event",
     "find_any_channel_for_event",
@@ -360,6 +360,38 @@ def mark_channel_deleted(
     return False
 
 
+def mark_channels_drifted(
+    conn: Connection,
+    dispatcharr_channel_ids: list[int],
+    message: str,
+) -> int:
+    """Mark active channels whose Dispatcharr write failed for retry.
+
+    The lifecycle service resends DB-tracked fields (profiles, logo) for
+    drifted channels on the next sync instead of trusting the stored values.
+
+    Args:
+        conn: Database connection
+        dispatcharr_channel_ids: Dispatcharr channel IDs
+        message: Sync message (the write error)
+
+    Returns:
+        Number of rows updated
+    """
+    if not dispatcharr_channel_ids:
+        return 0
+    placeholders = ", ".join("?" * len(dispatcharr_channel_ids))
+    cursor = conn.execute(
+        f"""UPDATE managed_channels
+            SET sync_status = 'drifted', sync_message = ?
+            WHERE deleted_at IS NULL AND dispatcharr_channel_id IN ({placeholders})""",
+        [message, *dispatcharr_channel_ids],
+    )
+    if cursor.rowcount > 0:
+        logger.info("[DRIFTED] %d managed channel(s): %s", cursor.rowcount, message)
+    return cursor.rowcount
+
+
 def mark_all_channels_deleted(conn: Connection) -> tuple[int, int]:
     """Mark all active managed channels as deleted (soft delete).
 
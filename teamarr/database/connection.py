@@ -11,6 +11,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 from teamarr.database.checkpoint_v43 import apply_checkpoint_v43
+from teamarr.utilities import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -40,20 +41,22 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
     """
     path = Path(db_path) if db_path else DEFAULT_DB_PATH
 
-    # timeout=30: Wait up to 30 seconds if database is locked by another connection
-    # check_same_thread=False: Allow connection to be used across threads (required for FastAPI)
-    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    with metrics.span("sqlite_connect"):
+        # timeout=30: Wait up to 30 seconds if database is locked by another connection
+        # check_same_thread=False: Allow connection to be used across threads
+        # (required for FastAPI)
+        conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
 
-    # Enable Write-Ahead Logging for better concurrent access
-    # WAL allows readers to not block writers and vice versa
-    conn.execute("PRAGMA journal_mode=WAL")
+        # Enable Write-Ahead Logging for better concurrent access
+        # WAL allows readers to not block writers and vice versa
+        conn.execute("PRAGMA journal_mode=WAL")
 
-    # Wait up to 30 seconds if a table is locked (milliseconds)
-    conn.execute("PRAGMA busy_timeout=30000")
+        # Wait up to 30 seconds if a table is locked (milliseconds)
+        conn.execute("PRAGMA busy_timeout=30000")
 
-    # Enable foreign keys
-    conn.execute("PRAGMA foreign_keys = ON")
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
 
     return conn
 
@@ -770,6 +773,30 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         logger.info("[MIGRATE] Schema upgraded to version 58 (linear discovery filtering)")
         current_version = 58
 
+    # v59: Trigram search index for team_cache (best-effort: needs FTS5)
+    if current_version < 59:
+        from teamarr.database.team_cache import rebuild_team_search_index
+
+        indexed = rebuild_team_search_index(conn)
+        conn.execute("UPDATE settings SET schema_version = 59 WHERE id = 1")
+        logger.info(
+            "[MIGRATE] Schema upgraded to version 59 (team search index, %d teams)", indexed
+        )
+        current_version = 59
+
+    # v60: Dashboard rollups (tables and triggers live in schema.sql; backfill here)
+    if current_version < 60:
+        from teamarr.database.stats import rebuild_dashboard_rollups, update_dashboard_run_rollup
+
+        try:
+            rebuild_dashboard_rollups(conn)
+            update_dashboard_run_rollup(conn)
+        except sqlite3.OperationalError as e:
+            logger.warning("[MIGRATE] Dashboard rollup backfill skipped: %s", e)
+        conn.execute("UPDATE settings SET schema_version = 60 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 60 (dashboard rollups)")
+        current_version = 60
+
 
 # =============================================================================
 # LEGACY MIGRATION HELPER FUNCTIONS
@@ -1464,6 +1464,28 @@ def get_all_group_xmltv(conn: Connection, group_ids: list[int] | None = None) ->
     return [row["xmltv_content"] for row in cursor.fetchall()]
 
 
+def get_group_xmltv_source_key(conn: Connection) -> str:
+    """Fingerprint the XMLTV that get_all_group_xmltv(conn) would return.
+
+    Built from group IDs and update times only, so checking whether a
+    merged guide is still current doesn't load any XMLTV content.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Opaque key that changes when any enabled group's XMLTV changes
+    """
+    rows = conn.execute(
+        """SELECT x.group_id, x.updated_at FROM event_epg_xmltv x
+           JOIN event_epg_groups g ON x.group_id = g.id
+           WHERE g.enabled = 1
+           AND x.xmltv_content IS NOT NULL AND x.xmltv_content != ''
+           ORDER BY x.group_id"""
+    ).fetchall()
+    return ",".join(f"{row['group_id']}@{row['updated_at']}" for row in rows)
+
+
 def store_group_xmltv(conn: Connection, group_id: int, xmltv_content: str) -> None:
     """Store XMLTV content for a group.
 
@@ -1484,6 +1506,79 @@ def store_group_xmltv(conn: Connection, group_id: int, xmltv_content: str) -> No
     logger.debug("[STORED] XMLTV for group id=%d size=%d", group_id, len(xmltv_content))
 
 
+def store_group_stream_snapshot(conn: Connection, group_id: int, streams: list[dict]) -> None:
+    """Store the streams just fetched for a group (before filtering).
+
+    Args:
+        conn: Database connection
+        group_id: Group ID
+        streams: Stream dicts as passed to filtering/matching
+    """
+    conn.execute(
+        """INSERT INTO event_epg_stream_snapshots (group_id, streams, captured_at)
+           VALUES (?, ?, datetime('now'))
+           ON CONFLICT(group_id) DO UPDATE SET
+               streams = excluded.streams,
+               captured_at = datetime('now')""",
+        (group_id, json.dumps(streams)),
+    )
+    conn.commit()
+
+
+def store_group_match_snapshot(
+    conn: Connection,
+    group_id: int,
+    target_date: str,
+    results: dict[str, dict],
+) -> None:
+    """Store per-stream match results for a group's stream snapshot.
+
+    Args:
+        conn: Database connection
+        group_id: Group ID
+        target_date: ISO date the streams were matched for
+        results: "config:fingerprint" match key -> preview stream dict
+    """
+    conn.execute(
+        """INSERT INTO event_epg_stream_snapshots (group_id, results, target_date)
+           VALUES (?, ?, ?)
+           ON CONFLICT(group_id) DO UPDATE SET
+               results = excluded.results,
+               target_date = excluded.target_date""",
+        (group_id, json.dumps(results), target_date),
+    )
+    conn.commit()
+
+
+def get_group_stream_snapshot(conn: Connection, group_id: int) -> dict | None:
+    """Get a group's last stream snapshot and match results.
+
+    Args:
+        conn: Database connection
+        group_id: Group ID
+
+    Returns:
+        Dict with streams, results, target_date and captured_at, or None if
+        no streams have been captured yet
+    """
+    row = conn.execute(
+        """SELECT streams, results, target_date, captured_at
+           FROM event_epg_stream_snapshots WHERE group_id = ?""",
+        (group_id,),
+    ).fetchone()
+    if not row:
+        return None
+    streams = json.loads(row["streams"] or "[]")
+    if not streams:
+        return None
+    return {
+        "streams": streams,
+        "results": json.loads(row["results"] or "{}"),
+        "target_date": row["target_date"],
+        "captured_at": row["captured_at"],
+    }
+
+
 def delete_group_xmltv(conn: Connection, group_id: int) -> bool:
     """Delete stored XMLTV content for a group.
 
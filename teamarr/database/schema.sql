@@ -1086,6 +1086,31 @@ CREATE TABLE IF NOT EXISTS service_cache (
 CREATE INDEX IF NOT EXISTS idx_sc_expires ON service_cache(expires_at);
 
 
+-- =============================================================================
+-- PROVIDER_RESPONSE_CACHE TABLE
+-- Raw API/scrape responses of the TSDB, HockeyTech and Cricbuzz clients
+-- (survives restarts so rate budget isn't re-spent on cold starts)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS provider_response_cache (
+    provider TEXT NOT NULL,                 -- 'tsdb', 'hockeytech', 'cricbuzz'
+    cache_key TEXT NOT NULL,                -- Client cache key (e.g., "tsdb:eventsday:ohl:2026-01-06")
+
+    -- zlib-compressed JSON payload
+    payload BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,            -- Compressed size (counts toward the provider cap)
+    raw_bytes INTEGER NOT NULL,             -- Uncompressed JSON size
+
+    -- TTL management (client-chosen, e.g. tiered by date)
+    expires_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (provider, cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_prc_expires ON provider_response_cache(provider, expires_at);
+
+
 -- =============================================================================
 -- LINEAR_EPG_CACHE TABLE
 -- Discovered events on linear 24/7 channels from Dispatcharr XMLTV
@@ -1344,6 +1369,26 @@ CREATE TABLE IF NOT EXISTS event_epg_xmltv (
 );
 
 
+-- =============================================================================
+-- EVENT_EPG_STREAM_SNAPSHOTS TABLE
+-- Last streams fetched for each group and their match results, so
+-- GET /groups/{id}/preview can answer without refreshing the M3U account or
+-- refetching streams. Results are keyed by stream fingerprint
+-- (group_id:stream_id:stream_name); only streams whose fingerprint is not
+-- in results (new or renamed) are re-matched.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS event_epg_stream_snapshots (
+    group_id INTEGER PRIMARY KEY,
+    streams JSON NOT NULL DEFAULT '[]',      -- stream dicts as fetched (before filtering)
+    results JSON NOT NULL DEFAULT '{}',      -- 'config:fingerprint' -> preview stream dict
+    target_date TEXT,                        -- date the results were matched for
+    captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (group_id) REFERENCES event_epg_groups(id) ON DELETE CASCADE
+);
+
+
 -- =============================================================================
 -- TEAM_EPG_XMLTV TABLE
 -- Stores generated XMLTV content per team
@@ -1359,6 +1404,26 @@ CREATE TABLE IF NOT EXISTS team_epg_xmltv (
 );
 
 
+-- =============================================================================
+-- XMLTV_ARTIFACTS TABLE
+-- Guides written by the last full generation, one row per scope
+-- ('full' = served EPG file, 'events' = event groups only). Lets the XMLTV
+-- and analysis endpoints serve precomputed output with ETags.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS xmltv_artifacts (
+    scope TEXT PRIMARY KEY,
+    run_id INTEGER,                   -- processing_runs.id that wrote it
+    path TEXT NOT NULL,               -- file on disk
+    etag TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,        -- file mtime when written (detects outside edits)
+    source_key TEXT,                  -- fingerprint of the inputs (events scope)
+    analysis JSON,                    -- precomputed /epg/analysis summary
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+
 -- =============================================================================
 -- PROCESSING_RUNS TABLE
 -- Stores historical stats from each processing run
@@ -1462,6 +1527,112 @@ CREATE INDEX IF NOT EXISTS idx_stats_snapshots_type ON stats_snapshots(snapshot_
 CREATE INDEX IF NOT EXISTS idx_stats_snapshots_period ON stats_snapshots(period_start);
 
 
+-- =============================================================================
+-- DASHBOARD ROLLUPS
+-- Pre-aggregated counts for GET /stats/dashboard (polled by the UI).
+-- Team and channel counts are kept current by the triggers below; the
+-- latest generation run's summary is written by update_dashboard_run_rollup()
+-- at the end of each run. rebuild_dashboard_rollups() recomputes them.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS dashboard_team_rollup (
+    league TEXT PRIMARY KEY,                 -- teams.primary_league
+    total INTEGER NOT NULL DEFAULT 0,
+    active INTEGER NOT NULL DEFAULT 0,
+    assigned INTEGER NOT NULL DEFAULT 0      -- teams with a template
+);
+
+CREATE TABLE IF NOT EXISTS dashboard_channel_rollup (
+    group_id INTEGER PRIMARY KEY,            -- managed_channels.event_epg_group_id
+    active INTEGER NOT NULL DEFAULT 0,       -- not deleted
+    with_logos INTEGER NOT NULL DEFAULT 0    -- not deleted, with a logo
+);
+
+CREATE TABLE IF NOT EXISTS dashboard_run_rollup (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    run_id INTEGER NOT NULL,                 -- processing_runs.id (latest full_epg)
+    summary JSON NOT NULL,                   -- match totals, per-group breakdown, EPG counts
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- deleted_24h count on the dashboard
+CREATE INDEX IF NOT EXISTS idx_managed_channels_deleted_at ON managed_channels(deleted_at)
+    WHERE deleted_at IS NOT NULL;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_teams_insert
+AFTER INSERT ON teams
+BEGIN
+    INSERT INTO dashboard_team_rollup (league, total, active, assigned)
+    VALUES (NEW.primary_league, 1, NEW.active IS 1, NEW.template_id IS NOT NULL)
+    ON CONFLICT (league) DO UPDATE SET
+        total = total + 1,
+        active = active + excluded.active,
+        assigned = assigned + excluded.assigned;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_teams_delete
+AFTER DELETE ON teams
+BEGIN
+    UPDATE dashboard_team_rollup SET
+        total = total - 1,
+        active = active - (OLD.active IS 1),
+        assigned = assigned - (OLD.template_id IS NOT NULL)
+    WHERE league = OLD.primary_league;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_teams_update
+AFTER UPDATE OF primary_league, active, template_id ON teams
+BEGIN
+    UPDATE dashboard_team_rollup SET
+        total = total - 1,
+        active = active - (OLD.active IS 1),
+        assigned = assigned - (OLD.template_id IS NOT NULL)
+    WHERE league = OLD.primary_league;
+    INSERT INTO dashboard_team_rollup (league, total, active, assigned)
+    VALUES (NEW.primary_league, 1, NEW.active IS 1, NEW.template_id IS NOT NULL)
+    ON CONFLICT (league) DO UPDATE SET
+        total = total + 1,
+        active = active + excluded.active,
+        assigned = assigned + excluded.assigned;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_channels_insert
+AFTER INSERT ON managed_channels
+WHEN NEW.deleted_at IS NULL
+BEGIN
+    INSERT INTO dashboard_channel_rollup (group_id, active, with_logos)
+    VALUES (NEW.event_epg_group_id, 1, COALESCE(NEW.logo_url, '') != '')
+    ON CONFLICT (group_id) DO UPDATE SET
+        active = active + 1,
+        with_logos = with_logos + excluded.with_logos;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_channels_delete
+AFTER DELETE ON managed_channels
+WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE dashboard_channel_rollup SET
+        active = active - 1,
+        with_logos = with_logos - (COALESCE(OLD.logo_url, '') != '')
+    WHERE group_id = OLD.event_epg_group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_channels_update
+AFTER UPDATE OF deleted_at, logo_url, event_epg_group_id ON managed_channels
+BEGIN
+    UPDATE dashboard_channel_rollup SET
+        active = active - 1,
+        with_logos = with_logos - (COALESCE(OLD.logo_url, '') != '')
+    WHERE group_id = OLD.event_epg_group_id AND OLD.deleted_at IS NULL;
+    INSERT INTO dashboard_channel_rollup (group_id, active, with_logos)
+    SELECT NEW.event_epg_group_id, 1, COALESCE(NEW.logo_url, '') != ''
+    WHERE NEW.deleted_at IS NULL
+    ON CONFLICT (group_id) DO UPDATE SET
+        active = active + 1,
+        with_logos = with_logos + excluded.with_logos;
+END;
+
+
 -- =============================================================================
 -- EPG_MATCHED_STREAMS TABLE
 -- Details of successfully matched streams per generation run
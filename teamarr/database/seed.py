@@ -107,6 +107,11 @@ def seed_tsdb_cache(conn) -> dict:
         if cursor.rowcount > 0:
             teams_added += 1
 
+    if teams_added:
+        from teamarr.database.team_cache import rebuild_team_search_index
+
+        rebuild_team_search_index(conn)
+
     # Update cached_team_count in leagues table
     cursor.execute(
         """
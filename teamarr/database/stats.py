@@ -372,6 +372,169 @@ def _row_to_run(row: dict) -> ProcessingRun:
 # =============================================================================
 
 
+def rebuild_dashboard_rollups(conn: Connection) -> None:
+    """Recompute the trigger-maintained dashboard rollups from scratch.
+
+    Run by the migration that introduced them; safe to run any time.
+    """
+    conn.execute("DELETE FROM dashboard_team_rollup")
+    conn.execute("""
+        INSERT INTO dashboard_team_rollup (league, total, active, assigned)
+        SELECT primary_league, COUNT(*),
+               SUM(active IS 1), SUM(template_id IS NOT NULL)
+        FROM teams
+        GROUP BY primary_league
+    """)
+    conn.execute("DELETE FROM dashboard_channel_rollup")
+    conn.execute("""
+        INSERT INTO dashboard_channel_rollup (group_id, active, with_logos)
+        SELECT event_epg_group_id, COUNT(*), SUM(COALESCE(logo_url, '') != '')
+        FROM managed_channels
+        WHERE deleted_at IS NULL AND event_epg_group_id IS NOT NULL
+        GROUP BY event_epg_group_id
+    """)
+
+
+def _summarize_run(conn: Connection, run) -> dict:
+    """Build the dashboard summary of a completed full_epg run."""
+    matched_by_group = conn.execute(
+        """
+        SELECT group_id, COUNT(*) as matched
+        FROM epg_matched_streams
+        WHERE run_id = ?
+        GROUP BY group_id
+    """,
+        (run["id"],),
+    ).fetchall()
+
+    failed_by_group = conn.execute(
+        """
+        SELECT group_id, COUNT(*) as failed
+        FROM epg_failed_matches
+        WHERE run_id = ?
+        GROUP BY group_id
+    """,
+        (run["id"],),
+    ).fetchall()
+
+    failed_lookup = {r["group_id"]: r["failed"] for r in failed_by_group}
+
+    # Matched groups first, then groups where nothing matched
+    group_breakdown = []
+    for r in matched_by_group:
+        gid = r["group_id"]
+        matched = r["matched"]
+        group_breakdown.append(
+            {"group_id": gid, "matched": matched, "total": matched + failed_lookup.get(gid, 0)}
+        )
+    matched_gids = {r["group_id"] for r in matched_by_group}
+    for gid, failed in failed_lookup.items():
+        if gid not in matched_gids:
+            group_breakdown.append({"group_id": gid, "matched": 0, "total": failed})
+
+    extra = json.loads(run["extra_metrics"]) if run["extra_metrics"] else {}
+    teams_processed = extra.get("teams_processed", 0)
+
+    programmes_total = run["programmes_total"] or 0
+    events_total = run["programmes_events"] or 0
+    channels_active = run["channels_active"] or 0
+
+    if teams_processed > 0 and channels_active == 0:
+        events_team = events_total
+        events_event = 0
+    elif channels_active > 0 and teams_processed == 0:
+        events_team = 0
+        events_event = events_total
+    elif teams_processed > 0 and channels_active > 0:
+        total_channels = teams_processed + channels_active
+        events_team = int(events_total * teams_processed / total_channels)
+        events_event = events_total - events_team
+    else:
+        events_team = 0
+        events_event = 0
+
+    filler_pregame = run["programmes_pregame"] or 0
+    filler_postgame = run["programmes_postgame"] or 0
+    filler_idle = run["programmes_idle"] or 0
+
+    return {
+        "streams_matched": run["streams_matched"] or 0,
+        "streams_unmatched": run["streams_unmatched"] or 0,
+        "groups": group_breakdown,
+        "epg": {
+            "channels_total": teams_processed + channels_active,
+            "channels_team": teams_processed,
+            "channels_event": channels_active,
+            "events_total": events_total,
+            "events_team": events_team,
+            "events_event": events_event,
+            "filler_total": filler_pregame + filler_postgame + filler_idle,
+            "filler_pregame": filler_pregame,
+            "filler_postgame": filler_postgame,
+            "filler_idle": filler_idle,
+            "programmes_total": programmes_total,
+        },
+    }
+
+
+_RUN_SUMMARY_COLUMNS = """
+    id, streams_matched, streams_unmatched, programmes_total, programmes_events,
+    programmes_pregame, programmes_postgame, programmes_idle, channels_active,
+    extra_metrics
+"""
+
+
+def _run_summary(conn: Connection, run_id: int | None = None) -> tuple[int, dict] | None:
+    """Dashboard summary of a full_epg run (latest completed one without run_id).
+
+    Returns:
+        (run id, summary), or None if there is no such run
+    """
+    if run_id is None:
+        run = conn.execute(f"""
+            SELECT {_RUN_SUMMARY_COLUMNS}
+            FROM processing_runs
+            WHERE status = 'completed' AND run_type = 'full_epg'
+            ORDER BY id DESC
+            LIMIT 1
+        """).fetchone()
+    else:
+        run = conn.execute(
+            f"SELECT {_RUN_SUMMARY_COLUMNS} FROM processing_runs WHERE id = ?", (run_id,)
+        ).fetchone()
+    if not run:
+        return None
+    return run["id"], _summarize_run(conn, run)
+
+
+def update_dashboard_run_rollup(conn: Connection, run_id: int | None = None) -> dict | None:
+    """Store the dashboard summary of a full_epg run.
+
+    Called once at the end of each generation run. Without run_id, uses
+    the latest completed full_epg run.
+
+    Returns:
+        The stored summary, or None if there is no such run
+    """
+    found = _run_summary(conn, run_id)
+    if not found:
+        return None
+
+    stored_run_id, summary = found
+    conn.execute(
+        """
+        INSERT INTO dashboard_run_rollup (id, run_id, summary, updated_at)
+        VALUES (1, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (id) DO UPDATE SET
+            run_id = excluded.run_id,
+            summary = excluded.summary,
+            updated_at = excluded.updated_at
+        """,
+        (stored_run_id, json.dumps(summary)),
+    )
+    return summary
+
+
 def get_dashboard_stats(conn: Connection) -> dict:
     """Get aggregated dashboard stats for UI quadrants.
 
@@ -380,129 +543,57 @@ def get_dashboard_stats(conn: Connection) -> dict:
     - Event Groups: total, streams, match rates, leagues (from latest run)
     - EPG: channels, events, filler by type (from latest run)
     - Channels: active, logos, groups, deleted
-    """
-    # Teams stats
-    teams_row = conn.execute("""
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN active = 1 THEN 1 ELSE 0 END) as active,
-            SUM(CASE WHEN template_id IS NOT NULL THEN 1 ELSE 0 END) as assigned
-        FROM teams
-    """).fetchone()
 
-    # Teams by league
+    Reads the dashboard rollup tables rather than aggregating history.
+    """
+    # Teams stats (trigger-maintained)
+    team_rows = conn.execute("""
+        SELECT league, total, active, assigned
+        FROM dashboard_team_rollup
+        WHERE total > 0
+        ORDER BY total DESC, league
+    """).fetchall()
     team_leagues = [
-        {"league": r["league"], "logo_url": None, "count": r["count"]}
-        for r in conn.execute("""
-            SELECT primary_league as league, COUNT(*) as count
-            FROM teams
-            GROUP BY primary_league
-            ORDER BY count DESC
-        """).fetchall()
+        {"league": r["league"], "logo_url": None, "count": r["total"]} for r in team_rows
     ]
 
     # Event groups configuration
     groups = conn.execute("""
-        SELECT id, name, leagues, total_stream_count
+        SELECT id, name, total_stream_count
         FROM event_epg_groups
         WHERE enabled = 1
     """).fetchall()
-
-    # Build group name lookup and collect configured leagues
-    group_name_lookup = {}
-    event_leagues_set: set[str] = set()
-    total_streams = 0
-
-    for g in groups:
-        group_name_lookup[g["id"]] = g["name"]
-        leagues = json.loads(g["leagues"]) if g["leagues"] else []
-        event_leagues_set.update(leagues)
-        total_streams += g["total_stream_count"] or 0
+    group_name_lookup = {g["id"]: g["name"] for g in groups}
+    total_streams = sum(g["total_stream_count"] or 0 for g in groups)
 
     event_leagues = [
-        {"league": league, "logo_url": None, "count": 1} for league in sorted(event_leagues_set)
+        {"league": r["league"], "logo_url": None, "count": 1}
+        for r in conn.execute("""
+            SELECT DISTINCT j.value as league
+            FROM event_epg_groups g, json_each(g.leagues) j
+            WHERE g.enabled = 1 AND g.leagues IS NOT NULL AND g.leagues != ''
+            ORDER BY league
+        """).fetchall()
     ]
 
-    # Get actual match stats from latest completed full_epg run
-    latest_run = conn.execute("""
-        SELECT id, streams_matched, streams_unmatched, streams_fetched, streams_cached,
-               programmes_total, programmes_events, programmes_pregame,
-               programmes_postgame, programmes_idle, channels_active,
-               extra_metrics
-        FROM processing_runs
-        WHERE status = 'completed' AND run_type = 'full_epg'
-        ORDER BY id DESC
-        LIMIT 1
+    # Latest completed full_epg run summary (written at the end of each run;
+    # the join drops it if that run has since been deleted). On a miss it is
+    # computed without storing it - this is a read path.
+    rollup = conn.execute("""
+        SELECT r.summary
+        FROM dashboard_run_rollup r
+        JOIN processing_runs p ON p.id = r.run_id
+        WHERE r.id = 1
     """).fetchone()
+    if rollup:
+        summary = json.loads(rollup["summary"])
+    else:
+        found = _run_summary(conn)
+        summary = found[1] if found else None
 
-    # Initialize match stats from latest run
     matched_streams = 0
     unmatched_streams = 0
     group_breakdown = []
-
-    if latest_run:
-        matched_streams = latest_run["streams_matched"] or 0
-        unmatched_streams = latest_run["streams_unmatched"] or 0
-
-        matched_by_group = conn.execute(
-            """
-            SELECT group_id, COUNT(*) as matched
-            FROM epg_matched_streams
-            WHERE run_id = ?
-            GROUP BY group_id
-        """,
-            (latest_run["id"],),
-        ).fetchall()
-
-        failed_by_group = conn.execute(
-            """
-            SELECT group_id, COUNT(*) as failed
-            FROM epg_failed_matches
-            WHERE run_id = ?
-            GROUP BY group_id
-        """,
-            (latest_run["id"],),
-        ).fetchall()
-
-        failed_lookup = {r["group_id"]: r["failed"] for r in failed_by_group}
-
-        for r in matched_by_group:
-            gid = r["group_id"]
-            matched = r["matched"]
-            failed = failed_lookup.get(gid, 0)
-            group_breakdown.append(
-                {
-                    "name": group_name_lookup.get(gid, f"Group {gid}"),
-                    "matched": matched,
-                    "total": matched + failed,
-                }
-            )
-
-        matched_gids = {r["group_id"] for r in matched_by_group}
-        for gid, failed in failed_lookup.items():
-            if gid not in matched_gids:
-                group_breakdown.append(
-                    {
-                        "name": group_name_lookup.get(gid, f"Group {gid}"),
-                        "matched": 0,
-                        "total": failed,
-                    }
-                )
-    else:
-        for g in groups:
-            stream_count = g["total_stream_count"] or 0
-            group_breakdown.append(
-                {
-                    "name": g["name"],
-                    "matched": 0,
-                    "total": stream_count,
-                }
-            )
-
-    total_eligible = matched_streams + unmatched_streams
-    match_percent = round(matched_streams / total_eligible * 100) if total_eligible > 0 else 0
-
-    # EPG stats from latest run
     epg_stats = {
         "channels_total": 0,
         "channels_team": 0,
@@ -517,81 +608,53 @@ def get_dashboard_stats(conn: Connection) -> dict:
         "programmes_total": 0,
     }
 
-    if latest_run:
-        extra = json.loads(latest_run["extra_metrics"]) if latest_run["extra_metrics"] else {}
-        teams_processed = extra.get("teams_processed", 0)
-
-        programmes_total = latest_run["programmes_total"] or 0
-        events_total = latest_run["programmes_events"] or 0
-        channels_active = latest_run["channels_active"] or 0
-
-        if teams_processed > 0 and channels_active == 0:
-            events_team = events_total
-            events_event = 0
-        elif channels_active > 0 and teams_processed == 0:
-            events_team = 0
-            events_event = events_total
-        elif teams_processed > 0 and channels_active > 0:
-            total_channels = teams_processed + channels_active
-            events_team = int(events_total * teams_processed / total_channels)
-            events_event = events_total - events_team
-        else:
-            events_team = 0
-            events_event = 0
-
-        epg_stats["programmes_total"] = programmes_total
-        epg_stats["events_total"] = events_total
-        epg_stats["events_team"] = events_team
-        epg_stats["events_event"] = events_event
-        epg_stats["filler_pregame"] = latest_run["programmes_pregame"] or 0
-        epg_stats["filler_postgame"] = latest_run["programmes_postgame"] or 0
-        epg_stats["filler_idle"] = latest_run["programmes_idle"] or 0
-        epg_stats["filler_total"] = (
-            epg_stats["filler_pregame"]
-            + epg_stats["filler_postgame"]
-            + epg_stats["filler_idle"]
-        )
-        epg_stats["channels_team"] = teams_processed
-        epg_stats["channels_event"] = channels_active
-        epg_stats["channels_total"] = teams_processed + channels_active
+    if summary:
+        matched_streams = summary["streams_matched"]
+        unmatched_streams = summary["streams_unmatched"]
+        group_breakdown = [
+            {
+                "name": group_name_lookup.get(g["group_id"], f"Group {g['group_id']}"),
+                "matched": g["matched"],
+                "total": g["total"],
+            }
+            for g in summary["groups"]
+        ]
+        epg_stats.update(summary["epg"])
+    else:
+        for g in groups:
+            group_breakdown.append(
+                {"name": g["name"], "matched": 0, "total": g["total_stream_count"] or 0}
+            )
 
-    # Managed channels stats
-    channels_row = conn.execute("""
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN deleted_at IS NULL THEN 1 ELSE 0 END) as active,
-            SUM(CASE WHEN logo_url IS NOT NULL AND logo_url != ''
-                THEN 1 ELSE 0 END) as with_logos,
-            SUM(CASE WHEN deleted_at IS NOT NULL
-                AND deleted_at > datetime('now', '-1 day')
-                THEN 1 ELSE 0 END) as deleted_24h
-        FROM managed_channels
-    """).fetchone()
+    total_eligible = matched_streams + unmatched_streams
+    match_percent = round(matched_streams / total_eligible * 100) if total_eligible > 0 else 0
 
-    # Channel groups breakdown
+    # Managed channels (trigger-maintained per group)
     channel_group_rows = conn.execute("""
-        SELECT mc.event_epg_group_id, eg.name as group_name, COUNT(*) as count
-        FROM managed_channels mc
-        LEFT JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
-        WHERE mc.deleted_at IS NULL AND mc.event_epg_group_id IS NOT NULL
-        GROUP BY mc.event_epg_group_id
-        ORDER BY count DESC
+        SELECT cr.group_id, cr.active, cr.with_logos, eg.name as group_name
+        FROM dashboard_channel_rollup cr
+        LEFT JOIN event_epg_groups eg ON cr.group_id = eg.id
+        WHERE cr.active > 0
+        ORDER BY cr.active DESC
     """).fetchall()
     channel_group_breakdown = [
         {
-            "id": r["event_epg_group_id"],
-            "name": r["group_name"] or f"Group {r['event_epg_group_id']}",
-            "count": r["count"],
+            "id": r["group_id"],
+            "name": r["group_name"] or f"Group {r['group_id']}",
+            "count": r["active"],
         }
         for r in channel_group_rows
     ]
-    channel_groups = len(channel_group_breakdown)
+    deleted_24h = conn.execute("""
+        SELECT COUNT(*) FROM managed_channels
+        WHERE deleted_at IS NOT NULL AND deleted_at > datetime('now', '-1 day')
+    """).fetchone()[0]
 
     return {
         "teams": {
-            "total": teams_row["total"] or 0,
-            "active": teams_row["active"] or 0,
-            "assigned": teams_row["assigned"] or 0,
+            "total": sum(r["total"] for r in team_rows),
+            "active": sum(r["active"] for r in team_rows),
+            "assigned": sum(r["assigned"] for r in team_rows),
             "leagues": team_leagues,
         },
         "event_groups": {
@@ -604,10 +667,10 @@ def get_dashboard_stats(conn: Connection) -> dict:
         },
         "epg": epg_stats,
         "channels": {
-            "active": channels_row["active"] or 0,
-            "with_logos": channels_row["with_logos"] or 0,
-            "groups": channel_groups,
-            "deleted_24h": channels_row["deleted_24h"] or 0,
+            "active": sum(r["active"] for r in channel_group_rows),
+            "with_logos": sum(r["with_logos"] for r in channel_group_rows),
+            "groups": len(channel_group_breakdown),
+            "deleted_24h": deleted_24h,
             "group_breakdown": channel_group_breakdown,
         },
     }
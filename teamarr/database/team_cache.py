@@ -2,10 +2,28 @@
 
 Simple queries for the team_cache table.
 Used by providers to look up team names without going through consumers layer.
+
+Team search goes through team_cache_fts, an FTS5 trigram index over
+unidecoded, lowercased names (rowid = team_cache.id). It is rebuilt
+wholesale when team_cache is seeded (rebuild_team_search_index()) and
+updated row by row by the diff-based cache refresh
+(update_team_search_index()).
 """
 
+import logging
+import sqlite3
+from collections.abc import Iterable
 from sqlite3 import Connection
 
+from unidecode import unidecode
+
+logger = logging.getLogger(__name__)
+
+# Trigram index can only answer queries of at least 3 characters
+TRIGRAM_MIN_QUERY = 3
+# Row ids per statement when updating the index (SQLite variable limit)
+_ID_BATCH = 500
+
 
 def get_team_name_by_id(
     conn: Connection,
@@ -63,6 +81,91 @@ def get_team_leagues_from_cache(
     return [row["league"] for row in cursor.fetchall()]
 
 
+def _search_text(value: str | None) -> str:
+    """Accent-insensitive, lowercase form used by the search index."""
+    return unidecode(value).lower().strip() if value else ""
+
+
+def create_team_search_index(conn: Connection) -> bool:
+    """Create the team_cache_fts table if SQLite supports FTS5 trigrams.
+
+    Returns:
+        True if the index table exists
+    """
+    try:
+        conn.execute(
+            """CREATE VIRTUAL TABLE IF NOT EXISTS team_cache_fts
+               USING fts5(name, short_name, tokenize='trigram')"""
+        )
+        return True
+    except sqlite3.OperationalError as e:
+        logger.warning("[TEAM_CACHE] FTS5 trigram search unavailable, using LIKE: %s", e)
+        return False
+
+
+def rebuild_team_search_index(conn: Connection) -> int:
+    """Rebuild team_cache_fts from team_cache.
+
+    Call after bulk changes to team_cache (cache refresh, seeding).
+
+    Returns:
+        Number of teams indexed (0 if the index is unavailable)
+    """
+    if not create_team_search_index(conn):
+        return 0
+    try:
+        rows = conn.execute("SELECT id, team_name, team_short_name FROM team_cache").fetchall()
+    except sqlite3.OperationalError as e:
+        logger.debug("[TEAM_CACHE] Search index not rebuilt: %s", e)
+        return 0
+    conn.execute("DELETE FROM team_cache_fts")
+    conn.executemany(
+        "INSERT INTO team_cache_fts (rowid, name, short_name) VALUES (?, ?, ?)",
+        [(row[0], _search_text(row[1]), _search_text(row[2])) for row in rows],
+    )
+    logger.debug("[TEAM_CACHE] Search index rebuilt: %d teams", len(rows))
+    return len(rows)
+
+
+def update_team_search_index(conn: Connection, team_ids: Iterable[int]) -> None:
+    """Re-index specific team_cache rows after they were inserted, changed or deleted.
+
+    Rows that no longer exist are simply dropped from the index.
+    """
+    ids = list(team_ids)
+    if not ids:
+        return
+    try:
+        for i in range(0, len(ids), _ID_BATCH):
+            batch = ids[i : i + _ID_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            conn.execute(f"DELETE FROM team_cache_fts WHERE rowid IN ({placeholders})", batch)
+            rows = conn.execute(
+                f"""SELECT id, team_name, team_short_name FROM team_cache
+                    WHERE id IN ({placeholders})""",
+                batch,
+            ).fetchall()
+            conn.executemany(
+                "INSERT INTO team_cache_fts (rowid, name, short_name) VALUES (?, ?, ?)",
+                [(row[0], _search_text(row[1]), _search_text(row[2])) for row in rows],
+            )
+    except sqlite3.OperationalError as e:
+        logger.debug("[TEAM_CACHE] Search index not updated: %s", e)
+
+
+def _team_row_to_dict(row) -> dict:
+    return {
+        "name": row["team_name"],
+        "abbrev": row["team_abbrev"],
+        "short_name": row["team_short_name"],
+        "provider": row["provider"],
+        "team_id": row["provider_team_id"],
+        "league": row["league"],
+        "sport": row["sport"],
+        "logo_url": row["logo_url"],
+    }
+
+
 def search_teams(
     conn: Connection,
     query: str,
@@ -72,8 +175,13 @@ def search_teams(
 ) -> list[dict]:
     """Search for teams in the cache by name.
 
-    Matches against team_name (LIKE), team_abbrev (exact), and
-    team_short_name (LIKE).
+    Matches substrings of team_name and team_short_name (accent- and
+    case-insensitive) plus exact team_abbrev. Results are ranked: exact
+    name/abbrev, then name prefix, then word prefix, then any substring;
+    ties by team_name.
+
+    Queries of 3+ characters use the FTS5 trigram index; shorter ones (or
+    SQLite builds without FTS5) fall back to a LIKE scan.
 
     Args:
         conn: Database connection
@@ -85,6 +193,72 @@ def search_teams(
     Returns:
         List of matching team dicts
     """
+    q_norm = _search_text(query)
+    if len(q_norm) >= TRIGRAM_MIN_QUERY:
+        try:
+            return _search_teams_indexed(conn, q_norm, league, sport, limit)
+        except sqlite3.OperationalError as e:
+            logger.debug("[TEAM_CACHE] Indexed search failed, using LIKE: %s", e)
+    return _search_teams_like(conn, query, league, sport, limit)
+
+
+def _search_teams_indexed(
+    conn: Connection,
+    q_norm: str,
+    league: str | None,
+    sport: str | None,
+    limit: int,
+) -> list[dict]:
+    """Ranked substring search through team_cache_fts."""
+    phrase = '{name short_name} : "' + q_norm.replace('"', '""') + '"'
+    sql = """
+        WITH hits(id) AS (
+            SELECT rowid FROM team_cache_fts WHERE team_cache_fts MATCH :phrase
+            UNION
+            SELECT id FROM team_cache WHERE team_abbrev = :q COLLATE NOCASE
+        )
+        SELECT tc.team_name, tc.team_abbrev, tc.team_short_name, tc.provider,
+               tc.provider_team_id, tc.league, tc.sport, tc.logo_url
+        FROM hits
+        JOIN team_cache tc ON tc.id = hits.id
+        LEFT JOIN team_cache_fts f ON f.rowid = tc.id
+        WHERE 1 = 1
+    """
+    params: dict = {"phrase": phrase, "q": q_norm}
+
+    if league:
+        sql += " AND tc.league = :league"
+        params["league"] = league
+    if sport:
+        sql += " AND tc.sport = :sport"
+        params["sport"] = sport
+
+    sql += """
+        ORDER BY
+            CASE
+                WHEN f.name = :q OR f.short_name = :q OR LOWER(tc.team_abbrev) = :q THEN 0
+                WHEN instr(f.name, :q) = 1 OR instr(f.short_name, :q) = 1 THEN 1
+                WHEN instr(' ' || f.name, ' ' || :q) > 0
+                     OR instr(' ' || f.short_name, ' ' || :q) > 0 THEN 2
+                ELSE 3
+            END,
+            tc.team_name
+        LIMIT :limit
+    """
+    params["limit"] = limit
+
+    rows = conn.execute(sql, params).fetchall()
+    return [_team_row_to_dict(row) for row in rows]
+
+
+def _search_teams_like(
+    conn: Connection,
+    query: str,
+    league: str | None,
+    sport: str | None,
+    limit: int,
+) -> list[dict]:
+    """Unindexed LIKE search (short queries, no FTS5)."""
     q_lower = query.lower().strip()
 
     sql = """
@@ -108,19 +282,7 @@ def search_teams(
     params.append(limit)
 
     rows = conn.execute(sql, params).fetchall()
-    return [
-        {
-            "name": row["team_name"],
-            "abbrev": row["team_abbrev"],
-            "short_name": row["team_short_name"],
-            "provider": row["provider"],
-            "team_id": row["provider_team_id"],
-            "league": row["league"],
-            "sport": row["sport"],
-            "logo_url": row["logo_url"],
-        }
-        for row in rows
-    ]
+    return [_team_row_to_dict(row) for row in rows]
 
 
 def list_sports(conn: Connection) -> dict[str, str]:
@@ -0,0 +1,122 @@
+"""XMLTV artifact manifest.
+
+Full generation writes each guide scope once (the served EPG file and an
+events-only guide) and records it here with an ETag and, for the full
+guide, the analysis summary. The XMLTV endpoints serve these files directly
+instead of re-merging group XMLTV or re-parsing the guide per request.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from sqlite3 import Connection
+
+logger = logging.getLogger(__name__)
+
+# Artifact scopes
+SCOPE_FULL = "full"  # teams + groups + Gold Zone: the file at epg_output_path
+SCOPE_EVENTS = "events"  # enabled event groups only: /groups/xmltv/combined
+
+
+@dataclass
+class XMLTVArtifact:
+    """A generated guide file and its metadata."""
+
+    scope: str
+    path: str
+    etag: str
+    size_bytes: int
+    mtime_ns: int
+    run_id: int | None = None
+    source_key: str | None = None
+    analysis: dict | None = None
+    created_at: str | None = None
+
+    def is_current(self) -> bool:
+        """True if the file on disk is still the one that was recorded."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_size == self.size_bytes and stat.st_mtime_ns == self.mtime_ns
+
+
+def xmltv_etag(content: str, run_id: int | None = None) -> str:
+    """Strong ETag for guide content, prefixed with the run that produced it."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return f'"{run_id or 0}-{digest}"'
+
+
+def save_xmltv_artifact(conn: Connection, artifact: XMLTVArtifact) -> None:
+    """Insert or replace the artifact for its scope.
+
+    Args:
+        conn: Database connection
+        artifact: Artifact to record (file must already be written)
+    """
+    conn.execute(
+        """INSERT INTO xmltv_artifacts
+               (scope, run_id, path, etag, size_bytes, mtime_ns, source_key, analysis,
+                created_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+           ON CONFLICT(scope) DO UPDATE SET
+               run_id = excluded.run_id,
+               path = excluded.path,
+               etag = excluded.etag,
+               size_bytes = excluded.size_bytes,
+               mtime_ns = excluded.mtime_ns,
+               source_key = excluded.source_key,
+               analysis = excluded.analysis,
+               created_at = datetime('now')""",
+        (
+            artifact.scope,
+            artifact.run_id,
+            artifact.path,
+            artifact.etag,
+            artifact.size_bytes,
+            artifact.mtime_ns,
+            artifact.source_key,
+            json.dumps(artifact.analysis) if artifact.analysis is not None else None,
+        ),
+    )
+
+
+def get_xmltv_artifact(conn: Connection, scope: str) -> XMLTVArtifact | None:
+    """Get the recorded artifact for a scope.
+
+    Args:
+        conn: Database connection
+        scope: Artifact scope (SCOPE_FULL, SCOPE_EVENTS)
+
+    Returns:
+        XMLTVArtifact or None if generation hasn't written this scope yet
+    """
+    row = conn.execute(
+        """SELECT scope, run_id, path, etag, size_bytes, mtime_ns, source_key, analysis,
+                  created_at
+           FROM xmltv_artifacts WHERE scope = ?""",
+        (scope,),
+    ).fetchone()
+    if not row:
+        return None
+
+    analysis = None
+    if row["analysis"]:
+        try:
+            analysis = json.loads(row["analysis"])
+        except json.JSONDecodeError:
+            logger.warning("[XMLTV] Ignoring corrupt analysis for artifact '%s'", scope)
+
+    return XMLTVArtifact(
+        scope=row["scope"],
+        path=row["path"],
+        etag=row["etag"],
+        size_bytes=row["size_bytes"],
+        mtime_ns=row["mtime_ns"],
+        run_id=row["run_id"],
+        source_key=row["source_key"],
+        analysis=analysis,
+        created_at=row["created_at"],
+    )
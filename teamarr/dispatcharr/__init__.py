@@ -42,6 +42,7 @@ from teamarr.dispatcharr.managers import (
     EPGManager,
     LogoManager,
     M3UManager,
+    MetadataManager,
 )
 from teamarr.dispatcharr.types import (
     BatchRefreshResult,
@@ -76,6 +77,7 @@ __all__ = [
     "EPGManager",
     "LogoManager",
     "M3UManager",
+    "MetadataManager",
     # Types
     "BatchRefreshResult",
     "DispatcharrChannel",
@@ -18,6 +18,7 @@ from urllib.parse import urlparse
 import httpx
 
 from teamarr.dispatcharr.auth import TokenManager
+from teamarr.utilities import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -144,17 +145,18 @@ class DispatcharrClient:
 
         for attempt in range(self._max_retries + 1):
             try:
-                if method.upper() == "GET":
-                    response = client.get(full_url, headers=headers)
-                elif method.upper() == "POST":
-                    response = client.post(full_url, headers=headers, json=data)
-                elif method.upper() == "PATCH":
-                    response = client.patch(full_url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = client.delete(full_url, headers=headers)
-                else:
-                    logger.error("[DISPATCHARR] Unsupported HTTP method: %s", method)
-                    return None
+                with metrics.span("dispatcharr_request", method=method.upper()):
+                    if method.upper() == "GET":
+                        response = client.get(full_url, headers=headers)
+                    elif method.upper() == "POST":
+                        response = client.post(full_url, headers=headers, json=data)
+                    elif method.upper() == "PATCH":
+                        response = client.patch(full_url, headers=headers, json=data)
+                    elif method.upper() == "DELETE":
+                        response = client.delete(full_url, headers=headers)
+                    else:
+                        logger.error("[DISPATCHARR] Unsupported HTTP method: %s", method)
+                        return None
 
                 # Handle 401 with re-authentication (not counted as retry)
                 if response.status_code == 401 and retry_on_401:
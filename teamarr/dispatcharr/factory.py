@@ -14,6 +14,7 @@ from teamarr.dispatcharr.managers.channels import ChannelManager
 from teamarr.dispatcharr.managers.epg import EPGManager
 from teamarr.dispatcharr.managers.logos import LogoManager
 from teamarr.dispatcharr.managers.m3u import M3UManager
+from teamarr.dispatcharr.managers.metadata import MetadataManager
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class DispatcharrConnection:
     """Container for Dispatcharr client and managers.
 
     Provides convenient access to all Dispatcharr functionality.
+    `metadata` serves cached account/group/profile lists for UI endpoints.
     """
 
     client: DispatcharrClient
@@ -30,6 +32,7 @@ class DispatcharrConnection:
     epg: EPGManager
     m3u: M3UManager
     logos: LogoManager
+    metadata: MetadataManager
 
     def close(self) -> None:
         """Close the underlying client connection."""
@@ -294,12 +297,15 @@ class DispatcharrFactory:
                 max_retries=api_settings.retry_count,
             )
 
+            channels = ChannelManager(client)
+            m3u = M3UManager(client)
             connection = DispatcharrConnection(
                 client=client,
-                channels=ChannelManager(client),
+                channels=channels,
                 epg=EPGManager(client),
-                m3u=M3UManager(client),
+                m3u=m3u,
                 logos=LogoManager(client),
+                metadata=MetadataManager(m3u, channels),
             )
 
             logger.info("[DISPATCHARR] Connected at %s", settings.url)
@@ -5,12 +5,14 @@ High-level managers for Dispatcharr operations:
 - EPGManager: EPG source operations
 - M3UManager: M3U accounts and streams
 - LogoManager: Logo upload/delete
+- MetadataManager: Cached accounts/groups/profiles for UI lists
 """
 
 from teamarr.dispatcharr.managers.channels import ChannelCache, ChannelManager
 from teamarr.dispatcharr.managers.epg import EPGManager
 from teamarr.dispatcharr.managers.logos import LogoManager
 from teamarr.dispatcharr.managers.m3u import M3UManager
+from teamarr.dispatcharr.managers.metadata import MetadataCache, MetadataManager
 
 __all__ = [
     "ChannelCache",
@@ -18,4 +20,6 @@ __all__ = [
     "EPGManager",
     "LogoManager",
     "M3UManager",
+    "MetadataCache",
+    "MetadataManager",
 ]
@@ -6,7 +6,8 @@ Handles M3U account listing, stream discovery, and refresh operations.
 import logging
 import time
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import warnings
+from collections.abc import Callable
 
 from teamarr.dispatcharr.client import DispatcharrClient
 from teamarr.dispatcharr.types import (
@@ -20,6 +21,10 @@ from teamarr.dispatcharr.types import (
 
 logger = logging.getLogger(__name__)
 
+# Adaptive refresh polling: first check after 0.5s, then back off 1.5x per tick
+INITIAL_POLL_INTERVAL = 0.5
+POLL_BACKOFF = 1.5
+
 
 def _fix_double_encoded_utf8(text: str) -> str:
     """Fix double-encoded UTF-8 strings.
@@ -334,11 +339,101 @@ class M3UManager:
         else:
             return RefreshResult(success=False, message=f"HTTP {response.status_code}")
 
+    @staticmethod
+    def _recently_refreshed(
+        account: DispatcharrM3UAccount, skip_if_recent_minutes: int
+    ) -> int | None:
+        """Return minutes since last refresh if within the skip window, else None."""
+        from datetime import datetime, timedelta
+
+        if not account.updated_at or skip_if_recent_minutes <= 0:
+            return None
+        try:
+            # Parse ISO timestamp
+            updated = datetime.fromisoformat(account.updated_at.replace("Z", "+00:00"))
+        except Exception:
+            return None  # If parsing fails, proceed with refresh
+        now = datetime.now(updated.tzinfo)
+        if updated > now - timedelta(minutes=skip_if_recent_minutes):
+            return (now - updated).seconds // 60
+        return None
+
+    def _await_refreshes(
+        self,
+        pending: dict[int, str | None],
+        timeout: float,
+        max_poll_interval: float,
+        poll: Callable[[list[int]], dict[int, DispatcharrM3UAccount | Exception]],
+    ) -> dict[int, RefreshResult]:
+        """Poll until every pending account's updated_at changes or errors.
+
+        Poll intervals start short and grow exponentially up to
+        max_poll_interval, so quick refreshes return almost immediately while
+        slow ones don't hammer Dispatcharr.
+
+        Args:
+            pending: account_id -> updated_at value before the refresh was triggered
+            timeout: Maximum seconds to wait for all accounts
+            max_poll_interval: Upper bound on the delay between polls
+            poll: Fetches current state for the given account IDs in one go;
+                an Exception value fails just that account
+
+        Returns:
+            Dict of account_id -> RefreshResult (timeouts included)
+        """
+        results: dict[int, RefreshResult] = {}
+        start_time = time.time()
+        interval = min(INITIAL_POLL_INTERVAL, max_poll_interval)
+
+        while pending:
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
+                break
+            time.sleep(min(interval, timeout - elapsed))
+            interval = min(interval * POLL_BACKOFF, max_poll_interval)
+
+            current = poll(list(pending))
+            duration = time.time() - start_time
+            for account_id, account in current.items():
+                if account_id not in pending:
+                    continue
+                if isinstance(account, Exception):
+                    results[account_id] = RefreshResult(
+                        success=False,
+                        message=f"Error: {account!s}",
+                        duration=duration,
+                    )
+                    del pending[account_id]
+                # Check if refresh completed (updated_at changed)
+                elif account.updated_at != pending[account_id]:
+                    results[account_id] = RefreshResult(
+                        success=True,
+                        message="M3U refresh completed",
+                        duration=duration,
+                    )
+                    del pending[account_id]
+                # Check for error status
+                elif account.status == "error":
+                    results[account_id] = RefreshResult(
+                        success=False,
+                        message="M3U refresh failed",
+                        duration=duration,
+                    )
+                    del pending[account_id]
+
+        for account_id in pending:
+            results[account_id] = RefreshResult(
+                success=False,
+                message=f"M3U refresh timed out after {timeout} seconds",
+                duration=float(timeout),
+            )
+        return results
+
     def wait_for_refresh(
         self,
         account_id: int,
         timeout: int = 120,
-        poll_interval: int = 2,
+        poll_interval: float = 2,
         skip_if_recent_minutes: int = 60,
     ) -> RefreshResult:
         """Trigger M3U refresh and wait for completion.
@@ -346,118 +441,150 @@ class M3UManager:
         Args:
             account_id: M3U account ID
             timeout: Maximum seconds to wait (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Maximum seconds between status checks (default: 2);
+                polling starts faster and backs off to this value
             skip_if_recent_minutes: Skip refresh if updated within this many minutes
 
         Returns:
             RefreshResult with success status and duration
         """
-        from datetime import datetime, timedelta
-
         # Check if recently refreshed
         account = self.get_account(account_id)
         if not account:
             return RefreshResult(success=False, message=f"M3U account {account_id} not found")
 
-        if account.updated_at and skip_if_recent_minutes > 0:
-            try:
-                # Parse ISO timestamp
-                updated = datetime.fromisoformat(account.updated_at.replace("Z", "+00:00"))
-                threshold = datetime.now(updated.tzinfo) - timedelta(minutes=skip_if_recent_minutes)
-                if updated > threshold:
-                    now = datetime.now(updated.tzinfo)
-                    mins_ago = (now - updated).seconds // 60
-                    return RefreshResult(
-                        success=True,
-                        message=f"Skipped - refreshed {mins_ago} minutes ago",
-                        skipped=True,
-                    )
-            except Exception:
-                pass  # If parsing fails, proceed with refresh
-
-        before_updated = account.updated_at
+        mins_ago = self._recently_refreshed(account, skip_if_recent_minutes)
+        if mins_ago is not None:
+            return RefreshResult(
+                success=True,
+                message=f"Skipped - refreshed {mins_ago} minutes ago",
+                skipped=True,
+            )
 
         # Trigger refresh
         trigger_result = self.refresh_account(account_id)
         if not trigger_result.success:
             return trigger_result
 
-        # Poll until status changes
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
-
+        def poll(ids: list[int]) -> dict[int, DispatcharrM3UAccount]:
             current = self.get_account(account_id)
-            if not current:
-                continue
+            return {account_id: current} if current else {}
 
-            # Check if refresh completed (updated_at changed)
-            if current.updated_at != before_updated:
-                duration = time.time() - start_time
-                return RefreshResult(
-                    success=True,
-                    message="M3U refresh completed",
-                    duration=duration,
-                )
+        results = self._await_refreshes(
+            {account_id: account.updated_at}, timeout, poll_interval, poll
+        )
+        return results[account_id]
 
-            # Check for error status
-            if current.status == "error":
-                duration = time.time() - start_time
-                return RefreshResult(
-                    success=False,
-                    message="M3U refresh failed",
-                    duration=duration,
-                )
+    def _lookup_accounts(
+        self, account_ids: list[int]
+    ) -> dict[int, DispatcharrM3UAccount | Exception]:
+        """Current state of several accounts, for refresh_multiple.
 
-        return RefreshResult(
-            success=False,
-            message=f"M3U refresh timed out after {timeout} seconds",
-            duration=float(timeout),
-        )
+        One list call covers them all; any account it doesn't return (e.g.
+        the listing failed and came back empty) is looked up individually.
+        Errors are returned per account instead of raised.
+
+        Returns:
+            Dict of account_id -> account or the Exception raised looking it
+            up; accounts that don't exist are left out
+        """
+        wanted = set(account_ids)
+        found: dict[int, DispatcharrM3UAccount | Exception] = {}
+        try:
+            found.update(
+                (a.id, a) for a in self.list_accounts(include_custom=True) if a.id in wanted
+            )
+        except Exception as e:
+            logger.warning("[M3U] Failed to list accounts, looking them up one by one: %s", e)
+        for account_id in account_ids:
+            if account_id in found:
+                continue
+            try:
+                account = self.get_account(account_id)
+            except Exception as e:
+                found[account_id] = e
+                continue
+            if account:
+                found[account_id] = account
+        return found
 
     def refresh_multiple(
         self,
         account_ids: list[int],
         timeout: int = 120,
         skip_if_recent_minutes: int = 60,
-        max_workers: int = 5,
+        max_workers: int | None = None,
+        max_poll_interval: float = 5.0,
     ) -> BatchRefreshResult:
-        """Refresh multiple M3U accounts in parallel.
+        """Refresh multiple M3U accounts and wait for all of them.
+
+        Uses a single poller for every pending account: each tick fetches the
+        account list once instead of one GET per account (falling back to
+        per-account GETs if the list call fails), and no thread is parked per
+        account while Dispatcharr works. A failure for one account doesn't
+        abort the others.
+
+        All accounts are triggered up front and share one deadline, so
+        ``timeout`` bounds the whole batch. It used to be a per-account wait
+        with at most ``max_workers`` accounts in flight, so batches larger
+        than that could take a multiple of ``timeout``.
 
         Args:
             account_ids: List of M3U account IDs to refresh
-            timeout: Maximum seconds to wait per account (default: 120)
+            timeout: Maximum seconds to wait for all accounts (default: 120)
             skip_if_recent_minutes: Skip if refreshed within this many minutes
-            max_workers: Maximum parallel refreshes (default: 5)
+            max_workers: Deprecated and ignored (one poller serves every account)
+            max_poll_interval: Upper bound on delay between polls (default: 5.0)
 
         Returns:
             BatchRefreshResult with results per account
         """
+        if max_workers is not None:
+            warnings.warn(
+                "refresh_multiple(max_workers=...) is deprecated and ignored",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         start_time = time.time()
         results: dict[int, RefreshResult] = {}
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self.wait_for_refresh,
-                    account_id,
-                    timeout,
-                    2,  # poll_interval
-                    skip_if_recent_minutes,
-                ): account_id
-                for account_id in account_ids
-            }
+        # One list call to check freshness for every account
+        known = self._lookup_accounts(account_ids)
+        pending: dict[int, str | None] = {}
+        for account_id in account_ids:
+            account = known.get(account_id)
+            if isinstance(account, Exception):
+                results[account_id] = RefreshResult(success=False, message=f"Error: {account!s}")
+                continue
+            if not account:
+                results[account_id] = RefreshResult(
+                    success=False, message=f"M3U account {account_id} not found"
+                )
+                continue
 
-            for future in as_completed(futures):
-                account_id = futures[future]
-                try:
-                    results[account_id] = future.result()
-                except Exception as e:
-                    results[account_id] = RefreshResult(
-                        success=False,
-                        message=f"Error: {e!s}",
-                    )
+            mins_ago = self._recently_refreshed(account, skip_if_recent_minutes)
+            if mins_ago is not None:
+                results[account_id] = RefreshResult(
+                    success=True,
+                    message=f"Skipped - refreshed {mins_ago} minutes ago",
+                    skipped=True,
+                )
+                continue
+
+            try:
+                trigger_result = self.refresh_account(account_id)
+            except Exception as e:
+                results[account_id] = RefreshResult(success=False, message=f"Error: {e!s}")
+                continue
+            if not trigger_result.success:
+                results[account_id] = trigger_result
+                continue
+            pending[account_id] = account.updated_at
+
+        if pending:
+            results.update(
+                self._await_refreshes(pending, timeout, max_poll_interval, self._lookup_accounts)
+            )
 
         total_duration = time.time() - start_time
         skipped = sum(1 for r in results.values() if r.skipped)
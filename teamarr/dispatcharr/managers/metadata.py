@@ -0,0 +1,168 @@
+"""Cached Dispatcharr metadata for UI list endpoints.
+
+M3U accounts, channel groups, channel profiles and stream profiles change
+rarely but are listed on nearly every page render. MetadataManager keeps
+them in memory with stale-while-revalidate semantics:
+
+- Fresh (younger than METADATA_TTL_SECONDS): served from memory
+- Stale (younger than METADATA_MAX_STALE_SECONDS): served from memory while
+  a background thread refetches
+- Missing or older: fetched synchronously
+
+Teamarr's own writes (creating a group or profile) invalidate the affected
+kind so the next read sees them. Generation code keeps using the managers
+directly - it needs live data, not UI-grade freshness.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from teamarr.dispatcharr.managers.channels import ChannelManager
+from teamarr.dispatcharr.managers.m3u import M3UManager
+from teamarr.dispatcharr.types import (
+    DispatcharrChannelGroup,
+    DispatcharrChannelProfile,
+    DispatcharrM3UAccount,
+    DispatcharrStreamProfile,
+)
+
+logger = logging.getLogger(__name__)
+
+# Serve from memory without refetching for this long
+METADATA_TTL_SECONDS = 300
+# Serve stale entries (refreshing in background) up to this age
+METADATA_MAX_STALE_SECONDS = 3600
+
+# Cached kinds
+ACCOUNTS = "accounts"
+CHANNEL_GROUPS = "channel_groups"
+CHANNEL_PROFILES = "channel_profiles"
+STREAM_PROFILES = "stream_profiles"
+
+
+class MetadataCache:
+    """Thread-safe stale-while-revalidate store keyed by kind.
+
+    Empty results are never stored: Dispatcharr list calls return [] on
+    errors, and caching that would hide real data for a whole TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = METADATA_TTL_SECONDS,
+        max_stale_seconds: float = METADATA_MAX_STALE_SECONDS,
+    ):
+        self._ttl = ttl_seconds
+        self._max_stale = max_stale_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[list, float]] = {}
+        self._refreshing: set[str] = set()
+        # Bumped on invalidate so an in-flight refresh can't store old data
+        self._generation: dict[str, int] = {}
+
+    def get(self, kind: str, loader: Callable[[], list]) -> list:
+        """Get cached list for kind, loading or refreshing as needed."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(kind)
+            generation = self._generation.get(kind, 0)
+            if entry is not None:
+                value, fetched_at = entry
+                age = now - fetched_at
+                if age < self._ttl:
+                    return value
+                if age < self._max_stale:
+                    if kind not in self._refreshing:
+                        self._refreshing.add(kind)
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(kind, loader, generation),
+                            name=f"dispatcharr-metadata-{kind}",
+                            daemon=True,
+                        ).start()
+                    return value
+
+        value = loader()
+        self._store(kind, value, generation)
+        return value
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """Drop one kind (or everything) so the next read refetches."""
+        with self._lock:
+            kinds = [kind] if kind else list(self._entries)
+            for k in kinds:
+                self._entries.pop(k, None)
+                self._generation[k] = self._generation.get(k, 0) + 1
+        logger.debug("[METADATA] Invalidated %s", kind or "all")
+
+    def _refresh(self, kind: str, loader: Callable[[], list], generation: int) -> None:
+        try:
+            self._store(kind, loader(), generation)
+        except Exception as e:
+            logger.warning("[METADATA] Background refresh of %s failed: %s", kind, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(kind)
+
+    def _store(self, kind: str, value: list, generation: int) -> None:
+        if not value:
+            return
+        with self._lock:
+            if self._generation.get(kind, 0) == generation:
+                self._entries[kind] = (value, time.monotonic())
+
+
+class MetadataManager:
+    """Cached read access to Dispatcharr accounts, groups and profiles.
+
+    Usage:
+        accounts = conn.metadata.list_accounts()
+        conn.metadata.invalidate(CHANNEL_GROUPS)  # after creating a group
+    """
+
+    def __init__(self, m3u: M3UManager, channels: ChannelManager):
+        """Initialize metadata manager.
+
+        Args:
+            m3u: M3UManager used to load accounts and channel groups
+            channels: ChannelManager used to load channel/stream profiles
+        """
+        self._m3u = m3u
+        self._channels = channels
+        self._cache = MetadataCache()
+
+    def list_accounts(self, include_custom: bool = False) -> list[DispatcharrM3UAccount]:
+        """List M3U accounts (see M3UManager.list_accounts).
+
+        For names and IDs. Refresh status and updated_at can be stale; read
+        them from M3UManager.list_accounts.
+        """
+        accounts: list[DispatcharrM3UAccount] = self._cache.get(
+            ACCOUNTS, lambda: self._m3u.list_accounts(include_custom=True)
+        )
+        if not include_custom:
+            accounts = [a for a in accounts if a.name.lower() != "custom"]
+        return accounts
+
+    def list_groups(self, exclude_m3u: bool = False) -> list[DispatcharrChannelGroup]:
+        """List channel groups (see M3UManager.list_groups)."""
+        groups: list[DispatcharrChannelGroup] = self._cache.get(
+            CHANNEL_GROUPS, self._m3u.list_groups
+        )
+        if exclude_m3u:
+            groups = [g for g in groups if not g.m3u_accounts]
+        return groups
+
+    def list_profiles(self) -> list[DispatcharrChannelProfile]:
+        """List channel profiles (see ChannelManager.list_profiles)."""
+        return self._cache.get(CHANNEL_PROFILES, self._channels.list_profiles)
+
+    def list_stream_profiles(self) -> list[DispatcharrStreamProfile]:
+        """List active stream profiles (see ChannelManager.list_stream_profiles)."""
+        return self._cache.get(STREAM_PROFILES, self._channels.list_stream_profiles)
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """Drop cached metadata of one kind (or all kinds)."""
+        self._cache.invalidate(kind)
@@ -22,6 +22,7 @@ from teamarr.providers.euroleague import EuroleagueClient, EuroleagueProvider
 from teamarr.providers.hockeytech import HockeyTechClient, HockeyTechProvider
 from teamarr.providers.registry import ProviderConfig, ProviderRegistry
 from teamarr.providers.tsdb import RateLimitStats, TSDBClient, TSDBProvider
+from teamarr.utilities.cache import get_provider_response_cache
 
 # =============================================================================
 # PROVIDER FACTORY FUNCTIONS
@@ -86,6 +87,7 @@ def _create_tsdb_provider() -> TSDBProvider:
         league_mapping_source=ProviderRegistry.get_league_mapping_source(),
         api_key=_get_tsdb_api_key(),
         team_name_resolver=_create_tsdb_team_name_resolver(),
+        cache=get_provider_response_cache("tsdb"),
     )
 
 
@@ -93,6 +95,7 @@ def _create_hockeytech_provider() -> HockeyTechProvider:
     """Factory for HockeyTech provider with injected dependencies."""
     return HockeyTechProvider(
         league_mapping_source=ProviderRegistry.get_league_mapping_source(),
+        cache=get_provider_response_cache("hockeytech"),
     )
 
 
@@ -100,6 +103,7 @@ def _create_cricbuzz_provider() -> CricbuzzProvider:
     """Factory for Cricbuzz provider with injected dependencies."""
     return CricbuzzProvider(
         league_mapping_source=ProviderRegistry.get_league_mapping_source(),
+        cache=get_provider_response_cache("cricbuzz"),
     )
 
 
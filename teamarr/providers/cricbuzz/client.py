@@ -24,7 +24,8 @@ from datetime import datetime
 import httpx
 
 from teamarr.core.interfaces import LeagueMappingSource
-from teamarr.utilities.cache import TTLCache, make_cache_key
+from teamarr.utilities import metrics
+from teamarr.utilities.cache import ProviderResponseCache, TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -71,13 +72,15 @@ class CricbuzzClient:
         league_mapping_source: LeagueMappingSource | None = None,
         timeout: float = 15.0,
         retry_count: int = 3,
+        cache: TTLCache | ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._timeout = timeout
         self._retry_count = retry_count
         self._client: httpx.Client | None = None
         self._client_lock = threading.Lock()
-        self._cache = TTLCache()
+        # Persistent when injected by the provider factory (survives restarts)
+        self._cache = cache if cache is not None else TTLCache()
         self._health = HealthStats()
         self._health_lock = threading.Lock()
 
@@ -196,7 +199,8 @@ class CricbuzzClient:
         for attempt in range(self._retry_count):
             try:
                 client = self._get_client()
-                response = client.get(url)
+                with metrics.span("http_request", client="cricbuzz"):
+                    response = client.get(url)
                 response.raise_for_status()
                 self._record_success()
                 return response.text
@@ -23,6 +23,7 @@ from teamarr.core import (
     Venue,
 )
 from teamarr.providers.cricbuzz.client import CricbuzzClient
+from teamarr.utilities.cache import ProviderResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +39,12 @@ class CricbuzzProvider(SportsProvider):
         self,
         league_mapping_source: LeagueMappingSource | None = None,
         client: CricbuzzClient | None = None,
+        cache: ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._client = client or CricbuzzClient(
             league_mapping_source=league_mapping_source,
+            cache=cache,
         )
 
     @property
@@ -17,6 +17,8 @@ import time
 
 import httpx
 
+from teamarr.utilities import metrics
+
 logger = logging.getLogger(__name__)
 
 # Environment variable configuration with defaults
@@ -39,6 +41,8 @@ RATE_LIMIT_MAX_RETRIES = 3  # Give up after 3 rate-limit retries
 
 ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
 ESPN_CORE_URL = "http://sports.core.api.espn.com/v2/sports"
+# Standings live under /apis/v2 rather than /apis/site/v2
+ESPN_STANDINGS_URL = "https://site.api.espn.com/apis/v2/sports"
 
 # UFC athlete endpoint (for fighter profiles)
 ESPN_UFC_ATHLETE_URL = "https://sports.core.api.espn.com/v2/sports/mma/leagues/ufc/athletes"
@@ -130,7 +134,8 @@ class ESPNClient:
         for attempt in range(self._retry_count + RATE_LIMIT_MAX_RETRIES):
             try:
                 client = self._get_client()
-                response = client.get(url, params=params)
+                with metrics.span("http_request", client="espn"):
+                    response = client.get(url, params=params)
 
                 # Handle 429 rate limit separately with longer backoff
                 if response.status_code == 429:
@@ -382,6 +387,22 @@ class ESPNClient:
         url = f"{ESPN_BASE_URL}/{sport}/{espn_league}/teams"
         return self._request(url, {"limit": 1000})
 
+    def get_standings(
+        self, league: str, sport_league: tuple[str, str] | None = None
+    ) -> dict | None:
+        """Fetch standings (records and splits) for every team in a league.
+
+        Args:
+            league: Canonical league code
+            sport_league: Optional (sport, league) tuple from database config
+
+        Returns:
+            Raw ESPN response (groups nested under "children") or None on error
+        """
+        sport, espn_league = self.get_sport_league(league, sport_league)
+        url = f"{ESPN_STANDINGS_URL}/{sport}/{espn_league}/standings"
+        return self._request(url)
+
     # UFC-specific endpoints
 
     def get_ufc_scoreboard(self) -> dict | None:
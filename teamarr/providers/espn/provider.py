@@ -717,6 +717,27 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
 
         return teams
 
+    def get_league_info(
+        self, league: str, sport_league: tuple[str, str] | None = None
+    ) -> dict | None:
+        """Fetch league name and logo from ESPN.
+
+        Used by cache refresh when the leagues table has no metadata.
+        Goes through this provider's pooled client, so concurrent callers
+        share keepalive connections.
+
+        Args:
+            league: Canonical league code
+            sport_league: Optional (sport, league) pair the caller already
+                loaded; looked up from the league mappings if None
+
+        Returns:
+            Dict with name, logo_url, abbreviation or None on error
+        """
+        if sport_league is None:
+            sport_league = self._get_sport_league_from_db(league)
+        return self._client.get_league_info(league, sport_league)
+
     def _parse_team_from_teams_endpoint(
         self, team_data: dict, league: str, sport: str
     ) -> Team | None:
@@ -778,6 +799,83 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         # Parse stats from overall record
         stats = {s["name"]: s["value"] for s in overall.get("stats", [])}
 
+        # Get conference/division
+        groups = team_data.get("groups", {})
+        conference, conference_abbrev, division = self._parse_groups(groups)
+
+        return self._build_team_stats(
+            stats,
+            record_items,
+            rank=team_data.get("rank") if team_data.get("rank", 99) <= 25 else None,
+            conference=conference,
+            conference_abbrev=conference_abbrev,
+            division=division,
+        )
+
+    def get_league_team_stats(self, league: str) -> dict[str, TeamStats]:
+        """Fetch statistics for every team in a league from one standings call.
+
+        Conference/division use the same group ID labels as get_team_stats, so
+        a team's stats read the same whichever path filled them (and
+        is_conference_game compares like with like). College leagues return
+        {} - standings carry no poll rank, so those teams stay on the per-team
+        path (get_team_stats).
+        """
+        sport_league = self._get_sport_league_from_db(league)
+        _, espn_league = self._client.get_sport_league(league, sport_league)
+        if "college" in espn_league:
+            return {}
+
+        data = self._client.get_standings(league, sport_league)
+        if not data:
+            return {}
+
+        # Top level is the whole league, children are conferences (or a single
+        # table for leagues without them), grandchildren are divisions
+        children = data.get("children") or [data]
+        has_conferences = len(children) > 1
+
+        result: dict[str, TeamStats] = {}
+        for child in children:
+            conference_id = child.get("id") if has_conferences else None
+            for division_id, entry in self._standings_entries(child, None):
+                team_id = str(entry.get("team", {}).get("id", ""))
+                if not team_id:
+                    continue
+                entry_stats = entry.get("stats", [])
+                record_items = [s for s in entry_stats if s.get("type") and "summary" in s]
+                if not any(r.get("type") == "total" for r in record_items):
+                    continue
+                stats = {s["name"]: s["value"] for s in entry_stats if "value" in s and "name" in s}
+                result[team_id] = self._build_team_stats(
+                    stats,
+                    record_items,
+                    rank=None,
+                    conference=self._group_label("Conference", conference_id),
+                    conference_abbrev=None,
+                    division=self._group_label("Division", division_id),
+                )
+        return result
+
+    def _standings_entries(self, node: dict, division: str | None) -> list[tuple[str | None, dict]]:
+        """Collect (division_id, entry) for each team entry under a standings node."""
+        entries = [(division, entry) for entry in node.get("standings", {}).get("entries", [])]
+        for child in node.get("children", []):
+            entries.extend(self._standings_entries(child, child.get("id")))
+        return entries
+
+    def _build_team_stats(
+        self,
+        stats: dict,
+        record_items: list[dict],
+        rank: int | None,
+        conference: str | None,
+        conference_abbrev: str | None,
+        division: str | None,
+    ) -> TeamStats:
+        """Build TeamStats from a stat name/value map and total/home/road record items."""
+        overall = next((r for r in record_items if r.get("type") == "total"), {})
+
         # Parse record string
         record_str = overall.get("summary", "0-0")
         wins, losses, ties = self._parse_record_string(record_str)
@@ -799,10 +897,6 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         streak_count = int(stats.get("streak", 0))
         streak_str = self._format_streak(streak_count)
 
-        # Get conference/division
-        groups = team_data.get("groups", {})
-        conference, conference_abbrev, division = self._parse_groups(groups)
-
         return TeamStats(
             record=record_str,
             wins=wins,
@@ -812,7 +906,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             away_record=away_record,
             streak=streak_str,
             streak_count=streak_count,
-            rank=team_data.get("rank") if team_data.get("rank", 99) <= 25 else None,
+            rank=rank,
             playoff_seed=int(stats.get("playoffSeed", 0)) or None,
             games_back=float(stats.get("gamesBehind", 0)) or None,
             conference=conference,
@@ -881,10 +975,14 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
 
         if is_conference:
             # groups.id is the conference
-            return f"Conference {group_id}", None, None
+            return self._group_label("Conference", group_id), None, None
 
         # groups.id is division/subdivision, parent is conference
-        conference = f"Conference {parent_id}" if parent_id else None
-        division = f"Division {group_id}" if group_id else None
+        conference = self._group_label("Conference", parent_id)
+        division = self._group_label("Division", group_id)
 
         return conference, None, division
+
+    def _group_label(self, kind: str, group_id: str | None) -> str | None:
+        """Placeholder conference/division name for an ESPN group ID."""
+        return f"{kind} {group_id}" if group_id else None
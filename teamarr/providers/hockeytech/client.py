@@ -17,7 +17,8 @@ from datetime import date
 import httpx
 
 from teamarr.core.interfaces import LeagueMappingSource
-from teamarr.utilities.cache import TTLCache, make_cache_key
+from teamarr.utilities import metrics
+from teamarr.utilities.cache import ProviderResponseCache, TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -94,13 +95,15 @@ class HockeyTechClient:
         league_mapping_source: LeagueMappingSource | None = None,
         timeout: float = 10.0,
         retry_count: int = 3,
+        cache: TTLCache | ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._timeout = timeout
         self._retry_count = retry_count
         self._client: httpx.Client | None = None
         self._client_lock = threading.Lock()
-        self._cache = TTLCache()
+        # Persistent when injected by the provider factory (survives restarts)
+        self._cache = cache if cache is not None else TTLCache()
 
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client (thread-safe)."""
@@ -179,7 +182,8 @@ class HockeyTechClient:
         for attempt in range(self._retry_count):
             try:
                 client = self._get_client()
-                response = client.get(HOCKEYTECH_BASE_URL, params=params)
+                with metrics.span("http_request", client="hockeytech"):
+                    response = client.get(HOCKEYTECH_BASE_URL, params=params)
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPStatusError as e:
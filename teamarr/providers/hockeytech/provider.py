@@ -18,6 +18,7 @@ from teamarr.core import (
     Venue,
 )
 from teamarr.providers.hockeytech.client import HockeyTechClient
+from teamarr.utilities.cache import ProviderResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +33,12 @@ class HockeyTechProvider(SportsProvider):
         self,
         league_mapping_source: LeagueMappingSource | None = None,
         client: HockeyTechClient | None = None,
+        cache: ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._client = client or HockeyTechClient(
             league_mapping_source=league_mapping_source,
+            cache=cache,
         )
 
     @property
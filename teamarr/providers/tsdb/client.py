@@ -35,7 +35,8 @@ from datetime import date, datetime
 import httpx
 
 from teamarr.core import LeagueMappingSource
-from teamarr.utilities.cache import TTLCache, make_cache_key
+from teamarr.utilities import metrics
+from teamarr.utilities.cache import ProviderResponseCache, TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -229,6 +230,7 @@ class TSDBClient:
         retry_count: int = 3,
         retry_delay: float = 1.0,
         requests_per_minute: int = 30,  # TSDB free tier limit
+        cache: TTLCache | ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._explicit_key = api_key
@@ -240,7 +242,11 @@ class TSDBClient:
         self._requests_per_minute = requests_per_minute
         # Rate limiter initialized lazily after we can check is_premium
         self._rate_limiter: RateLimiter | None = None
-        self._cache = TTLCache()
+        # Persistent when injected by the provider factory (survives restarts)
+        self._cache = cache if cache is not None else TTLCache()
+        # Per cache key, so concurrent misses for one endpoint fetch it once
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        self._fetch_locks_guard = threading.Lock()
 
     @property
     def _api_key(self) -> str:
@@ -287,6 +293,11 @@ class TSDBClient:
     BACKOFF_MAX = 120.0
     BACKOFF_MAX_RETRIES = 5
 
+    def _fetch_lock(self, cache_key: str) -> threading.Lock:
+        """Lock for one cache key (teams are processed in parallel)."""
+        with self._fetch_locks_guard:
+            return self._fetch_locks.setdefault(cache_key, threading.Lock())
+
     def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
         """Make HTTP request with rate limiting and retry logic.
 
@@ -307,7 +318,8 @@ class TSDBClient:
         for attempt in range(self._retry_count + self.BACKOFF_MAX_RETRIES):
             try:
                 client = self._get_client()
-                response = client.get(url, params=params)
+                with metrics.span("http_request", client="tsdb"):
+                    response = client.get(url, params=params)
 
                 # Handle rate limit response (reactive) with exponential backoff
                 if response.status_code == 429:
@@ -435,16 +447,45 @@ class TSDBClient:
         if not league_name:
             return None
 
-        # eventsday.php uses 'l' for league NAME (strLeague), not ID
-        result = self._request("eventsday.php", {"d": date_str, "l": league_name})
-        if result:
-            # Use tiered TTL based on date
-            target_date = date.fromisoformat(date_str)
-            ttl = get_cache_ttl_for_date(target_date)
-            self._cache.set(cache_key, result, ttl)
-            logger.debug("[TSDB] Cached %s for %dh %dm", cache_key, ttl // 3600, (ttl % 3600) // 60)
+        with self._fetch_lock(cache_key):
+            # Another thread may have fetched it while we waited
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # eventsday.php uses 'l' for league NAME (strLeague), not ID
+            result = self._request("eventsday.php", {"d": date_str, "l": league_name})
+            if result:
+                self._cache_events_day(cache_key, date_str, result)
         return result
 
+    def _cache_events_day(self, cache_key: str, date_str: str, result: dict) -> None:
+        """Cache an eventsday response with the tiered TTL for its date."""
+        ttl = get_cache_ttl_for_date(date.fromisoformat(date_str))
+        self._cache.set(cache_key, result, ttl)
+        logger.debug("[TSDB] Cached %s for %dh %dm", cache_key, ttl // 3600, (ttl % 3600) // 60)
+
+    def has_events_by_date(self, league: str, date_str: str) -> bool:
+        """Check if eventsday for a league/date is cached (no API call)."""
+        return self._cache.get(make_cache_key("tsdb", "eventsday", league, date_str)) is not None
+
+    def seed_events_by_date(self, league: str, events: list[dict], date_strs: list[str]) -> int:
+        """Cache eventsday entries for dates from a season-wide event list.
+
+        Lets one eventsseason.php call stand in for one eventsday.php call
+        per date. Dates without games are cached as empty, like eventsday.
+
+        Returns:
+            Number of dates cached
+        """
+        by_date: dict[str, list[dict]] = {}
+        for event in events:
+            by_date.setdefault(event.get("dateEvent") or "", []).append(event)
+        for date_str in date_strs:
+            cache_key = make_cache_key("tsdb", "eventsday", league, date_str)
+            self._cache_events_day(cache_key, date_str, {"events": by_date.get(date_str)})
+        return len(date_strs)
+
     def get_league_next_events(self, league: str) -> dict | None:
         """Fetch upcoming events for a league.
 
@@ -466,9 +507,14 @@ class TSDBClient:
         if not league_id:
             return None
 
-        result = self._request("eventsnextleague.php", {"id": league_id})
-        if result:
-            self._cache.set(cache_key, result, TSDB_CACHE_TTL_NEXT_EVENTS)
+        with self._fetch_lock(cache_key):
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            result = self._request("eventsnextleague.php", {"id": league_id})
+            if result:
+                self._cache.set(cache_key, result, TSDB_CACHE_TTL_NEXT_EVENTS)
         return result
 
     def get_events_by_round(
@@ -510,10 +556,17 @@ class TSDBClient:
             logger.debug("[TSDB] Cache hit: %s", cache_key)
             return cached
 
-        result = self._request("eventsround.php", {"id": league_id, "r": round_num, "s": season})
-        if result:
-            # Cache for 2 hours (same as eventsday)
-            self._cache.set(cache_key, result, 2 * 60 * 60)
+        with self._fetch_lock(cache_key):
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            result = self._request(
+                "eventsround.php", {"id": league_id, "r": round_num, "s": season}
+            )
+            if result:
+                # Cache for 2 hours (same as eventsday)
+                self._cache.set(cache_key, result, 2 * 60 * 60)
         return result
 
     def get_all_league_events(self, league: str, season: str | None = None) -> list[dict]:
@@ -527,6 +580,23 @@ class TSDBClient:
         if cached is not None:
             return cached
 
+        # One deep scan at a time per league/season
+        with self._fetch_lock(cache_key):
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+            return self._scan_all_league_events(cache_key, league, season)
+
+    def has_all_league_events(self, league: str, season: str | None = None) -> bool:
+        """Check if the season deep scan for a league is cached (no API call)."""
+        cache_key = make_cache_key("tsdb", "allevents", league, season or "current")
+        return self._cache.get(cache_key) is not None
+
+    def _scan_all_league_events(
+        self, cache_key: str, league: str, season: str | None
+    ) -> list[dict]:
+        """Uncached body of get_all_league_events()."""
+
         all_events = []
         league_id = self.get_league_id(league)
         if not league_id:
@@ -6,6 +6,7 @@ Used as fallback for leagues not supported by ESPN.
 
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 
 from teamarr.core import (
@@ -18,6 +19,7 @@ from teamarr.core import (
     Venue,
 )
 from teamarr.providers.tsdb.client import TSDBClient
+from teamarr.utilities.cache import ProviderResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,20 @@ logger = logging.getLogger(__name__)
 TeamNameResolver = Callable[[str, str], str | None]
 
 
+@dataclass(frozen=True)
+class PrefetchCall:
+    """One deduplicated TSDB endpoint fetch planned by plan_prefetch().
+
+    value is how much team work it saves: teams in the league times the
+    days the response covers.
+    """
+
+    league: str
+    endpoint: str  # "eventsday", "eventsseason" or "allevents"
+    dates: tuple[str, ...] = ()
+    value: int = 0
+
+
 class TSDBProvider(SportsProvider):
     """TheSportsDB implementation of SportsProvider.
 
@@ -41,11 +57,13 @@ class TSDBProvider(SportsProvider):
         client: TSDBClient | None = None,
         api_key: str | None = None,
         team_name_resolver: TeamNameResolver | None = None,
+        cache: ProviderResponseCache | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._client = client or TSDBClient(
             league_mapping_source=league_mapping_source,
             api_key=api_key,
+            cache=cache,
         )
         self._team_name_resolver = team_name_resolver
 
@@ -155,6 +173,83 @@ class TSDBProvider(SportsProvider):
         # Cap days_ahead for other leagues (rate limit optimization)
         days_ahead = min(days_ahead, self.TSDB_MAX_DAYS_AHEAD)
 
+        # Same league/day entries plan_prefetch() warms, shared by every team
+        today = date.today()
+        events: list[Event] = []
+        for offset in range(days_ahead):
+            events.extend(
+                self._get_events_for_team(league, today + timedelta(days=offset), team_name)
+            )
+        events.sort(key=lambda e: e.start_time)
+        return events
+
+    def plan_prefetch(
+        self,
+        team_counts: dict[str, int],
+        days_ahead: int = TSDB_MAX_DAYS_AHEAD,
+    ) -> list[PrefetchCall]:
+        """Plan the endpoint fetches team schedules will need, most valuable first.
+
+        Every team in a league reads the same league/day entries, so needs
+        are deduplicated per league and already-cached entries are dropped.
+        Premium keys replace a league's missing days with one season call.
+
+        Args:
+            team_counts: League code -> number of teams reading it
+            days_ahead: Days get_team_schedule() covers (capped like it)
+
+        Returns:
+            Uncached fetches, highest value (then nearest date) first
+        """
+        days_ahead = min(days_ahead, self.TSDB_MAX_DAYS_AHEAD)
+        today = date.today()
+        dates = [(today + timedelta(days=offset)).isoformat() for offset in range(days_ahead)]
+
+        calls: list[PrefetchCall] = []
+        for league, teams in team_counts.items():
+            if not self.supports_league(league):
+                continue
+            if league == "acb":
+                if not self._client.has_all_league_events(league):
+                    calls.append(PrefetchCall(league, "allevents", value=teams * days_ahead))
+                continue
+
+            missing = tuple(d for d in dates if not self._client.has_events_by_date(league, d))
+            if not missing:
+                continue
+            if self.is_premium and len(missing) > 1:
+                calls.append(
+                    PrefetchCall(league, "eventsseason", missing, value=teams * len(missing))
+                )
+            else:
+                calls.extend(PrefetchCall(league, "eventsday", (d,), value=teams) for d in missing)
+
+        calls.sort(key=lambda c: (-c.value, c.dates[:1], c.league))
+        return calls
+
+    def prefetch(self, call: PrefetchCall) -> bool:
+        """Fetch one planned endpoint into the client cache.
+
+        Returns:
+            True if the provider returned data
+        """
+        if call.endpoint == "allevents":
+            return bool(self._client.get_all_league_events(call.league))
+
+        if call.endpoint == "eventsseason":
+            data = self._client.get_season_events(call.league)
+            events = (data or {}).get("events") or []
+            # Only trust a season listing that reaches the end of the window
+            # (free tier truncates it, and the season string may be off)
+            if events and max(e.get("dateEvent") or "" for e in events) >= call.dates[-1]:
+                self._client.seed_events_by_date(call.league, events, list(call.dates))
+                return True
+            for date_str in call.dates:
+                self._client.get_events_by_date(call.league, date_str)
+            return bool(events)
+
+        return self._client.get_events_by_date(call.league, call.dates[0]) is not None
+
     def _get_events_for_team(
         self,
         league: str,
@@ -31,6 +31,13 @@ from teamarr.utilities.constants import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    # CPython's regex parser (private); without it patterns aren't prefiltered
+    from re import _constants as _sre_constants
+    from re import _parser as _sre_parser
+except ImportError:
+    _sre_constants = _sre_parser = None
+
 
 def _load_user_keywords(category: str) -> list[dict]:
     """Load user-defined keywords from database.
@@ -59,6 +66,71 @@ def _load_user_keywords(category: str) -> list[dict]:
         return []
 
 
+def _required_literal(pattern: Pattern[str]) -> str | None:
+    """Longest ASCII literal run every match of the pattern must contain.
+
+    Taken from the pattern's top-level sequence (anything under a repeat,
+    group or alternation may be skipped). Lowercased for IGNORECASE
+    patterns. None if there is no usable literal, or if the regex parser
+    internals are unavailable or have changed shape.
+    """
+    if _sre_parser is None or _sre_constants is None:
+        return None
+    best = run = ""
+    try:
+        literal_op = _sre_constants.LITERAL
+        for op, arg in _sre_parser.parse(pattern.pattern, pattern.flags):
+            if op is literal_op and arg < 128:
+                run += chr(arg)
+                best = max(best, run, key=len)
+            else:
+                run = ""
+    except Exception:
+        return None
+    if not best:
+        return None
+    return best.lower() if pattern.flags & re.IGNORECASE else best
+
+
+class _PatternSet:
+    """Ordered patterns screened by a substring prefilter.
+
+    Each pattern is only searched if the stream name contains its required
+    literal (e.g. "nfl" for the NFL league hint), a C-level substring check,
+    so a typical name runs a handful of regex searches per category instead
+    of one per pattern. Priority order is unchanged.
+
+    Non-ASCII names skip the prefilter: IGNORECASE matching folds some
+    non-ASCII characters onto ASCII letters that str.lower() doesn't.
+    """
+
+    def __init__(self, entries: list):
+        # Accept bare patterns or (pattern, value) tuples as the accessors return
+        patterns = [e[0] if isinstance(e, tuple) else e for e in entries]
+        self._patterns = patterns
+        self._screened = [
+            (i, p, _required_literal(p), bool(p.flags & re.IGNORECASE))
+            for i, p in enumerate(patterns)
+        ]
+
+    def _candidates(self, text: str):
+        if not text.isascii():
+            yield from enumerate(self._patterns)
+            return
+        lower = text.lower()
+        for i, pattern, literal, ignore_case in self._screened:
+            if literal is None or literal in (lower if ignore_case else text):
+                yield i, pattern
+
+    def search_any(self, text: str) -> bool:
+        """True if any pattern matches."""
+        return any(p.search(text) for _, p in self._candidates(text))
+
+    def first_match(self, text: str) -> int | None:
+        """Index of the highest-priority pattern that matches, or None."""
+        return next((i for i, p in self._candidates(text) if p.search(text)), None)
+
+
 class DetectionKeywordService:
     """Service for loading and caching detection patterns.
 
@@ -78,6 +150,10 @@ class DetectionKeywordService:
     _exclusion_patterns: ClassVar[list[Pattern[str]] | None] = None
     _separators: ClassVar[list[str] | None] = None
 
+    # Prefiltered matchers, keyed by category and tied to the pattern list
+    # they were built from
+    _pattern_sets: ClassVar[dict[str, tuple[list, _PatternSet]]] = {}
+
     # ==========================================================================
     # Pattern Accessors
     # ==========================================================================
@@ -450,6 +526,16 @@ class DetectionKeywordService:
                     cls._event_type_patterns[event_type].append(pattern)
         return cls._event_type_patterns
 
+    @classmethod
+    def _pattern_set(cls, key: str, patterns: list) -> _PatternSet:
+        """Get (building on first use) the prefiltered matcher for a category."""
+        cached = cls._pattern_sets.get(key)
+        if cached is not None and cached[0] is patterns:
+            return cached[1]
+        pattern_set = _PatternSet(patterns)
+        cls._pattern_sets[key] = (patterns, pattern_set)
+        return pattern_set
+
     @classmethod
     def detect_event_type(cls, text: str) -> str | None:
         """Detect event type from stream name.
@@ -467,9 +553,8 @@ class DetectionKeywordService:
         for event_type, patterns in cls._get_event_type_patterns().items():
             if event_type == "TEAM_VS_TEAM":
                 continue  # TEAM_VS_TEAM detected via separators, not keywords
-            for pattern in patterns:
-                if pattern.search(text):
-                    return event_type
+            if cls._pattern_set(f"event_type:{event_type}", patterns).search_any(text):
+                return event_type
         return None
 
     @classmethod
@@ -500,10 +585,9 @@ class DetectionKeywordService:
         Returns:
             League code (str), list of codes for umbrella brands, or None
         """
-        for pattern, code in cls.get_league_hints():
-            if pattern.search(text):
-                return code
-        return None
+        hints = cls.get_league_hints()
+        index = cls._pattern_set("league_hints", hints).first_match(text)
+        return hints[index][1] if index is not None else None
 
     @classmethod
     def detect_sport(cls, text: str) -> str | None:
@@ -515,10 +599,9 @@ class DetectionKeywordService:
         Returns:
             Sport name (e.g., 'Hockey', 'Soccer') or None
         """
-        for pattern, sport in cls.get_sport_hints():
-            if pattern.search(text):
-                return sport
-        return None
+        hints = cls.get_sport_hints()
+        index = cls._pattern_set("sport_hints", hints).first_match(text)
+        return hints[index][1] if index is not None else None
 
     @classmethod
     def is_placeholder(cls, text: str) -> bool:
@@ -530,10 +613,7 @@ class DetectionKeywordService:
         Returns:
             True if stream appears to be a placeholder/filler
         """
-        for pattern in cls.get_placeholder_patterns():
-            if pattern.search(text):
-                return True
-        return False
+        return cls._pattern_set("placeholders", cls.get_placeholder_patterns()).search_any(text)
 
     @classmethod
     def detect_card_segment(cls, text: str) -> str | None:
@@ -545,10 +625,9 @@ class DetectionKeywordService:
         Returns:
             Segment name ('early_prelims', 'prelims', 'main_card', 'combined') or None
         """
-        for pattern, segment in cls.get_card_segment_patterns():
-            if pattern.search(text):
-                return segment
-        return None
+        segments = cls.get_card_segment_patterns()
+        index = cls._pattern_set("card_segments", segments).first_match(text)
+        return segments[index][1] if index is not None else None
 
     @classmethod
     def is_excluded(cls, text: str) -> bool:
@@ -560,10 +639,7 @@ class DetectionKeywordService:
         Returns:
             True if stream matches exclusion patterns (weigh-ins, press conferences, etc.)
         """
-        for pattern in cls.get_exclusion_patterns():
-            if pattern.search(text):
-                return True
-        return False
+        return cls._pattern_set("exclusions", cls.get_exclusion_patterns()).search_any(text)
 
     @classmethod
     def find_separator(cls, text: str) -> tuple[str | None, int]:
@@ -601,6 +677,7 @@ class DetectionKeywordService:
         cls._card_segment_patterns = None
         cls._exclusion_patterns = None
         cls._separators = None
+        cls._pattern_sets = {}
         logger.info("[DETECT_SVC] Pattern cache invalidated")
 
     @classmethod
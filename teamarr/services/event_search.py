@@ -0,0 +1,293 @@
+"""In-memory search index over events in the shared service cache.
+
+Used by the manual match correction UI to find an event by team name in
+any league without calling a provider. League scoreboards
+("events:<league>:<date>") and team schedules ("schedule:<league>:<team>")
+already live in the shared PersistentTTLCache; this module indexes those
+entries in place:
+
+- normalized team tokens -> events (prefix lookup via a sorted token list)
+- date -> events
+
+The index re-syncs incrementally: only cache entries whose value object
+changed since the last sync are re-read.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from teamarr.utilities.fuzzy_match import normalize_text
+from teamarr.utilities.tz import to_user_tz
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefixes holding lists of serialized events
+_EVENT_LIST_PREFIXES = ("events:", "schedule:")
+
+# Re-scan at least this often even if the cache reports no changes, so
+# entries that merely expired drop out of the results
+RESYNC_INTERVAL_SECONDS = 60
+
+DocKey = tuple[str, str]  # (league, event_id)
+
+
+@dataclass(slots=True)
+class IndexedEvent:
+    """Search document for one cached event."""
+
+    event_id: str
+    event_name: str
+    league: str
+    start_time: str
+    home_team: str | None
+    away_team: str | None
+    status: str | None
+    # Normalized team names, short names and abbreviations (or event name)
+    names: tuple[str, ...]
+    tokens: frozenset[str]
+    # Cache key -> date (YYYY-MM-DD) the event is listed under there
+    sources: dict[str, str] = field(default_factory=dict)
+
+
+def _team_names(team: dict | None) -> list[str]:
+    if not team:
+        return []
+    return [normalize_text(team[k]) for k in ("name", "short_name", "abbreviation") if team.get(k)]
+
+
+def _event_date(event: dict) -> str | None:
+    try:
+        return to_user_tz(datetime.fromisoformat(event["start_time"])).date().isoformat()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class EventSearchIndex:
+    """Token and date index over cached event lists."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._generation: int | None = None
+        self._synced_at = 0.0
+        # Cache key -> (value object as last indexed, doc keys it contributed)
+        self._sources: dict[str, tuple[Any, list[DocKey]]] = {}
+        self._docs: dict[DocKey, IndexedEvent] = {}
+        self._by_token: dict[str, set[DocKey]] = {}
+        self._by_date: dict[str, set[DocKey]] = {}
+        self._sorted_tokens: list[str] | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of distinct indexed events."""
+        return len(self._docs)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def sync(self, cache) -> None:
+        """Bring the index up to date with a (Persistent)TTLCache."""
+        with self._lock:
+            self._sync(cache)
+
+    def _sync(self, cache) -> None:
+        generation = cache.generation
+        now = time.monotonic()
+        if generation == self._generation and now - self._synced_at < RESYNC_INTERVAL_SECONDS:
+            return
+
+        entries = cache.get_all_entries()
+        changed = 0
+        for key, (value, _expires_at) in entries.items():
+            if not key.startswith(_EVENT_LIST_PREFIXES):
+                continue
+            indexed = self._sources.get(key)
+            if indexed is not None and indexed[0] is value:
+                continue
+            if indexed is not None:
+                self._remove_source(key)
+            self._add_source(key, value)
+            changed += 1
+
+        for key in [k for k in self._sources if k not in entries]:
+            self._remove_source(key)
+            changed += 1
+
+        self._generation = generation
+        self._synced_at = now
+        if changed:
+            logger.debug(
+                "[EVENT_SEARCH] Synced %d cache entries, %d events indexed",
+                changed,
+                len(self._docs),
+            )
+
+    def _add_source(self, cache_key: str, value: Any) -> None:
+        doc_keys: list[DocKey] = []
+        self._sources[cache_key] = (value, doc_keys)
+        if not isinstance(value, list):
+            return
+
+        # events:<league>:<date> lists a scoreboard day; schedules span days
+        parts = cache_key.split(":")
+        key_date = parts[2] if parts[0] == "events" and len(parts) == 3 else None
+
+        for event in value:
+            if not isinstance(event, dict) or not event.get("id"):
+                continue
+            listed_on = key_date or _event_date(event)
+            if not listed_on:
+                continue
+            doc_key = (event.get("league") or parts[1], str(event["id"]))
+            doc = self._docs.get(doc_key)
+            if doc is None:
+                doc = self._make_doc(doc_key, event)
+                self._docs[doc_key] = doc
+                for token in doc.tokens:
+                    self._by_token.setdefault(token, set()).add(doc_key)
+                self._sorted_tokens = None
+            else:
+                # Keep the freshest status/time when several entries list it
+                doc.start_time = event.get("start_time") or doc.start_time
+                doc.status = (event.get("status") or {}).get("state") or doc.status
+            doc.sources[cache_key] = listed_on
+            self._by_date.setdefault(listed_on, set()).add(doc_key)
+            doc_keys.append(doc_key)
+
+    def _remove_source(self, cache_key: str) -> None:
+        _value, doc_keys = self._sources.pop(cache_key)
+        for doc_key in doc_keys:
+            doc = self._docs.get(doc_key)
+            if doc is None:
+                continue
+            listed_on = doc.sources.pop(cache_key, None)
+            if listed_on and listed_on not in doc.sources.values():
+                self._discard(self._by_date, listed_on, doc_key)
+            if not doc.sources:
+                del self._docs[doc_key]
+                for token in doc.tokens:
+                    if self._discard(self._by_token, token, doc_key):
+                        self._sorted_tokens = None
+
+    @staticmethod
+    def _discard(index: dict[str, set[DocKey]], term: str, doc_key: DocKey) -> bool:
+        """Remove doc_key under term; True if the term is now gone."""
+        keys = index.get(term)
+        if keys is None:
+            return False
+        keys.discard(doc_key)
+        if not keys:
+            del index[term]
+            return True
+        return False
+
+    @staticmethod
+    def _make_doc(doc_key: DocKey, event: dict) -> IndexedEvent:
+        home = event.get("home_team")
+        away = event.get("away_team")
+        names = tuple(_team_names(home) + _team_names(away))
+        if not names:
+            # Teamless events (e.g. some combat cards) are found by event name
+            names = (normalize_text(event.get("name") or ""),)
+        status = event.get("status") or {}
+        return IndexedEvent(
+            event_id=doc_key[1],
+            event_name=event.get("name") or "",
+            league=doc_key[0],
+            start_time=event.get("start_time") or "",
+            home_team=home.get("name") if home else None,
+            away_team=away.get("name") if away else None,
+            status=status.get("state"),
+            names=names,
+            tokens=frozenset(t for name in names for t in name.split()),
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        team: str | None = None,
+        target_date: date | None = None,
+        league: str | None = None,
+        limit: int = 50,
+    ) -> list[IndexedEvent]:
+        """Find indexed events.
+
+        Every word of ``team`` must prefix-match a word of one of the event's
+        team names (accent/case-insensitive). Results are ranked: exact team
+        name, team name prefix, team name substring, then token-only matches;
+        ties by start time. Without ``team``, all events on the date are
+        returned ordered by league and start time.
+
+        Args:
+            team: Team name query
+            target_date: Only events listed on this date
+            league: Only events in this league
+            limit: Max results
+        """
+        with self._lock:
+            candidates: set[DocKey] | None = None
+            if target_date is not None:
+                candidates = set(self._by_date.get(target_date.isoformat(), ()))
+
+            query = normalize_text(team) if team else ""
+            for word in query.split():
+                matches = self._prefix_matches(word)
+                candidates = matches if candidates is None else candidates & matches
+                if not candidates:
+                    return []
+
+            if candidates is None:
+                candidates = set(self._docs)
+            docs = [self._docs[k] for k in candidates if not league or k[0] == league]
+
+        if not query:
+            docs.sort(key=lambda d: (d.league, d.start_time, d.event_id))
+            return docs[:limit]
+
+        def rank(doc: IndexedEvent) -> tuple:
+            if query in doc.names:
+                tier = 0
+            elif any(name.startswith(query) for name in doc.names):
+                tier = 1
+            elif any(query in name for name in doc.names):
+                tier = 2
+            else:
+                tier = 3
+            return (tier, doc.start_time, doc.league, doc.event_id)
+
+        docs.sort(key=rank)
+        return docs[:limit]
+
+    def _prefix_matches(self, word: str) -> set[DocKey]:
+        """Doc keys with any token starting with word. Called with lock held."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._by_token)
+        tokens = self._sorted_tokens
+        matches: set[DocKey] = set()
+        i = bisect_left(tokens, word)
+        while i < len(tokens) and tokens[i].startswith(word):
+            matches |= self._by_token[tokens[i]]
+            i += 1
+        return matches
+
+
+_index: EventSearchIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_event_search_index() -> EventSearchIndex:
+    """Get the process-wide event search index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = EventSearchIndex()
+    return _index
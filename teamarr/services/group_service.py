@@ -112,12 +112,15 @@ class GroupService:
         self,
         group_id: int,
         target_date: date | None = None,
+        from_snapshot: bool = False,
     ):
         """Preview stream matching for a group without creating channels.
 
         Args:
             group_id: Group ID to preview
             target_date: Target date (defaults to today)
+            from_snapshot: Answer from the last run's stream snapshot, re-matching
+                only changed streams, instead of refreshing and refetching
 
         Returns:
             PreviewResult from the processor
@@ -129,6 +132,7 @@ class GroupService:
             group_id=group_id,
             dispatcharr_client=self._client,
             target_date=target_date,
+            from_snapshot=from_snapshot,
         )
 
     def process_all_groups(
@@ -17,6 +17,7 @@ class SchedulerStatus:
     cron_expression: str = "0 * * * *"
     last_run: datetime | None = None
     next_run: datetime | None = None
+    tasks: list[dict] = field(default_factory=list)
 
 
 @dataclass
@@ -80,7 +81,8 @@ class SchedulerService:
         """Get scheduler status.
 
         Returns:
-            SchedulerStatus with running state, cron expression, and run times
+            SchedulerStatus with running state, cron expression, run times
+            and per-task schedules/history
         """
         from teamarr.consumers.scheduler import get_scheduler_status
 
@@ -94,6 +96,7 @@ class SchedulerService:
             next_run=(
                 datetime.fromisoformat(status["next_run"]) if status.get("next_run") else None
             ),
+            tasks=status.get("tasks", []),
         )
 
     def run_once(self) -> SchedulerRunResult:
@@ -24,6 +24,8 @@ from teamarr.database.provider_cache import (
     team_to_dict,
 )
 from teamarr.providers import ProviderRegistry
+from teamarr.services.event_search import IndexedEvent, get_event_search_index
+from teamarr.utilities import metrics
 from teamarr.utilities.cache import (
     CACHE_TTL_SCHEDULE,
     CACHE_TTL_SINGLE_EVENT,
@@ -42,6 +44,14 @@ logger = logging.getLogger(__name__)
 _shared_cache: PersistentTTLCache | None = None
 _cache_lock = threading.Lock()
 
+# Distinct teams of one league missing from the stats cache before the whole
+# league is fetched in one call (provider.get_league_team_stats)
+LEAGUE_STATS_HOT_THRESHOLD = 3
+
+# league -> team IDs that missed the stats cache since the last bulk fetch
+_league_stats_misses: dict[str, set[str]] = {}
+_league_stats_lock = threading.Lock()
+
 
 def _get_shared_cache() -> PersistentTTLCache:
     """Get or create the shared cache singleton."""
@@ -65,6 +75,16 @@ def flush_shared_cache() -> int:
     return 0
 
 
+def reset_league_stats_misses() -> None:
+    """Forget stats cache misses counted toward making a league hot.
+
+    Called at the start of each generation run, so a league only turns hot
+    from misses within one run.
+    """
+    with _league_stats_lock:
+        _league_stats_misses.clear()
+
+
 def _ensure_registry_initialized() -> None:
     """Ensure ProviderRegistry is initialized with dependencies.
 
@@ -137,6 +157,7 @@ class SportsDataService:
 
         # Check cache (deserialize from dict)
         cached = self._cache.get(cache_key)
+        metrics.inc("service_cache", kind="events", result="miss" if cached is None else "hit")
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
@@ -151,7 +172,8 @@ class SportsDataService:
         # Iterate through providers
         for provider in self._providers:
             if provider.supports_league(league):
-                events = provider.get_events(league, target_date)
+                with metrics.span("provider_call", provider=provider.name, method="get_events"):
+                    events = provider.get_events(league, target_date)
                 # Check if all events are final (for past dates, enables 30-day cache)
                 # Empty list counts as "all final" (no games = nothing to update)
                 all_final = len(events) == 0 or all(is_event_final(e) for e in events)
@@ -173,6 +195,7 @@ class SportsDataService:
 
         # Check cache (deserialize from dict)
         cached = self._cache.get(cache_key)
+        metrics.inc("service_cache", kind="schedule", result="miss" if cached is None else "hit")
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
@@ -183,7 +206,10 @@ class SportsDataService:
         # Fetch from provider
         for provider in self._providers:
             if provider.supports_league(league):
-                events = provider.get_team_schedule(team_id, league, days_ahead)
+                with metrics.span(
+                    "provider_call", provider=provider.name, method="get_team_schedule"
+                ):
+                    events = provider.get_team_schedule(team_id, league, days_ahead)
                 if events:
                     # Serialize to dict before caching
                     serialized = [event_to_dict(e) for e in events]
@@ -197,6 +223,7 @@ class SportsDataService:
 
         # Check cache (deserialize from dict)
         cached = self._cache.get(cache_key)
+        metrics.inc("service_cache", kind="team", result="miss" if cached is None else "hit")
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
@@ -207,7 +234,8 @@ class SportsDataService:
         # Fetch from provider
         for provider in self._providers:
             if provider.supports_league(league):
-                team = provider.get_team(team_id, league)
+                with metrics.span("provider_call", provider=provider.name, method="get_team"):
+                    team = provider.get_team(team_id, league)
                 if team:
                     # Serialize to dict before caching
                     self._cache.set(cache_key, team_to_dict(team), CACHE_TTL_TEAM_INFO)
@@ -230,6 +258,7 @@ class SportsDataService:
 
         # Check cache (deserialize from dict)
         cached = self._cache.get(cache_key)
+        metrics.inc("service_cache", kind="event", result="miss" if cached is None else "hit")
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
@@ -239,7 +268,8 @@ class SportsDataService:
 
         for provider in self._providers:
             if provider.supports_league(league):
-                event = provider.get_event(event_id, league)
+                with metrics.span("provider_call", provider=provider.name, method="get_event"):
+                    event = provider.get_event(event_id, league)
                 if event:
                     # Serialize to dict before caching
                     self._cache.set(cache_key, event_to_dict(event), CACHE_TTL_SINGLE_EVENT)
@@ -285,12 +315,50 @@ class SportsDataService:
         logger.debug("[SPORTS_DATA] Could not refresh event %s, using cached status", event.id)
         return event
 
+    def update_cached_event(self, event: Event, target_date: date) -> int:
+        """Write a refreshed event into the cached scoreboard and team schedules.
+
+        Used by the live-score fast path so today's scoreboard and both
+        teams' schedules reflect fresh scores without being refetched.
+        Entries that aren't cached (or don't contain the event) are left alone.
+
+        Args:
+            event: Refreshed event (e.g. from refresh_event_status)
+            target_date: Scoreboard date the event was found under
+
+        Returns:
+            Number of cache entries updated
+        """
+        entries = [
+            (make_cache_key("events", event.league, target_date.isoformat()), None),
+        ]
+        for team in (event.home_team, event.away_team):
+            if team and team.id:
+                entries.append(
+                    (make_cache_key("schedule", event.league, team.id), CACHE_TTL_SCHEDULE)
+                )
+
+        updated = 0
+        serialized = event_to_dict(event)
+        for cache_key, ttl in entries:
+            cached = self._cache.get(cache_key)
+            if not cached or not any(e.get("id") == event.id for e in cached):
+                continue
+            patched = [serialized if e.get("id") == event.id else e for e in cached]
+            if ttl is None:
+                all_final = all(is_event_final(dict_to_event(e)) for e in patched)
+                ttl = get_events_cache_ttl(target_date, all_events_final=all_final)
+            self._cache.set(cache_key, patched, ttl)
+            updated += 1
+        return updated
+
     def get_team_stats(self, team_id: str, league: str) -> TeamStats | None:
         """Get detailed team statistics."""
         cache_key = make_cache_key("stats", league, team_id)
 
         # Check cache (deserialize from dict)
         cached = self._cache.get(cache_key)
+        metrics.inc("service_cache", kind="stats", result="miss" if cached is None else "hit")
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
@@ -298,16 +366,89 @@ class SportsDataService:
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
+        # Many teams of this league missing - fill the whole league at once
+        if self._should_fetch_league_stats(league, team_id):
+            self._fetch_league_stats(league)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return dict_to_stats(cached)
+                except (KeyError, TypeError) as e:
+                    logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
+
         # Fetch from provider
         for provider in self._providers:
             if provider.supports_league(league):
-                stats = provider.get_team_stats(team_id, league)
+                with metrics.span("provider_call", provider=provider.name, method="get_team_stats"):
+                    stats = provider.get_team_stats(team_id, league)
                 if stats:
                     # Serialize to dict before caching
                     self._cache.set(cache_key, stats_to_dict(stats), CACHE_TTL_TEAM_STATS)
                     return stats
         return None
 
+    def _should_fetch_league_stats(self, league: str, team_id: str) -> bool:
+        """Record a stats cache miss; True once for the caller that makes the league hot.
+
+        At most one bulk fetch per league per stats TTL: the marker entry
+        written by _fetch_league_stats suppresses further attempts, even
+        when the provider had nothing to offer.
+        """
+        if self._cache.get(make_cache_key("league_stats", league)) is not None:
+            return False
+        with _league_stats_lock:
+            misses = _league_stats_misses.setdefault(league, set())
+            misses.add(team_id)
+            if len(misses) < LEAGUE_STATS_HOT_THRESHOLD:
+                return False
+            del _league_stats_misses[league]
+        return True
+
+    def _fetch_league_stats(self, league: str) -> None:
+        """Cache stats for every team in a league from one provider call."""
+        all_stats: dict[str, TeamStats] = {}
+        for provider in self._providers:
+            if provider.supports_league(league):
+                with metrics.span(
+                    "provider_call", provider=provider.name, method="get_league_team_stats"
+                ):
+                    try:
+                        all_stats = provider.get_league_team_stats(league)
+                    except Exception as e:
+                        logger.warning("[STATS] League stats fetch failed for %s: %s", league, e)
+                if all_stats:
+                    break
+
+        for team_id, stats in all_stats.items():
+            self._cache.set(
+                make_cache_key("stats", league, team_id),
+                stats_to_dict(stats),
+                CACHE_TTL_TEAM_STATS,
+            )
+        self._cache.set(
+            make_cache_key("league_stats", league), sorted(all_stats), CACHE_TTL_TEAM_STATS
+        )
+        if all_stats:
+            logger.info(
+                "[STATS] Cached stats for %d %s teams from standings", len(all_stats), league
+            )
+
+    def search_cached_events(
+        self,
+        team: str | None = None,
+        target_date: date | None = None,
+        league: str | None = None,
+        limit: int = 50,
+    ) -> list[IndexedEvent]:
+        """Search events already in the cache, across all leagues.
+
+        Never calls a provider. See EventSearchIndex.search for matching
+        and ranking.
+        """
+        index = get_event_search_index()
+        index.sync(self._cache)
+        return index.search(team=team, target_date=target_date, league=league, limit=limit)
+
     # Cache management
 
     def get_provider_name(self, league: str) -> str | None:
@@ -393,23 +534,37 @@ class SportsDataService:
                 if hasattr(client, "reset_rate_limit_stats"):
                     client.reset_rate_limit_stats()
 
-    def prewarm_tsdb_leagues(self, leagues: list[str], days_ahead: int = 14) -> None:
-        """Pre-warm TSDB events cache for multiple leagues.
+    def prewarm_tsdb_leagues(
+        self,
+        leagues: list[str],
+        days_ahead: int = 14,
+        team_counts: dict[str, int] | None = None,
+        max_calls: int | None = None,
+    ) -> dict:
+        """Pre-warm the TSDB cache for everything team schedules will read.
 
-        Fetches events for each league/day upfront, populating the cache.
-        This ensures all subsequent get_team_schedule calls are cache hits.
+        The TSDB provider plans the needed endpoints across all leagues
+        (deduplicated, cached entries dropped) and ranks them by how much
+        team work each saves. They are fetched most valuable first, paced
+        by the client's RateLimiter, so TSDB teams can then be processed
+        in parallel from cache.
 
         NOTE: Team name lookup uses seeded database cache (not API), so we
-        only need to pre-warm events, not teams. This saves 2 API calls per league.
+        only need to pre-warm events, not teams.
 
         Args:
             leagues: List of canonical league codes to pre-warm
             days_ahead: Number of days to pre-warm (default 14, matches get_team_schedule)
-        """
-        from datetime import timedelta
+            team_counts: Optional league -> number of teams reading it (ranking)
+            max_calls: Optional cap on API calls; lowest-value fetches are
+                left to the teams that need them
 
-        if not leagues:
-            return
+        Returns:
+            Dict with planned/fetched/skipped/failed call counts
+        """
+        stats = {"planned": 0, "fetched": 0, "skipped": 0, "failed": 0}
+        if not leagues and not team_counts:
+            return stats
 
         # Find TSDB provider
         tsdb_provider = None
@@ -418,39 +573,32 @@ class SportsDataService:
                 tsdb_provider = provider
                 break
 
-        if not tsdb_provider:
+        if not tsdb_provider or not hasattr(tsdb_provider, "plan_prefetch"):
             logger.debug("[PREWARM] No TSDB provider registered, skipping pre-warm")
-            return
+            return stats
 
-        unique_leagues = list(set(leagues))
-        today = date.today()
+        counts = dict.fromkeys(leagues, 1)
+        counts.update(team_counts or {})
+        plan = tsdb_provider.plan_prefetch(counts, days_ahead)
+        stats["planned"] = len(plan)
+        if max_calls is not None and len(plan) > max_calls:
+            stats["skipped"] = len(plan) - max_calls
+            plan = plan[:max_calls]
 
-        # Cap to TSDB's max days (same as provider)
-        days_ahead = min(days_ahead, 14)
-
-        total_calls = len(unique_leagues) * days_ahead  # N days per league
         logger.info(
-            "[PREWARM] TSDB: %d leagues × %d days = ~%d API calls",
-            len(unique_leagues),
-            days_ahead,
-            total_calls,
+            "[PREWARM] TSDB: %d leagues, %d fetches needed (%d over budget)",
+            len(counts),
+            stats["planned"],
+            stats["skipped"],
         )
 
-        for league in unique_leagues:
-            if not tsdb_provider.supports_league(league):
-                continue
+        for call in plan:
+            try:
+                with metrics.span("provider_call", provider="tsdb", method=call.endpoint):
+                    ok = tsdb_provider.prefetch(call)
+            except Exception as e:
+                logger.warning("[PREWARM] TSDB %s %s failed: %s", call.endpoint, call.league, e)
+                ok = False
+            stats["fetched" if ok else "failed"] += 1
 
-            # Pre-warm events cache for each day
-            # Team names come from seeded database cache (no API needed)
-            for i in range(days_ahead):
-                target_date = today + timedelta(days=i)
-                # Use get_events which goes through provider → client cache
-                tsdb_provider.get_events(league, target_date)
-                # Small delay between days to stay under free tier limit
-                import time
-                time.sleep(2)
-
-            logger.debug("[PREWARM] TSDB league %s: %d days", league, days_ahead)
-            # Extra delay between leagues
-            import time
-            time.sleep(5)
+        return stats
@@ -1,8 +1,10 @@
 """Cache implementations with TTL support.
 
-Two cache backends available:
+Cache backends available:
 - TTLCache: In-memory, fast, resets on restart
 - PersistentTTLCache: Hybrid in-memory + SQLite persistence
+- ProviderResponseCache: Per-provider raw responses, read/write-through
+  to SQLite with compressed payloads and a size cap
 
 The PersistentTTLCache uses a "load on startup, operate in memory, flush
 periodically" pattern for optimal performance:
@@ -20,6 +22,7 @@ import atexit
 import json
 import logging
 import threading
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
@@ -65,6 +68,8 @@ class TTLCache:
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        # Bumped on every change to the key set or a value (see generation)
+        self._generation = 0
 
     def get(self, key: str) -> Any | None:
         """Get value if exists and not expired."""
@@ -75,6 +80,7 @@ class TTLCache:
                 return None
             if datetime.now() > entry.expires_at:
                 del self._cache[key]
+                self._generation += 1
                 self._misses += 1
                 return None
             # Update last accessed time for LRU
@@ -98,6 +104,7 @@ class TTLCache:
                 expires_at=expires_at,
                 last_accessed=now,
             )
+            self._generation += 1
 
     def _evict_if_needed(self) -> None:
         """Evict entries if cache is at max size. Called with lock held."""
@@ -109,6 +116,8 @@ class TTLCache:
         expired_keys = [k for k, v in self._cache.items() if now > v.expires_at]
         for key in expired_keys:
             del self._cache[key]
+        if expired_keys:
+            self._generation += 1
 
         # If still at/over max, evict least recently used
         while len(self._cache) >= self._max_size:
@@ -117,16 +126,19 @@ class TTLCache:
             # Find LRU entry
             lru_key = min(self._cache.keys(), key=lambda k: self._cache[k].last_accessed)
             del self._cache[lru_key]
+            self._generation += 1
 
     def delete(self, key: str) -> None:
         """Delete a key from cache."""
         with self._lock:
-            self._cache.pop(key, None)
+            if self._cache.pop(key, None) is not None:
+                self._generation += 1
 
     def clear(self) -> None:
         """Clear all cached values."""
         with self._lock:
             self._cache.clear()
+            self._generation += 1
             self._hits = 0
             self._misses = 0
 
@@ -139,6 +151,8 @@ class TTLCache:
             for key in expired_keys:
                 del self._cache[key]
                 removed += 1
+            if removed:
+                self._generation += 1
         return removed
 
     @property
@@ -151,6 +165,14 @@ class TTLCache:
         """Maximum cache size (0 = unlimited)."""
         return self._max_size
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever entries are added, replaced or removed.
+
+        Lets derived indexes skip re-scanning an unchanged cache.
+        """
+        return self._generation
+
     def stats(self) -> dict:
         """Get cache statistics."""
         now = datetime.now()
@@ -199,6 +221,7 @@ class TTLCache:
                 expires_at=expires_at,
                 last_accessed=now,
             )
+            self._generation += 1
 
 
 class PersistentTTLCache:
@@ -439,6 +462,15 @@ class PersistentTTLCache:
 
         return written
 
+    def get_all_entries(self) -> dict[str, tuple[Any, datetime]]:
+        """Get all non-expired in-memory entries as key -> (value, expires_at)."""
+        return self._memory_cache.get_all_entries()
+
+    @property
+    def generation(self) -> int:
+        """Change counter of the in-memory cache (see TTLCache.generation)."""
+        return self._memory_cache.generation
+
     @property
     def size(self) -> int:
         """Current number of entries in memory."""
@@ -464,6 +496,308 @@ class PersistentTTLCache:
         return base_stats
 
 
+class ProviderResponseCache:
+    """Persistent raw-response cache for one provider client.
+
+    Drop-in for the TTLCache a client keeps (get/set/delete/clear/stats),
+    shared by all instances of that provider and backed by the
+    provider_response_cache table:
+    - get() checks memory, then reads through to SQLite (cold starts reuse
+      responses fetched before the restart instead of re-spending the
+      TSDB rate budget or re-scraping Cricbuzz)
+    - set() writes through, storing the JSON payload zlib-compressed with
+      the TTL the client chose (e.g. get_cache_ttl_for_date)
+    - Stored bytes per provider are capped; entries closest to expiry are
+      evicted first
+
+    Usage:
+        cache = get_provider_response_cache("tsdb")
+        client = TSDBClient(cache=cache)
+    """
+
+    # Compressed bytes kept per provider unless configured
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        provider: str,
+        db_factory: Any = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = TTLCache.DEFAULT_MAX_SIZE,
+        default_ttl_seconds: int = 3600,
+    ):
+        if db_factory is None:
+            from teamarr.database.connection import get_db
+
+            db_factory = get_db
+        self._provider = provider
+        self._db_factory = db_factory
+        self._max_bytes = max_bytes
+        self._memory_cache = TTLCache(
+            default_ttl_seconds=default_ttl_seconds,
+            max_size=max_entries,
+        )
+        self._default_ttl = timedelta(seconds=default_ttl_seconds)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stored_bytes: int | None = None  # Loaded lazily from SQLite
+
+    @property
+    def provider(self) -> str:
+        """Provider this cache belongs to."""
+        return self._provider
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def get(self, key: str) -> Any | None:
+        """Get value from memory or SQLite if it exists and isn't expired."""
+        value = self._memory_cache.get(key)
+        if value is not None:
+            self._count("_hits")
+            return value
+
+        try:
+            with self._db_factory() as conn:
+                row = conn.execute(
+                    """SELECT payload, expires_at FROM provider_response_cache
+                       WHERE provider = ? AND cache_key = ? AND expires_at > ?""",
+                    (self._provider, key, datetime.now().isoformat()),
+                ).fetchone()
+        except Exception as e:
+            logger.warning("[CACHE] %s response cache read failed: %s", self._provider, e)
+            row = None
+
+        if row is None:
+            self._count("_misses")
+            return None
+        try:
+            value = json.loads(zlib.decompress(row["payload"]))
+        except (zlib.error, ValueError) as e:
+            logger.warning("[CACHE] Corrupt %s response %s: %s", self._provider, key, e)
+            self._count("_misses")
+            return None
+
+        self._memory_cache.set_with_expiry(key, value, datetime.fromisoformat(row["expires_at"]))
+        self._count("_disk_hits")
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """Set value in memory and persist it compressed."""
+        self._memory_cache.set(key, value, ttl_seconds)
+        ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else self._default_ttl
+
+        try:
+            raw = json.dumps(value, default=str).encode()
+        except (TypeError, ValueError) as e:
+            logger.warning("[CACHE] Failed to serialize %s response %s: %s", self._provider, key, e)
+            return
+        payload = zlib.compress(raw)
+
+        try:
+            with self._db_factory() as conn:
+                previous = conn.execute(
+                    """SELECT size_bytes FROM provider_response_cache
+                       WHERE provider = ? AND cache_key = ?""",
+                    (self._provider, key),
+                ).fetchone()
+                conn.execute(
+                    """INSERT OR REPLACE INTO provider_response_cache
+                       (provider, cache_key, payload, size_bytes, raw_bytes, expires_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (
+                        self._provider,
+                        key,
+                        payload,
+                        len(payload),
+                        len(raw),
+                        (datetime.now() + ttl).isoformat(),
+                    ),
+                )
+                with self._lock:
+                    if self._stored_bytes is None:
+                        self._stored_bytes = self._sum_bytes(conn)
+                    else:
+                        self._stored_bytes += len(payload) - (
+                            previous["size_bytes"] if previous else 0
+                        )
+                    over_cap = self._stored_bytes > self._max_bytes
+                if over_cap:
+                    self._enforce_cap(conn)
+        except Exception as e:
+            logger.warning("[CACHE] %s response cache write failed: %s", self._provider, e)
+
+    def _sum_bytes(self, conn: Any) -> int:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) AS total FROM provider_response_cache"
+            " WHERE provider = ?",
+            (self._provider,),
+        ).fetchone()
+        return row["total"]
+
+    def _enforce_cap(self, conn: Any) -> None:
+        """Drop expired rows, then those closest to expiry, until under the cap."""
+        conn.execute(
+            "DELETE FROM provider_response_cache WHERE provider = ? AND expires_at <= ?",
+            (self._provider, datetime.now().isoformat()),
+        )
+        total = self._sum_bytes(conn)
+        evicted: list[str] = []
+        if total > self._max_bytes:
+            rows = conn.execute(
+                """SELECT cache_key, size_bytes FROM provider_response_cache
+                   WHERE provider = ? ORDER BY expires_at""",
+                (self._provider,),
+            ).fetchall()
+            for row in rows:
+                if total <= self._max_bytes:
+                    break
+                evicted.append(row["cache_key"])
+                total -= row["size_bytes"]
+            conn.executemany(
+                "DELETE FROM provider_response_cache WHERE provider = ? AND cache_key = ?",
+                [(self._provider, key) for key in evicted],
+            )
+        with self._lock:
+            self._stored_bytes = total
+        for key in evicted:
+            self._memory_cache.delete(key)
+        if evicted:
+            logger.debug("[CACHE] %s over size cap: evicted %d", self._provider, len(evicted))
+
+    def delete(self, key: str) -> None:
+        """Delete a key from memory and SQLite."""
+        self._memory_cache.delete(key)
+        try:
+            with self._db_factory() as conn:
+                conn.execute(
+                    "DELETE FROM provider_response_cache WHERE provider = ? AND cache_key = ?",
+                    (self._provider, key),
+                )
+            with self._lock:
+                self._stored_bytes = None
+        except Exception as e:
+            logger.warning("[CACHE] %s response cache delete failed: %s", self._provider, e)
+
+    def clear(self) -> None:
+        """Clear all cached responses for this provider."""
+        self._memory_cache.clear()
+        with self._lock:
+            self._hits = self._disk_hits = self._misses = 0
+            self._stored_bytes = 0
+        try:
+            with self._db_factory() as conn:
+                conn.execute(
+                    "DELETE FROM provider_response_cache WHERE provider = ?", (self._provider,)
+                )
+        except Exception as e:
+            logger.error("[CACHE] Failed to clear %s response cache: %s", self._provider, e)
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from memory and SQLite."""
+        removed = self._memory_cache.cleanup_expired()
+        try:
+            with self._db_factory() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM provider_response_cache WHERE provider = ? AND expires_at <= ?",
+                    (self._provider, datetime.now().isoformat()),
+                )
+                removed += cursor.rowcount
+            with self._lock:
+                self._stored_bytes = None
+        except Exception as e:
+            logger.error("[CACHE] Failed to cleanup %s response cache: %s", self._provider, e)
+        return removed
+
+    @property
+    def size(self) -> int:
+        """Current number of entries in memory."""
+        return self._memory_cache.size
+
+    def stats(self) -> dict:
+        """Get cache statistics (memory + stored), with hit rate across both."""
+        stats = self._memory_cache.stats()
+        try:
+            with self._db_factory() as conn:
+                row = conn.execute(
+                    """SELECT COUNT(*) AS entries,
+                              COALESCE(SUM(size_bytes), 0) AS size_bytes,
+                              COALESCE(SUM(raw_bytes), 0) AS raw_bytes
+                       FROM provider_response_cache
+                       WHERE provider = ? AND expires_at > ?""",
+                    (self._provider, datetime.now().isoformat()),
+                ).fetchone()
+            stored = {
+                "stored_entries": row["entries"],
+                "stored_bytes": row["size_bytes"],
+                "raw_bytes": row["raw_bytes"],
+            }
+        except Exception as e:
+            logger.warning("[CACHE] %s response cache stats failed: %s", self._provider, e)
+            stored = {"stored_entries": 0, "stored_bytes": 0, "raw_bytes": 0}
+
+        with self._lock:
+            hits, disk_hits, misses = self._hits, self._disk_hits, self._misses
+        total_requests = hits + disk_hits + misses
+        stats.update(
+            {
+                "persistent": True,
+                "provider": self._provider,
+                "hits": hits + disk_hits,
+                "memory_hits": hits,
+                "disk_hits": disk_hits,
+                "misses": misses,
+                "hit_rate": round((hits + disk_hits) / total_requests, 3) if total_requests else 0,
+                **stored,
+                "max_bytes": self._max_bytes,
+            }
+        )
+        return stats
+
+
+# Compressed bytes kept per provider (TSDB's rate budget makes it the most valuable)
+PROVIDER_CACHE_MAX_BYTES = {
+    "tsdb": 64 * 1024 * 1024,
+    "hockeytech": 32 * 1024 * 1024,
+    "cricbuzz": 32 * 1024 * 1024,
+}
+
+_provider_caches: dict[str, ProviderResponseCache] = {}
+_provider_caches_lock = threading.Lock()
+
+
+def get_provider_response_cache(provider: str) -> ProviderResponseCache:
+    """Get the shared persistent response cache for a provider."""
+    with _provider_caches_lock:
+        cache = _provider_caches.get(provider)
+        if cache is None:
+            cache = ProviderResponseCache(
+                provider,
+                max_bytes=PROVIDER_CACHE_MAX_BYTES.get(
+                    provider, ProviderResponseCache.DEFAULT_MAX_BYTES
+                ),
+            )
+            _provider_caches[provider] = cache
+        return cache
+
+
+def provider_response_cache_stats() -> dict[str, dict]:
+    """Stats of every provider response cache, by provider."""
+    with _provider_caches_lock:
+        providers = sorted(set(PROVIDER_CACHE_MAX_BYTES) | set(_provider_caches))
+    return {name: get_provider_response_cache(name).stats() for name in providers}
+
+
+def cleanup_provider_response_caches() -> int:
+    """Remove expired responses from every provider response cache in use."""
+    with _provider_caches_lock:
+        caches = list(_provider_caches.values())
+    return sum(cache.cleanup_expired() for cache in caches)
+
+
 # Cache TTL constants (seconds)
 # Optimized for typical EPG regeneration patterns (hourly to 24hr)
 CACHE_TTL_TEAM_STATS = 4 * 60 * 60  # 4 hours - record/standings change infrequently
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from rapidfuzz import fuzz
@@ -53,15 +54,21 @@ class FuzzyMatchResult:
     pattern_used: str | None = None
 
 
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=16384)
 def normalize_text(value: str) -> str:
     """Normalize text for matching.
 
     Applies: unidecode, lowercase, strip punctuation, normalize whitespace.
+    Memoized by raw string: event team names are re-normalized for every
+    stream they are compared against.
     """
     # Normalize: strip accents (é→e, ü→u), lowercase
     normalized = unidecode(value).lower().strip()
     # Remove punctuation (hyphens become spaces)
-    normalized = re.sub(r"[^\w\s]", " ", normalized)
+    normalized = _PUNCTUATION_PATTERN.sub(" ", normalized)
     # Clean up whitespace
     normalized = " ".join(normalized.split())
     return normalized
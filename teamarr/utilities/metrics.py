@@ -0,0 +1,264 @@
+"""Lightweight timing spans and counters.
+
+Instrumentation points wrap work in a span and bump counters:
+
+    with metrics.span("http_request", client="espn"):
+        response = client.get(url)
+
+    metrics.inc("service_cache", kind="events", result="hit")
+
+Every observation goes to the process-wide registry, which backs the
+Prometheus text endpoint (/api/v1/metrics), and to the registry of the
+EPG generation run in progress (if any), whose summary is stored in
+processing_runs.extra_metrics.
+
+Set TEAMARR_METRICS=0 to disable: span() then returns a shared no-op
+context manager and inc()/observe() return immediately.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds (seconds) of latency histogram buckets
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Prefix for exported metric names
+METRIC_PREFIX = "teamarr_"
+
+Labels = tuple[tuple[str, str], ...]
+
+_enabled = os.environ.get("TEAMARR_METRICS", "1").lower() not in ("0", "false", "no", "off")
+
+
+class _Histogram:
+    """Latency histogram (per-bucket counts, cumulated on export)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+class MetricsRegistry:
+    """Thread-safe set of named counters and latency histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], _Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, labels: Labels = ()) -> None:
+        """Add value to a counter."""
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, labels: Labels = ()) -> None:
+        """Record one duration in a histogram."""
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.observe(seconds)
+
+    def summary(self) -> dict:
+        """Compact JSON-friendly summary (count/total/max per span, counters)."""
+        with self._lock:
+            spans = {
+                _flat_name(name, labels): {
+                    "count": h.count,
+                    "total_s": round(h.total, 3),
+                    "max_s": round(h.max, 3),
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            }
+            counters = {
+                _flat_name(name, labels): value
+                for (name, labels), value in sorted(self._counters.items())
+            }
+        return {"spans": spans, "counters": counters}
+
+    def render(self) -> str:
+        """Render in the Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+            last_name = None
+            for (name, labels), h in histograms:
+                metric = f"{METRIC_PREFIX}{name}_seconds"
+                if name != last_name:
+                    lines.append(f"# TYPE {metric} histogram")
+                    last_name = name
+                cumulative = 0
+                for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), h.counts, strict=True):
+                    cumulative += count
+                    le = bound if isinstance(bound, str) else repr(bound)
+                    lines.append(
+                        f"{metric}_bucket{_label_str(labels + (('le', le),))} {cumulative}"
+                    )
+                lines.append(f"{metric}_sum{_label_str(labels)} {h.total:.6f}")
+                lines.append(f"{metric}_count{_label_str(labels)} {h.count}")
+
+            last_name = None
+            for (name, labels), value in counters:
+                metric = f"{METRIC_PREFIX}{name}_total"
+                if name != last_name:
+                    lines.append(f"# TYPE {metric} counter")
+                    last_name = name
+                lines.append(f"{metric}{_label_str(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _flat_name(name: str, labels: Labels) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+def _label_str(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+_process = MetricsRegistry()
+_run: MetricsRegistry | None = None
+
+
+def _record_duration(name: str, seconds: float, labels: Labels) -> None:
+    _process.observe(name, seconds, labels)
+    run = _run
+    if run is not None:
+        run.observe(name, seconds, labels)
+
+
+class _Span:
+    """Times the with-block into a histogram; exceptions also count as errors."""
+
+    __slots__ = ("_name", "_labels", "_start")
+
+    def __init__(self, name: str, labels: Labels) -> None:
+        self._name = name
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _record_duration(self._name, time.perf_counter() - self._start, self._labels)
+        if exc_type is not None:
+            inc(f"{self._name}_errors", **dict(self._labels))
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **labels: str) -> _Span | _NoopSpan:
+    """Context manager timing a block as histogram `name` (seconds)."""
+    if not _enabled:
+        return _NOOP_SPAN
+    return _Span(name, tuple(sorted(labels.items())) if labels else ())
+
+
+def inc(name: str, value: float = 1, **labels: str) -> None:
+    """Increment counter `name`."""
+    if not _enabled:
+        return
+    key = tuple(sorted(labels.items())) if labels else ()
+    _process.inc(name, value, key)
+    run = _run
+    if run is not None:
+        run.inc(name, value, key)
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    """Record a duration measured elsewhere."""
+    if not _enabled:
+        return
+    _record_duration(name, seconds, tuple(sorted(labels.items())) if labels else ())
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn instrumentation on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def begin_run() -> None:
+    """Start collecting a per-run summary (one generation run at a time)."""
+    global _run
+    _run = MetricsRegistry()
+
+
+def run_summary() -> dict:
+    """Summary of everything recorded since begin_run() (empty if none)."""
+    run = _run
+    return run.summary() if run is not None else {}
+
+
+def end_run() -> None:
+    """Stop collecting the per-run summary."""
+    global _run
+    _run = None
+
+
+def render_prometheus() -> str:
+    """Process-lifetime metrics in Prometheus text format."""
+    return _process.render()
+
+
+def reset() -> None:
+    """Drop all recorded metrics (process-wide and per-run)."""
+    global _process, _run
+    _process = MetricsRegistry()
+    _run = None
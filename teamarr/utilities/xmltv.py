@@ -154,6 +154,20 @@ def merge_xmltv_content(
     Returns:
         Merged XMLTV XML string
     """
+    root = merge_xmltv_tree(xmltv_contents, generator_name, generator_url)
+    return serialize_xmltv(root)
+
+
+def merge_xmltv_tree(
+    xmltv_contents: list[str],
+    generator_name: str = "Teamarr",
+    generator_url: str | None = None,
+) -> Element:
+    """Merge multiple XMLTV content strings into one <tv> element.
+
+    Same merge as merge_xmltv_content, but returns the tree so callers
+    can inspect it (e.g. analyze_xmltv_tree) before serializing.
+    """
     import xml.etree.ElementTree as ET
 
     root = Element("tv")
@@ -198,5 +212,226 @@ def merge_xmltv_content(
     for programme in all_programmes:
         root.append(programme)
 
-    xml_str = tostring(root, encoding="unicode")
-    return _prettify(xml_str)
+    return root
+
+
+def splice_xmltv_tree(
+    root: Element,
+    channel_ids: set[str],
+    xmltv_content: str | None,
+) -> Element:
+    """Replace some channels of a merged guide with fresh XMLTV.
+
+    Drops the channels in channel_ids and their programmes from root, then
+    merges in xmltv_content (if any), keeping channels first and programmes
+    sorted by channel and start time like merge_xmltv_tree.
+
+    Args:
+        root: Merged <tv> element (e.g. the parsed output file)
+        channel_ids: Channels to replace - the unit's old and new channel IDs
+        xmltv_content: The unit's new XMLTV, or None to only remove
+
+    Returns:
+        New <tv> element (root is left untouched)
+    """
+    import xml.etree.ElementTree as ET
+
+    spliced = Element("tv", dict(root.attrib))
+    seen_channels: set[str] = set()
+    programmes: list[Element] = []
+    seen_programmes: set[tuple[str, str, str]] = set()  # (channel, start, stop)
+
+    sources = [root]
+    if xmltv_content and xmltv_content.strip():
+        try:
+            sources.append(ET.fromstring(xmltv_content))
+        except ET.ParseError:
+            pass
+
+    for i, source in enumerate(sources):
+        fresh = i > 0
+        for channel in source.findall("channel"):
+            channel_id = channel.get("id")
+            if not channel_id or channel_id in seen_channels:
+                continue
+            if not fresh and channel_id in channel_ids:
+                continue
+            seen_channels.add(channel_id)
+            spliced.append(channel)
+
+        for programme in source.findall("programme"):
+            channel_id = programme.get("channel")
+            if not fresh and channel_id in channel_ids:
+                continue
+            key = (channel_id, programme.get("start"), programme.get("stop"))
+            if key not in seen_programmes:
+                seen_programmes.add(key)
+                programmes.append(programme)
+
+    programmes.sort(key=lambda p: (p.get("channel", ""), p.get("start", "")))
+    for programme in programmes:
+        spliced.append(programme)
+
+    return spliced
+
+
+def xmltv_channel_ids(xmltv_content: str | None) -> set[str]:
+    """Channel IDs declared in an XMLTV string (empty if missing or invalid)."""
+    import xml.etree.ElementTree as ET
+
+    if not xmltv_content or not xmltv_content.strip():
+        return set()
+    try:
+        source = ET.fromstring(xmltv_content)
+    except ET.ParseError:
+        return set()
+    ids = {channel.get("id") for channel in source.findall("channel")}
+    ids |= {programme.get("channel") for programme in source.findall("programme")}
+    return {channel_id for channel_id in ids if channel_id}
+
+
+def serialize_xmltv(root: Element) -> str:
+    """Serialize a <tv> element to pretty-printed XMLTV."""
+    return _prettify(tostring(root, encoding="unicode"))
+
+
+def analyze_xmltv_tree(root: Element) -> dict:
+    """Summarize an XMLTV tree for the EPG analysis view.
+
+    Counts channels and programmes (by filler type, when the tree was
+    parsed with comments), and reports the date range, unreplaced
+    template variables and coverage gaps over 5 minutes.
+    """
+    import re
+    from collections import defaultdict
+    from datetime import datetime
+
+    result = empty_xmltv_analysis()
+
+    # Count channels
+    channels = root.findall("channel")
+    result["channels"]["total"] = len(channels)
+    for ch in channels:
+        ch_id = ch.get("id", "")
+        if ch_id.startswith("teamarr-event-"):
+            result["channels"]["event_based"] += 1
+        else:
+            result["channels"]["team_based"] += 1
+
+    # Analyze programmes
+    programmes = root.findall("programme")
+    result["programmes"]["total"] = len(programmes)
+
+    # Track programmes per channel for gap detection
+    channel_programmes: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
+    unreplaced_vars: set[str] = set()
+    var_pattern = re.compile(r"\{[a-z_]+\}")
+
+    min_start = None
+    max_stop = None
+
+    for prog in programmes:
+        channel_id = prog.get("channel", "")
+        start = prog.get("start", "")
+        stop = prog.get("stop", "")
+
+        # Track date range
+        if start:
+            start_date = start[:8]
+            if min_start is None or start_date < min_start:
+                min_start = start_date
+        if stop:
+            stop_date = stop[:8]
+            if max_stop is None or stop_date > max_stop:
+                max_stop = stop_date
+
+        # Get text content for variable checking
+        title = prog.findtext("title", "") or ""
+        subtitle = prog.findtext("sub-title", "") or ""
+        desc = prog.findtext("desc", "") or ""
+
+        # Check for programme type from filler comment (V1 compatibility)
+        # Comments look like: <!-- teamarr:filler-pregame -->
+        filler_type = None
+        for child in prog:
+            if callable(child.tag):  # This is a Comment
+                comment_text = child.text or ""
+                if comment_text.startswith("teamarr:filler-"):
+                    filler_type = comment_text.replace("teamarr:filler-", "")
+                    break
+
+        if filler_type == "pregame":
+            result["programmes"]["pregame"] += 1
+        elif filler_type == "postgame":
+            result["programmes"]["postgame"] += 1
+        elif filler_type == "idle":
+            result["programmes"]["idle"] += 1
+        else:
+            result["programmes"]["events"] += 1
+
+        for text in [title, subtitle, desc]:
+            if text:
+                matches = var_pattern.findall(text)
+                unreplaced_vars.update(matches)
+
+        # Store for gap detection
+        if channel_id and start and stop:
+            channel_programmes[channel_id].append((start, stop, title or "Unknown"))
+
+    result["unreplaced_variables"] = sorted(unreplaced_vars)
+    result["date_range"]["start"] = min_start
+    result["date_range"]["end"] = max_stop
+
+    # Detect coverage gaps (> 5 minute gap between programmes)
+    for channel_id, progs in channel_programmes.items():
+        # Sort by start time
+        progs.sort(key=lambda x: x[0])
+
+        for i in range(len(progs) - 1):
+            _, stop1, title1 = progs[i]
+            start2, _, title2 = progs[i + 1]
+
+            # Parse times (format: YYYYMMDDHHmmss +ZZZZ)
+            try:
+                stop1_time = stop1[:14]
+                start2_time = start2[:14]
+
+                fmt = "%Y%m%d%H%M%S"
+                dt_stop = datetime.strptime(stop1_time, fmt)
+                dt_start = datetime.strptime(start2_time, fmt)
+
+                gap_seconds = (dt_start - dt_stop).total_seconds()
+                gap_minutes = int(gap_seconds / 60)
+
+                if gap_minutes > 5:  # More than 5 minute gap
+                    result["coverage_gaps"].append(
+                        {
+                            "channel": channel_id,
+                            "after_program": title1[:50],
+                            "before_program": title2[:50],
+                            "after_stop": stop1,
+                            "before_start": start2,
+                            "gap_minutes": gap_minutes,
+                        }
+                    )
+            except (ValueError, TypeError):
+                continue
+
+    return result
+
+
+def empty_xmltv_analysis() -> dict:
+    """Analysis result for a missing or unparseable guide."""
+    return {
+        "channels": {"total": 0, "team_based": 0, "event_based": 0},
+        "programmes": {
+            "total": 0,
+            "events": 0,
+            "pregame": 0,
+            "postgame": 0,
+            "idle": 0,
+        },
+        "date_range": {"start": None, "end": None},
+        "unreplaced_variables": [],
+        "coverage_gaps": [],
+    }
@@ -0,0 +1,269 @@
+"""Tests for the diff-based, per-league incremental team/league cache refresh."""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from teamarr.consumers.cache.refresh import CacheRefresher
+from teamarr.core import Team
+from teamarr.database.team_cache import create_team_search_index, search_teams
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        CREATE TABLE team_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_name TEXT NOT NULL,
+            team_abbrev TEXT,
+            team_short_name TEXT,
+            provider TEXT NOT NULL,
+            provider_team_id TEXT NOT NULL,
+            league TEXT NOT NULL,
+            sport TEXT NOT NULL,
+            logo_url TEXT,
+            last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(provider, provider_team_id, league)
+        );
+        CREATE TABLE league_cache (
+            league_slug TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            league_name TEXT,
+            sport TEXT NOT NULL,
+            logo_url TEXT,
+            team_count INTEGER DEFAULT 0,
+            last_refreshed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (league_slug, provider)
+        );
+        CREATE TABLE leagues (
+            league_code TEXT PRIMARY KEY,
+            display_name TEXT,
+            logo_url TEXT,
+            sport TEXT,
+            league_id TEXT,
+            provider TEXT,
+            provider_league_id TEXT,
+            cached_team_count INTEGER,
+            last_cache_refresh TEXT
+        );
+        CREATE TABLE cache_meta (
+            id INTEGER PRIMARY KEY,
+            last_full_refresh TIMESTAMP,
+            espn_last_refresh TIMESTAMP,
+            tsdb_last_refresh TIMESTAMP,
+            leagues_count INTEGER DEFAULT 0,
+            teams_count INTEGER DEFAULT 0,
+            refresh_duration_seconds REAL DEFAULT 0,
+            refresh_in_progress BOOLEAN DEFAULT 0,
+            last_error TEXT
+        );
+        INSERT INTO cache_meta (id) VALUES (1);
+        """
+    )
+    create_team_search_index(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def refresher(conn):
+    @contextmanager
+    def db():
+        yield conn
+        conn.commit()
+
+    return CacheRefresher(db)
+
+
+def _team(team_id, name, league, provider="espn", sport="hockey"):
+    return {
+        "team_name": name,
+        "team_abbrev": name[:3].upper(),
+        "team_short_name": name.split()[-1],
+        "provider": provider,
+        "provider_team_id": team_id,
+        "league": league,
+        "sport": sport,
+        "logo_url": None,
+    }
+
+
+def _league(slug, provider="espn", sport="hockey", **extra):
+    return {
+        "league_slug": slug,
+        "provider": provider,
+        "sport": sport,
+        "league_name": slug.upper(),
+        "logo_url": None,
+        "team_count": 0,
+        **extra,
+    }
+
+
+def _rows(conn):
+    return {
+        (r["league"], r["provider_team_id"]): (r["id"], r["team_name"])
+        for r in conn.execute("SELECT * FROM team_cache")
+    }
+
+
+def test_save_cache_applies_diff(conn, refresher):
+    refresher._save_cache(
+        [
+            _team("1", "Boston Bruins", "nhl"),
+            _team("2", "Montreal Canadiens", "nhl"),
+            _team("3", "Toronto Marlies", "ahl"),
+        ],
+        [_league("nhl"), _league("ahl")],
+    )
+    before = _rows(conn)
+
+    stats = refresher._save_cache(
+        [
+            _team("1", "Boston Bruins", "nhl"),  # unchanged
+            _team("2", "Montréal Canadiens", "nhl"),  # renamed
+            _team("4", "Seattle Kraken", "nhl"),  # new; team 3 league failed
+        ],
+        [_league("nhl"), _league("ahl", failed=True)],
+    )
+    after = _rows(conn)
+
+    assert stats["unchanged"] == 1
+    assert (stats["inserted"], stats["updated"], stats["deleted"]) == (1, 1, 0)
+    assert after[("nhl", "1")] == before[("nhl", "1")]
+    assert after[("nhl", "2")] == (before[("nhl", "2")][0], "Montréal Canadiens")
+    # Failed league keeps its existing rows
+    assert after[("ahl", "3")] == before[("ahl", "3")]
+    assert [t["name"] for t in search_teams(conn, "kraken")] == ["Seattle Kraken"]
+
+    stats = refresher._save_cache([_team("1", "Boston Bruins", "nhl")], [_league("nhl")])
+
+    # Vanished teams in refreshed leagues go; undiscovered leagues are
+    # dropped along with their teams
+    assert stats["deleted"] == 3
+    assert set(_rows(conn)) == {("nhl", "1")}
+    assert search_teams(conn, "kraken") == []
+    assert search_teams(conn, "marlies") == []
+    assert stats["leagues_total"] == 1
+
+
+class FakeProvider:
+    name = "espn"
+
+    def __init__(self, rosters):
+        self.rosters = rosters
+        self.fetched = []
+
+    def get_supported_leagues(self):
+        return list(self.rosters)
+
+    def get_league_teams(self, league):
+        self.fetched.append(league)
+        return [
+            Team(
+                id=tid,
+                provider="espn",
+                name=name,
+                short_name=name,
+                abbreviation="",
+                league=league,
+                sport="hockey",
+            )
+            for tid, name in self.rosters[league]
+        ]
+
+
+def test_incremental_refresh_only_fetches_stale_leagues(conn, refresher):
+    provider = FakeProvider(
+        {"nhl": [("1", "Boston Bruins")], "ahl": [("3", "Toronto Marlies")], "echl": []}
+    )
+    fresh = (datetime.utcnow() - timedelta(hours=1)).isoformat() + "Z"
+    stale = (datetime.utcnow() - timedelta(days=3)).isoformat() + "Z"
+    conn.executemany(
+        "INSERT INTO league_cache (league_slug, provider, sport, last_refreshed)"
+        " VALUES (?, 'espn', 'hockey', ?)",
+        [("nhl", fresh), ("ahl", stale)],
+    )
+
+    with (
+        patch("teamarr.providers.ProviderRegistry.get_all", return_value=[provider]),
+        patch.object(CacheRefresher, "_merge_with_seed", lambda self, t, lg: (t, lg)),
+        patch.object(CacheRefresher, "_update_cricbuzz_series_ids", return_value=0),
+        patch.object(CacheRefresher, "_refresh_soccer_team_leagues", return_value=0),
+    ):
+        result = refresher.refresh(max_league_age_days=1)
+
+    assert result["success"]
+    # echl was never cached, ahl is stale, nhl is fresh
+    assert sorted(provider.fetched) == ["ahl", "echl"]
+    assert set(_rows(conn)) == {("ahl", "3")}
+    meta = conn.execute("SELECT * FROM cache_meta").fetchone()
+    assert meta["last_full_refresh"] is None
+    assert meta["teams_count"] == 1
+    assert meta["leagues_count"] == 3
+
+
+class FakeInfoProvider(FakeProvider):
+    def __init__(self, rosters):
+        super().__init__(rosters)
+        self.info_calls = []
+
+    def get_league_info(self, league, sport_league=None):
+        self.info_calls.append((league, sport_league))
+        return {"name": league.upper(), "logo_url": f"http://{league}.png"}
+
+
+def test_league_info_uses_batched_metadata(conn, refresher):
+    provider = FakeInfoProvider({"nhl": [("1", "Boston Bruins")], "ahl": []})
+    conn.execute(
+        "INSERT INTO leagues (league_code, provider, provider_league_id)"
+        " VALUES ('nhl', 'espn', 'hockey/nhl')"
+    )
+
+    with (
+        patch("teamarr.providers.ProviderRegistry.get_all", return_value=[provider]),
+        patch.object(CacheRefresher, "_merge_with_seed", lambda self, t, lg: (t, lg)),
+        patch.object(CacheRefresher, "_update_cricbuzz_series_ids", return_value=0),
+        patch.object(CacheRefresher, "_refresh_soccer_team_leagues", return_value=0),
+        patch.object(
+            CacheRefresher, "_load_league_metadata", wraps=refresher._load_league_metadata
+        ) as load,
+    ):
+        result = refresher.refresh(max_league_age_days=1)
+
+    assert result["success"]
+    # One leagues query for the run; the sport/league path comes from it
+    assert load.call_count == 1
+    assert sorted(provider.info_calls) == [("ahl", None), ("nhl", ("hockey", "nhl"))]
+
+
+def test_soccer_slugs_share_one_client(refresher):
+    index = "https://sports.core.api.espn.com/v2/sports/soccer/leagues?limit=500"
+    slugs = {"eng.1", "esp.1", "nonfifa"}
+
+    def handler(request):
+        if str(request.url) == index:
+            return httpx.Response(
+                200, json={"items": [{"$ref": f"https://ref/{slug}"} for slug in slugs]}
+            )
+        return httpx.Response(200, json={"slug": request.url.path.strip("/")})
+
+    clients = []
+    real_client = httpx.Client
+
+    def client(**kwargs):
+        clients.append(kwargs)
+        return real_client(transport=httpx.MockTransport(handler), timeout=kwargs["timeout"])
+
+    with patch("httpx.Client", side_effect=client):
+        found = refresher._fetch_espn_soccer_league_slugs()
+
+    assert len(clients) == 1
+    assert sorted(found) == ["eng.1", "esp.1"]
@@ -0,0 +1,156 @@
+"""Tests for the per-run channel number allocator."""
+
+import sqlite3
+
+import pytest
+
+from teamarr.database.channel_numbers import (
+    MAX_CHANNEL,
+    ChannelNumberAllocator,
+    _FreeIntervals,
+    get_next_channel_number,
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        CREATE TABLE settings (
+            id INTEGER PRIMARY KEY,
+            channel_range_start INTEGER,
+            channel_range_end INTEGER,
+            channel_numbering_mode TEXT
+        );
+        CREATE TABLE event_epg_groups (
+            id INTEGER PRIMARY KEY,
+            channel_start_number INTEGER,
+            channel_assignment_mode TEXT,
+            sort_order INTEGER,
+            total_stream_count INTEGER,
+            parent_group_id INTEGER,
+            enabled INTEGER DEFAULT 1
+        );
+        CREATE TABLE managed_channels (
+            id INTEGER PRIMARY KEY,
+            event_epg_group_id INTEGER,
+            channel_number TEXT,
+            deleted_at TEXT
+        );
+        INSERT INTO settings VALUES (1, 101, NULL, 'strict_block');
+        """
+    )
+    yield conn
+    conn.close()
+
+
+def _add_group(conn, group_id, mode="auto", sort_order=0, streams=0, start=None):
+    conn.execute(
+        """INSERT INTO event_epg_groups
+           (id, channel_start_number, channel_assignment_mode, sort_order, total_stream_count)
+           VALUES (?, ?, ?, ?, ?)""",
+        (group_id, start, mode, sort_order, streams),
+    )
+
+
+def _add_channels(conn, group_id, numbers, deleted=False):
+    conn.executemany(
+        "INSERT INTO managed_channels (event_epg_group_id, channel_number, deleted_at)"
+        " VALUES (?, ?, ?)",
+        [(group_id, str(n), "x" if deleted else None) for n in numbers],
+    )
+
+
+def test_free_intervals_take_and_release_merge():
+    pool = _FreeIntervals([3, 5])
+
+    assert pool.first_free(3) == 4
+    assert pool.min_used() == 3
+    pool.take(4)
+    assert pool.first_free(3) == 6
+    pool.release(4)
+    pool.release(3)
+    pool.release(5)
+    assert pool.used_count == 0
+    assert pool.first_free(1) == 1
+    assert pool.first_free(MAX_CHANNEL) == MAX_CHANNEL
+
+
+def test_free_intervals_refcount_shared_numbers():
+    # Two channels hold 3 (a duplicate); one is deleted
+    pool = _FreeIntervals([3, 3])
+    pool.release(3)
+    assert not pool.is_free(3) and pool.used_count == 1
+    pool.take(3)
+    pool.release(3)
+    pool.release(3)
+    assert pool.is_free(3) and pool.used_count == 0
+    # Releasing a number nobody holds is a no-op
+    pool.release(3)
+    assert pool.used_count == 0
+
+
+def test_strict_block_fills_gaps_and_reuses_released(conn):
+    _add_group(conn, 1, sort_order=1, streams=16)
+    _add_group(conn, 2, sort_order=2, streams=25)
+    _add_channels(conn, 1, [101, 103])
+    _add_channels(conn, 1, [102], deleted=True)
+
+    allocator = ChannelNumberAllocator(conn)
+
+    assert allocator.allocate(1) == 102
+    assert allocator.allocate(1) == 104
+    assert allocator.allocate(2) == 121
+    allocator.release(1, "102.0")
+    assert allocator.allocate(1) == 102
+    # One-off lookups agree with a fresh allocator over the same rows
+    assert get_next_channel_number(conn, 2) == 121
+
+
+def test_block_end_stops_at_next_group(conn):
+    conn.execute("UPDATE settings SET channel_numbering_mode = 'rational_block'")
+    _add_group(conn, 1, sort_order=1)
+    _add_group(conn, 2, sort_order=2)
+
+    allocator = ChannelNumberAllocator(conn)
+
+    assert allocator.allocate(1) == 101
+    assert allocator.allocate(2) == 111
+    assert [allocator.allocate(1) for _ in range(9)] == list(range(102, 111))
+    assert allocator.allocate(1) is None
+
+
+def test_strict_compact_shares_pool_across_auto_groups(conn):
+    conn.execute("UPDATE settings SET channel_numbering_mode = 'strict_compact'")
+    _add_group(conn, 1, sort_order=1)
+    _add_group(conn, 2, sort_order=2)
+    _add_group(conn, 3, mode="manual", start=101)
+    _add_channels(conn, 1, [101, 103])
+    _add_channels(conn, 2, [103])  # Duplicate number across the shared pool
+    _add_channels(conn, 3, [102])  # Manual groups don't reserve compact numbers
+
+    allocator = ChannelNumberAllocator(conn)
+
+    assert allocator.allocate(2) == 102
+    assert allocator.allocate(1) == 104
+    allocator.release(1, 101)
+    assert allocator.allocate(2) == 101
+    assert allocator.allocate(3) == 101
+    # Group 2 still holds 103
+    allocator.release(1, 103)
+    assert allocator.allocate(1) == 105
+
+
+def test_manual_group_without_start_is_assigned_once(conn):
+    _add_group(conn, 1, mode="manual", start=101, streams=20)
+    _add_group(conn, 2, mode="manual")
+
+    allocator = ChannelNumberAllocator(conn)
+
+    assert allocator.allocate(2) == 131
+    assert allocator.allocate(2) == 132
+    row = conn.execute("SELECT channel_start_number FROM event_epg_groups WHERE id = 2").fetchone()
+    assert row["channel_start_number"] == 131
+    assert allocator.allocate(99) is None
@@ -0,0 +1,136 @@
+"""Tests and memory benchmark for the slotted core types."""
+
+import tracemalloc
+from dataclasses import MISSING, asdict, field, fields, make_dataclass, replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from teamarr.core import Event, EventStatus, Programme, Team
+from teamarr.database.provider_cache import dict_to_event, event_to_dict
+from teamarr.utilities.xmltv import programmes_to_xmltv
+
+START = datetime(2026, 3, 14, 19, 0, tzinfo=UTC)
+
+
+def _team(team_id, league, sport="hockey", cls=Team):
+    return cls(
+        id=team_id,
+        provider="espn",
+        name=f"Team {team_id}",
+        short_name=team_id,
+        abbreviation=team_id[:3].upper(),
+        # Built per call, as when parsing a provider response
+        league="".join(league),
+        sport="".join(sport),
+    )
+
+
+def _event(event_id, league, team_cls=Team, event_cls=Event, **extra):
+    return event_cls(
+        id=event_id,
+        provider="espn",
+        name=f"Game {event_id}",
+        short_name=event_id,
+        start_time=START,
+        home_team=_team(f"{event_id}h", league, cls=team_cls),
+        away_team=_team(f"{event_id}a", league, cls=team_cls),
+        status=EventStatus(state="scheduled"),
+        league="".join(league),
+        sport="".join("hockey"),
+        **extra,
+    )
+
+
+def test_slots_and_shared_empties():
+    event = _event("1", "nhl", broadcasts=[], segment_times={})
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.not_a_field = 1
+
+    assert event.broadcasts == () and event.bouts == () and event.segment_times is None
+    assert _event("2", "nhl", broadcasts=["ESPN"]).broadcasts == ["ESPN"]
+    assert event.league is _event("3", "nhl").away_team.league
+
+    programme = Programme(channel_id="".join("team.1"), title="t", start=START, stop=START)
+    assert programme.categories == () and programme.xmltv_flags is None
+    assert programme.channel_id is Programme("team.1", "t", START, START).channel_id
+
+    # Frozen slotted types still support replace()
+    team = replace(event.home_team, logo_url="logo")
+    assert team.logo_url == "logo" and team.league is event.league
+
+
+def test_round_trips_with_empty_sentinels():
+    event = _event("1", "nhl")
+    assert dict_to_event(event_to_dict(event)) == event
+    assert asdict(event)["broadcasts"] == ()
+
+    xml = programmes_to_xmltv(
+        [Programme(channel_id="team.1", title="Game", start=START, stop=START)],
+        [{"id": "team.1", "name": "Team"}],
+    )
+    assert '<title lang="en">Game</title>' in xml
+
+
+def _legacy(cls, factories):
+    """The same dataclass as before: no slots, per-instance empty containers."""
+    spec = []
+    for f in fields(cls):
+        if f.name in factories:
+            spec.append((f.name, f.type, field(default_factory=factories[f.name])))
+        elif f.default is MISSING:
+            spec.append((f.name, f.type))
+        else:
+            spec.append((f.name, f.type, field(default=f.default)))
+    return make_dataclass(cls.__name__, spec, frozen=cls.__dataclass_params__.frozen)
+
+
+LegacyTeam = _legacy(Team, {})
+LegacyEvent = _legacy(Event, {"broadcasts": list, "segment_times": dict, "bouts": list})
+LegacyProgramme = _legacy(Programme, {"categories": list, "xmltv_flags": dict, "xmltv_video": dict})
+
+
+def _measure(build):
+    tracemalloc.start()
+    objects = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, size
+
+
+@pytest.mark.benchmark
+def test_benchmark_prefetch_and_programme_memory():
+    """280 leagues x 15 days x 8 events, plus 50k programmes."""
+
+    def prefetch(team_cls, event_cls):
+        return [
+            _event(f"{lg}-{d}-{g}", f"league{lg}", team_cls, event_cls, broadcasts=[])
+            for lg in range(280)
+            for d in range(15)
+            for g in range(8)
+        ]
+
+    def programmes(cls):
+        return [
+            cls(
+                channel_id=f"team.{i % 500}",
+                title="Filler",
+                start=START + timedelta(hours=i),
+                stop=START + timedelta(hours=i + 1),
+                filler_type="idle",
+            )
+            for i in range(50_000)
+        ]
+
+    events, slotted_events = _measure(lambda: prefetch(Team, Event))
+    legacy, legacy_events = _measure(lambda: prefetch(LegacyTeam, LegacyEvent))
+    assert len(events) == len(legacy) == 33_600
+    del events, legacy
+
+    progs, slotted_progs = _measure(lambda: programmes(Programme))
+    legacy, legacy_progs = _measure(lambda: programmes(LegacyProgramme))
+    del progs, legacy
+
+    assert slotted_events < legacy_events * 0.75
+    assert slotted_progs < legacy_progs * 0.75
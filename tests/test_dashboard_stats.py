@@ -0,0 +1,251 @@
+"""Tests and benchmark for the materialized dashboard rollups."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from teamarr.database.stats import (
+    get_dashboard_stats,
+    rebuild_dashboard_rollups,
+    update_dashboard_run_rollup,
+)
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    yield conn
+    conn.close()
+
+
+def _add_team(conn, team_id, league, active=1, template_id=None):
+    conn.execute(
+        """INSERT INTO teams (id, provider_team_id, primary_league, sport, team_name, channel_id,
+                              active, template_id)
+           VALUES (?, ?, ?, 'hockey', ?, ?, ?, ?)""",
+        (team_id, str(team_id), league, f"Team {team_id}", f"team.{team_id}", active, template_id),
+    )
+
+
+def _add_group(conn, group_id, leagues, streams=0):
+    conn.execute(
+        "INSERT INTO event_epg_groups (id, name, leagues, total_stream_count) VALUES (?, ?, ?, ?)",
+        (group_id, f"Group {group_id} name", json.dumps(leagues), streams),
+    )
+
+
+def _add_channel(conn, channel_id, group_id, logo=None, deleted_at=None):
+    conn.execute(
+        """INSERT INTO managed_channels (id, event_epg_group_id, event_id, event_provider, tvg_id,
+                                         channel_name, logo_url, deleted_at)
+           VALUES (?, ?, ?, 'espn', ?, 'Channel', ?, ?)""",
+        (channel_id, group_id, str(channel_id), f"tvg.{channel_id}", logo, deleted_at),
+    )
+
+
+def _add_run(conn, matched, failed, **columns):
+    run_id = conn.execute(
+        """INSERT INTO processing_runs (run_type, started_at, status, streams_matched,
+                                        streams_unmatched, programmes_total, programmes_events,
+                                        channels_active, extra_metrics)
+           VALUES ('full_epg', CURRENT_TIMESTAMP, 'completed', ?, ?, ?, ?, ?, ?)""",
+        (
+            sum(matched.values()),
+            sum(failed.values()),
+            columns.get("programmes_total", 0),
+            columns.get("programmes_events", 0),
+            columns.get("channels_active", 0),
+            json.dumps({"teams_processed": columns.get("teams_processed", 0)}),
+        ),
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO epg_matched_streams (run_id, group_id, stream_name, event_id)"
+        " VALUES (?, ?, 's', 'e')",
+        [(run_id, gid) for gid, n in matched.items() for _ in range(n)],
+    )
+    conn.executemany(
+        "INSERT INTO epg_failed_matches (run_id, group_id, stream_name, reason)"
+        " VALUES (?, ?, 's', 'no_event_found')",
+        [(run_id, gid) for gid, n in failed.items() for _ in range(n)],
+    )
+    return run_id
+
+
+def _rollups(conn):
+    return (
+        [tuple(r) for r in conn.execute("SELECT * FROM dashboard_team_rollup ORDER BY league")],
+        [tuple(r) for r in conn.execute("SELECT * FROM dashboard_channel_rollup ORDER BY 1")],
+    )
+
+
+def test_triggers_keep_rollups_in_step(conn):
+    _add_team(conn, 1, "nhl")
+    _add_team(conn, 2, "nhl", active=0, template_id=None)
+    _add_team(conn, 3, "nba", template_id=1)
+    _add_group(conn, 1, ["nhl"])
+    _add_group(conn, 2, ["nba", "nhl"])
+    _add_channel(conn, 1, 1, logo="http://logo")
+    _add_channel(conn, 2, 1)
+    _add_channel(conn, 3, 2, deleted_at="2020-01-01 00:00:00")
+
+    conn.execute("UPDATE teams SET primary_league = 'nba', active = 1 WHERE id = 2")
+    conn.execute("UPDATE teams SET template_id = NULL WHERE id = 3")
+    conn.execute("DELETE FROM teams WHERE id = 1")
+    conn.execute("UPDATE managed_channels SET deleted_at = datetime('now') WHERE id = 1")
+    conn.execute("UPDATE managed_channels SET deleted_at = NULL, logo_url = 'x' WHERE id = 3")
+    conn.execute("UPDATE managed_channels SET event_epg_group_id = 2 WHERE id = 2")
+    conn.execute("DELETE FROM managed_channels WHERE id = 3")
+    _add_channel(conn, 4, 1, logo="http://logo")
+
+    incremental = _rollups(conn)
+    rebuild_dashboard_rollups(conn)
+    rebuilt = _rollups(conn)
+    # Zeroed rows may linger incrementally; they are filtered on read
+    assert [r for r in incremental[0] if r[1]] == rebuilt[0]
+    assert [r for r in incremental[1] if r[1]] == rebuilt[1]
+
+    stats = get_dashboard_stats(conn)
+    assert stats["teams"] == {
+        "total": 2,
+        "active": 2,
+        "assigned": 0,
+        "leagues": [{"league": "nba", "logo_url": None, "count": 2}],
+    }
+    assert stats["channels"] == {
+        "active": 2,
+        "with_logos": 1,
+        "groups": 2,
+        "deleted_24h": 1,
+        "group_breakdown": [
+            {"id": 1, "name": "Group 1 name", "count": 1},
+            {"id": 2, "name": "Group 2 name", "count": 1},
+        ],
+    }
+    assert [lg["league"] for lg in stats["event_groups"]["leagues"]] == ["nba", "nhl"]
+
+
+def test_logo_count_excludes_deleted_channels(conn):
+    # The Logos tile sits next to Active, so it counts the same channels.
+    # The pre-rollup query also counted soft-deleted rows with a logo.
+    _add_group(conn, 1, ["nhl"])
+    _add_channel(conn, 1, 1, logo="http://logo")
+    _add_channel(conn, 2, 1, logo="http://logo", deleted_at="2020-01-01 00:00:00")
+    _add_channel(conn, 3, 1, deleted_at="2020-01-01 00:00:00")
+
+    channels = get_dashboard_stats(conn)["channels"]
+
+    assert (channels["active"], channels["with_logos"]) == (1, 1)
+
+
+def test_run_summary_is_written_once_and_read_back(conn):
+    _add_group(conn, 1, ["nhl"], streams=10)
+    _add_group(conn, 2, ["nba"], streams=5)
+
+    stats = get_dashboard_stats(conn)
+    assert stats["event_groups"]["groups"] == [
+        {"name": "Group 1 name", "matched": 0, "total": 10},
+        {"name": "Group 2 name", "matched": 0, "total": 5},
+    ]
+
+    # No stored summary yet: computed from history, but reads never store it
+    _add_run(conn, {1: 1}, {1: 1})
+    assert get_dashboard_stats(conn)["event_groups"]["streams_matched"] == 1
+    assert conn.execute("SELECT COUNT(*) FROM dashboard_run_rollup").fetchone()[0] == 0
+
+    run_id = _add_run(
+        conn,
+        {1: 6},
+        {1: 2, 2: 4},
+        programmes_total=50,
+        programmes_events=20,
+        channels_active=6,
+        teams_processed=2,
+    )
+    update_dashboard_run_rollup(conn, run_id)
+    # History rows are no longer read once the summary exists
+    conn.execute("DELETE FROM epg_matched_streams")
+
+    stats = get_dashboard_stats(conn)
+    assert stats["event_groups"]["streams_matched"] == 6
+    assert stats["event_groups"]["match_percent"] == 50
+    assert stats["event_groups"]["groups"] == [
+        {"name": "Group 1 name", "matched": 6, "total": 8},
+        {"name": "Group 2 name", "matched": 0, "total": 4},
+    ]
+    assert stats["epg"]["channels_total"] == 8
+    assert stats["epg"]["events_team"] == 5
+    assert stats["epg"]["events_event"] == 15
+
+    # Summary of a deleted run is ignored
+    conn.execute("DELETE FROM processing_runs")
+    assert get_dashboard_stats(conn)["event_groups"]["streams_matched"] == 0
+
+
+def _legacy_dashboard_queries(conn):
+    """The aggregates the dashboard used to run on every poll."""
+    conn.execute("""SELECT COUNT(*), SUM(CASE WHEN active = 1 THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN template_id IS NOT NULL THEN 1 ELSE 0 END)
+                    FROM teams""").fetchone()
+    conn.execute("SELECT primary_league, COUNT(*) FROM teams GROUP BY primary_league").fetchall()
+    for g in conn.execute("SELECT leagues FROM event_epg_groups WHERE enabled = 1"):
+        json.loads(g["leagues"])
+    run = conn.execute("""SELECT id FROM processing_runs
+                          WHERE status = 'completed' AND run_type = 'full_epg'
+                          ORDER BY id DESC LIMIT 1""").fetchone()
+    for table in ("epg_matched_streams", "epg_failed_matches"):
+        conn.execute(
+            f"SELECT group_id, COUNT(*) FROM {table} WHERE run_id = ? GROUP BY group_id",
+            (run["id"],),
+        ).fetchall()
+    conn.execute("""SELECT COUNT(*), SUM(CASE WHEN deleted_at IS NULL THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN logo_url IS NOT NULL AND logo_url != ''
+                               THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN deleted_at IS NOT NULL
+                               AND deleted_at > datetime('now', '-1 day') THEN 1 ELSE 0 END)
+                    FROM managed_channels""").fetchone()
+    conn.execute("""SELECT mc.event_epg_group_id, eg.name, COUNT(*)
+                    FROM managed_channels mc
+                    LEFT JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
+                    WHERE mc.deleted_at IS NULL GROUP BY mc.event_epg_group_id""").fetchall()
+
+
+@pytest.mark.benchmark
+def test_benchmark_dashboard_with_history(conn):
+    """Months of history: 50k channels (mostly deleted), 2k teams, 12k-stream latest run."""
+    for gid in range(1, 21):
+        _add_group(conn, gid, ["nhl", "nba", f"league{gid}"], streams=600)
+    for tid in range(2000):
+        _add_team(conn, tid + 1, f"league{tid % 40}")
+    conn.executemany(
+        """INSERT INTO managed_channels (event_epg_group_id, event_id, event_provider, tvg_id,
+                                         channel_name, logo_url, deleted_at)
+           VALUES (?, ?, 'espn', 'tvg', 'Channel', 'logo', ?)""",
+        [
+            (i % 20 + 1, str(i), None if i % 25 == 0 else "2025-01-01 00:00:00")
+            for i in range(50_000)
+        ],
+    )
+    for _ in range(3):
+        run_id = _add_run(conn, {g: 500 for g in range(1, 21)}, {g: 100 for g in range(1, 21)})
+    update_dashboard_run_rollup(conn, run_id)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        _legacy_dashboard_queries(conn)
+    legacy = (time.perf_counter() - start) / 20
+
+    start = time.perf_counter()
+    for _ in range(20):
+        stats = get_dashboard_stats(conn)
+    rollup = (time.perf_counter() - start) / 20
+
+    assert stats["channels"]["active"] == 2000
+    assert stats["event_groups"]["streams_matched"] == 10_000
+    assert rollup < legacy
@@ -0,0 +1,136 @@
+"""Tests and benchmark for prefiltered detection keyword matching."""
+
+import itertools
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+
+from teamarr.services.detection_keywords import DetectionKeywordService, _PatternSet
+
+NAMES = [
+    "NFL: Kansas City Chiefs vs Buffalo Bills 8:20 PM ET",
+    "UFC 310: Main Card - Pantoja vs Asakura",
+    "UFC 310 Early Prelims",
+    "Premier League | Arsenal v Chelsea 15:00 GMT",
+    "NHL - Rangers @ Devils",
+    "ESPN+ 04: No Event Scheduled",
+    "Boxing: Weigh-In Live",
+    "NCAAB: Duke at North Carolina",
+    "PPV 12 - Coming Soon",
+    "Bundesliga: Bayern München x Dortmund",
+    "MLB Spring Training: Yankees vs Red Sox",
+    "Dallas Cowboys vs Philadelphia Eagles",
+    "Bellator 300 Prelims",
+    "WNBA: Aces vs Liberty",
+    "Liga MX | América vs Chivas",
+    "Formula 1 Grand Prix Qualifying",
+    "Golf: The Masters Round 1",
+    "Copa Libertadores - Flamengo v River Plate",
+]
+
+
+@pytest.fixture(autouse=True)
+def builtin_keywords_only():
+    with patch("teamarr.services.detection_keywords._load_user_keywords", return_value=[]):
+        DetectionKeywordService.invalidate_cache()
+        yield
+    DetectionKeywordService.invalidate_cache()
+
+
+def _reference_first(entries, text):
+    for entry in entries:
+        pattern, value = entry if isinstance(entry, tuple) else (entry, True)
+        if pattern.search(text):
+            return value
+    return None
+
+
+def _reference_classify(text):
+    svc = DetectionKeywordService
+    event_type = None
+    for et, patterns in svc._get_event_type_patterns().items():
+        if et != "TEAM_VS_TEAM" and any(p.search(text) for p in patterns):
+            event_type = et
+            break
+    return (
+        event_type,
+        _reference_first(svc.get_league_hints(), text),
+        _reference_first(svc.get_sport_hints(), text),
+        bool(_reference_first(svc.get_placeholder_patterns(), text)),
+        _reference_first(svc.get_card_segment_patterns(), text),
+        bool(_reference_first(svc.get_exclusion_patterns(), text)),
+    )
+
+
+def _classify(text):
+    svc = DetectionKeywordService
+    return (
+        svc.detect_event_type(text),
+        svc.detect_league(text),
+        svc.detect_sport(text),
+        svc.is_placeholder(text),
+        svc.detect_card_segment(text),
+        svc.is_excluded(text),
+    )
+
+
+def test_combined_matching_matches_per_pattern_order():
+    for name in NAMES:
+        assert _classify(name) == _reference_classify(name), name
+
+
+def test_priority_wins_over_leftmost_match():
+    patterns = [re.compile(p, re.IGNORECASE) for p in ("late", "early", "x")]
+    pattern_set = _PatternSet(patterns)
+
+    assert pattern_set.first_match("x early then late") == 0
+    assert pattern_set.first_match("x early") == 1
+    assert pattern_set.first_match("nothing") is None
+    assert pattern_set.search_any("an X")
+
+
+def test_prefilter_literals_and_non_ascii_fallback():
+    hint = re.compile(r"\bg[\s-]?league[:\s-]", re.IGNORECASE)
+    pattern_set = _PatternSet([hint])
+
+    assert pattern_set._screened[0][2] == "league"
+    assert _PatternSet([re.compile("a|b")])._screened[0][2] is None
+    # Long s matches "s" under IGNORECASE but str.lower() leaves it alone
+    assert _PatternSet([re.compile("us", re.IGNORECASE)]).search_any("U\u017f")
+    assert pattern_set.first_match("G League: Skyhawks") == 0
+
+
+def test_prefilter_disabled_without_regex_parser_internals():
+    with patch("teamarr.services.detection_keywords._sre_parser", None):
+        pattern_set = _PatternSet([re.compile("late"), re.compile("early")])
+    assert [screened[2] for screened in pattern_set._screened] == [None, None]
+    assert pattern_set.first_match("early") == 1
+
+    with patch("teamarr.services.detection_keywords._sre_constants", object()):
+        assert _PatternSet([re.compile("late")])._screened[0][2] is None
+
+
+@pytest.mark.benchmark
+def test_benchmark_classify_50k_streams():
+    """Classify 50k stream names with the default keyword set.
+
+    The per-pattern reference runs on a 5k slice (it is ~4x slower) and is
+    scaled up for the comparison.
+    """
+    names = list(itertools.islice(itertools.cycle(NAMES), 50_000))
+    # Distinct strings, as in a real M3U, so nothing is served from caches
+    names = [f"{name} [{i}]" for i, name in enumerate(names)]
+    sample = names[:5_000]
+
+    start = time.perf_counter()
+    expected = [_reference_classify(n) for n in sample]
+    reference = (time.perf_counter() - start) * len(names) / len(sample)
+
+    start = time.perf_counter()
+    actual = [_classify(n) for n in names]
+    screened = time.perf_counter() - start
+
+    assert actual[: len(sample)] == expected
+    assert screened < reference
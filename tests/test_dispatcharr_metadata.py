@@ -0,0 +1,126 @@
+"""Tests for the stale-while-revalidate Dispatcharr metadata cache."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from teamarr.dispatcharr.managers.metadata import CHANNEL_GROUPS, MetadataCache, MetadataManager
+from teamarr.dispatcharr.types import DispatcharrChannelGroup, DispatcharrM3UAccount
+
+
+class Loader:
+    def __init__(self, *results, delay=0.0):
+        self.results = list(results)
+        self.delay = delay
+        self.calls = 0
+        self.done = threading.Event()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        self.calls += 1
+        value = self.results[min(self.calls, len(self.results)) - 1]
+        self.done.set()
+        return value
+
+
+def _age(cache, kind, seconds):
+    value, fetched_at = cache._entries[kind]
+    cache._entries[kind] = (value, fetched_at - seconds)
+
+
+def test_fresh_stale_and_expired():
+    cache = MetadataCache(ttl_seconds=60, max_stale_seconds=600)
+    loader = Loader(["a"], ["b"], ["c"])
+
+    assert cache.get("groups", loader) == ["a"]
+    assert cache.get("groups", loader) == ["a"]
+    assert loader.calls == 1
+
+    # Stale: old value served immediately, refreshed in the background
+    _age(cache, "groups", 120)
+    loader.done.clear()
+    assert cache.get("groups", loader) == ["a"]
+    assert loader.done.wait(2)
+    for _ in range(100):
+        if cache._entries["groups"][0] == ["b"]:
+            break
+        time.sleep(0.01)
+    assert cache.get("groups", loader) == ["b"]
+
+    # Too old to serve: fetched synchronously
+    _age(cache, "groups", 1000)
+    assert cache.get("groups", loader) == ["c"]
+    assert loader.calls == 3
+
+
+def test_empty_results_not_cached():
+    cache = MetadataCache()
+    loader = Loader([], ["a"])
+    assert cache.get("groups", loader) == []
+    assert cache.get("groups", loader) == ["a"]
+    assert loader.calls == 2
+
+
+def test_invalidate_discards_in_flight_refresh():
+    cache = MetadataCache(ttl_seconds=60, max_stale_seconds=600)
+    cache.get("groups", Loader(["old"]))
+    _age(cache, "groups", 120)
+
+    slow = Loader(["before-create"], delay=0.2)
+    assert cache.get("groups", slow) == ["old"]
+    cache.invalidate("groups")
+    assert slow.done.wait(2)
+    time.sleep(0.05)
+
+    assert "groups" not in cache._entries
+    assert cache.get("groups", Loader(["after-create"])) == ["after-create"]
+
+
+class FakeM3U:
+    def __init__(self):
+        self.calls = 0
+
+    def list_accounts(self, include_custom=False):
+        self.calls += 1
+        return [
+            DispatcharrM3UAccount(id=1, name="Provider"),
+            DispatcharrM3UAccount(id=2, name="custom"),
+        ]
+
+    def list_groups(self):
+        self.calls += 1
+        return [
+            DispatcharrChannelGroup(id=1, name="Sports"),
+            DispatcharrChannelGroup(id=2, name="M3U group", m3u_accounts=(1,)),
+        ]
+
+
+def test_manager_filters_cached_lists():
+    m3u = FakeM3U()
+    metadata = MetadataManager(m3u, channels=None)
+
+    assert [a.name for a in metadata.list_accounts()] == ["Provider"]
+    assert [a.name for a in metadata.list_accounts(include_custom=True)] == ["Provider", "custom"]
+    assert [g.id for g in metadata.list_groups(exclude_m3u=True)] == [1]
+    assert [g.id for g in metadata.list_groups()] == [1, 2]
+    assert m3u.calls == 2
+
+    metadata.invalidate(CHANNEL_GROUPS)
+    metadata.list_groups()
+    metadata.list_accounts()
+    assert m3u.calls == 3
+
+
+def test_m3u_accounts_route_reads_live_status(monkeypatch):
+    from teamarr.api.routes import dispatcharr as dispatcharr_routes
+
+    live = DispatcharrM3UAccount(id=1, name="Provider", status="success")
+    m3u = SimpleNamespace(list_accounts=lambda include_custom=False: [live])
+    # Cached copy still has the pre-refresh status
+    conn = SimpleNamespace(m3u=m3u, metadata=MetadataManager(FakeM3U(), channels=None))
+    conn.metadata.list_accounts()
+    monkeypatch.setattr(dispatcharr_routes, "get_dispatcharr_connection", lambda **kw: conn)
+
+    accounts = dispatcharr_routes.list_m3u_accounts()
+
+    assert [(a["id"], a["status"]) for a in accounts] == [(1, "success")]
@@ -0,0 +1,227 @@
+"""Tests for the Dispatcharr write pipeline used by the channel lifecycle service.
+
+Covers coalescing of per-channel PATCHes, profile batching, the pending view
+used for comparisons before a flush, stats reporting, and failed writes.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from teamarr.consumers.lifecycle.service import ChannelLifecycleService
+from teamarr.consumers.lifecycle.write_pipeline import (
+    DispatcharrWritePipeline,
+    WriteFailure,
+    WritePipelineStats,
+)
+from teamarr.database.channels import create_managed_channel, get_managed_channel
+from teamarr.dispatcharr.types import DispatcharrChannel, OperationResult
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+def _manager() -> MagicMock:
+    manager = MagicMock()
+    manager.update_channel.return_value = OperationResult(success=True)
+    manager.bulk_update_profile_channels.return_value = OperationResult(success=True)
+    return manager
+
+
+class TestCoalescing:
+    def test_updates_to_same_channel_merge_into_one_patch(self):
+        manager = _manager()
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_update(42, {"name": "Old"})
+        pipeline.queue_update(42, {"logo_id": 7})
+        pipeline.queue_update(42, {"name": "New"})
+        pipeline.queue_update(43, {"streams": [1, 2]})
+        pipeline.flush()
+
+        calls = {c.args[0]: c.args[1] for c in manager.update_channel.call_args_list}
+        assert calls == {42: {"name": "New", "logo_id": 7}, 43: {"streams": [1, 2]}}
+        assert pipeline.stats.queued == 4
+        assert pipeline.stats.coalesced == 2
+        assert pipeline.stats.channel_patches == 2
+        assert pipeline.stats.max_queue_depth == 2
+        assert pipeline.queue_depth == 0
+
+    def test_discard_drops_pending_writes(self):
+        manager = _manager()
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_update(42, {"name": "Gone"})
+        pipeline.queue_profile_change(3, 42, "add")
+        pipeline.discard(42)
+        pipeline.flush()
+
+        manager.update_channel.assert_not_called()
+        manager.bulk_update_profile_channels.assert_not_called()
+
+    def test_concurrent_patches_are_bounded(self):
+        manager = _manager()
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        gate = threading.Event()
+
+        def slow_update(channel_id, data):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            gate.wait(0.01)
+            with lock:
+                active -= 1
+            return OperationResult(success=True)
+
+        manager.update_channel.side_effect = slow_update
+        pipeline = DispatcharrWritePipeline(manager, max_workers=3)
+        for channel_id in range(1, 21):
+            pipeline.queue_update(channel_id, {"channel_number": channel_id})
+        pipeline.flush()
+
+        assert manager.update_channel.call_count == 20
+        assert peak <= 3
+
+
+class TestProfiles:
+    def test_profile_changes_batched_per_profile(self):
+        manager = _manager()
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_profile_change(3, 10, "add")
+        pipeline.queue_profile_change(3, 11, "add")
+        pipeline.queue_profile_change(3, 12, "remove")
+        pipeline.queue_profile_change(4, 10, "remove")
+        pipeline.flush()
+
+        assert manager.bulk_update_profile_channels.call_count == 2
+        first = manager.bulk_update_profile_channels.call_args_list[0].kwargs
+        assert first == {
+            "profile_id": 3,
+            "add_channel_ids": [10, 11],
+            "remove_channel_ids": [12],
+        }
+
+    def test_later_action_cancels_opposite(self):
+        manager = _manager()
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_profile_change(3, 10, "remove")
+        pipeline.queue_profile_change(3, 10, "add")
+        pipeline.flush()
+
+        kwargs = manager.bulk_update_profile_channels.call_args.kwargs
+        assert kwargs["add_channel_ids"] == [10]
+        assert kwargs["remove_channel_ids"] is None
+
+
+class TestPendingView:
+    def test_pending_view_applies_queued_fields(self):
+        pipeline = DispatcharrWritePipeline(_manager())
+        channel = DispatcharrChannel(
+            id=42, uuid="u", name="Old", channel_number="5001", streams=(1,)
+        )
+
+        pipeline.queue_update(42, {"streams": [1, 2], "channel_number": 5002})
+        view = pipeline.pending_view(channel)
+
+        assert view.streams == (1, 2)
+        assert view.channel_number == "5002"
+        assert view.name == "Old"
+        assert pipeline.pending_view(None) is None
+
+
+class TestStats:
+    def test_failed_patch_counted(self):
+        manager = _manager()
+        manager.update_channel.return_value = OperationResult(success=False, error="boom")
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_update(1, {"name": "x"})
+        failures = pipeline.flush()
+        stats = pipeline.stats
+
+        assert failures == [WriteFailure((1,), "boom")]
+        assert stats.failed == 1
+        assert stats.latency_count == 1
+        assert stats.to_dict()["latency_ms"]["buckets"]["+Inf"] == 1
+
+    def test_merge_accumulates(self):
+        a = WritePipelineStats(queued=2, coalesced=1, max_queue_depth=3)
+        a.observe_latency(30)
+        b = WritePipelineStats(queued=5, max_queue_depth=1)
+        b.observe_latency(700)
+
+        a.merge(b)
+
+        assert a.queued == 7
+        assert a.max_queue_depth == 3
+        assert a.latency_buckets["50"] == 1
+        assert a.latency_buckets["1000"] == 2
+        assert a.latency_count == 2
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("INSERT INTO event_epg_groups (id, name, leagues) VALUES (1, 'G', '[]')")
+    channel_id = create_managed_channel(
+        conn, 1, "401", "espn", "teamarr-event-401", "A @ B", dispatcharr_channel_id=42
+    )
+
+    @contextmanager
+    def factory():
+        yield conn
+
+    factory.conn = conn
+    factory.channel_id = channel_id
+    yield factory
+    conn.close()
+
+
+class TestFailures:
+    def test_failed_profile_batch_reported(self):
+        manager = _manager()
+        manager.bulk_update_profile_channels.return_value = OperationResult(
+            success=False, error="denied"
+        )
+        pipeline = DispatcharrWritePipeline(manager)
+
+        pipeline.queue_profile_change(3, 11, "add")
+        pipeline.queue_profile_change(3, 10, "remove")
+
+        assert pipeline.flush() == [WriteFailure((11, 10), "denied", profile_id=3)]
+        assert pipeline.flush() == []
+
+    def test_failed_patch_marks_channel_drifted(self, db):
+        manager = _manager()
+        manager.update_channel.side_effect = RuntimeError("timeout")
+        service = ChannelLifecycleService(db, sports_service=object(), channel_manager=manager)
+
+        service._queue_channel_update(42, {"name": "B @ A"})
+        errors = service.flush_pending_writes(db.conn)
+
+        assert errors == [{"channel_id": 42, "error": "Dispatcharr update failed: timeout"}]
+        channel = get_managed_channel(db.conn, db.channel_id)
+        assert channel.sync_status == "drifted"
+        assert channel.sync_message == "Dispatcharr update failed: timeout"
+
+    def test_drifted_channel_resends_profiles(self, db):
+        service = ChannelLifecycleService(db, sports_service=object(), channel_manager=_manager())
+        db.conn.execute("UPDATE managed_channels SET channel_profile_ids = '[3]'")
+        existing = get_managed_channel(db.conn, db.channel_id)
+        group_config = {"channel_profile_ids": [3]}
+
+        service._sync_channel_profiles(db.conn, existing, group_config, None, None, [])
+        assert service._write_pipeline._pending_profiles == {}
+
+        service._sync_channel_profiles(db.conn, existing, group_config, None, None, [], True)
+        assert service._write_pipeline._pending_profiles == {3: {"add": {42}, "remove": set()}}
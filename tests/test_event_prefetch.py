@@ -0,0 +1,131 @@
+"""Tests for the run-wide event prefetch planner and its event store."""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from teamarr.consumers.event_group_processor import EventGroupProcessor
+from teamarr.consumers.matching import MATCH_WINDOW_DAYS, EventPrefetchPlanner, EventStore
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+TODAY = date(2026, 1, 10)
+
+
+class FakeService:
+    """Minimal SportsDataService stand-in recording get_events calls."""
+
+    def __init__(self, providers: dict[str, str], delay: float = 0.0):
+        self._providers = providers
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.calls: list[tuple[str, date, bool]] = []
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def get_provider_name(self, league):
+        return self._providers.get(league)
+
+    def get_events(self, league, target_date, cache_only=False):
+        provider = self._providers.get(league)
+        with self._lock:
+            self.calls.append((league, target_date, cache_only))
+            self.active[provider] = self.active.get(provider, 0) + 1
+            self.peak[provider] = max(self.peak.get(provider, 0), self.active[provider])
+        threading.Event().wait(self._delay)
+        with self._lock:
+            self.active[provider] -= 1
+        return [] if cache_only else [f"{league}@{target_date}"]
+
+
+def test_union_fetches_each_league_day_once_and_api_wins():
+    service = FakeService({"nfl": "espn", "nba": "espn", "eng.1": "tsdb"})
+    planner = EventPrefetchPlanner(service)
+
+    # Group A includes nfl, group B includes nba; both search all leagues
+    planner.add_match_window(["nfl", "nba", "eng.1"], ["nfl"], TODAY, days_ahead=1)
+    planner.add_match_window(["nfl", "nba", "eng.1"], ["nba"], TODAY, days_ahead=1)
+    store = planner.execute()
+
+    per_league = MATCH_WINDOW_DAYS + 2
+    assert len(service.calls) == 3 * per_league
+    api_calls = {(lg, d) for lg, d, cache_only in service.calls if not cache_only}
+    assert api_calls == {(lg, TODAY + timedelta(days=o)) for lg in ("nfl", "nba") for o in (0, 1)}
+
+    assert store.lookup("nfl", TODAY, cache_only=False) == [f"nfl@{TODAY}"]
+    # TSDB is cache-only: an empty result satisfies cache-only callers only
+    assert store.lookup("eng.1", TODAY, cache_only=True) == []
+    assert store.lookup("eng.1", TODAY, cache_only=False) is None
+    assert store.lookup("nhl", TODAY, cache_only=True) is None
+
+
+def test_concurrency_is_capped_per_provider():
+    service = FakeService({f"e{i}": "espn" for i in range(10)} | {"t0": "tsdb"}, delay=0.01)
+    planner = EventPrefetchPlanner(service)
+    planner.add_fetch_window([f"e{i}" for i in range(10)], [TODAY, TODAY + timedelta(days=1)])
+    planner.add_fetch_window(["t0"], [TODAY + timedelta(days=o) for o in range(6)])
+
+    with patch.dict(
+        "teamarr.consumers.matching.prefetch.PROVIDER_MAX_WORKERS", {"espn": 3, "tsdb": 1}
+    ):
+        store = planner.execute()
+
+    assert service.peak["espn"] <= 3
+    assert service.peak["tsdb"] == 1
+    assert len(store) == 26
+
+
+def test_store_is_read_only():
+    store = EventStore({TODAY: {"nfl": (("game",), False)}})
+
+    events = store.lookup("nfl", TODAY, cache_only=False)
+    events.append("mutated")
+
+    assert store.lookup("nfl", TODAY, cache_only=False) == ["game"]
+    assert store.events_on(TODAY) == {"nfl": ("game",)}
+
+
+def test_process_all_groups_prefetches_outside_connection_and_resets_store():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("INSERT INTO event_epg_groups (id, name, leagues) VALUES (1, 'NHL', '[\"nhl\"]')")
+    open_connections = []
+
+    @contextmanager
+    def db():
+        open_connections.append(conn)
+        try:
+            yield conn
+        finally:
+            open_connections.pop()
+
+    processor = EventGroupProcessor(db_factory=db, service=object())
+    store = EventStore({})
+    seen = {}
+
+    class Planner:
+        def __len__(self):
+            return 0
+
+        def execute(self, status_callback=None):
+            seen["open_during_fetch"] = len(open_connections)
+            return store
+
+    def fail(conn, group, target_date, **kwargs):
+        seen["store"] = processor._event_store
+        raise RuntimeError("group failed")
+
+    processor._plan_event_prefetch = lambda conn, groups, target_date: Planner()
+    processor._process_group_internal = fail
+
+    with pytest.raises(RuntimeError):
+        processor.process_all_groups(TODAY, run_enforcement=False)
+
+    assert seen == {"open_during_fetch": 0, "store": store}
+    assert processor._event_store is None
+    conn.close()
@@ -0,0 +1,125 @@
+"""Tests and benchmark for the cached-event search index."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from teamarr.services.event_search import EventSearchIndex
+from teamarr.utilities.cache import TTLCache
+
+DAY = date(2026, 3, 14)
+
+
+def _team(name, abbrev, short=None):
+    return {"name": name, "short_name": short, "abbreviation": abbrev}
+
+
+def _event(event_id, league, home, away, start="2026-03-14T19:00:00+00:00", state="scheduled"):
+    return {
+        "id": event_id,
+        "name": f"{away['name']} at {home['name']}",
+        "league": league,
+        "start_time": start,
+        "home_team": home,
+        "away_team": away,
+        "status": {"state": state},
+    }
+
+
+BRUINS = _team("Boston Bruins", "BOS", "Bruins")
+CELTICS = _team("Boston Celtics", "BOS", "Celtics")
+HABS = _team("Montréal Canadiens", "MTL", "Canadiens")
+KNICKS = _team("New York Knicks", "NY", "Knicks")
+BAYERN = _team("Bayern München", "FCB", "Bayern")
+BVB = _team("Borussia Dortmund", "BVB", "Dortmund")
+
+
+def _cache():
+    cache = TTLCache(max_size=0)
+    cache.set(f"events:nhl:{DAY}", [_event("1", "nhl", BRUINS, HABS)])
+    cache.set(
+        f"events:nba:{DAY}", [_event("2", "nba", CELTICS, KNICKS, "2026-03-14T23:30:00+00:00")]
+    )
+    cache.set(
+        f"events:ger.1:{DAY}", [_event("3", "ger.1", BAYERN, BVB, "2026-03-14T14:30:00+00:00")]
+    )
+    cache.set("team:nhl:1", {"name": "not an event list"})
+    return cache
+
+
+def _ids(results):
+    return [r.event_id for r in results]
+
+
+def test_search_ranks_across_leagues():
+    index = EventSearchIndex()
+    index.sync(_cache())
+
+    assert index.size == 3
+    # Exact abbreviation for both Boston teams, then by start time
+    assert _ids(index.search("celtics", DAY)) == ["2"]
+    assert _ids(index.search("bos", DAY)) == ["1", "2"]
+    assert _ids(index.search("Boston Bruins", DAY)) == ["1"]
+    assert _ids(index.search("munchen", DAY)) == ["3"]
+    assert _ids(index.search("canad", DAY)) == ["1"]
+    assert _ids(index.search("bos", DAY, league="nba")) == ["2"]
+    assert index.search("bos", DAY + timedelta(days=1)) == []
+    assert index.search("lakers", DAY) == []
+    # No team: everything on the date, by league then start time
+    assert _ids(index.search(None, DAY)) == ["3", "2", "1"]
+
+    result = index.search("mtl", DAY)
+    assert result[0].home_team == "Boston Bruins"
+    assert result[0].away_team == "Montréal Canadiens"
+    assert result[0].status == "scheduled"
+
+
+def test_sync_is_incremental_and_tracks_removals():
+    cache = _cache()
+    index = EventSearchIndex()
+    index.sync(cache)
+
+    # Replaced scoreboard: new status, and the old event is superseded
+    cache.set(f"events:nhl:{DAY}", [_event("1", "nhl", BRUINS, HABS, state="in")])
+    cache.delete(f"events:nba:{DAY}")
+    # Schedules are listed under the event's own date
+    cache.set("schedule:nba:2", [_event("9", "nba", CELTICS, KNICKS, "2026-03-20T23:30:00+00:00")])
+    index.sync(cache)
+
+    assert index.search("bruins", DAY)[0].status == "in"
+    assert _ids(index.search("celtics")) == ["9"]
+    assert index.size == 3
+
+    cache.clear()
+    index.sync(cache)
+    assert index.size == 0
+    assert index.search("bos") == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_search_all_cached_leagues():
+    """~31k cached events (280 leagues x 14 days x 8 games)."""
+    cache = TTLCache(max_size=0)
+    for lg in range(280):
+        for d in range(14):
+            day = DAY + timedelta(days=d)
+            cache.set(
+                f"events:league{lg}:{day}",
+                [
+                    _event(
+                        f"{lg}-{d}-{g}",
+                        f"league{lg}",
+                        _team(f"Home City {lg} Team {g}", f"H{g}"),
+                        _team(f"Away Town {lg} Club {g}", f"A{g}"),
+                        f"{day}T19:00:00+00:00",
+                    )
+                    for g in range(8)
+                ],
+            )
+    index = EventSearchIndex()
+    index.sync(cache)
+
+    results = index.search("away town 137 club", DAY + timedelta(days=3))
+
+    assert index.size == 280 * 14 * 8
+    assert len(results) == 8
@@ -0,0 +1,112 @@
+"""Tests and benchmark for the per-day event lookups used by filler generation."""
+
+import random
+import time
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from teamarr.consumers.filler.generator import _EventSchedule
+from teamarr.core import Event, EventStatus, Team
+from teamarr.utilities.tz import to_user_tz
+
+SEASON_START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _schedule(n_games: int, seed: int) -> list[Event]:
+    rng = random.Random(seed)
+    team = Team(
+        id="1", provider="espn", name="Home", short_name="H", abbreviation="H",
+        league="nhl", sport="hockey",
+    )  # fmt: skip
+    events = []
+    for i in range(n_games):
+        # Every ~2 days at any hour, with occasional doubleheaders
+        start = SEASON_START + timedelta(hours=rng.randrange(0, 24 * 2 * n_games))
+        events.append(
+            Event(
+                id=str(i),
+                provider="espn",
+                name=f"Game {i}",
+                short_name=str(i),
+                start_time=start,
+                home_team=team,
+                away_team=team,
+                status=EventStatus(state="scheduled"),
+                league="nhl",
+                sport="hockey",
+            )
+        )
+    return sorted(events, key=lambda e: e.start_time)
+
+
+def _legacy_lookups(events, day, day_start):
+    """The per-day list comprehensions the generator used before."""
+
+    def event_date(e):
+        return to_user_tz(e.start_time).date()
+
+    day_events = [e for e in events if event_date(e) == day]
+    prev_day_events = [e for e in events if event_date(e) == day - timedelta(days=1)]
+    future_events = [e for e in events if event_date(e) > day]
+    past_events = [e for e in events if e.start_time < day_start]
+    return (
+        day_events,
+        prev_day_events[-1] if prev_day_events else None,
+        future_events[0] if future_events else None,
+        past_events[-1] if past_events else None,
+    )
+
+
+def _lookups(schedule, day, day_start):
+    return (
+        schedule.on(day),
+        schedule.last_on(day - timedelta(days=1)),
+        schedule.first_after(day),
+        schedule.last_before(day_start),
+    )
+
+
+def _day_start(day):
+    return datetime.combine(day, datetime.min.time()).replace(tzinfo=UTC)
+
+
+def test_matches_full_scans():
+    for seed in range(5):
+        events = _schedule(80, seed)
+        schedule = _EventSchedule(events)
+        day = date(2025, 12, 28)
+        while day <= date(2026, 6, 30):
+            assert _lookups(schedule, day, _day_start(day)) == _legacy_lookups(
+                events, day, _day_start(day)
+            )
+            day += timedelta(days=1)
+
+
+def test_empty_schedule():
+    schedule = _EventSchedule([])
+    day = date(2026, 1, 1)
+    assert _lookups(schedule, day, _day_start(day)) == ([], None, None, None)
+    assert len(schedule) == 0
+
+
+@pytest.mark.benchmark
+def test_benchmark_500_teams_14_days():
+    """500 teams x 80-game schedules x 14 output days."""
+    teams = [_schedule(80, seed) for seed in range(500)]
+    days = [date(2026, 2, 1) + timedelta(days=d) for d in range(14)]
+
+    start = time.perf_counter()
+    for events in teams[:50]:
+        for day in days:
+            _legacy_lookups(events, day, _day_start(day))
+    legacy = (time.perf_counter() - start) * 10  # scaled to 500 teams
+
+    start = time.perf_counter()
+    for events in teams:
+        schedule = _EventSchedule(events)
+        for day in days:
+            _lookups(schedule, day, _day_start(day))
+    swept = time.perf_counter() - start
+
+    assert swept < legacy
@@ -0,0 +1,126 @@
+"""Tests for the overlapped team and event-group phases of full generation."""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+import teamarr.consumers as consumers
+from teamarr.consumers.generation import (
+    GenerationResult,
+    _PhaseProgress,
+    _process_teams_and_groups,
+)
+from teamarr.consumers.team_processor import BatchTeamResult, TeamProcessingResult
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+
+    @contextmanager
+    def factory():
+        yield conn
+
+    factory.conn = conn
+    yield factory
+    conn.close()
+
+
+def _stored_team_ids(conn):
+    return [row["team_id"] for row in conn.execute("SELECT team_id FROM team_epg_xmltv")]
+
+
+class _GroupResult:
+    groups_processed = 1
+    total_programmes = 3
+
+
+def _fake_phases(monkeypatch, db, groups):
+    """Teams block until groups have seen them running; groups run `groups`."""
+    state = {"teams_running": threading.Event(), "release_teams": threading.Event()}
+
+    def process_all_teams(db_factory, progress_callback=None, defer_writes=False):
+        state["defer_writes"] = defer_writes
+        progress_callback(0, 2, "Processing A...")
+        state["teams_running"].set()
+        state["release_teams"].wait(5)
+        progress_callback(2, 2, "Finished B")
+        batch = BatchTeamResult()
+        batch.results = [
+            TeamProcessingResult(team_id=1, team_name="A", channel_id="a", xmltv="<tv/>"),
+            TeamProcessingResult(team_id=2, team_name="B", channel_id="b"),
+        ]
+        state["teams_done"] = True
+        return batch
+
+    def process_all_event_groups(**kwargs):
+        assert state["teams_running"].wait(5)
+        # Overlapped: teams are still running, and haven't written anything
+        state["stored_during_groups"] = _stored_team_ids(db.conn)
+        state["release_teams"].set()
+        return groups()
+
+    monkeypatch.setattr(consumers, "process_all_teams", process_all_teams)
+    monkeypatch.setattr(consumers, "process_all_event_groups", process_all_event_groups)
+    return state
+
+
+def _run(db, progress):
+    return _process_teams_and_groups(
+        db,
+        dispatcharr_client=None,
+        m3u_future=None,
+        result=GenerationResult(),
+        update_progress=lambda *args: progress.append(args),
+        generation=1,
+        service=None,
+    )
+
+
+def test_team_xmltv_stored_after_groups(db, monkeypatch):
+    state = _fake_phases(monkeypatch, db, groups=_GroupResult)
+    progress = []
+
+    team_result, group_result = _run(db, progress)
+
+    assert state["defer_writes"] is True
+    assert state["stored_during_groups"] == []
+    assert _stored_team_ids(db.conn) == [1]
+    assert team_result.teams_processed == 2 and team_result.results[0].xmltv is None
+    assert group_result.groups_processed == 1
+    assert {p[0] for p in progress} == {"teams", "groups"}
+
+
+def test_team_phase_joined_and_stored_when_groups_fail(db, monkeypatch):
+    def fail():
+        raise RuntimeError("groups failed")
+
+    state = _fake_phases(monkeypatch, db, groups=fail)
+
+    with pytest.raises(RuntimeError, match="groups failed"):
+        _run(db, [])
+
+    assert state["teams_done"]
+    assert _stored_team_ids(db.conn) == [1]
+
+
+def test_phase_progress_averages_phases():
+    updates = []
+    progress = _PhaseProgress(lambda *args: updates.append(args), ("teams", "groups"), 5, 92)
+
+    progress.report("teams", "a", 5, 10, "A")
+    progress.report("groups", "b", 10, 10)
+    progress.report("groups", "waiting")  # total=0 keeps the phase's completion
+    progress.report("teams", "c", 12, 10)  # capped at done
+    progress.complete("groups")
+
+    assert [u[1] for u in updates] == [26, 70, 70, 92]
+    assert updates[0] == ("teams", 26, "a", 5, 10, "A")
+    assert progress._percent() == 92
@@ -0,0 +1,67 @@
+"""Tests for the generation progress bus (coalescing, snapshots, SSE rate limit)."""
+
+import threading
+import time
+
+from teamarr.api import generation_status as gs
+
+
+def _start():
+    gs.complete_generation({})
+    assert gs.start_generation()
+
+
+def test_updates_coalesce_per_phase():
+    _start()
+    for i in range(1, 1001):
+        gs.update_status(status="progress", phase="groups", percent=50, current=i, total=1000)
+    gs.update_status(status="progress", phase="teams", percent=30, message="Team X", total=10)
+
+    status = gs.get_status()
+
+    # Latest publish wins for the flat fields; each phase keeps its own state
+    assert status["phase"] == "teams"
+    assert status["percent"] == 50  # never goes backwards
+    assert status["phases"]["groups"]["current"] == 1000
+    assert status["phases"]["teams"]["message"] == "Team X"
+    assert len(gs._pending) == 2
+    gs.complete_generation({})
+
+
+def test_updates_after_completion_are_ignored():
+    _start()
+    gs.update_status(status="progress", phase="groups", percent=60)
+    gs.complete_generation({"success": True})
+    gs.update_status(status="progress", phase="groups", percent=70, message="late")
+
+    status = gs.get_status()
+
+    assert status["status"] == "complete"
+    assert status["percent"] == 100
+    assert status["message"] == "EPG generation complete"
+
+
+def test_subscriber_emission_is_rate_limited():
+    _start()
+    stop = threading.Event()
+
+    def publish():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            gs.update_status(status="progress", phase="groups", current=i, total=10**9)
+        gs.complete_generation({})
+
+    publisher = threading.Thread(target=publish)
+    publisher.start()
+    started = time.monotonic()
+    frames = []
+    for snapshot in gs.iter_status_updates(max_rate_hz=20):
+        frames.append(snapshot)
+        if time.monotonic() - started > 0.5:
+            stop.set()
+    publisher.join()
+
+    elapsed = time.monotonic() - started
+    assert frames and all(f is not None for f in frames)
+    assert len(frames) <= elapsed * 20 + 2
@@ -0,0 +1,165 @@
+"""Tests for group preview served from the last stream snapshot."""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from teamarr.api.routes import groups as group_routes
+from teamarr.consumers.event_group_processor import EventGroupProcessor
+from teamarr.consumers.matching import BatchMatchResult
+from teamarr.consumers.matching.matcher import MatchedStreamResult
+from teamarr.database.groups import get_group
+from teamarr.services import detection_keywords
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+TODAY = date(2026, 3, 14)
+
+
+def _stream(stream_id, name):
+    return {"id": stream_id, "name": name, "is_stale": False}
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    # Stream filtering loads user keywords through the app database
+    monkeypatch.setattr(detection_keywords, "_load_user_keywords", lambda category: [])
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("INSERT INTO event_epg_groups (id, name, leagues) VALUES (1, 'NHL', '[\"nhl\"]')")
+
+    @contextmanager
+    def db():
+        yield conn
+        conn.commit()
+
+    processor = EventGroupProcessor(db_factory=db, service=object())
+    processor.conn = conn
+    processor.matched = []
+
+    def fake_match(streams, group, target_date, **kwargs):
+        processor.matched.append([s["name"] for s in streams])
+        return BatchMatchResult(
+            target_date=target_date,
+            results=[
+                MatchedStreamResult(
+                    stream_name=s["name"],
+                    stream_id=s["id"],
+                    matched="Bruins" in s["name"],
+                    league="nhl",
+                )
+                for s in streams
+            ],
+        )
+
+    processor._match_streams = fake_match
+    yield processor
+    conn.close()
+
+
+def _run(processor, streams, target_date=TODAY):
+    """What a generation run leaves behind: fetched streams and their matches."""
+    with processor._db_factory() as conn:
+        group = get_group(conn, 1)
+    processor._store_stream_snapshot(1, streams)
+    processor._store_match_snapshot(group, processor._match_streams(streams, group, target_date))
+    processor.matched.clear()
+
+
+def test_reuses_unchanged_matches(processor):
+    _run(processor, [_stream(1, "Bruins vs Leafs"), _stream(2, "Oilers vs Flames")])
+
+    result = processor.preview_group_fast(1, TODAY)
+
+    assert processor.matched == []
+    assert result.snapshot_at is not None
+    assert (result.total_streams, result.matched_count, result.unmatched_count) == (2, 1, 1)
+    assert (result.rematched_count, result.cache_hits) == (0, 2)
+    assert [s.stream_name for s in result.streams] == ["Bruins vs Leafs", "Oilers vs Flames"]
+
+
+def test_rematches_only_changed_streams(processor):
+    _run(processor, [_stream(1, "Bruins vs Leafs"), _stream(2, "Oilers vs Flames")])
+    # Stream 2 renamed, stream 3 new
+    processor._store_stream_snapshot(
+        1,
+        [_stream(1, "Bruins vs Leafs"), _stream(2, "Bruins vs Kings"), _stream(3, "Jets vs Stars")],
+    )
+
+    result = processor.preview_group_fast(1, TODAY)
+    assert processor.matched == [["Bruins vs Kings", "Jets vs Stars"]]
+    assert (result.matched_count, result.unmatched_count, result.rematched_count) == (2, 1, 2)
+
+    # Previews are read-only: the snapshot still holds the last run's results
+    processor.matched.clear()
+    processor.preview_group_fast(1, TODAY)
+    assert processor.matched == [["Bruins vs Kings", "Jets vs Stars"]]
+    processor.matched.clear()
+
+    # Results from another day are not reused
+    processor.preview_group_fast(1, TODAY + timedelta(days=1))
+    assert len(processor.matched[0]) == 3
+
+
+def test_current_filters_applied_to_snapshot(processor):
+    _run(processor, [_stream(1, "Bruins vs Leafs"), _stream(2, "Oilers vs Flames")])
+    processor.conn.execute(
+        """UPDATE event_epg_groups
+           SET stream_exclude_regex = 'Oilers', stream_exclude_regex_enabled = 1 WHERE id = 1"""
+    )
+
+    result = processor.preview_group_fast(1, TODAY)
+    assert (result.filtered_count, result.filtered_exclude_regex) == (1, 1)
+    assert [s.stream_name for s in result.streams] == ["Bruins vs Leafs"]
+
+    # No snapshot yet: nothing to answer from (a full preview captures one)
+    processor.conn.execute(
+        "INSERT INTO event_epg_groups (id, name, leagues) VALUES (2, 'NBA', '[\"nba\"]')"
+    )
+    result = processor.preview_group_fast(2, TODAY)
+    assert result.streams == [] and result.snapshot_at is None
+    assert result.errors == ["No stream snapshot yet - run a full preview"]
+
+
+def test_matching_settings_change_rematches(processor):
+    _run(processor, [_stream(1, "Bruins vs Leafs"), _stream(2, "Oilers vs Flames")])
+    processor.conn.execute(
+        """UPDATE event_epg_groups
+           SET custom_regex_teams = '(?P<team1>.+) vs (?P<team2>.+)',
+               custom_regex_teams_enabled = 1 WHERE id = 1"""
+    )
+
+    result = processor.preview_group_fast(1, TODAY)
+    assert processor.matched == [["Bruins vs Leafs", "Oilers vs Flames"]]
+    assert result.rematched_count == 2
+
+    # Same for league changes
+    processor.matched.clear()
+    _run(processor, [_stream(1, "Bruins vs Leafs")])
+    processor.conn.execute("UPDATE event_epg_groups SET leagues = ?", ('["nhl", "ahl"]',))
+    processor.preview_group_fast(1, TODAY)
+    assert processor.matched == [["Bruins vs Leafs"]]
+
+
+def test_route_starts_refresh_job_without_snapshot(processor, monkeypatch):
+    @contextmanager
+    def db():
+        yield processor.conn
+
+    started = []
+    monkeypatch.setattr(group_routes, "get_db", db)
+    monkeypatch.setattr("teamarr.dispatcharr.get_factory", lambda get_db: None)
+    monkeypatch.setattr("teamarr.services.create_group_service", lambda get_db, conn: "svc")
+    monkeypatch.setattr(
+        group_routes,
+        "_start_preview_job",
+        lambda service, group_id, target_date: started.append(group_id) or "job",
+    )
+
+    assert group_routes.preview_group(1, refresh=False) == "job"
+    _run(processor, [_stream(1, "Bruins vs Leafs")])
+    assert group_routes.preview_group(1, refresh=True) == "job"
+    assert started == [1, 1]
@@ -0,0 +1,180 @@
+"""Tests for filling team stats league-wide from one standings call."""
+
+import pytest
+
+from teamarr.core import SportsProvider, TeamStats
+from teamarr.providers.espn.client import ESPNClient
+from teamarr.providers.espn.provider import ESPNProvider
+from teamarr.services import sports_data
+from teamarr.services.sports_data import LEAGUE_STATS_HOT_THRESHOLD, SportsDataService
+from teamarr.utilities.cache import TTLCache
+
+
+def _entry(team_id, total, home, road, **stats):
+    items = [{"name": name, "value": value} for name, value in stats.items()]
+    items += [
+        {"name": "overall", "type": "total", "summary": total},
+        {"name": "Home", "type": "home", "summary": home},
+        {"name": "Road", "type": "road", "summary": road},
+    ]
+    return {"team": {"id": team_id}, "stats": items}
+
+
+STANDINGS = {
+    "name": "National Hockey League",
+    "children": [
+        {
+            "id": "7",
+            "name": "Eastern Conference",
+            "abbreviation": "East",
+            "children": [
+                {
+                    "id": "1",
+                    "name": "Atlantic Division",
+                    "standings": {
+                        "entries": [
+                            _entry("1", "30-10-5", "18-4-1", "12-6-4", streak=3, playoffSeed=1),
+                            _entry("2", "20-20-5", "11-9-2", "9-11-3", streak=-2),
+                        ]
+                    },
+                }
+            ],
+        },
+        {
+            "id": "8",
+            "name": "Western Conference",
+            "abbreviation": "West",
+            "standings": {"entries": [_entry("3", "25-15", "15-5", "10-10", gamesBehind=2.5)]},
+        },
+    ],
+}
+
+
+class FakeClient(ESPNClient):
+    def __init__(self, espn_league="nhl"):
+        super().__init__()
+        self.espn_league = espn_league
+        self.requests = []
+
+    def get_sport_league(self, league, sport_league=None):
+        return "hockey", self.espn_league
+
+    def _request(self, url, params=None):
+        self.requests.append(url)
+        return STANDINGS
+
+
+def test_espn_standings_parse():
+    client = FakeClient()
+    stats = ESPNProvider(client=client).get_league_team_stats("nhl")
+
+    assert client.requests == ["https://site.api.espn.com/apis/v2/sports/hockey/nhl/standings"]
+    assert set(stats) == {"1", "2", "3"}
+    first = stats["1"]
+    assert (first.record, first.wins, first.losses, first.ties) == ("30-10-5", 30, 5, 10)
+    assert (first.home_record, first.away_record) == ("18-4-1", "12-6-4")
+    assert (first.streak, first.playoff_seed, first.rank) == ("W3", 1, None)
+    assert (first.conference, first.conference_abbrev, first.division) == (
+        "Conference 7",
+        None,
+        "Division 1",
+    )
+    assert stats["2"].streak == "L2"
+    assert (stats["3"].conference, stats["3"].division, stats["3"].games_back) == (
+        "Conference 8",
+        None,
+        2.5,
+    )
+    # Same labels as the per-team path for the same groups
+    groups = {"id": "1", "parent": {"id": "7"}}
+    assert ESPNProvider(client=client)._parse_groups(groups) == ("Conference 7", None, "Division 1")
+
+    # Poll ranks only come from the per-team endpoint
+    college = FakeClient("mens-college-basketball")
+    assert ESPNProvider(client=college).get_league_team_stats("ncaam") == {}
+    assert college.requests == []
+
+
+class FakeProvider(SportsProvider):
+    def __init__(self, league_stats):
+        self.league_stats = league_stats
+        self.calls = []
+
+    @property
+    def name(self):
+        return "fake"
+
+    def supports_league(self, league):
+        return True
+
+    def get_events(self, league, target_date):
+        return []
+
+    def get_team_schedule(self, team_id, league, days_ahead=14):
+        return []
+
+    def get_team(self, team_id, league):
+        return None
+
+    def get_event(self, event_id, league):
+        return None
+
+    def get_team_stats(self, team_id, league):
+        self.calls.append(("team", team_id))
+        return TeamStats(record="1-0", wins=1, losses=0)
+
+    def get_league_team_stats(self, league):
+        self.calls.append(("league", league))
+        return self.league_stats
+
+
+@pytest.fixture
+def service():
+    def build(league_stats):
+        svc = SportsDataService.__new__(SportsDataService)
+        svc._providers = [FakeProvider(league_stats)]
+        svc._cache = TTLCache()
+        return svc
+
+    sports_data._league_stats_misses.clear()
+    yield build
+    sports_data._league_stats_misses.clear()
+
+
+def test_hot_league_fetched_once(service):
+    league_stats = {str(i): TeamStats(record=f"{i}-0", wins=i, losses=0) for i in range(30)}
+    svc = service(league_stats)
+    provider = svc._providers[0]
+
+    records = [svc.get_team_stats(str(i), "nhl").record for i in range(30)]
+
+    cold = LEAGUE_STATS_HOT_THRESHOLD - 1
+    assert records == ["1-0"] * cold + [f"{i}-0" for i in range(cold, 30)]
+    assert provider.calls == [("team", str(i)) for i in range(cold)] + [("league", "nhl")]
+    # Marker stops repeat bulk fetches for this TTL
+    assert svc.get_team_stats("99", "nhl").record == "1-0"
+    assert provider.calls.count(("league", "nhl")) == 1
+
+
+def test_unsupported_falls_back_per_team(service):
+    svc = service({})
+    provider = svc._providers[0]
+
+    for i in range(10):
+        assert svc.get_team_stats(str(i), "mlb").record == "1-0"
+
+    assert provider.calls.count(("league", "mlb")) == 1
+    assert [c for c in provider.calls if c[0] == "team"] == [("team", str(i)) for i in range(10)]
+
+
+def test_misses_reset_per_run(service):
+    svc = service({"1": TeamStats(record="9-0", wins=9, losses=0)})
+    provider = svc._providers[0]
+
+    for i in range(LEAGUE_STATS_HOT_THRESHOLD - 1):
+        svc.get_team_stats(str(i), "nhl")
+    sports_data.reset_league_stats_misses()
+    svc.get_team_stats("x", "nhl")
+
+    # Misses from an earlier run don't count toward this run's threshold
+    assert ("league", "nhl") not in provider.calls
@@ -0,0 +1,212 @@
+"""Tests for the live-score fast path."""
+
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from teamarr.consumers import generation, live_scores
+from teamarr.consumers.generation import GenerationResult
+from teamarr.consumers.live_scores import refresh_live_scores
+from teamarr.core import Event, EventStatus, Team
+from teamarr.database.provider_cache import event_to_dict
+from teamarr.services.sports_data import SportsDataService
+from teamarr.utilities.cache import TTLCache, make_cache_key
+from teamarr.utilities.tz import to_user_tz
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+NOW = datetime.now(UTC)
+TODAY = to_user_tz(NOW).date()
+
+
+def _team(team_id):
+    return Team(
+        id=team_id, provider="espn", name=team_id, short_name=team_id, abbreviation=team_id,
+        league="nhl", sport="hockey",
+    )  # fmt: skip
+
+
+def _event(event_id, start, state="in", home_score=1):
+    return Event(
+        id=event_id,
+        provider="espn",
+        name=event_id,
+        short_name=event_id,
+        start_time=start,
+        home_team=_team(f"{event_id}-home"),
+        away_team=_team(f"{event_id}-away"),
+        status=EventStatus(state=state),
+        league="nhl",
+        sport="hockey",
+        home_score=home_score,
+        away_score=0,
+    )
+
+
+class FakeService:
+    def __init__(self, events, changed):
+        self.events = events
+        self.changed = changed
+        self.refreshed = []
+
+    def get_events(self, league, target_date, cache_only=False):
+        assert cache_only
+        return self.events if (league, target_date) == ("nhl", TODAY) else []
+
+    def refresh_event_status(self, event):
+        self.refreshed.append(event.id)
+        if event.id in self.changed:
+            return replace(event, home_score=event.home_score + 1)
+        return replace(event)
+
+    def update_cached_event(self, event, target_date):
+        return 1
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("INSERT INTO event_epg_groups (id, name, leagues) VALUES (3, 'NHL', '[\"nhl\"]')")
+    conn.execute(
+        """INSERT INTO managed_channels
+               (event_epg_group_id, event_id, event_provider, tvg_id, channel_name, league)
+           VALUES (3, 'live', 'espn', 'teamarr-event-live', 'Live', 'nhl')"""
+    )
+    conn.execute(
+        """INSERT INTO teams (id, provider_team_id, primary_league, sport, team_name, channel_id)
+           VALUES (7, 'other-away', 'nhl', 'hockey', 'Other', 'team-other')"""
+    )
+
+    @contextmanager
+    def factory():
+        yield conn
+
+    yield factory
+    conn.close()
+
+
+def _fake_live_update(calls, busy=None):
+    def run_live_update(db_factory, events, group_ids, team_ids, **kwargs):
+        calls.append(([e.id for e in events], group_ids, team_ids))
+        if busy:
+            return GenerationResult(success=False, error=busy)
+        return GenerationResult(groups_processed=len(group_ids), teams_processed=len(team_ids))
+
+    return run_live_update
+
+
+def test_only_changed_live_events_regenerate_their_units(db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(generation, "run_live_update", _fake_live_update(calls))
+    events = [
+        _event("live", NOW - timedelta(hours=1)),
+        _event("other", NOW - timedelta(minutes=5)),
+        _event("quiet", NOW - timedelta(hours=2)),
+        _event("later", NOW + timedelta(hours=2), state="scheduled"),
+        _event("done", NOW - timedelta(hours=1), state="final"),
+        _event("long-over", NOW - timedelta(hours=5)),
+    ]
+    service = FakeService(events, changed={"live", "other"})
+
+    result = refresh_live_scores(db, service=service, now=NOW)
+
+    assert service.refreshed == ["live", "other", "quiet"]
+    assert (result.events_live, result.events_changed, result.cache_entries_updated) == (3, 2, 3)
+    assert calls == [(["live", "other"], {3}, {7})]
+    assert (result.groups_regenerated, result.teams_regenerated) == (1, 1)
+
+
+def test_skipped_rerender_is_retried_next_pass(db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        generation, "run_live_update", _fake_live_update(calls, busy="Generation in progress")
+    )
+    service = FakeService([_event("live", NOW - timedelta(hours=1))], changed={"live"})
+
+    result = refresh_live_scores(db, service=service, now=NOW)
+    assert result.skipped and result.reason == "Generation in progress"
+
+    # The cache now has the new score, so the event no longer looks changed
+    service.changed = set()
+    monkeypatch.setattr(generation, "run_live_update", _fake_live_update(calls))
+    result = refresh_live_scores(db, service=service, now=NOW)
+
+    assert not result.skipped and result.events_changed == 1
+    assert calls[-1] == (["live"], {3}, set())
+    assert live_scores._pending_changes == {}
+
+
+def test_update_cached_event_patches_scoreboard_and_schedules():
+    svc = SportsDataService.__new__(SportsDataService)
+    svc._cache = TTLCache()
+    live, other = _event("live", NOW), _event("other", NOW)
+    scoreboard = make_cache_key("events", "nhl", TODAY.isoformat())
+    schedule = make_cache_key("schedule", "nhl", "live-home")
+    svc._cache.set(scoreboard, [event_to_dict(live), event_to_dict(other)])
+    svc._cache.set(schedule, [event_to_dict(live)])
+
+    updated = replace(live, home_score=5)
+    assert svc.update_cached_event(updated, TODAY) == 2
+    assert [e["home_score"] for e in svc._cache.get(scoreboard)] == [5, 1]
+    assert svc._cache.get(schedule)[0]["home_score"] == 5
+    # Not cached / not containing the event: untouched
+    assert svc.update_cached_event(_event("unknown", NOW), TODAY) == 0
+    assert svc._cache.get(make_cache_key("schedule", "nhl", "unknown-home")) is None
+
+
+def test_rerender_event_channels_splices_stored_group_xmltv(db, monkeypatch):
+    from teamarr.consumers.event_group_processor import EventGroupProcessor
+    from teamarr.database.groups import get_group_xmltv, store_group_xmltv
+    from teamarr.utilities.xmltv import xmltv_channel_ids
+
+    factory = db
+    with factory() as conn:
+        conn.execute("UPDATE managed_channels SET primary_stream_id = 55")
+        conn.execute(
+            """INSERT INTO managed_channel_streams
+                   (managed_channel_id, dispatcharr_stream_id, stream_name)
+               VALUES (1, 55, 'NHL: Live Game')"""
+        )
+        store_group_xmltv(
+            conn,
+            3,
+            '<tv><channel id="teamarr-event-live"><display-name>old</display-name></channel>'
+            '<channel id="teamarr-event-x"><display-name>x</display-name></channel></tv>',
+        )
+
+    rendered = []
+
+    def fake_generate(self, matched, group, conn):
+        rendered.extend((m["stream"]["name"], m["event"].home_score) for m in matched)
+        tvg_id = self._tvg_id
+        xml = f'<tv><channel id="{tvg_id}"><display-name>new</display-name></channel></tv>'
+        return xml, 1, 1, 0, 0
+
+    monkeypatch.setattr(EventGroupProcessor, "_generate_xmltv", fake_generate)
+    processor = EventGroupProcessor(db_factory=factory, service=object())
+    processor._tvg_id = "teamarr-event-live"
+    events = {"live": _event("live", NOW, home_score=4)}
+
+    ids, _xml = processor.rerender_event_channels(3, events)
+
+    assert ids == {"teamarr-event-live"}
+    assert rendered == [("NHL: Live Game", 4)]
+    with factory() as conn:
+        stored = get_group_xmltv(conn, 3)
+    assert xmltv_channel_ids(stored) == {"teamarr-event-live", "teamarr-event-x"}
+    assert "new" in stored and "old" not in stored
+
+    # Rendered channels that don't line up with the managed ones need a full run
+    processor._tvg_id = "teamarr-event-live-spanish"
+    assert processor.rerender_event_channels(3, events) is None
+
+
+def test_live_update_skipped_while_lock_held(db):
+    with generation._generation_lock:
+        update = generation.run_live_update(db, [], {3}, set())
+    assert not update.success and update.error == "Generation already in progress"
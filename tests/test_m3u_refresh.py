@@ -0,0 +1,104 @@
+"""Tests for M3U refresh waiting: adaptive polling and the shared batch poller."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from teamarr.dispatcharr.managers.m3u import M3UManager
+from teamarr.dispatcharr.types import DispatcharrM3UAccount, RefreshResult
+
+OLD = "2020-01-01T00:00:00Z"
+NEW = "2020-01-01T00:05:00Z"
+
+
+def _manager(snapshots: list[list[DispatcharrM3UAccount]]) -> M3UManager:
+    manager = M3UManager(MagicMock())
+    manager.list_accounts = MagicMock(side_effect=snapshots)
+    manager.get_account = MagicMock(return_value=None)
+    manager.refresh_account = MagicMock(
+        return_value=RefreshResult(success=True, message="triggered")
+    )
+    return manager
+
+
+@patch("teamarr.dispatcharr.managers.m3u.time.sleep")
+def test_refresh_multiple_uses_one_list_call_per_tick(sleep):
+    manager = _manager(
+        [
+            # Initial freshness check
+            [
+                DispatcharrM3UAccount(1, "a", updated_at=OLD),
+                DispatcharrM3UAccount(2, "b", updated_at=OLD),
+            ],
+            # Tick 1: account 1 done
+            [
+                DispatcharrM3UAccount(1, "a", updated_at=NEW),
+                DispatcharrM3UAccount(2, "b", updated_at=OLD),
+            ],
+            # Tick 2: account 2 errored
+            [
+                DispatcharrM3UAccount(1, "a", updated_at=NEW),
+                DispatcharrM3UAccount(2, "b", status="error", updated_at=OLD),
+            ],
+        ]
+    )
+
+    result = manager.refresh_multiple([1, 2], timeout=60, skip_if_recent_minutes=0)
+
+    assert manager.list_accounts.call_count == 3
+    assert result.results[1].success
+    assert not result.results[2].success
+    assert result.succeeded_count == 1
+    assert result.failed_count == 1
+    # Poll interval backs off between ticks
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays[0] < delays[1]
+
+
+@patch("teamarr.dispatcharr.managers.m3u.time.sleep")
+def test_refresh_multiple_reports_missing_and_skipped(sleep):
+    recent = "2999-01-01T00:00:00+00:00"
+    manager = _manager([[DispatcharrM3UAccount(1, "a", updated_at=recent)]])
+
+    result = manager.refresh_multiple([1, 9], timeout=60, skip_if_recent_minutes=30)
+
+    manager.refresh_account.assert_not_called()
+    assert result.results[1].skipped
+    assert not result.results[9].success
+    assert result.skipped_count == 1
+    sleep.assert_not_called()
+
+
+@patch("teamarr.dispatcharr.managers.m3u.time.sleep")
+def test_refresh_multiple_falls_back_when_listing_fails(sleep):
+    # The listing fails every time (list_accounts returns [] on transport errors)
+    manager = _manager([[], [], []])
+    states = {
+        1: iter([DispatcharrM3UAccount(1, "a", updated_at=OLD)] * 2),
+        2: iter([DispatcharrM3UAccount(2, "b", updated_at=OLD), DispatcharrM3UAccount(2, "b")]),
+    }
+
+    def get_account(account_id):
+        if account_id == 1:
+            state = next(states[1], None)
+            if state is None:
+                raise ConnectionError("connection reset")
+            return state
+        return next(states[2])
+
+    manager.get_account = MagicMock(side_effect=get_account)
+
+    result = manager.refresh_multiple([1, 2], timeout=60, skip_if_recent_minutes=0)
+
+    assert manager.refresh_account.call_count == 2
+    # Account 2 finished; account 1's poll error doesn't abort the batch
+    assert result.results[2].success
+    assert result.results[1].message == "Error: connection reset"
+
+
+@patch("teamarr.dispatcharr.managers.m3u.time.sleep")
+def test_refresh_multiple_max_workers_deprecated(sleep):
+    manager = _manager([[]])
+
+    with pytest.warns(DeprecationWarning, match="max_workers"):
+        manager.refresh_multiple([], max_workers=5)
@@ -0,0 +1,94 @@
+"""Tests for timing spans, counters and the Prometheus text export."""
+
+import time
+
+import pytest
+
+from teamarr.api.routes.metrics import get_metrics
+from teamarr.consumers.generation import _timed_phase
+from teamarr.utilities import metrics
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset()
+    metrics.set_enabled(True)
+    yield
+    metrics.reset()
+    metrics.set_enabled(True)
+
+
+def test_spans_counters_and_run_summary():
+    with metrics.span("http_request", client="espn"):
+        pass
+    metrics.begin_run()
+    metrics.observe("http_request", 0.2, client="espn")
+    with pytest.raises(ValueError):
+        with metrics.span("http_request", client="tsdb"):
+            raise ValueError("boom")
+    metrics.inc("service_cache", kind="events", result="hit")
+    metrics.inc("service_cache", 2, kind="events", result="hit")
+    assert _timed_phase("teams", lambda x: x * 2, 21) == 42
+
+    summary = metrics.run_summary()
+    metrics.end_run()
+
+    # Only what happened during the run
+    assert summary["spans"]["http_request{client=espn}"]["count"] == 1
+    assert summary["spans"]["http_request{client=espn}"]["max_s"] == 0.2
+    assert summary["spans"]["http_request{client=tsdb}"]["count"] == 1
+    assert summary["spans"]["generation_phase{phase=teams}"]["count"] == 1
+    assert summary["counters"] == {
+        "http_request_errors{client=tsdb}": 1,
+        "service_cache{kind=events,result=hit}": 3,
+    }
+    assert metrics.run_summary() == {}
+
+
+def test_prometheus_text_format():
+    metrics.observe("http_request", 0.003, client="espn")
+    metrics.observe("http_request", 0.2, client="espn")
+    metrics.observe("http_request", 120, client="espn")
+    metrics.inc("service_cache", kind="events", result="miss")
+
+    response = get_metrics()
+    text = response.body.decode()
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+    lines = text.splitlines()
+    assert "# TYPE teamarr_http_request_seconds histogram" in lines
+    assert 'teamarr_http_request_seconds_bucket{client="espn",le="0.001"} 0' in lines
+    assert 'teamarr_http_request_seconds_bucket{client="espn",le="0.005"} 1' in lines
+    assert 'teamarr_http_request_seconds_bucket{client="espn",le="0.25"} 2' in lines
+    assert 'teamarr_http_request_seconds_bucket{client="espn",le="60.0"} 2' in lines
+    assert 'teamarr_http_request_seconds_bucket{client="espn",le="+Inf"} 3' in lines
+    assert 'teamarr_http_request_seconds_count{client="espn"} 3' in lines
+    assert 'teamarr_http_request_seconds_sum{client="espn"} 120.203000' in lines
+    assert "# TYPE teamarr_service_cache_total counter" in lines
+    assert 'teamarr_service_cache_total{kind="events",result="miss"} 1' in lines
+
+
+def test_disabled_is_a_noop():
+    metrics.set_enabled(False)
+    metrics.begin_run()
+    with metrics.span("http_request", client="espn"):
+        pass
+    metrics.inc("service_cache", kind="events", result="hit")
+    assert metrics.run_summary() == {"spans": {}, "counters": {}}
+    assert metrics.render_prometheus() == "\n"
+
+
+@pytest.mark.benchmark
+def test_benchmark_span_overhead():
+    n = 100_000
+
+    def loop():
+        start = time.perf_counter()
+        for _ in range(n):
+            with metrics.span("stream_match"):
+                pass
+        return (time.perf_counter() - start) / n
+
+    enabled = loop()
+    metrics.set_enabled(False)
+    disabled = loop()
+    assert disabled < enabled
@@ -0,0 +1,108 @@
+"""Tests and micro-benchmark for precompiled, memoized text normalization.
+
+The reference implementations below are the previous loop-per-table
+versions; the precompiled ones must produce identical output.
+"""
+
+import itertools
+import re
+import time
+
+import pytest
+from unidecode import unidecode
+
+from teamarr.consumers.matching.normalizer import (
+    apply_city_translations,
+    normalize_for_matching,
+)
+from teamarr.utilities.constants import BROADCAST_NETWORKS, CITY_TRANSLATIONS
+from teamarr.utilities.fuzzy_match import normalize_text
+
+TEAMS = [
+    "Bayern München",
+    "1. FC Köln",
+    "Fortuna Düsseldorf",
+    "Eintracht Frankfurt",
+    "São Paulo FC",
+    "MIL Bucks",
+    "Boston Celtics",
+    "Los Angeles Lakers",
+    "Man United",
+    "Atlético Madrid",
+    "Inter Milan",
+    "Seattle Redhawks",
+    "Portland Pilots",
+    "Kansas City Chiefs",
+    "Tampa Bay Lightning",
+]
+TEMPLATES = [
+    "NBA: {a} vs {b} ( ESPN Feed )",
+    "ESPN+ | {a} @ {b} 7:30 PM ET",
+    "[FOX] {a} - {b} 12/31 8pm",
+    "Bundesliga: {a} v {b} (Sky Sports) 15:30 CET",
+    "{a} x {b} | DAZN 1080p",
+    "NHL 01: {a} at {b} - TSN/SPORTSNET",
+    "ESPN2: {a} vs. {b} NBCSN backup STREAM",
+]
+CORPUS = [
+    t.format(a=a, b=b)
+    for t, (a, b) in zip(itertools.cycle(TEMPLATES), itertools.permutations(TEAMS, 2), strict=False)
+]
+
+
+def _reference_city_translations(text: str) -> str:
+    text = unidecode(text)
+    result = text
+    text_lower = text.lower()
+    for variant, english in CITY_TRANSLATIONS.items():
+        if variant in text_lower:
+            result = re.compile(re.escape(variant), re.IGNORECASE).sub(english, result)
+    return result
+
+
+def _reference_normalize_for_matching(text: str) -> str:
+    if not text:
+        return ""
+    text = _reference_city_translations(text).lower()
+    for network in BROADCAST_NETWORKS:
+        text = re.sub(rf"\b{re.escape(network.lower())}\b", " ", text)
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split()).strip()
+
+
+def test_precompiled_normalization_matches_reference():
+    for name in CORPUS + TEAMS + ["", "ESPN+ Live", "espn+x", "MÜNCHEN munchen"]:
+        assert normalize_for_matching(name) == _reference_normalize_for_matching(name), name
+        if name:
+            assert apply_city_translations(name) == _reference_city_translations(name), name
+
+
+def test_normalization_is_memoized():
+    normalize_for_matching.cache_clear()
+    normalize_text.cache_clear()
+
+    for _ in range(3):
+        for team in TEAMS:
+            normalize_for_matching(team)
+            normalize_text(team)
+
+    assert normalize_for_matching.cache_info().misses == len(TEAMS)
+    assert normalize_text.cache_info().hits == 2 * len(TEAMS)
+
+
+@pytest.mark.benchmark
+def test_benchmark_normalization():
+    """Micro-benchmark: a run re-normalizes each stream/team name many times."""
+    workload = CORPUS * 5
+
+    start = time.perf_counter()
+    expected = [_reference_normalize_for_matching(s) for s in workload]
+    reference = time.perf_counter() - start
+
+    normalize_for_matching.cache_clear()
+    start = time.perf_counter()
+    actual = [normalize_for_matching(s) for s in workload]
+    optimized = time.perf_counter() - start
+
+    assert actual == expected
+    assert optimized < reference
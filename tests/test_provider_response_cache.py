@@ -0,0 +1,97 @@
+"""Tests for the persistent provider response cache."""
+
+import json
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from teamarr.providers.tsdb.client import TSDBClient
+from teamarr.utilities.cache import ProviderResponseCache
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+
+    @contextmanager
+    def factory():
+        yield conn
+        conn.commit()
+
+    yield factory
+    conn.close()
+
+
+RESPONSE = {"events": [{"idEvent": str(i), "strEvent": "Otters vs Knights"} for i in range(50)]}
+
+
+def test_responses_survive_restart_compressed(db):
+    ProviderResponseCache("tsdb", db).set("tsdb:eventsday:ohl:2026-03-14", RESPONSE, 600)
+
+    # New process: nothing in memory, read through to SQLite
+    cache = ProviderResponseCache("tsdb", db)
+    assert cache.get("tsdb:eventsday:ohl:2026-03-14") == RESPONSE
+    assert cache.get("tsdb:eventsday:ohl:2026-03-14") == RESPONSE
+    assert cache.get("tsdb:eventsday:ohl:2026-03-15") is None
+    # Other providers don't see it
+    assert ProviderResponseCache("cricbuzz", db).get("tsdb:eventsday:ohl:2026-03-14") is None
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.667
+    assert stats["stored_entries"] == 1
+    assert stats["stored_bytes"] < stats["raw_bytes"] / 5
+
+    with db() as conn:
+        row = conn.execute("SELECT payload FROM provider_response_cache").fetchone()
+    assert zlib.decompress(row["payload"]).startswith(b'{"events"')
+
+
+def test_expired_rows_ignored_and_cleaned(db):
+    cache = ProviderResponseCache("hockeytech", db)
+    cache.set("old", [1], 600)
+    with db() as conn:
+        conn.execute("UPDATE provider_response_cache SET expires_at = '2000-01-01T00:00:00'")
+
+    assert ProviderResponseCache("hockeytech", db).get("old") is None
+    assert cache.cleanup_expired() >= 1
+    assert cache.stats()["stored_entries"] == 0
+
+
+def test_size_cap_evicts_soonest_expiring(db):
+    payload = {"blob": [str(i) * 40 for i in range(400)]}
+    size = len(zlib.compress(json.dumps(payload).encode()))
+    cache = ProviderResponseCache("cricbuzz", db, max_bytes=int(size * 2.5))
+
+    cache.set("today", payload, 60)
+    cache.set("next-week", payload, 86400)
+    cache.set("tomorrow", payload, 3600)
+
+    with db() as conn:
+        keys = {
+            r["cache_key"] for r in conn.execute("SELECT cache_key FROM provider_response_cache")
+        }
+    assert keys == {"next-week", "tomorrow"}
+    assert cache.get("today") is None
+    assert cache.stats()["stored_bytes"] <= cache.stats()["max_bytes"]
+
+
+def test_tsdb_client_cold_start_reuses_stored_responses(db):
+    calls = []
+
+    def client():
+        c = TSDBClient(cache=ProviderResponseCache("tsdb", db))
+        c.get_league_id = lambda league: "4380"
+        c._request = lambda endpoint, params=None: calls.append(endpoint) or RESPONSE
+        return c
+
+    assert client().get_league_next_events("nhl") == RESPONSE
+    assert client().get_league_next_events("nhl") == RESPONSE
+    assert calls == ["eventsnextleague.php"]
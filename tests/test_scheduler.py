@@ -0,0 +1,154 @@
+"""Tests for the priority-ordered task scheduler."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from teamarr.api import generation_status
+from teamarr.consumers.scheduler import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    CronScheduler,
+    ScheduledTask,
+)
+
+NOW = datetime(2026, 3, 14, 12, 0, 30)
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(generation_status, "is_in_progress", lambda: False)
+    scheduler = CronScheduler(db_factory=None, run_on_start=False, max_concurrent=2)
+    scheduler._tasks = []
+    yield scheduler
+    for worker in list(scheduler._workers.values()):
+        worker.join(timeout=5)
+
+
+def _task(name, priority, release=None, spec="0 * * * *", **kwargs):
+    def run():
+        if release:
+            release.wait(5)
+        return {"success": True}
+
+    task = ScheduledTask(name, run, lambda: spec, priority=priority, **kwargs)
+    task.spec = spec
+    task.next_run = NOW - timedelta(seconds=30)
+    return task
+
+
+def test_priority_order_exclusive_and_deferral(scheduler):
+    release = threading.Event()
+    scheduler._tasks = [
+        _task("backup", PRIORITY_LOW, release, defer_while_generating=True),
+        _task("cache", 5, release),
+        _task("reset", PRIORITY_HIGH, release, exclusive=True),
+        _task("generation", PRIORITY_HIGH + 1, release, exclusive=True),
+    ]
+
+    # Reset first; generation waits for it; the last slot isn't given to cache
+    assert scheduler._dispatch(NOW) == ["reset"]
+    release.set()
+    scheduler._workers["reset"].join(5)
+
+    assert scheduler._dispatch(NOW) == ["generation"]
+    scheduler._workers["generation"].join(5)
+    assert scheduler._dispatch(NOW) == ["cache"]
+    scheduler._workers["cache"].join(5)
+    assert scheduler._dispatch(NOW) == ["backup"]
+
+
+def test_backup_deferred_while_generation_runs(scheduler, monkeypatch):
+    scheduler._tasks = [_task("backup", PRIORITY_LOW, defer_while_generating=True)]
+    monkeypatch.setattr(generation_status, "is_in_progress", lambda: True)
+    assert scheduler._dispatch(NOW) == []
+
+    monkeypatch.setattr(generation_status, "is_in_progress", lambda: False)
+    assert scheduler._dispatch(NOW) == ["backup"]
+
+
+def test_missed_runs_coalesced_and_history_recorded(scheduler):
+    task = _task("generation", PRIORITY_HIGH + 1)
+    task.next_run = NOW - timedelta(hours=3)
+    scheduler._tasks = [task]
+
+    assert scheduler._dispatch(NOW) == ["generation"]
+    scheduler._workers["generation"].join(5)
+    # Fired at 09:00, 10:00, 11:00 and 12:00: one run, three coalesced
+    assert task.coalesced_runs == 3
+    assert task.run_count == 1 and task.next_run > datetime.now()
+
+    status = scheduler.task_status()[0]
+    assert status["last_status"] == "ok"
+    assert [run["status"] for run in status["history"]] == ["ok"]
+    assert status["last_duration_seconds"] is not None
+    # Not due again until the next firing
+    assert scheduler._dispatch(NOW) == []
+
+
+def test_generation_waits_for_same_tick_refreshes(scheduler):
+    release = threading.Event()
+    scheduler._tasks = [
+        _task("cache_refresh", 5, release, defer_while_generating=True),
+        _task(
+            "epg_generation",
+            PRIORITY_HIGH + 1,
+            exclusive=True,
+            after=("cache_refresh",),
+        ),
+    ]
+
+    assert scheduler._dispatch(NOW) == ["cache_refresh"]
+    # Still refreshing: generation keeps waiting
+    assert scheduler._dispatch(NOW) == []
+    release.set()
+    scheduler._workers["cache_refresh"].join(5)
+    assert scheduler._dispatch(NOW) == ["epg_generation"]
+
+
+def _built_tasks(scheduler, runs):
+    """The scheduler's real task definitions, with blocking stand-in runs."""
+    tasks = [t for t in scheduler._build_tasks() if t.name in runs]
+    for task in tasks:
+        task.run = runs[task.name]
+        task.spec = "0 * * * *"
+        task.next_run = NOW - timedelta(seconds=30)
+    return tasks
+
+
+def test_slow_linear_refresh_does_not_hold_back_generation(scheduler):
+    cache_done, linear_done, generation_done = (threading.Event() for _ in range(3))
+    scheduler._tasks = _built_tasks(
+        scheduler,
+        {
+            "cache_refresh": lambda: cache_done.wait(5) and {},
+            "linear_epg_refresh": lambda: linear_done.wait(5) and {},
+            "epg_generation": lambda: generation_done.wait(5) and {},
+        },
+    )
+    linear = next(t for t in scheduler._tasks if t.name == "linear_epg_refresh")
+
+    # Same tick: cache first, generation right after it, linear EPG last
+    assert scheduler._dispatch(NOW) == ["cache_refresh"]
+    cache_done.set()
+    scheduler._workers["cache_refresh"].join(5)
+    assert scheduler._dispatch(NOW) == ["epg_generation"]
+    generation_done.set()
+    scheduler._workers["epg_generation"].join(5)
+    assert scheduler._dispatch(NOW) == ["linear_epg_refresh"]
+
+    # Next tick while the linear refresh is still running: the cache refresh
+    # gets the last slot and generation starts without waiting for linear EPG
+    cache_done.clear()
+    generation_done.clear()
+    for task in scheduler._tasks:
+        if task is not linear:
+            task.next_run = NOW
+    assert scheduler._dispatch(NOW) == ["cache_refresh"]
+    cache_done.set()
+    scheduler._workers["cache_refresh"].join(5)
+    assert scheduler._dispatch(NOW) == ["epg_generation"]
+    assert linear.running
+    generation_done.set()
+    linear_done.set()
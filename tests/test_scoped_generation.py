@@ -0,0 +1,182 @@
+"""Tests for regenerating a single group or team into the written guide."""
+
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import teamarr.consumers
+from teamarr.consumers import generation
+from teamarr.consumers.generation import (
+    _events_output_path,
+    _stored_unit_xmltv,
+    _write_xmltv_artifact,
+    run_scoped_generation,
+)
+from teamarr.database.groups import (
+    get_all_group_xmltv,
+    get_group_xmltv_source_key,
+    store_group_xmltv,
+)
+from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, SCOPE_FULL, get_xmltv_artifact
+from teamarr.utilities.xmltv import merge_xmltv_content, merge_xmltv_tree, splice_xmltv_tree
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+def _guide(*channels):
+    """XMLTV with one 2-hour programme per (channel, start hour)."""
+    parts = []
+    for channel, hour in channels:
+        parts.append(f'<channel id="{channel}"><display-name>{channel}</display-name></channel>')
+        parts.append(
+            f'<programme start="20260314{hour:02d}0000 +0000" stop="20260314{hour + 2:02d}0000'
+            f' +0000" channel="{channel}"><title>{channel} game</title></programme>'
+        )
+    return f"<tv>{''.join(parts)}</tv>"
+
+
+def _channels(root):
+    return sorted(c.get("id") for c in root.findall("channel"))
+
+
+def _programmes(root):
+    return [(p.get("channel"), p.get("start")) for p in root.findall("programme")]
+
+
+def test_splice_replaces_only_unit_channels():
+    root = merge_xmltv_tree([_guide(("team-a", 10)), _guide(("event-1", 12), ("event-2", 14))])
+
+    spliced = splice_xmltv_tree(root, {"event-1", "event-2", "event-3"}, _guide(("event-3", 9)))
+    assert _channels(spliced) == ["event-3", "team-a"]
+    assert _programmes(spliced) == [
+        ("event-3", "20260314090000 +0000"),
+        ("team-a", "20260314100000 +0000"),
+    ]
+
+    removed = splice_xmltv_tree(root, {"team-a"}, None)
+    assert _channels(removed) == ["event-1", "event-2"]
+    # Original tree untouched
+    assert _channels(root) == ["event-1", "event-2", "team-a"]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("UPDATE settings SET epg_output_path = ?", (str(tmp_path / "teamarr.xml"),))
+    conn.execute(
+        """INSERT INTO teams (id, provider_team_id, primary_league, sport, team_name, channel_id)
+           VALUES (1, '1', 'nhl', 'hockey', 'Bruins', 'team-a')"""
+    )
+    for group_id in (1, 2):
+        conn.execute(
+            "INSERT INTO event_epg_groups (id, name, leagues) VALUES (?, ?, '[\"nhl\"]')",
+            (group_id, f"Group {group_id}"),
+        )
+    conn.execute(
+        "INSERT INTO team_epg_xmltv (team_id, xmltv_content) VALUES (1, ?)",
+        (_guide(("team-a", 10)),),
+    )
+    store_group_xmltv(conn, 1, _guide(("event-1", 12), ("event-2", 14)))
+    store_group_xmltv(conn, 2, _guide(("event-9", 16)))
+
+    @contextmanager
+    def factory():
+        yield conn
+        conn.commit()
+
+    # What the last full run left behind
+    output = tmp_path / "teamarr.xml"
+    _write_xmltv_artifact(
+        conn, SCOPE_FULL, output, merge_xmltv_content(_stored_unit_xmltv(conn)), 5
+    )
+    _write_xmltv_artifact(
+        conn,
+        SCOPE_EVENTS,
+        _events_output_path(output),
+        merge_xmltv_content(get_all_group_xmltv(conn)),
+        5,
+        source_key=get_group_xmltv_source_key(conn),
+    )
+
+    def fake_process_group(db_factory, group_id, dispatcharr_client=None):
+        with db_factory() as c:
+            store_group_xmltv(c, group_id, _guide(("event-2", 15), ("event-3", 18)))
+            # Stored timestamps only have second resolution
+            c.execute("UPDATE event_epg_xmltv SET updated_at = '2099-01-01' WHERE group_id = ?",
+                      (group_id,))  # fmt: skip
+        return SimpleNamespace(errors=[], programmes_generated=2)
+
+    monkeypatch.setattr(teamarr.consumers, "process_event_group", fake_process_group)
+    yield factory, conn, output
+    conn.close()
+
+
+def test_group_spliced_into_full_and_events_guides(db):
+    factory, conn, output = db
+    old_etag = get_xmltv_artifact(conn, SCOPE_FULL).etag
+
+    result = run_scoped_generation(factory, group_id=1)
+
+    assert result.success, result.error
+    assert (result.groups_processed, result.programmes_total) == (1, 2)
+    full = ET.parse(output).getroot()
+    expected = merge_xmltv_tree(_stored_unit_xmltv(conn))
+    assert _channels(full) == _channels(expected) == ["event-2", "event-3", "event-9", "team-a"]
+    assert _programmes(full) == _programmes(expected)
+
+    artifact = get_xmltv_artifact(conn, SCOPE_FULL)
+    assert artifact.is_current() and artifact.etag != old_etag
+    assert artifact.analysis["channels"]["total"] == 4
+
+    events = get_xmltv_artifact(conn, SCOPE_EVENTS)
+    assert events.is_current()
+    assert events.source_key == get_group_xmltv_source_key(conn)
+    assert _channels(ET.parse(events.path).getroot()) == ["event-2", "event-3", "event-9"]
+
+
+def test_disabled_group_removed_and_errors(db):
+    factory, conn, output = db
+    conn.execute("UPDATE event_epg_groups SET enabled = 0 WHERE id = 2")
+
+    assert run_scoped_generation(factory, group_id=2).success
+    assert _channels(ET.parse(output).getroot()) == ["event-1", "event-2", "team-a"]
+
+    assert run_scoped_generation(factory, group_id=42).error == "Group 42 not found"
+
+    with generation._generation_lock:
+        assert run_scoped_generation(factory, group_id=1).error.endswith("in progress")
+
+    with pytest.raises(ValueError):
+        run_scoped_generation(factory, group_id=1, team_id=1)
+
+
+def test_full_run_waits_for_scoped_run(db):
+    factory, _, _ = db
+    # Stand in for an in-flight scoped run
+    generation._generation_lock.acquire()
+    waiter_result = []
+    waiter = threading.Thread(
+        target=lambda: waiter_result.append(generation._acquire_full_generation())
+    )
+    waiter.start()
+    try:
+        while not generation._full_run_pending:
+            threading.Event().wait(0.001)
+        # A second full run is skipped, new scoped runs are refused
+        assert not generation._acquire_full_generation()
+        assert run_scoped_generation(factory, group_id=1).error == "Full generation in progress"
+    finally:
+        generation._generation_lock.release()
+    waiter.join(timeout=5)
+
+    assert waiter_result == [True]
+    assert generation.generation_in_progress()
+    generation._release_full_generation()
+    assert not generation.generation_in_progress()
@@ -0,0 +1,138 @@
+"""Tests and benchmark for trigram-indexed team_cache search."""
+
+import sqlite3
+import time
+
+import pytest
+
+from teamarr.database.team_cache import (
+    _search_teams_like,
+    rebuild_team_search_index,
+    search_teams,
+)
+
+TEAMS = [
+    ("Bayern München", "FCB", "Bayern", "ger.1", "soccer"),
+    ("Borussia Mönchengladbach", "BMG", "Gladbach", "ger.1", "soccer"),
+    ("Boston Celtics", "BOS", "Celtics", "nba", "basketball"),
+    ("Boston Bruins", "BOS", "Bruins", "nhl", "hockey"),
+    ("Boston College Eagles", "BC", "Boston College", "college-football", "football"),
+    ("Northeastern Huskies", "NE", "Northeastern", "mens-college-hockey", "hockey"),
+    ("New England Patriots", "NE", "Patriots", "nfl", "football"),
+    ("Atlético Madrid", "ATM", "Atlético", "esp.1", "soccer"),
+    ("Real Madrid", "RMA", "Real Madrid", "esp.1", "soccer"),
+]
+
+
+def _create(conn):
+    conn.executescript(
+        """
+        CREATE TABLE team_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_name TEXT NOT NULL,
+            team_abbrev TEXT,
+            team_short_name TEXT,
+            provider TEXT NOT NULL,
+            provider_team_id TEXT NOT NULL,
+            league TEXT NOT NULL,
+            sport TEXT NOT NULL,
+            logo_url TEXT,
+            last_seen TEXT
+        );
+        """
+    )
+
+
+def _insert(conn, teams):
+    conn.executemany(
+        """INSERT INTO team_cache
+           (team_name, team_abbrev, team_short_name, provider, provider_team_id, league, sport)
+           VALUES (?, ?, ?, 'espn', ?, ?, ?)""",
+        [(n, a, s, str(i), lg, sp) for i, (n, a, s, lg, sp) in enumerate(teams)],
+    )
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    _create(conn)
+    _insert(conn, TEAMS)
+    rebuild_team_search_index(conn)
+    yield conn
+    conn.close()
+
+
+def _names(results):
+    return [r["name"] for r in results]
+
+
+def test_ranks_prefix_before_substring(conn):
+    assert _names(search_teams(conn, "bos")) == [
+        "Boston Bruins",
+        "Boston Celtics",
+        "Boston College Eagles",
+    ]
+    # Exact short name first, then word prefix ("... Madrid"), then none
+    assert _names(search_teams(conn, "madrid")) == ["Atlético Madrid", "Real Madrid"]
+    assert _names(search_teams(conn, "celtics"))[0] == "Boston Celtics"
+    assert _names(search_teams(conn, "eastern")) == ["Northeastern Huskies"]
+
+
+def test_accent_insensitive_and_filters(conn):
+    assert _names(search_teams(conn, "munchen")) == ["Bayern München"]
+    assert _names(search_teams(conn, "MÖNCHEN")) == ["Borussia Mönchengladbach"]
+    assert _names(search_teams(conn, "atletico")) == ["Atlético Madrid"]
+    assert _names(search_teams(conn, "bos", sport="hockey")) == ["Boston Bruins"]
+    assert _names(search_teams(conn, "bos", league="nba", limit=1)) == ["Boston Celtics"]
+
+    result = search_teams(conn, "FCB")[0]
+    assert result == {
+        "name": "Bayern München",
+        "abbrev": "FCB",
+        "short_name": "Bayern",
+        "provider": "espn",
+        "team_id": "0",
+        "league": "ger.1",
+        "sport": "soccer",
+        "logo_url": None,
+    }
+
+
+def test_short_queries_and_missing_index_fall_back_to_like(conn):
+    # Two characters: LIKE on names plus exact abbreviation
+    assert _names(search_teams(conn, "ne")) == ["New England Patriots", "Northeastern Huskies"]
+
+    conn.execute("DROP TABLE team_cache_fts")
+    assert _names(search_teams(conn, "celtics")) == ["Boston Celtics"]
+
+
+@pytest.mark.benchmark
+def test_benchmark_search_50k_teams():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    _create(conn)
+    teams = [
+        (f"{name} {i}", abbrev, short, f"{league}-{i % 200}", sport)
+        for i in range(50_000 // len(TEAMS) + 1)
+        for name, abbrev, short, league, sport in TEAMS
+    ][:50_000]
+    _insert(conn, teams)
+    rebuild_team_search_index(conn)
+    queries = ["munchen", "celtics", "madrid 12", "gladbach 4711", "patriots 9"]
+
+    start = time.perf_counter()
+    for _ in range(5):
+        for q in queries:
+            _search_teams_like(conn, q, None, None, 50)
+    like = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(5):
+        for q in queries:
+            search_teams(conn, q)
+    indexed = time.perf_counter() - start
+
+    assert _names(search_teams(conn, "gladbach 4711")) == ["Borussia Mönchengladbach 4711"]
+    conn.close()
+    assert indexed < like
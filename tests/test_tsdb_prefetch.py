@@ -0,0 +1,110 @@
+"""Tests for planning and prefetching TSDB endpoints shared by teams."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from teamarr.core import LeagueMapping
+from teamarr.providers.tsdb.client import TSDBClient
+from teamarr.providers.tsdb.provider import TSDBProvider
+from teamarr.services.sports_data import SportsDataService
+
+TODAY = date.today()
+DATES = [(TODAY + timedelta(days=offset)).isoformat() for offset in range(3)]
+
+
+class FakeMappings:
+    def get_mapping(self, league_code, provider):
+        return LeagueMapping(
+            league_code=league_code,
+            provider="tsdb",
+            provider_league_id=f"id-{league_code}",
+            provider_league_name=f"League {league_code}",
+            sport="Hockey",
+            display_name=league_code,
+        )
+
+    def supports_league(self, league_code, provider):
+        return True
+
+
+def _game(league, date_str, home, away):
+    return {
+        "idEvent": f"{league}-{date_str}-{home}",
+        "dateEvent": date_str,
+        "strTimestamp": f"{date_str}T23:00:00",
+        "strHomeTeam": home,
+        "strAwayTeam": away,
+    }
+
+
+def _provider(api_key=None):
+    client = TSDBClient(league_mapping_source=FakeMappings(), api_key=api_key)
+    calls = []
+    lock = threading.Lock()
+
+    def request(endpoint, params=None):
+        with lock:
+            calls.append((endpoint, params.get("l") or params.get("id"), params.get("d")))
+        threading.Event().wait(0.01)
+        if endpoint == "eventsday.php":
+            league = params["l"].removeprefix("League ")
+            return {"events": [_game(league, params["d"], "Otters", "Knights")]}
+        if endpoint == "eventsseason.php":
+            league = params["id"].removeprefix("id-")
+            return {"events": [_game(league, d, "Otters", "Knights") for d in DATES[::2]]}
+        return {"events": None}
+
+    client._request = request
+    names = {"1": "Otters", "2": "Knights", "3": "Rangers"}
+    provider = TSDBProvider(client=client, team_name_resolver=lambda tid, lg: names.get(tid))
+    return provider, calls
+
+
+def test_plan_dedupes_skips_cached_and_ranks_by_teams():
+    provider, calls = _provider()
+    provider._client.get_events_by_date("ohl", DATES[0])
+    calls.clear()
+
+    plan = provider.plan_prefetch({"nll": 1, "ohl": 3}, days_ahead=3)
+
+    assert [(c.league, c.dates, c.value) for c in plan] == [
+        ("ohl", (DATES[1],), 3),
+        ("ohl", (DATES[2],), 3),
+        ("nll", (DATES[0],), 1),
+        ("nll", (DATES[1],), 1),
+        ("nll", (DATES[2],), 1),
+    ]
+    assert calls == []
+
+
+def test_teams_processed_in_parallel_from_prefetched_cache():
+    provider, calls = _provider()
+    service = SportsDataService.__new__(SportsDataService)
+    service._providers = [provider]
+
+    stats = service.prewarm_tsdb_leagues(["ohl"], days_ahead=3, team_counts={"ohl": 3})
+    assert stats == {"planned": 3, "fetched": 3, "skipped": 0, "failed": 0}
+    assert sorted(d for _, _, d in calls) == DATES
+    calls.clear()
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        schedules = list(pool.map(lambda t: provider.get_team_schedule(t, "ohl", 3), "123"))
+
+    assert calls == []
+    assert [len(s) for s in schedules] == [3, 3, 0]
+    assert schedules[0][0].start_time.date().isoformat() == DATES[0]
+
+
+def test_premium_season_call_replaces_missing_days():
+    provider, calls = _provider(api_key="premium")
+
+    plan = provider.plan_prefetch({"ohl": 2}, days_ahead=3)
+    assert [(c.endpoint, c.dates, c.value) for c in plan] == [("eventsseason", tuple(DATES), 6)]
+
+    assert provider.prefetch(plan[0])
+    assert [endpoint for endpoint, _, _ in calls] == ["eventsseason.php"]
+    # Seeded per day, including the day without games
+    assert provider._client.get_events_by_date("ohl", DATES[1]) == {"events": None}
+    assert len(provider._client.get_events_by_date("ohl", DATES[2])["events"]) == 1
+    assert provider.plan_prefetch({"ohl": 2}, days_ahead=3) == []
@@ -0,0 +1,108 @@
+"""Tests for XMLTV artifacts written by generation and served with ETags."""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from starlette.requests import Request
+
+from teamarr.api.routes import groups as group_routes
+from teamarr.api.routes.epg import _analyze_xmltv
+from teamarr.consumers.generation import _write_xmltv_artifact
+from teamarr.database.groups import store_group_xmltv
+from teamarr.database.xmltv_artifacts import SCOPE_EVENTS, get_xmltv_artifact
+from teamarr.utilities.xmltv import (
+    analyze_xmltv_tree,
+    merge_xmltv_content,
+    merge_xmltv_tree,
+    serialize_xmltv,
+)
+
+SCHEMA = Path(__file__).parent.parent / "teamarr" / "database" / "schema.sql"
+
+
+def _guide(channel, *programmes):
+    progs = "".join(
+        f'<programme start="{start} +0000" stop="{stop} +0000" channel="{channel}">'
+        f"<title>{title}</title></programme>"
+        for start, stop, title in programmes
+    )
+    channel_xml = f'<channel id="{channel}"><display-name>{channel}</display-name></channel>'
+    return f"<tv>{channel_xml}{progs}</tv>"
+
+
+GUIDES = [
+    _guide(
+        "teamarr-event-1",
+        ("20260314180000", "20260314200000", "Bruins at Leafs"),
+        ("20260314210000", "20260314230000", "{team_name} Postgame"),
+    ),
+    _guide("team-5", ("20260315000000", "20260315060000", "Oilers Tonight")),
+]
+
+
+def test_tree_analysis_matches_parsing_written_guide():
+    root = merge_xmltv_tree(GUIDES)
+    analysis = analyze_xmltv_tree(root)
+
+    assert analysis == _analyze_xmltv(serialize_xmltv(root))
+    assert analysis["channels"] == {"total": 2, "team_based": 1, "event_based": 1}
+    assert analysis["unreplaced_variables"] == ["{team_name}"]
+    assert analysis["date_range"] == {"start": "20260314", "end": "20260315"}
+    assert [g["gap_minutes"] for g in analysis["coverage_gaps"]] == [60]
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("INSERT INTO event_epg_groups (id, name, leagues) VALUES (1, 'NHL', '[\"nhl\"]')")
+    store_group_xmltv(conn, 1, GUIDES[0])
+
+    @contextmanager
+    def db():
+        yield conn
+
+    monkeypatch.setattr(group_routes, "get_db", db)
+    yield conn
+    conn.close()
+
+
+def test_combined_served_from_artifact_until_groups_change(conn, tmp_path):
+    from teamarr.database.groups import get_group_xmltv_source_key
+
+    path = tmp_path / "teamarr-events.xml"
+    content = merge_xmltv_content([GUIDES[0]])
+    _write_xmltv_artifact(
+        conn, SCOPE_EVENTS, path, content, 7, source_key=get_group_xmltv_source_key(conn)
+    )
+    artifact = get_xmltv_artifact(conn, SCOPE_EVENTS)
+    assert artifact.etag.startswith('"7-')
+
+    response = group_routes.get_combined_xmltv(_request())
+    assert response.path == artifact.path
+    assert response.headers["etag"] == artifact.etag
+
+    assert group_routes.get_combined_xmltv(_request(artifact.etag)).status_code == 304
+    assert group_routes.get_combined_xmltv(_request(f"W/{artifact.etag}")).status_code == 304
+
+    # A group reprocessed after generation: merge on the fly, new ETag
+    store_group_xmltv(conn, 1, GUIDES[0].replace("Bruins", "Canadiens"))
+    conn.execute("UPDATE event_epg_xmltv SET updated_at = '2099-01-01 00:00:00'")
+    response = group_routes.get_combined_xmltv(_request(artifact.etag))
+    assert response.status_code == 200
+    assert b"Canadiens" in response.body
+    assert response.headers["etag"] != artifact.etag
+
+    # File edited outside generation is no longer trusted either
+    conn.execute("UPDATE xmltv_artifacts SET source_key = ?", (get_group_xmltv_source_key(conn),))
+    path.write_text(content + "\n", encoding="utf-8")
+    assert get_xmltv_artifact(conn, SCOPE_EVENTS).is_current() is False
+    assert group_routes.get_combined_xmltv(_request()).status_code == 200